@@ -0,0 +1,113 @@
+import re
+import base64
+import hashlib
+import time
+from PyQt5.QtGui import QTextDocument, QImage
+
+# 笔记中的图片以 attachment:<sha256> 的形式引用，图片数据按内容哈希只存一份
+URL_SCHEME = 'attachment'
+
+# 不再被任何笔记引用的图片保留这么久再删除（秒），与历史版本的保留时长一致
+ORPHAN_GRACE_PERIOD = 30 * 24 * 3600
+
+INLINE_IMAGE_RE = re.compile(r'src="data:(image/[\w.+-]+);base64,([^"]*)"')
+REFERENCE_RE = re.compile(URL_SCHEME + r':([0-9a-f]{64})')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def url_for(digest):
+    return f'{URL_SCHEME}:{digest}'
+
+
+def store(cursor, digest, mime, data, thumbnail=None):
+    # 新存入的图片在被笔记引用之前视为孤立，插入后又撤销的图片也能被回收
+    now = int(time.time())
+    cursor.execute('INSERT OR IGNORE INTO attachments (hash, mime, data, thumbnail, created, orphaned_at) VALUES (?, ?, ?, ?, ?, ?)',
+                   (digest, mime, data, thumbnail, now, now))
+
+
+def extract_inline_images(cursor, content):
+    # 把旧笔记中内联的 base64 图片存入附件表，并改为按哈希引用
+    if 'data:image' not in content:
+        return content
+
+    def replace(match):
+        data = base64.b64decode(match.group(2))
+        digest = content_hash(data)
+        store(cursor, digest, match.group(1), data)
+        return f'src="{url_for(digest)}"'
+
+    return INLINE_IMAGE_RE.sub(replace, content)
+
+
+def update_references(cursor, note_id, content):
+    # 记录笔记引用了哪些图片，失去全部引用的图片标记为孤立，等待回收
+    hashes = set(REFERENCE_RE.findall(content))
+    cursor.execute('SELECT hash FROM note_attachments WHERE note_id = ?', (note_id,))
+    old_hashes = {digest for digest, in cursor.fetchall()}
+    added = [(digest,) for digest in hashes - old_hashes]
+    removed = [(digest,) for digest in old_hashes - hashes]
+    if added:
+        cursor.executemany('INSERT INTO note_attachments (note_id, hash) VALUES (?, ?)',
+                           [(note_id, digest) for digest, in added])
+        cursor.executemany('UPDATE attachments SET orphaned_at = NULL WHERE hash = ?', added)
+    if removed:
+        cursor.executemany('DELETE FROM note_attachments WHERE note_id = ? AND hash = ?',
+                           [(note_id, digest) for digest, in removed])
+        mark_orphans(cursor, removed)
+
+
+def add_references(cursor, references):
+    # 批量导入的新笔记：references 为 (笔记 id, 哈希) 列表
+    cursor.executemany('INSERT OR IGNORE INTO note_attachments (note_id, hash) VALUES (?, ?)', references)
+    cursor.executemany('UPDATE attachments SET orphaned_at = NULL WHERE hash = ?', [(digest,) for _, digest in references])
+
+
+def delete_references(cursor, note_ids):
+    for note_id in note_ids:
+        cursor.execute('SELECT hash FROM note_attachments WHERE note_id = ?', (note_id,))
+        removed = cursor.fetchall()
+        cursor.execute('DELETE FROM note_attachments WHERE note_id = ?', (note_id,))
+        mark_orphans(cursor, removed)
+
+
+def mark_orphans(cursor, hashes):
+    now = int(time.time())
+    cursor.executemany(
+        'UPDATE attachments SET orphaned_at = ? WHERE hash = ? '
+        'AND NOT EXISTS (SELECT 1 FROM note_attachments WHERE note_attachments.hash = attachments.hash)',
+        [(now, digest) for digest, in hashes]
+    )
+
+
+def collect_garbage(cursor, grace_period=ORPHAN_GRACE_PERIOD):
+    cursor.execute('DELETE FROM attachments WHERE orphaned_at IS NOT NULL AND orphaned_at < ?',
+                   (int(time.time()) - grace_period,))
+    return cursor.rowcount
+
+
+def load(cursor, digest):
+    cursor.execute('SELECT data FROM attachments WHERE hash = ?', (digest,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+# 编辑器使用的文档：遇到 attachment: 图片时从附件表中读取
+class NoteDocument(QTextDocument):
+
+    def __init__(self, cursor, parent=None):
+        super().__init__(parent)
+        self.cursor = cursor
+        self.resource_bytes = 0  # 已载入的图片占用的内存，文档缓存据此估算文档大小
+
+    def loadResource(self, resource_type, url):
+        if resource_type == QTextDocument.ImageResource and url.scheme() == URL_SCHEME:
+            data = load(self.cursor, url.path())
+            if data is not None:
+                image = QImage.fromData(data)
+                self.resource_bytes += image.sizeInBytes()
+                return image
+        return super().loadResource(resource_type, url)
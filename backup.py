@@ -0,0 +1,198 @@
+import os
+import re
+import time
+import posixpath
+import mimetypes
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QTextDocument
+
+import storage
+import attachments
+import codec
+
+# 在线备份每一步复制的页数，每步之间释放数据库，写入线程不会被长时间阻塞
+BACKUP_PAGES_PER_STEP = 1024
+# 每步之间暂停的时间（秒）
+BACKUP_STEP_SLEEP = 0.005
+# 导出时图片数据每次读取的字节数
+BLOB_CHUNK_SIZE = 1024 * 1024
+# 导出进度信号的间隔（笔记数）
+PROGRESS_INTERVAL = 50
+# 导出包中存放图片的目录
+IMAGE_DIR = 'images'
+
+# 导出的笔记：不在被删除的文件夹中
+EXPORTED_NOTES = 'folder_id IS NULL OR folder_id NOT IN (SELECT id FROM trash_folders)'
+
+INVALID_NAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+class Cancelled(Exception):
+    pass
+
+
+def backup(source_path, target_path, progress=None, cancelled=None):
+    # 用 SQLite 的在线备份接口分步复制整个数据库，progress(已复制的页数, 总页数)
+    # 全程持有一个读事务：WAL 模式下写入线程照常提交，备份得到的是开始时刻的一致快照，也不会因为写入而重新开始
+    part_path = target_path + '.part'
+    source = storage.connect(source_path)
+    target = None
+    try:
+        source.execute('BEGIN')
+        source.execute('SELECT count(*) FROM sqlite_master')
+        target = storage.connect(part_path)
+
+        def step(status, remaining, total):
+            if cancelled and cancelled():
+                raise Cancelled()
+            if progress:
+                progress(total - remaining, total)
+
+        source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=step, sleep=BACKUP_STEP_SLEEP)
+        target.execute('PRAGMA journal_mode = DELETE')
+        target.close()
+        target = None
+        os.replace(part_path, target_path)
+    finally:
+        source.close()
+        if target is not None:
+            target.close()
+        for path in (part_path, part_path + '-wal', part_path + '-shm'):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def safe_name(name):
+    name = INVALID_NAME_RE.sub('_', name).strip().rstrip('.')
+    return name or '未命名'
+
+
+def unique_name(used, directory, name, extension):
+    # 同一目录下重名的笔记或文件夹依次加上 (2)、(3)…
+    candidate = name + extension
+    number = 2
+    while (directory, candidate.lower()) in used:
+        candidate = f'{name} ({number}){extension}'
+        number += 1
+    used.add((directory, candidate.lower()))
+    return posixpath.join(directory, candidate)
+
+
+def folder_paths(cursor, used):
+    # 文件夹 id -> 导出包中的目录
+    cursor.execute('SELECT id, name, parent_id FROM folders ORDER BY id')
+    folders = {folder_id: (name, parent_id) for folder_id, name, parent_id in cursor.fetchall()}
+    paths = {None: ''}
+
+    def path_of(folder_id):
+        if folder_id not in paths:
+            name, parent_id = folders.get(folder_id, (str(folder_id), None))
+            paths[folder_id] = ''  # 数据异常出现循环时退回到根目录
+            paths[folder_id] = unique_name(used, path_of(parent_id if parent_id in folders else None), safe_name(name), '')
+        return paths[folder_id]
+
+    for folder_id in folders:
+        path_of(folder_id)
+    return paths
+
+
+def write_image(connection, archive, cursor, digest):
+    # 按块从附件表读出图片写入压缩包，返回包中的路径；图片已是压缩格式，不再压缩
+    import zipfile
+    cursor.execute('SELECT rowid, mime FROM attachments WHERE hash = ?', (digest,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    rowid, mime = row
+    path = posixpath.join(IMAGE_DIR, digest + (mimetypes.guess_extension(mime) or ''))
+    info = zipfile.ZipInfo(path, time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    with connection.blobopen('attachments', 'data', rowid, readonly=True) as blob, archive.open(info, 'w') as target:
+        while True:
+            data = blob.read(BLOB_CHUNK_SIZE)
+            if not data:
+                break
+            target.write(data)
+    return path
+
+
+def export_notes(source_path, target_path, markdown=False, progress=None, cancelled=None):
+    # 把全部笔记导出为 zip：文件夹对应目录，每篇笔记一个 HTML 或 Markdown 文件，图片放在 images 目录中
+    # 笔记逐行读出、逐个写入压缩包，内存占用与笔记本大小无关
+    # 被删除的笔记已移入 trash_notes；被删除文件夹中的笔记仍在 notes 表中（见 trash.py），与搜索一样排除
+    # 与备份一样在一个读事务中完成，导出的是开始时刻的一致快照
+    import zipfile  # 只在导出时加载，不拖慢程序启动
+    part_path = target_path + '.part'
+    connection = storage.connect(source_path)
+    try:
+        connection.execute('BEGIN')
+        cursor = connection.cursor()
+        cursor.execute(f'SELECT count(*) FROM notes WHERE {EXPORTED_NOTES}')
+        total = cursor.fetchone()[0]
+        used = set()
+        paths = folder_paths(cursor, used)
+        images = {}  # 哈希 -> 包中的路径，每张图片只写一次
+        image_cursor = connection.cursor()
+        extension = '.md' if markdown else '.html'
+        with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for folder_path in sorted(set(paths.values()) - {''}):
+                archive.writestr(folder_path + '/', b'')
+            cursor.execute(f'SELECT folder_id, title, content, timestamp FROM notes WHERE {EXPORTED_NOTES} '
+                           'ORDER BY folder_id, id')
+            for done, (folder_id, title, content, timestamp) in enumerate(cursor, 1):
+                if cancelled and cancelled():
+                    raise Cancelled()
+                directory = paths.get(folder_id, '')
+                path = unique_name(used, directory, safe_name(title), extension)
+                content = codec.decode(content)
+
+                def replace(match):
+                    digest = match.group(1)
+                    if digest not in images:
+                        images[digest] = write_image(connection, archive, image_cursor, digest)
+                    if images[digest] is None:
+                        return match.group(0)
+                    return posixpath.relpath(images[digest], directory or '.')
+
+                content = attachments.REFERENCE_RE.sub(replace, content)
+                if markdown:
+                    document = QTextDocument()
+                    document.setHtml(content)
+                    content = document.toMarkdown()
+                date_time = time.strptime(timestamp, '%Y-%m-%d %H:%M:%S')[:6] if timestamp else time.localtime()[:6]
+                archive.writestr(zipfile.ZipInfo(path, date_time), content.encode('utf-8'), zipfile.ZIP_DEFLATED)
+                if progress and (done % PROGRESS_INTERVAL == 0 or done == total):
+                    progress(done, total)
+        os.replace(part_path, target_path)
+    finally:
+        connection.close()
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+# 在后台线程中执行备份或导出，界面线程只接收进度
+class BackupTask(QThread):
+    progress = pyqtSignal(int, int)  # (已完成, 总数)
+    completed = pyqtSignal(str)  # 出错时为错误信息，成功或取消时为空
+
+    def __init__(self, func, source_path, target_path, parent=None, **options):
+        super().__init__(parent)
+        self.func = func  # backup 或 export_notes
+        self.source_path = source_path
+        self.target_path = target_path
+        self.options = options
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            self.func(self.source_path, self.target_path, progress=self.progress.emit,
+                      cancelled=lambda: self.cancelled, **self.options)
+        except Cancelled:
+            self.completed.emit('')
+        except Exception as e:
+            self.completed.emit(str(e))
+        else:
+            self.completed.emit('')
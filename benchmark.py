@@ -0,0 +1,563 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import random
+import signal
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+# 性能基准脚本，在无界面（offscreen）模式下运行，结果以 JSON 输出
+# 用法：python benchmark.py startup --runs 10
+#       python benchmark.py codec --notes 2000
+#       python benchmark.py format --paragraphs 2000
+#       python benchmark.py generate bench.db --notes 10000 --depth 3 --fanout 5 --images 200
+#       python benchmark.py ops --notes 10000 --output result.json
+#       python benchmark.py writes --saves 2000
+#       python benchmark.py crash --runs 20
+#       python benchmark.py --baseline baseline.json ops --notes 10000
+# 指定 --baseline 时与之前保存的结果比较，有操作的中位数变慢超过 --tolerance 时退出码为 1
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 崩溃恢复测试的子进程：不停地通过写入线程保存笔记，每次保存提交后（回调中）输出 "笔记 id 序号"
+# 每保存 BURST_SAVES 次暂停一会，让写入线程有机会在空闲时做检查点
+CRASH_SCRIPT = '''
+import sys
+sys.path.insert(0, sys.argv[1])
+from PyQt5.QtCore import QCoreApplication, QTimer
+import storage
+app = QCoreApplication(sys.argv[:1])
+worker = storage.StorageWorker(sys.argv[2])
+worker.start()
+note_count = int(sys.argv[3])
+BURST_SAVES = 2000
+sequence = 0
+
+def acknowledge(note_id, number):
+    print(note_id, number, flush=True)
+
+def submit():
+    global sequence
+    if worker.pending > 256:
+        return
+    for _ in range(8):
+        sequence += 1
+        note_id = sequence % note_count + 1
+        worker.submit(storage.save_note, note_id, f'<p>save {sequence}</p>', '2024-01-01 00:00:00',
+                      callback=lambda result, n=note_id, s=sequence: acknowledge(n, s), note_id=note_id)
+    if sequence % BURST_SAVES == 0:
+        timer.stop()
+        QTimer.singleShot(1500, timer.start)
+
+timer = QTimer()
+timer.timeout.connect(submit)
+timer.start(0)
+app.exec_()
+'''
+
+# 在独立进程中启动应用直到首次绘制，输出各阶段耗时（秒）
+STARTUP_SCRIPT = '''
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+t1 = time.perf_counter()
+import main
+t2 = time.perf_counter()
+window = main.ElegantNoteApp()
+window.show()
+app.processEvents()
+t3 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2, t3 - t0)
+window.close()  # 停止写入线程后再退出
+'''
+
+
+def run_startup(runs, db_path=None):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    samples = {'qt': [], 'import_main': [], 'window': [], 'total': []}
+    with tempfile.TemporaryDirectory() as work_dir:
+        if db_path:
+            with open(db_path, 'rb') as src, open(os.path.join(work_dir, 'notes.db'), 'wb') as dst:
+                dst.write(src.read())
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, '-c', STARTUP_SCRIPT, APP_DIR],
+                cwd=work_dir, env=env, check=True, capture_output=True, text=True
+            ).stdout.split()
+            for key, value in zip(('qt', 'import_main', 'window', 'total'), output):
+                samples[key].append(float(value))
+    return {key: summarize(values) for key, values in samples.items()}
+
+
+SAMPLE_WORDS = ['笔记', '性能', '数据库', '优化', '编辑器', '今天', '素材', 'note', 'Qt', 'SQLite', 'hello', 'world']
+
+
+def make_note_html(rng, paragraphs):
+    # 用 QTextEdit 生成与真实笔记相同的 toHtml() 输出，包含工具栏支持的各种格式
+    from PyQt5.QtWidgets import QTextEdit
+    parts = []
+    for i in range(paragraphs):
+        words = ' '.join(rng.choices(SAMPLE_WORDS, k=rng.randint(5, 40)))
+        kind = rng.random()
+        if kind < 0.05:
+            parts.append(f'<h{rng.randint(1, 3)}>{words[:20]}</h{rng.randint(1, 3)}>')
+        elif kind < 0.15:
+            parts.append(f'<ul><li>{words}</li><li>{words[:30]}</li></ul>')
+        elif kind < 0.2:
+            parts.append(f'<ol><li>{words}</li></ol>')
+        elif kind < 0.3:
+            parts.append(f'<p>{words} <b>{words[:10]}</b> <span style="background-color:yellow">{words[:8]}</span></p>')
+        elif kind < 0.35:
+            parts.append(f'<p><a href="https://example.com/{i}">{words[:12]}</a></p>')
+        else:
+            parts.append(f'<p>{words}</p>')
+    editor = QTextEdit()
+    editor.setHtml(''.join(parts))
+    return editor.toHtml()
+
+
+def ensure_qt():
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QFont
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    QApplication.setFont(QFont("微软雅黑", 10))
+    return app
+
+
+def run_codec(note_count, operations=200, seed=1):
+    # 比较未压缩与压缩存储的数据库大小、编解码耗时和单篇笔记的读取、保存延迟
+    sys.path.insert(0, APP_DIR)
+    import storage
+    import codec
+    app = ensure_qt()  # 保持引用，生成文档期间 QApplication 不能被回收
+    rng = random.Random(seed)
+    documents = [make_note_html(rng, rng.randint(1, 60)) for _ in range(min(note_count, 200))]
+    result = {'notes': note_count, 'mean_raw_bytes': round(statistics.mean(len(d.encode('utf-8')) for d in documents))}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for mode, encode, decode in (('raw', lambda c: c, lambda v: v), ('compressed', codec.encode, codec.decode)):
+            path = os.path.join(work_dir, f'{mode}.db')
+            conn = storage.connect(path)
+            conn.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY AUTOINCREMENT, folder_id INTEGER, '
+                         'title TEXT NOT NULL, content TEXT, timestamp TEXT)')
+            conn.executemany('INSERT INTO notes (title, content) VALUES (?, ?)',
+                             [(f'note {i}', encode(documents[i % len(documents)])) for i in range(note_count)])
+            conn.commit()
+            conn.execute('VACUUM')
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            size = os.path.getsize(path)
+
+            encode_times, decode_times, load_times, save_times = [], [], [], []
+            for _ in range(operations):
+                document = rng.choice(documents)
+                note_id = rng.randint(1, note_count)
+                start = time.perf_counter()
+                encoded = encode(document)
+                encode_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                decode(encoded)
+                decode_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                decode(conn.execute('SELECT content FROM notes WHERE id = ?', (note_id,)).fetchone()[0])
+                load_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                conn.execute('UPDATE notes SET content = ? WHERE id = ?', (encode(document), note_id))
+                conn.commit()
+                save_times.append(time.perf_counter() - start)
+            conn.close()
+            result[mode] = {
+                'db_bytes': size,
+                'encode': summarize(encode_times),
+                'decode': summarize(decode_times),
+                'load': summarize(load_times),
+                'save': summarize(save_times),
+            }
+    return result
+
+
+def run_format(paragraphs, runs=10, seed=1):
+    # 比较 Qt 原始 toHtml() 输出与精简格式的大小、保存（序列化）和打开（解析）耗时
+    sys.path.insert(0, APP_DIR)
+    import note_format
+    from PyQt5.QtGui import QTextDocument
+    app = ensure_qt()
+    document = QTextDocument()
+    document.setHtml(make_note_html(random.Random(seed), paragraphs))
+    full = document.toHtml()
+    compact = note_format.compact(full)
+    result = {'paragraphs': paragraphs, 'raw_bytes': len(full.encode('utf-8')), 'compact_bytes': len(compact.encode('utf-8'))}
+    for mode, serialize, html in (('raw', document.toHtml, full),
+                                  ('compact', lambda: note_format.compact(document.toHtml()), compact)):
+        save_times, load_times = [], []
+        for _ in range(runs):
+            start = time.perf_counter()
+            serialize()
+            save_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            QTextDocument().setHtml(html)
+            load_times.append(time.perf_counter() - start)
+        result[mode] = {'serialize': summarize(save_times), 'parse': summarize(load_times)}
+    return result
+
+
+def generate_db(path, depth=3, fanout=5, note_count=1000, paragraphs=20, image_count=0, seed=1):
+    # 生成合成的笔记数据库：depth 层、每层 fanout 个子文件夹的目录树，笔记随机分布在各个文件夹（和根目录）中，
+    # 正文平均 paragraphs 段，其中 image_count 篇笔记各引用一张图片。表结构由应用的迁移创建，与真实数据库一致
+    sys.path.insert(0, APP_DIR)
+    app = ensure_qt()
+    import storage
+    import migrations
+    import attachments
+    import search
+    import codec
+    import note_format
+    from image_ingest import encode_image
+    from PyQt5.QtGui import QImage, QColor
+
+    path = os.path.abspath(path)
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    conn = storage.connect(path)
+    cursor = conn.cursor()
+    migrations.upgrade(cursor)
+    folder_ids = [None]
+    parents = [None]
+    for level in range(depth):
+        children = []
+        for parent_id in parents:
+            for i in range(fanout):
+                cursor.execute('INSERT INTO folders (name, parent_id) VALUES (?, ?)', (f'文件夹 {level + 1}-{i + 1}', parent_id))
+                children.append(cursor.lastrowid)
+        folder_ids.extend(children)
+        parents = children
+
+    # 用 QTextEdit 生成正文比较慢，生成一批不同长度的正文轮流使用
+    documents = [make_note_html(rng, rng.randint(1, paragraphs * 2)) for _ in range(min(note_count, 200))]
+    image_urls = []
+    for i in range(image_count):
+        image = QImage(rng.randint(200, 1280), rng.randint(150, 800), QImage.Format_RGB32)
+        image.fill(QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        data, mime = encode_image(image)
+        digest = attachments.content_hash(data + str(i).encode())
+        attachments.store(cursor, digest, mime, data)
+        image_urls.append((attachments.url_for(digest), image.width(), image.height()))
+    image_notes = set(rng.sample(range(note_count), min(image_count, note_count)))
+    for i in range(note_count):
+        content = documents[i % len(documents)]
+        if i in image_notes:
+            url, width, height = image_urls.pop()
+            content = content.replace('</body>', f'<p><img src="{url}" width="{width}" height="{height}" /></p></body>', 1)
+        content = note_format.compact(content)
+        title = f'笔记 {i + 1} {rng.choice(SAMPLE_WORDS)}'
+        cursor.execute('INSERT INTO notes (folder_id, title, content, timestamp, modified) VALUES (?, ?, ?, ?, ?)',
+                       (rng.choice(folder_ids), title, codec.encode(content), '2024-01-01 00:00:00', 1704067200))
+        note_id = cursor.lastrowid
+        search.index_note(cursor, note_id, title, search.html_to_text(content))
+        attachments.update_references(cursor, note_id, content)
+    conn.commit()
+    cursor.execute('ANALYZE')
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    conn.close()
+    return {'path': path, 'folders': len(folder_ids) - 1, 'notes': note_count, 'images': image_count,
+            'db_bytes': os.path.getsize(path)}
+
+
+def run_operations(db_path, operations=50, seed=1):
+    # 在数据库副本上打开主窗口，测量常用操作的耗时。写入操作一直计时到写入线程提交为止
+    sys.path.insert(0, APP_DIR)
+    app = ensure_qt()
+    from PyQt5.QtCore import QEventLoop
+    from PyQt5.QtGui import QTextCursor
+    import storage
+
+    rng = random.Random(seed)
+    samples = {key: [] for key in ('window', 'load_folders_and_notes', 'load_note', 'load_note_cached',
+                                   'auto_save', 'rename_note', 'delete_note', 'search')}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        shutil.copy(db_path, os.path.join(work_dir, storage.DB_PATH))
+        os.chdir(work_dir)
+        try:
+            start = time.perf_counter()
+            import main
+            window = main.ElegantNoteApp()
+            window.show()
+            app.processEvents()
+            samples['window'].append(time.perf_counter() - start)
+            # 启动时的后台任务不计入后面的操作
+            window.storage.flush()
+
+            def timed(key, func):
+                start = time.perf_counter()
+                func()
+                samples[key].append(time.perf_counter() - start)
+
+            def open_note(note_id, folder_id):
+                window.load_note(window.tree_model.index_for_note(note_id, folder_id))
+                while window.note_loader.is_loading():
+                    app.processEvents()
+                app.processEvents()
+
+            for _ in range(min(operations, 20)):
+                timed('load_folders_and_notes', lambda: (window.load_folders_and_notes(), app.processEvents()))
+            window.cursor.execute('SELECT id, folder_id FROM notes')
+            notes = window.cursor.fetchall()
+            picked = rng.sample(notes, min(operations, len(notes)))
+
+            # 打开笔记：缓存上限为 0 时每次都从数据库读取并解析
+            window.document_cache.max_bytes = 0
+            for note_id, folder_id in picked:
+                timed('load_note', lambda: open_note(note_id, folder_id))
+            window.document_cache.max_bytes = 1 << 40
+            recent = picked[:5]
+            for note_id, folder_id in recent:
+                open_note(note_id, folder_id)
+            for i in range(operations):
+                note_id, folder_id = recent[i % len(recent)]
+                timed('load_note_cached', lambda: open_note(note_id, folder_id))
+
+            for note_id, folder_id in picked:
+                open_note(note_id, folder_id)
+                cursor = window.note_editor.textCursor()
+                cursor.movePosition(QTextCursor.End)
+                cursor.insertText(f' {rng.choice(SAMPLE_WORDS)}')
+                timed('auto_save', lambda: (window.save_scheduler.flush(), window.storage.flush()))
+
+            for note_id, _ in picked:
+                def rename():
+                    window.storage.submit(storage.rename_note, note_id, f'改名 {note_id}')
+                    window.tree_model.rename('note', note_id, f'改名 {note_id}')
+                    window.storage.flush()
+                timed('rename_note', rename)
+
+            # 搜索在后台线程中执行，计时到结果显示为止；这个槽在主窗口的槽之后连接，收到时结果已经显示
+            shown = []
+            window.search_worker.results.connect(lambda query, results: shown.append(query))
+            for query in SAMPLE_WORDS + ['数据库 优化', 'Qt 笔记 hello', '不存在的内容', '不存', '优化 笔记']:
+                def run_search():
+                    window.search_box.setText(query)
+                    window.run_search()
+                    while query not in shown:
+                        # 阻塞等待事件，空转会占住 GIL 拖慢后台线程
+                        app.processEvents(QEventLoop.WaitForMoreEvents)
+                    shown.clear()
+                timed('search', run_search)
+            window.search_box.clear()
+
+            for note_id, folder_id in picked:
+                window.tree_model.index_for_note(note_id, folder_id)
+
+                def delete():
+                    window.storage.submit(storage.delete_note, note_id)
+                    window.remove_tree_item('note', note_id)
+                    window.storage.flush()
+                timed('delete_note', delete)
+            window.close()
+        finally:
+            os.chdir(cwd)
+    return {key: summarize(values) for key, values in samples.items()}
+
+
+def run_writes(saves=2000, paragraphs=5, seed=1):
+    # 持续保存的吞吐量（次/秒）：
+    # rollback_per_save —— 回滚日志、synchronous=FULL，每次保存单独提交（原来每个处理函数各自 commit 的做法）
+    # wal_per_save —— WAL，每次保存单独提交
+    # worker —— 写入线程，排队的保存合并到同一个事务中提交（组提交）
+    sys.path.insert(0, APP_DIR)
+    app = ensure_qt()
+    import storage
+
+    rng = random.Random(seed)
+    result = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, 'template.db')
+        generate_db(template, depth=1, fanout=2, note_count=100, paragraphs=paragraphs, seed=seed)
+        contents = [make_note_html(rng, paragraphs) for _ in range(50)]
+        jobs = [(rng.randint(1, 100), contents[i % len(contents)] + f'<p>{i}</p>') for i in range(saves)]
+        timestamp = '2024-01-01 00:00:00'
+        for mode in ('rollback_per_save', 'wal_per_save', 'worker'):
+            path = os.path.join(work_dir, mode + '.db')
+            shutil.copy(template, path)
+            if mode == 'worker':
+                worker = storage.StorageWorker(path)
+                worker.start()
+                start = time.perf_counter()
+                for note_id, content in jobs:
+                    worker.submit(storage.save_note, note_id, content, timestamp)
+                worker.flush()
+                elapsed = time.perf_counter() - start
+                worker.stop()
+            else:
+                conn = storage.connect(path)
+                conn.isolation_level = None
+                if mode == 'rollback_per_save':
+                    conn.execute('PRAGMA journal_mode = DELETE')
+                cursor = conn.cursor()
+                start = time.perf_counter()
+                for note_id, content in jobs:
+                    cursor.execute('BEGIN IMMEDIATE')
+                    storage.save_note(cursor, note_id, content, timestamp)
+                    cursor.execute('COMMIT')
+                elapsed = time.perf_counter() - start
+                conn.close()
+            result[mode] = {'saves': saves, 'seconds': round(elapsed, 3), 'saves_per_second': round(saves / elapsed, 1)}
+    return result
+
+
+def run_crash(runs=20, note_count=50, max_delay=5.0, seed=1):
+    # 崩溃恢复测试：子进程持续保存，在随机时刻被 SIGKILL 杀掉。之后打开数据库检查完整性，
+    # 并确认每篇笔记的内容不早于子进程已确认（提交后回调）的最后一次保存
+    sys.path.insert(0, APP_DIR)
+    import storage
+    import codec
+
+    rng = random.Random(seed)
+    failures = []
+    acknowledged_total = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, 'template.db')
+        generate_db(template, depth=1, fanout=2, note_count=note_count, paragraphs=2, seed=seed)
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        for run in range(runs):
+            path = os.path.join(work_dir, f'crash{run}.db')
+            shutil.copy(template, path)
+            child = subprocess.Popen([sys.executable, '-c', CRASH_SCRIPT, APP_DIR, path, str(note_count)],
+                                     env=env, stdout=subprocess.PIPE, text=True)
+            time.sleep(rng.uniform(0.5, max_delay))
+            child.send_signal(signal.SIGKILL)
+            output, _ = child.communicate()
+            acknowledged = {}
+            for line in output.splitlines():
+                parts = line.split()
+                if len(parts) == 2:  # 被杀时写了一半的行不算确认
+                    acknowledged[int(parts[0])] = max(acknowledged.get(int(parts[0]), 0), int(parts[1]))
+            acknowledged_total += sum(1 for line in output.splitlines() if len(line.split()) == 2)
+            conn = storage.connect(path)
+            integrity = conn.execute('PRAGMA integrity_check').fetchone()[0]
+            lost = []
+            for note_id, number in acknowledged.items():
+                content = codec.decode(conn.execute('SELECT content FROM notes WHERE id = ?', (note_id,)).fetchone()[0])
+                saved = [int(value) for value in re.findall(r'save (\d+)', content)]
+                if not saved or saved[0] < number:
+                    lost.append(note_id)
+            conn.close()
+            if integrity != 'ok' or lost:
+                failures.append({'run': run, 'integrity': integrity, 'lost_notes': lost})
+    return {'runs': runs, 'acknowledged_saves': acknowledged_total, 'failures': failures}
+
+
+def compare(result, baseline, tolerance):
+    # 比较两次结果中所有的中位数，返回变慢超过 tolerance（比例）的项目
+    # 差值小于 1 毫秒的不算，避免很快的操作因为测量噪声误报
+    regressions = []
+
+    def walk(current, previous, path):
+        if not isinstance(current, dict) or not isinstance(previous, dict):
+            return
+        if 'median_ms' in current and 'median_ms' in previous:
+            if current['median_ms'] > previous['median_ms'] * (1 + tolerance) and current['median_ms'] - previous['median_ms'] >= 1:
+                regressions.append({'name': '.'.join(path), 'baseline_ms': previous['median_ms'], 'current_ms': current['median_ms']})
+            return
+        for key, value in current.items():
+            walk(value, previous.get(key), path + [key])
+
+    walk(result, baseline, [])
+    return regressions
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        'runs': len(values),
+        'median_ms': round(statistics.median(values) * 1000, 2),
+        'min_ms': round(values[0] * 1000, 2),
+        'max_ms': round(values[-1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='非丨优雅笔记 性能基准')
+    parser.add_argument('--output', help='把结果另存为 JSON 文件，可作为以后的基准')
+    parser.add_argument('--baseline', help='与之前保存的结果比较')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='允许变慢的比例')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    startup_parser = subparsers.add_parser('startup', help='测量冷启动耗时')
+    startup_parser.add_argument('--runs', type=int, default=10)
+    startup_parser.add_argument('--db', help='使用指定的 notes.db 副本启动')
+    codec_parser = subparsers.add_parser('codec', help='比较笔记正文压缩前后的数据库大小和读写延迟')
+    codec_parser.add_argument('--notes', type=int, default=2000)
+    codec_parser.add_argument('--operations', type=int, default=200)
+    format_parser = subparsers.add_parser('format', help='比较原始 HTML 与精简格式的大小和解析耗时')
+    format_parser.add_argument('--paragraphs', type=int, default=2000)
+    format_parser.add_argument('--runs', type=int, default=10)
+    generate_parser = subparsers.add_parser('generate', help='生成合成的笔记数据库')
+    generate_parser.add_argument('path')
+    ops_parser = subparsers.add_parser('ops', help='测量启动、打开、保存、重命名、删除和搜索笔记的耗时')
+    ops_parser.add_argument('--db', help='使用已有的数据库，不指定时按下面的参数生成')
+    ops_parser.add_argument('--operations', type=int, default=50)
+    ops_parser.add_argument('--startup-runs', type=int, default=5)
+    writes_parser = subparsers.add_parser('writes', help='比较逐次提交与组提交时持续保存的吞吐量')
+    writes_parser.add_argument('--saves', type=int, default=2000)
+    writes_parser.add_argument('--paragraphs', type=int, default=5)
+    crash_parser = subparsers.add_parser('crash', help='在保存过程中杀掉进程，检查已确认的保存是否丢失')
+    crash_parser.add_argument('--runs', type=int, default=20)
+    crash_parser.add_argument('--notes', type=int, default=50)
+    crash_parser.add_argument('--max-delay', type=float, default=5.0, help='启动后最晚多久杀掉进程（秒）')
+    for sub in (generate_parser, ops_parser):
+        sub.add_argument('--depth', type=int, default=3)
+        sub.add_argument('--fanout', type=int, default=5)
+        sub.add_argument('--notes', type=int, default=1000)
+        sub.add_argument('--paragraphs', type=int, default=20)
+        sub.add_argument('--images', type=int, default=0)
+        sub.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    exit_code = 0
+
+    if args.command == 'startup':
+        result = run_startup(args.runs, args.db)
+    elif args.command == 'codec':
+        result = run_codec(args.notes, args.operations)
+    elif args.command == 'format':
+        result = run_format(args.paragraphs, args.runs)
+    elif args.command == 'generate':
+        result = generate_db(args.path, args.depth, args.fanout, args.notes, args.paragraphs, args.images, args.seed)
+    elif args.command == 'writes':
+        result = run_writes(args.saves, args.paragraphs)
+    elif args.command == 'crash':
+        result = run_crash(args.runs, args.notes, args.max_delay)
+        exit_code = 1 if result['failures'] else 0
+    elif args.command == 'ops':
+        with tempfile.TemporaryDirectory() as work_dir:
+            db_path = args.db
+            if db_path:
+                result = {'db': {'path': db_path, 'db_bytes': os.path.getsize(db_path)}}
+            else:
+                db_path = os.path.join(work_dir, 'bench.db')
+                result = {'db': generate_db(db_path, args.depth, args.fanout, args.notes, args.paragraphs, args.images, args.seed)}
+            result['startup'] = run_startup(args.startup_runs, db_path)
+            result['operations'] = run_operations(db_path, args.operations, args.seed)
+    result = {args.command: result}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            result['regressions'] = compare(result, json.load(baseline_file), args.tolerance)
+        # 与崩溃检查等自身的结果合并，任何一项失败都返回非零
+        exit_code = exit_code or (1 if result['regressions'] else 0)
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output)
+    print(output)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import time
+import uuid
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# 多个窗口或进程同时打开同一个数据库时，彼此的修改通过 changes 表传递：
+# 每个实例的写入连接上装有临时触发器，笔记和文件夹的每次增删改都在 changes 表中记一行，注明来源实例；
+# 界面线程定时检查 PRAGMA data_version，它只在其他连接提交后才变化，没有变化时每次只需这一条查询
+# 检查的间隔（毫秒）
+POLL_INTERVAL = 1000
+# changes 表中的记录保留这么久（秒），落后更多的实例重新加载整个笔记树
+CHANGE_RETENTION = 24 * 3600
+# 一次读到的修改超过这么多条（例如批量导入）时不再逐条处理，直接重新加载
+MAX_INCREMENTAL_CHANGES = 500
+
+# (表, 事件, 类型, 行, 动作)。content 表示笔记正文被修改，update 表示标题、所属文件夹或名称被修改
+TRIGGERS = (
+    ('notes', 'INSERT', 'note', 'NEW', 'insert'),
+    ('notes', 'DELETE', 'note', 'OLD', 'delete'),
+    ('notes', 'UPDATE OF title, folder_id', 'note', 'NEW', 'update'),
+    ('notes', 'UPDATE OF content', 'note', 'NEW', 'content'),
+    ('folders', 'INSERT', 'folder', 'NEW', 'insert'),
+    ('folders', 'DELETE', 'folder', 'OLD', 'delete'),
+    ('folders', 'UPDATE OF name, parent_id', 'folder', 'NEW', 'update'),
+)
+
+
+def install_triggers(cursor, source):
+    # 在写入线程的连接上创建临时触发器，只记录这个连接的写入，连接关闭后自动消失
+    for table, event, kind, row, action in TRIGGERS:
+        cursor.execute(f'''
+            CREATE TEMP TRIGGER IF NOT EXISTS log_{table}_{action} AFTER {event} ON main.{table}
+            BEGIN
+                INSERT INTO changes (created, source, kind, item_id, action)
+                VALUES (CAST(strftime('%s', 'now') AS INTEGER), '{source}', '{kind}', {row}.id, '{action}');
+            END
+        ''')
+
+
+def prune(cursor, retention=CHANGE_RETENTION):
+    cursor.execute('DELETE FROM changes WHERE created < ?', (int(time.time()) - retention,))
+
+
+# 监视其他实例对数据库的修改
+class ChangeFeed(QObject):
+    changed = pyqtSignal(list)  # [(类型, id, 动作)]，按发生的顺序，不含本实例自己的修改
+    reload_needed = pyqtSignal()  # 需要的记录已被清除或修改太多，整体重新加载
+
+    def __init__(self, cursor, interval=POLL_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.cursor = cursor
+        self.source = uuid.uuid4().hex  # 本实例的标识，写入线程安装触发器时使用
+        self.data_version = self.read_data_version()
+        # 已分配的最大编号，表中的记录即使都已清除也能接着比较
+        cursor.execute("SELECT coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'changes'), 0)")
+        self.last_id = cursor.fetchone()[0]
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def read_data_version(self):
+        self.cursor.execute('PRAGMA data_version')
+        return self.cursor.fetchone()[0]
+
+    def poll(self):
+        data_version = self.read_data_version()
+        if data_version == self.data_version:
+            return
+        self.data_version = data_version
+        # 本实例写入线程的提交同样会改变 data_version，读出的记录中按来源过滤掉
+        self.cursor.execute('SELECT id, source, kind, item_id, action FROM changes WHERE id > ? ORDER BY id',
+                            (self.last_id,))
+        rows = self.cursor.fetchall()
+        if not rows:
+            return
+        # 编号是连续的，中间缺了说明落后太多，记录已被清除
+        gap = rows[0][0] != self.last_id + 1
+        self.last_id = rows[-1][0]
+        if gap:
+            self.reload_needed.emit()
+            return
+        changes = [(kind, item_id, action) for _, source, kind, item_id, action in rows if source != self.source]
+        if len(changes) > MAX_INCREMENTAL_CHANGES:
+            self.reload_needed.emit()
+        elif changes:
+            self.changed.emit(changes)
@@ -0,0 +1,73 @@
+import zlib
+
+# 笔记正文的存储编码：toHtml() 的输出有大量重复的头部和样式，
+# 用预置字典的 zlib 压缩后存为 BLOB，开头的魔数标明格式和字典版本
+# 没有魔数的 TEXT 是旧的未压缩内容，读取时原样返回
+MAGIC = b'\x00NZ'
+VERSION = 1
+COMPRESSION_LEVEL = 6
+
+# 预置字典：Qt 富文本 HTML 中反复出现的片段。zlib 对字典末尾的内容引用距离最短，
+# 所以最常见的段落样式放在最后。字典内容一旦发布就不能修改，需要调整时增加新版本
+ZDICT_V1 = (
+    '<a href="https://'
+    '<img src="attachment:'
+    '" width="'
+    '" height="'
+    '<hr />\n'
+    '<span style=" font-size:large; font-weight:600;">'
+    '<span style=" font-size:x-large; font-weight:600;">'
+    '<span style=" font-size:xx-large; font-weight:600;">'
+    '<h3 style=" margin-top:14px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+    '<h2 style=" margin-top:16px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+    '<h1 style=" margin-top:18px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+    '<span style=" text-decoration: line-through;">'
+    '<span style=" text-decoration: underline;">'
+    '<span style=" font-style:italic;">'
+    '<span style=" text-decoration: underline; color:#0000ff;">'
+    '<span style=" color:#'
+    '<span style=" background-color:#ffff00;">'
+    '<span style=" font-weight:600;">'
+    '</span></a></p>\n'
+    '</li></ol>\n'
+    '</li></ul>\n'
+    '<ol style="margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;">'
+    '<ul style="margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;">'
+    '<li style=" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+    '<p style=" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+    '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" "http://www.w3.org/TR/REC-html40/strict.dtd">\n'
+    '<html><head><meta name="qrichtext" content="1" /><style type="text/css">\n'
+    'p, li { white-space: pre-wrap; }\n'
+    '</style></head><body style=" font-family:\'微软雅黑\'; font-size:10pt; font-weight:400; font-style:normal;">\n'
+    '</p></body></html>'
+    '<p style="-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;"><br /></p>\n'
+    '</span></p>\n'
+    '<p style=" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">'
+).encode('utf-8')
+
+DICTIONARIES = {1: ZDICT_V1}
+
+
+def encode(content):
+    # 写入数据库前调用；空内容保持为空字符串
+    if not content:
+        return content
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS, zdict=DICTIONARIES[VERSION])
+    return MAGIC + bytes([VERSION]) + compressor.compress(content.encode('utf-8')) + compressor.flush()
+
+
+def decode(value):
+    # 从数据库读出后调用，兼容未压缩的旧内容
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if not value.startswith(MAGIC):
+        return value.decode('utf-8')
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS, zdict=DICTIONARIES[value[len(MAGIC)]])
+    return (decompressor.decompress(value[len(MAGIC) + 1:]) + decompressor.flush()).decode('utf-8')
+
+
+def is_encoded(value):
+    return isinstance(value, bytes) and value.startswith(MAGIC)
+
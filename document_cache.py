@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from PyQt5.QtCore import QObject
+
+import attachments
+
+# 缓存的文档总共最多占用多少内存（字节，估算值）
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+# 估算文档占用的内存：每个文档的固定开销，加上每个字符（含排版结果）的开销，再加上已载入的图片
+DOCUMENT_OVERHEAD = 16 * 1024
+BYTES_PER_CHARACTER = 16
+
+
+def estimate_size(document):
+    return DOCUMENT_OVERHEAD + document.characterCount() * BYTES_PER_CHARACTER + document.resource_bytes
+
+
+# 最近打开的笔记文档，按笔记 id 缓存。切换笔记时把缓存的文档直接换入编辑器，
+# 不再查询数据库、解析 HTML，每篇笔记保留各自的撤销历史
+# 超出内存上限时淘汰最久没有打开的文档；正在编辑的文档总是最近使用的，不会被淘汰
+class DocumentCache(QObject):
+
+    def __init__(self, cursor, max_bytes=MAX_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.cursor = cursor
+        self.max_bytes = max_bytes
+        self.documents = OrderedDict()  # 笔记 id -> 文档，最近使用的在末尾
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, note_id):
+        document = self.documents.get(note_id)
+        if document is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.documents.move_to_end(note_id)
+        return document
+
+    def create(self, note_id):
+        # 新建一个空文档放入缓存，由调用方填充内容
+        document = attachments.NoteDocument(self.cursor, self)
+        self.documents[note_id] = document
+        self.evict()
+        return document
+
+    def discard(self, note_id):
+        # 笔记被删除或数据库中的内容在编辑器之外被修改时调用
+        # 调用方负责先让编辑器换用其他文档
+        document = self.documents.pop(note_id, None)
+        if document is not None:
+            document.deleteLater()
+
+    def evict(self):
+        # 文档会随编辑和分段加载变大，每次都重新估算
+        total = sum(estimate_size(document) for document in self.documents.values())
+        while total > self.max_bytes and len(self.documents) > 1:
+            note_id, document = self.documents.popitem(last=False)
+            total -= estimate_size(document)
+            document.deleteLater()
+            self.evictions += 1
+
+    def stats(self):
+        # 命中率等统计，用于调整 MAX_CACHE_BYTES
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'documents': len(self.documents),
+            'bytes': sum(estimate_size(document) for document in self.documents.values()),
+        }
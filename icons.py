@@ -0,0 +1,17 @@
+import os
+from PyQt5.QtGui import QIcon
+
+# 图标以 .ico 文件的形式放在 resources 目录下，名称即文件名（如 'folder' 对应 resources/folder.ico）
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+# 已创建的图标缓存，树节点和工具栏按钮共用同一个 QIcon
+# QIcon 通过文件路径构造时不会立即读取图片，首次绘制时才解码，并且每个图标只解码一次
+_icon_cache = {}
+
+
+def get_icon(name):
+    icon = _icon_cache.get(name)
+    if icon is None:
+        icon = QIcon(os.path.join(ICON_DIR, name + '.ico'))
+        _icon_cache[name] = icon
+    return icon
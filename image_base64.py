@@ -1,104 +0,0 @@
-# image_base64.py
-
-# 应用程序图标
-app_icon_base64 = '''
-AAABAAEAMDAAAAAAIABTFgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAFhpJREFUeJzFmmmMZNd13393eVtVdXf1PkvPxtnI4TYcckRzkxhRpCVZlENJSGglso1IESAb2RRBDpLA+WIkgRMYNgQHiRJogUVJkCIZoqgxSWUokiI5pIccckhxhuRw9pnel6qu5W13yYfX00PZ8IfABnI/VHdV3657zrln+Z//eeLa6w/4NM1RUlKUBVorTFmQxHVUGGOdRSDwgPceawtcaZjYcA2Dw+OARwuFkAKlJFIKtNbU44CG8vzL3/0Ue268FttPEVJyZXk8AvAexPpn4L1D1yLePXmOf/MHX8MiMcbhncd5cHicE2u7QRvjKAuDWRNitd3i9tsO0Ov3OfHOeZrNJrkpq1Ocx5ocby1zsxcIwpgkqWMoUQhAglcYAWUp6OWW5547zt4DN6CTGkgJUoDwlQAeEGJNFg/Og7WgAxTgrcdhcc6vKeBwDvAC7zwe0FIpdKjxDnAQxxFhGHLDvmtptzvMLbVpDA5ijEEqCU7iEXhnWJy/wNbt1yKlqmSTEiEFUgic8xAGvPr6aY7//GXGNgxj04xev6Aocoq8JM1ysqyg1y/ophlZmtFLC7ppzlKrC1KBcwjhQYL0Eikrwb2T4CViz77bfJZVLpRnXQbqCY1ag9HJCQ7ccC2PH36WucUV6o0BrLXgHdYYhJQ4Zxkd2cSGTVsBh5QKIQRKSpRWaKVQQjIUaZJAYruX2TI2xsW2oZ1ZvFS4Nfd0XmDXLsF5j/WgpMBacM7hvQcvcM7ivcd5g3Me7YWorrbSizCMCcKY02cuIYXgIx/6AI8ffoa5pTb1Wh3jBVoIrLMoHbDSmieu1RkZmcDjkEKCgEBAoBU7hhWyaPP6mRnOz82yY2KWocYAK33H+IbtOO9Z6RU4ayiNpbQGawxlaTBlibEGayzeWayzlQLO4byt4k9KjZQWZzOUlMgkpsARBAHvnr2Ms46P3Hcvjz35FEurPZIkwVG5ifegFCwuXCKOa4RBhPU5/dJw44jl4OZhXjhxnhMX5+lmJQ7P6bkVxOwKysNo5HhrpkWrb9f8u7K091WAXglVIQQgEOI9vwPWg7julnt9lmWYdIVQRwxvHMblliKzGOspy5JdO6bYv28vjz/9HMutDkkSYXQEeYqzBu9LlAyIwojVrGD3+AAfvnEzz524wPl2ShxIAqmQSpFmKf2soChKtNZIHSDDBCGj9UxUBbh4T6C7tffgRaWgVJrhWoQWYR1Kh/cQxQmJCOg7S6g9gRRIEfLumUt4BHfffgvPHHmF1W6foDaEMDnWeExpQXsWu46dYwN85fP3c/j4aVIvGEiiKoE5hzElURgRRwn9PKPT6RGGGo1FBYoSjRAeIQRCSISQSCGr9xKkUAgpEUg21A2rq6toGQ4hun2UkMT1gCCRJC6ml/aRiUKVjpiQc5emMbbg/b9yK8+//CrLRYG2lihOkEKAN9y+c5Lfe+ggPz1+hrcvLHH91nFeemeaONIIL3AWLB4loRZFhIHGOYcQMJ44tu7Yw6UOaMm6K3kH1nm8AIEjLy1jdViaPsWlVh+twybWnkOrgKAeYmREFAaYwrLaT5FaIrSjGQ3RUfCLU+9y4IbreP7EObK+Q0tHFMVkZcmOiQb/84mjvH5mgcF6gpKCJJAoQEgBQtHPCtCCycE6rX6GtZZAB8yvdijPvMWibdDLM4SQOAFeerS12CwnLwrCMMAOSuZXOtRrCVpFIdicOAypR4o8TRBBHyMLlBPYwiK9JJmMyHTGzPkWcRCiA40UoJTCWMt4s049UvzkxfPsnpokzQqsdWiv0LHEWANUmUkpRV4ayrKo6rG1ALxz8SK/9c+/xNSObQQKkihkeLTJoR88jumm3PuB2ymzjK985U/WQ0RfOvk0EQXhwDBeOsKGImk7WlmJQ6JDiS8lTJRkZ1MiHdLu9clyh9aaIAhQQcgtW5sstVbxHorCUI9CBqOYB++9je8dfpE8y3E44ihCCklWGJRUVVH0HiUVtVrMXXs2c//990KWVUWhOcC7Pz+G2Fbjk5/8NV49cZKZhTmGGoN475C//k+/QDkwwczcHHPnO6SLy7R7q8hYEyQS07fEgzXK3JMuF6hAkBcG7wUq0CgpkAJeP7fA7EofJRV5WbJr0wQffN/19H3B+HCdvVsmEMBiq02kNXhLN83x3uGMAe8R1jI4MkK/16PbT1lNU2yaUVpDaj3zi0v82de+SZrlICrF9X/5x/fy0TsO8D+++yjHf/Y43emzJLUBRKHRNUEcxDQ2J/SyLlJIlJaUziOkrOqA1rRbbQYHQ9LSMVSLiFSVTd44c45GUudLn/sE7ZVV/s9zx7kwN8/pmRU6vYyBJKDTT9E6oF+UDI2MkpaWQigEHiUEEo+MIhbm5/n9L36JQ4efIYpCyrIkCkL08uIid08qbvvyP+LxD9/Nd//8L3jzyPPUyj7Chtg4Irc9zGqOVAIVBGRpgYw0pmNIZY5Skk7hKIynEYV85oE7IA4JrOPFN9/lm48fY8tgzI6pCTZPjXP0kcd48I6b+dQdt/H06yf57z89wmqrxee++K+5bv/NGGPwOgJnEMaR1Bs8+vVvkfdmSQYa9NM+aZ4RBBo92Ijo5ZaoWOXhmye4/+Yv8L3n/x4/PPQ0l998nby7RPmmhlCjtEQKVbkPkmQsJu+VlIVHhAoRJ6z2erQ7KbcfuIn9OzeTbN7IxblVfueT94AvQQcMD9U5sG0LvekOH3/gTv7rD59kcHKKucU+33rkx6S9HqVzWFPBhfnZZQKlaKUFQkqkEJRlSS/tIw6/9KofjAQ76obSCWoKolBzYsny3SNneOnZFzh1/Chx2WGoOUScJLS7KS4ZpD7Qob5R05nL6F0ucdaza8sG6kHAhuEGX/7Cw4wPRvzksaf4xAO3YpxAaI1OIk689DaqEBxfOMMfPPoq/+y/fZX+ahcAFQQIJVFSENVrnHryaf7y8Sc4dfIYEodzBrEGZbTGYowkCTXSKQpnsFaydxh+/2N7mL1rK0+8chvfeuTbtBeWCOI6KohQYUBnOiNPA8b2xeRLlnzVkBnJwQP7+fyv7uXshUucaPe4ae82hA6RHmSoAU9tpM5zx37Bf/yzJ/jtP/4Kk9s2kfd7SKXwbq2BcY5keJiZOOaa29/Psuky/8ZriEDhra2gyI2jgr1NTycr8N4yNNAgjgJ8EIAKGB2MeOiOPXzjD3+PqQ2jLLdWCMIIpEJHEb6vidLNjG2aJK7HzC61qMmMzVvHuGP/dt5/+y72XL8drxVCS0SouHRhkUefPMa/+MNvcM/Dn+bW999JurKIcAZvCrQSRLEmjiOWT7/JzOlDePM2Bx98CFuUaB2Q51nVoxjr8VTNQVEa8qIkCBSBrlJkrRZx6PmLvPhGn307NzIYwc6Ndcaisir1QuBLydS27US1BvVGna8/9hLPvfwuupYQxSHWeZyQqCgEB6+/cobxpMEH33cb93z4I+hunyGhaSAY1ppLL7/EsUd/RLo4T3HsG5w+dYRXfn6IgSHYcuAgebdLXKuhlEavpJqJIYE3BikVYRAAAikFUkqsNdy4Y4hWX5HECbmIKJxmNAmIxgfp9HMWTp9n+XKC8YJGUkPIkK8++gK337wTgUQJgaqH5KspLz13glarT5yEfOzgzYyajMl6HVGPycqCfmuVx/70Tzh29GV+7TOf4brNivHxDyL8IhN5j8994bP8288eodls4p1AlqaCrM458iJncaWFsRWoRYD3grFmwD0HJhloDFAWfbLmMBcXlmllhtrgAJsmhxlvREw0IgIMI81Bjp68zB9/+ymC4QZSeI6+cJLvffsZLp1bQAWS0lpiHdD72ZO88oPv8hff+TYzJ0+ye2oT27fuxvuAvaMT3H/3w4zUJrlp734+cvBOrqkpagN1nDUgQNdViqeOVIrBRhPwVd8tKvwtpcQ7QZ5bhptNtLfUQ8jrdXKhWepl9JeXqcUJmyfHaEjBzOIcY80GP3rmJHnhuTy7wol3ZxkdSPjULbvQQlJYSz2KeeHESX74v77J7PIKd91zF++/737mlntce8sdPP/qOxx54zSdbh+Al/7dcbYPKrzzXOEyqhtAILyj3+8RhSFKXaU/pJRIKcF7RoeHqoajvUpjZJjm1s1Mbt7I6IaNFN5x8sx5pJQEwlBTBUlQ8tizr/HGuRnigRqrTvCTty6y0ktpxBF/fuRFvvbUs+h6jev37WX6wnm++8h32LZxksHRCXppSqvbo18UlM6h4oQzM8tr/bFH4tFdk9C0jqRWQ2tNWeYIoQgDveZFAiElxlpGmkNIAa50LPW7qNygA48LPLV6RJ4VzC6uIBDUXUJHGOqJRytPoApqUY3zc9O84focKTJ+8spxpsbHCKMAWxqiOCLPUuanL+Gdph5HFGmfmvKUzkJp6Gd5xY7gKw5qommRUmGsJ4k1WkmcX+9GERKUlFhjGRqoV0pZw3AQMb+yUn2RDkhqQyivWV5ZRqJJhCIcaXJ5sQVZlyAMiII2K3OXeWF5jumVFbZtmEArhbUOh0c4iKKAY8dfY3LqGoaHhjClZaAWIa0gjiJcrcG0rxoepRQaETA0OIC1bo2u8BVC9FVwqzVtjbE06jXiKCB3hmBsA7IwKCGRnQ6LCysILdFaY0tPX8GAKBnYvBFZlvjFBVpLC7T7fdoehhp1pBRYaylsiZKqomU81CLF/PQ5dk3dgQYW2x28c/R7KdK79fgEj37kB09y7fZNbNw4xlhzgMGBBiMjQ+hatJaGHLVaTJaVjI4O06w36Pb6DIxlpEuLlL0cHVeFzRlfsXPKY/KSqJ6wvJri8x6BM+RZilZqnX4UUtLtdwmDYA2GF4Rao3SA6a7y2hu/YNPUVrTw9PMMKQVF1qu8QAic9+ivf+s7mNJTjzXNZpPxsTHGxobZNrWBrRsnmZwYo5bEJHHM5k1jNGoJC2nJpDC0k5ClzGGtg7XGGyERCKxxNIxEdXu0l1bAl+RFgVQK5yxKKYqyREhBFIQ479aaf48QniiK6HZaOLOJLK/6hSRK6HXbFSshJc46tDEFrfYKduuHWZ4/xcm3n2VwqInzFZhK4ph6rUZzoM4/eOADTA03Obd4jqXlLrWRMURT4IyhTFOcdVhTYkpDJ02ZX2kxODoIEbjFZVrGEEhZMXdKYoyhFiXrriukxHqHsJ4oCuj2V0nTDv/+d/4hh546ymtvn2N1tYXWCudcxcyFUcyte3ezumEL52dPsWPTCDddu5sjFzK0t9j+KoUXnOkF/OkPnkBrRXelxcluhzAZIB5sgs0JlEJLiZEC5ww379rGUqeg3+oSRAEzrTZTGyZpd3p4KiZCKwVUVKK/4tXeUxQl9XqCloI87VEUltVun8WlGYwtkUriXHXrUgL12gD6zDNkS2dZTj3HTi9BnlJmOUl9kCjQ6GKV1SynS0wcKnyZQ1hn4/3/hIXpy5x/602UMWwamWBqcgMDsWZ1eQZyQzq7SD/ts2F0hBt2bsMag17jUR0eJ/y6XwOkeUFZWoJA0+50+PFTL/PW6bN0VldQqipkXoBHoD2K185cQOPYtnkr27ZOMTw8Qa+9RC2ULC61OHn+EiMDCaoW0fMGITU7Ng1ybnGOzuxZoiQmiQL27tlNkZVMz3d48oXXcSbnV953DbPTK3jvmF9ZIVSSRr1eUeZXrO4qMkvKyrLOQ6fXxzrLYBixc8MYR491EEJVA4V1chG0QhAlDUa37GIgGiAabtLctJGJiRUG0nMEuaC+c4KhUBCFAXUp2di8jo8/cCcn55b5xqHDzPa63LBrCzeOC1554wK7agHJ1jGyomDm0lmUBCUV03MLNAcHSKIQ4xzvXc55nDPkeYVyS2ux1uKd59SF8yy2VgiCYI0IE+v/J+7/5L/y3c4K/e4CvU4PFQ0zvHEPplxi4cRh/sNnH+K3Pnkfs/MrPHv0OPVeRrvlePSVk9x/z4184qF7+P6jT/P8sVOcnJ4nc4rRRp32aotGLSGp1ZhfWmG53WawXqORJFjv1q3PGu3Y7vQw1sHa5MYJCd4R6oAw0PSyrKIYK1+DNSivN+27nUtvv8zihVcqHqZs0b2wSLuzxE3bN/DpBz9AWljGx0d5+NMfZ2lumZ88+SL9yHJ+Zg5rFXfvfx8TyWZ+1eTMdrpcXmrR7XXp9HocfesdTGkYGx4iDgKMtaxDMc+6IlVQ+jVeV6xB+ooQK0yJkhK/lqk81R4BiH279/giL6rm0lrwHussWgj+8+d/g303bEPi2bl7B9ZVmIkowKY5p8/PcOH8AksLOf3UIp0i0hIdVMVKeM8jhw/z7C9+wcRwE7029BCiyjwg1iC7J88L8tJQlCVcEfZKYHu/7jZCCK5GgUC306oZbwSKIFBYa0mtY/v4GHOLbc7+/DU+dOd+wnoDAg15CZ0UlUTsuXE3e/ZOUfQy2u2UhcUeC4sdur2SMrcoIbnv1pto9Vf46MFbePPsNK+eu4DzHqXVGqqs9AjDgH6Wr1tYCA04qtkX69iM9dc1NT710V/3p86eY25lGaUqFFqanLwo6fRSytJQjwI+fMdB7rpxDzbNeOnt82yeGOXhj93DwVv3Qj2GsqwOk6wN6zzWefr9HKUV5I7HDx3lzOw8j718nNn2KkkcckUiZx2tTm/dwn7dxhVGqyj3K8F7dUop/tMXv+yLPGd2eZm/PHGSmYUlhPDUoojmYJ2p8QnmVvs0ipSDDcHPZrtctCFJMkAoFXdfv43f/NhBbj94LbJRgyzFGIvwlQBSelCaXrvPoR+/SKRCzkwv8Ec/+jH1Rp1aHOG8pyhLuv0UIa72Ilcs75xDrRW9q6tyP93NMuIoJK7XaNTq/O5vfAjvLGPNBgf27UUqSZYX2LIAobizKMjykrS0YOH8zCxf+qNHqEXw23//Ph64az/jG0chUGsTOwtKEoQBUkm6acb/fuEImTH4bo+yKIjjhKI0CFHBDLc+ZvrlAvdXFQOB+MTHHvI6iGivtmm3V9gwNspEc4j77zhIP8u5NDvP7u1TXLNliovTM1hr2TgxjnGOF197k+//9DBzyy26vT6dTocbdmzjgwdv5n3X72LnlklGmgOoMODyxXkWppd55GfP8djLrzIxMgyI6rbWJpsIsRbkAmPN+qzMO7/WxPzVJRD799/m+2kO3jLaHKI0hsFand988KN8/4mfcnF2ll1bt/DZTzzIG++cpp7UCIKAHz39c4699XY1Ci1LjDEktTpOCPK8JFSK0cEBrp/axHVTG5kcbnKxtcpXDz2B9JYgjCpILeQvW/tKpnEefyWtOo9QEuHX5V77KRDX7rvBt1rt6hEDW12jsYbhgUHqSUwQaFa7fawzjDabGGO4MDNPaSz1JMK6qmIqpZFSrQecZ62aGotWijgMKIzFe0tly7XZ13ukulrc/NrjDe8td2Jdbv+ePWLf9Tf4heVltNZXx5tCYIxZ98Ur12tMxUmGQYCUa9P4NUvgr+aO9SMF64JYV7EdVx8t+Jt8+/9t6eperqYlqAqL1vqvb17LBN77q8JXH1wR+Zf2V2m++pu8Iqzn73T9dSnXD/87PulvOONvewvyb3+J/3/X/wWePnc9YkheTAAAAABJRU5ErkJggg=='''
-
-# 新建笔记图标
-new_note_icon_base64 = '''
-AAABAAEAMDAAAAAAIABLDwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADxJJREFUeJzNmmmQXFd1x3/n3vve656emZ59ZC3YwkYgBDLYJtiAsTEGHAJhSwhLEQyBIsRV2QpIhYIiLBVI4gBJIKmEwhgocCpUKq4ySxGwMXZhGxTjRZaRLFm7NDMazWhmenp779178uG1xp6ZHkk2X7hV70NXv77n/M92//ecFlVVHzwn995P/fAuXHseMYLym7dUFZ/007tpKyPPehHGWCTLMz3+4J34w/fj4hJeHILnNxKCCKpKnrVJNm1n/cWvws3se4Bw+H6SUoJXMHj4tZQvfitqgbD0WUVRDPLrAFBFgCROaB3ZxcnKIK5+ZBdRXMLrkqinvTmqIIoaQzCCEdvZsbCcqIegHRkC8vTgBBVKDhaP7MK51hzexBjyp6S8imKCECisIi5GXWF1224irXk0y1DACIiL0KQPkhgVQ/AeyTLAo8YAgtFz1UBBDKa9gBMD8pSVB+MDaiwSlxHfIswcxR0+hEwegblptDWPzbLC4sagUYz29GAGxvDrNmM3nU8YGQfpQdImqr7jkXPzisdiJeAUeYoJ67G5haSXEJrYR3dgdu3ATR5B0zoWRaxBjQUKy+JB0jYszCHHDmMe3YGWS5jzLsA/9wrMRVsItgdNmx39zw5CUBTBPQXNixgWh+9x2H0PEN33E3TqIE4V4gRKFVQFbwImKKJ0xAgighqLTyIEsD4QDu5GDv4K1j2T8JJXYS7YRsgyJOSoWM4lKuTQ9754TuZXBeMcNm2id/+A+OH7CDYUiquAhnMzwpPVKuIXaacEoH3pSzBXXIfaHkzWIhhz1v3OzQMhYKMSoXYCvnsLMvU4vqcHEywanlrZXfamBlDQJMKqp/yL20knjqG/8w587wCSZgXIM6yzQFQIiiQl8oUJov/6Om5qP7bcB2oJAmrM034KDwgmBIJaKA8SHdtH8p2vYhZOolHSKbtrrzN6QFUhKeFOnURu/TbamCCUK5h2E81z9HQ9f4rrdJ6qgliHj2IERYLH91Rwp44S3fpN/Fs+SF5KIOTIGrZeE4BqILIxjfoi2fe+Tf/cUUKpgvEZ+dj5uOoQ1sjTOvcKAEKuAV+bx04fIWDwBkQh7e3HnDyI3n4L9nXvRtXgjWJ0tbG6AwhgnWU+85y64zYunD6Ij/uoSMYvZ9ts/PBn6V+/kYXJCaJSqfDUOS8FEUKWY/t7GbSG+Y+8AacZGkDqbUxcQntGkb0PkT50L3rpNUizCWa1nK4ArIFWZti/4z6ed+ARJLYkRtlT89w9mfGH5R7u+OIneeS/v4eLzrkALS0R8AE2Xn4Z7/r7z6MYLJ6sVCU8/2VkkweIDu8lKvfi77sDv3kLpncdXtvIipBdBUABjPLgYwdYf2AnfZohpsTexRZ3TRVJ68QgqWfDs5/Jy/7yo9CuFwmpsqJOrt5dQ8D09LP7u//JzNFJLAZnhfkTTdpv+2O23vB5mtN7mP/SX5Hd/yPixiLtX95JuPYdSMuj4pZBWAZAVUmcZc/xaRaPHeEZi4dwkbBnIeOnJzw+SojUg4GQZcRjozz/de+EvNGpZ7o2AAFU0JAibozZfbs5fuhWjMBirUbphs9xqB5YuPnvePH1f4H5yBeYfu8VRPUa8thOuGQK7R9B8nQZCVwGwFrDYr3JnmOzbJ0/RDWk7GqUuHuqhVpDHDIaYgg+EPf0sP+un/DFK7eAzwBB5cy5oJ3SY12JfGGGwa3PodFow9s/xPq33cAGTdnx7Zv48b9/lkuGYmy9RogSTL2GPPYQ+eXXQdbuDkAVrFH2Tp4iNOs8ozHFnkXDnSebYB2x5igWoyDGkLVajGzZyhtu/Dd8axEjDj2j9SnCp9TDsYd/wff/+kNUawuUNj6LZ27ZhrQW8D7nRe/8EPu+/lEW/ulvqIxW8QSMdWSH9iKXvgJdcbAtAXDGMN9MOTozx7g2OXZigXtP5ATncOQElScSqKOQOEd5cAjfrGCEogZ2QyFFuVUUKfdSGRwmbcH4C19K0teHtpoQPLYyQO2eW+m97T+Q0f7igqWAjZCZSZifRQeGIM+XvOAK6yvGweTJGUJQaqcWOXi0SR47SkHx2M6R1bny+EBcLjOx6yG+8ttX4Wmg2Cf0Pu3hzjlnVMnFYvM2xsU0Z2tse/Nrue5jn0OzNhpypNJP/ZGfM3fj+4nSRcT1gPoOdzeY1iJ+dgqGxyDPloS4wkBCHpSZmXkiY1g4dYpcc6xYgj6h+OkfiTW0Gw3WX3wp7775f8jadQy28MDqwEesoTl3im9+4K3Udh9k81VX83v/8FUiA5q1kZ4BGvsfYfYz7yFu1SHp6XCsjkgBgkfnZ1bd4hyAMUKzmVOvZ5g4gtYCSGDNkqKKsYasXuPYzgfI0xZWpQsAQTXgSiVyn1M/OcvwCy7m9//5ZqKoREjnMeU+2hP7mP/ke4jmT0C5F7xfZoEghjgEfH2egBRiOjicKhgRFlpt2t4TS0yee8AidD+hNCguTpg7dJAf/u3HCSHreGkFABW8MzROTtI4NsuGi7fzB1/+OqVqH6FRQ+IK7dopZj/zJ5iJx5HeQdSnKx2IKHiRwlsoKoWxRAUHiojQbDYJpynBWS7bRQjVOe+Sy3jPt34GeLoT2wBY7r7p09zxiU9wxQf/jP5Nz8fXjmDiGI1jsscPoId3IZUq6vM1Za5VoJeqUDs9jVww1qCEjlKrvaBBcUnCxO5d/PjGj6BZvauAoBDFvRy4+4dceM1VpGnGvd/6Ai9++3vJ6jVu//KneOmrX4PEZcjbXbl/0YwptDAuxp+OnY5AJ1p8mXeSRgBbKhd0l7XIsmKMJV9c5OjDP0fzNhIsSxssockgSahNH6enOsAlb/wA+++5jR23fIMD99zByb37ueaNb2LRn24qdDGDgFEhFyFU+oobnOoS2GUncadcYysDxW2L0BWAGEPabDC2/VKu/8ZPT9uny5tFLt39lU9x1798ju9/+gbyxXmO7vgpJx47yuYrLydowHRXvZClUlBpDH5gCAmBJ7Nqd5p/RcaiCiEETHUQYtuhmSsv14oGjyslTDy8k9s+/kf4LMMSlltfClziEqZ2P4zNUh785r+iCnFfD70DMbkAqgQB1znoVi4VRYJAqQSD46j3PDku3GlZURx3jFbwdPqqyPwsWLvaPKpY56hPT7PzlpvQ5XsurdABFJUMcSmh3WgSArRqDfIalGfnEYk7rTGFLr4QDOrbZKObMP3D5D5HVnIhVaVSLmGMKS4VSYme0Q0szp7Auqi7f1UxkdBbrZKpds6N5au4fwgaMnI1bHvju0gG+gs7NReobrmE5qnjSNaEKC4I2epdwKfYTVvwSQlpNuBJ3QonIgRV+soxsbWkKlgvJOdvprH/USR0c2xhcQlKFjwafNdcCZ0XlaJfevWffpj+DduAGlBlYc+POPmx99Fr7BmuEDkkfYRnbS/CZ0WJN1DEfbmU0FcpYXyG+jYyMk607hn4POt+LoggxmDFYsQiZ3pM8TQW5gntk+R4Dv/v15j+87dSbRzDu6i79Y2FtEV64XbC6CZC3l6lSyeEwBpheKjK9NwCMQYJSnnrNrKJgyAe1NHpMxNQQjOlVQ9INI+epfWhCl4MFsUkwzz+nS+hX/koQ2UhN1VsyDp58GQDFd29tNSLe8HLybT7zGKJzHnvWTdS5cDRSbyC+JRobB3JRc+j9asHMGWLBMELuKTM8LbtbDxxgnJfBQ1heZ48SRcFTACxnnholJ0330h808cZHUpIcUUbsVsAmpi8MYdc/ruE89Yj7SYWi1/x6tI54IPSX445b2SAgxMzxFEEaUpl+3byE1Pkp05gkhhnI47u+D82X/lKLrjsZYhZi3YUNFI6Q448KrHra//I8Pe/yshoH21vsBq61wfroFUj3/Qc/OVXYdIijPMufHFZb1REaLVa3PPwXlJ1OG0TohJmbo7pO3+ApDWsjcla+dJc4EwroIhR2t4wbgPXnhcx1J+Q+e4dcUWLXlM7p9VfxbzlfWTVcWyWrrqJrfIAFMlcqVS4cOM4j+w/jkscmmVIdYjRl1zD1M9+BGmTqFyGcOZeSsEaoUlgkxVetb5Mr4O2D5g1WC7GQtamWRlEXv8u8sH1mHYdOpOerj9ZJlSEPM/YvGGM84b7SdMcayFkLRhbx/iV16GVKr7VxJsimVWXP0GLOwBAM8C4GK5db+mxOS3v11DeFBWtXadZGcG86XrydecjrRaIPaOvu9E/UM+2LZupVhLyzCM2QtM2OrKOsVe8FrfxArTVAs2QToP2Cct7vA3UFUad8ur1Mb3GkXtwK8JGEVQES0BaLSbHn0P+5vfjxzbimg06F+01le8OQAQfoOwML9i2hXK5RJ5lGOuQrI6We6i+/JX0/dbLMUmVLG0heVYQQSOIETJvWecyrt0QU3GQapELQQrec3py40JG7HNOuTI7n30V9vXXEw2NQKuNmuiMii+pu9aAQ1VxzlJv5zz4q/3M1uokUdFHVBUkidBGg/rBx0gP7UNP1dCQkwmMx45rN5SoRJ40GIwU54cJAcgRVYKJmC8Psr+6icVNz+Oii5/LaAx57ovxlJ5b3/uMExpVxVpD7pXdB45yeHIWtY7YFD0eNRHOObTdJJ2ZojV5HDs3zVXVlHHq5HknChRy48htTKtUYbayjunyKNM9wwxuHGf75nFKxuJXELVz8sDB735BxZg1iBSgAStFH39yZo7HD08wu9jGCDgrRYKJxbhiqGd8js3a2KxBHLKOFENuIlrO0TJlcoXe3phnbxhm4/BQ8ReCoEU+nWu/XoRMDc4n/dh0YVXX94kXiwkyuWfdyCAjA/1MzMxzeGqWWq1B7nOC8bi8GOR5Y0hdjLoYKObIPhQVqiSB4Z6I9WNDrB8bJI4isswXxFDO2BVeqRQEj4nLyNSee7X26F0kSXK2aU4xbRchcoYsQG2xxez8PHO1RWotT5ZmBA3Fe0AkShQ5SqUSA30Vhgb6qPaViMXi80DeaSic6yrUM1gJpO0Wla1XI96nevzB22kf3kkcOUQgnGV0VgABawxiLKpK5gN5nhdJ2PneWYtzDucsRgQNAR98MVp6Wn8zEGzIafuUZMN21l3yGkRVNQTP9N77WTzyCLa9gDnHzbVAU9hFihBCCgZ0empTHG5P3DOf5t8jihUgLydUNr6Q0YsuQ6zl/wHyH48X/A5FNgAAAABJRU5ErkJggg==
-'''
-
-# 新建文件夹图标
-new_folder_icon_base64 = '''
-AAABAAEAMDAAAAAAIACCDgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADklJREFUeJytmsuPXVdWxn9r7X3Ovbcedj0cv1Jux+3EOImdpgXtxI2QUKRut7oZIPEYMOBfiIQYMGCASEsMmCAkJEZINNBk0DBDQoime0ADEYPudIyT2Hn4UX7FVXa5Hq6695y9FoO9zy2/Y4ds6dS9vufes9e31ree2+LuzlOu7hci3SeJO8PEyqawuuGsjZzhCFpzRISgQq8ypmphZkLZOQkTtQDxEc978hWfSvDyR8QBZ23TWFw2rqzArTvCsFVaF9QFBSgCmTuOgDgqTj8aM5OJZ2eMhTlhehAAyc9HeBoc8qQWMAcVAOPaSssHV+HqTWWYhKCBGCBo1qJsy373RpgI5pDMaExIZgyCsW828cI+Yd9MBSjuT26NzwTQ3RSMWxstP7tgXL4VcA/UUYkCqCNAkPxNxIBMH++e4oArILgbhuAupATD5EDDgTnjKweV2cl6vPdn4XgsAL+LLv97ccQ7l5U2VfQjhJC3UAG9R/Myfp+lF8Bxyc/zDpKBeQHhjrkwbJyoLa8cMF4+EMnWkMda45EAOjNuNQ0/OdeyuFTTqwJVcNSBCEEclbyBIqiAixM6scd/MpgknSUgkWnpDsmBBO5C47A5ajk433DySKRfxceCeCiATvi1zSH/fsa5tVkxVQcAgjpRHUEIItvaFx9vsm2NbQI6jqOYeYk6gkH+t20DSim/3mmcmYkhr78YmB5UjwTxAICOd6t3hvzbaWdj1GOiIofDkAUNCrFoXgRUHNXyQwooL5YqRkjljRcFuZfo5IAJrTvJM6DWctTaGgkT1ZBvHA9MDx5uiXsAeNHV5qjlX3+eWN3qMVFnmoSQ+R40C6iAhkybAKAO4gQkv3cIrgAYmVruMo757k6yQqPOApYtkKDcEzYbZ0c95JuvRAZ1fMCx7wXg4CR+eHrE1ds1k5UiSg6R5FcpTjsGItkXxtboQqAULuFZ856VY2UfMxnTxiyD6T5vLFsjWf7dxtDYv3PI68cqIJZwnlfcFt4RMX5+vuHKrR6TfcXFs/AiRAUVy1pXIUr2BxVAoSLTjI7/ki3CXdrJFvDMdXFkTCVBNAvt7lSaI7Go0yRhUCuLKxWnLzS88ly8J0/ETvMiwo21hncXlX4v341BCBiV5g20lAVRyJTCCSqISrGCgci28u/2rCKcA4HsH53DauGZ5LCFpZwU3SCq0xpM1JF3Lzv754fsmq7xkrEzSQXcEz89D0hFECeoE3BCyMIHze+DQtRslaCSrUILJARHpSVoyp+LEQPEKIQIIQoxyFgRVRBioWLsnqugISfFKIJ2e4vjBH76ieNu2xTqktWF5YZrK4GJWgiUcCl6F7+L5sWRkO9JgMmpQB23fUM8EIo/mMHGuuPimGzTSFTQ4rhI9qMGB3NMS/D1EnhLBnSEuhKurgYWlxMHdgXcM0icxHtXQDXkeB68aJhx5Om0E1QIOKKJOgZ+9l9vs7m5joZszJyZnWSJnTtm+MVf+hqjUSK44R5IZB+g0Ew8Z+kgYIUYUZSkOWvHJDRd4DAQibx3ZcTCvIFo9oHlVefGaqBXaQag+YGioCrjSKNFW1Wl7N4Lf/bHf8JHZ/6HQ889R9O2mZWSNVbVNR+e+5ATv/I6f/CHv8/aWsBDF2mg9S4CQZuyP7hDa7C2lkGpCK45y7vneqsXhU9XleW1ll076gzgwpKTPBKL9gKa43wBIcFxzSVC3RPWV27w5999kwsfvcsPfvBPzM7O8rC1tHSD3/6d3+L9904TNOY6qFDDUcYR3BVX2Nrc4sSvfotTv/G73F43RErwcMXUEM/KbAlcWGrYtcOJrSWurkAVlM6tFZDAODHFUqAlGzE1XfPXf/lX7Bwkvv/9t6iqirW1NWKMwHamdHdmZ+f42+/9PZcXF4lVKFqUIriPs3JKLTiMRlu8+eZ32ffsYY597VVW1wwxCGK4K0kMF6hUuHZbMHPi6kZibSg59ko2k5b4rZ0GgF4Q6okeE30Ybm3x6984xZ49e2jbhhirh1oAYGFhgYWFhUfe75Z5DtN/872/49z777J34TBTs7sYueGp+FYpAmMQ1jeF2xst8eY6NEmpq6z5gJQKM5vQxdEobN5Z5S/+9I9YW1nm6pWLfHzmbf7hrbdwd1RlnEseEMzsgc+6JSIMhyOOHTvOG2+8QV3XtK3R69dcXTzPzOYm8/sOkJLnnsNKCBbYMmVpvSXe3CAnn7vbKHEELVnVqYOysr7Kf/zonxltbdEfDLiejPff/yCDfPq2erxUlR//+Ee89tprnDp1CrOEuFBVFdcuX8AJzO7eTxrm4CJuhCLsyh0hrg7v0pw4IgoUByohtGmdPXv3c/iFl/n47GmqqkeMRr/f/9yCdyvGSNu2nD59mlOnTkHunhFRqqri+uWLJBfmntmXQYy7PlgdOjoaeWnAfdzLqgiKl3reMUtMTigHDh1huDUskdIxs//3lVJCRDhz5kzWoQiqipSWNFYVN65eYOnTa8RYqlnP0XHYgDauaI4N2aTe6cBRg2AhV5gKzx89jnniszvVJ19mRl3XfPTROdbWVgkhZlk0F84qSgwV168ucuPGNWLUYiWhTRDFS6HVlb53rTGzVGhbOPzCS/T6fczSFwbA3anrmmvXrrG4eIm6rnEckZAtLQYOMUSWrl8hOeyc3ZszIbknGTfa3Aehi9YiwqiBZw98mdm53bRt89CI83lXCIH19XXOnj2XATjFFyXvo4IiVDGy/OkVbt74tDRTgsbKSV3fQS66rMAwAVPDRGhHxtz8PPsOHKIZjb5QAJCpdObMmfJcKWWJgivipUHACCFya+kKK8tL9OuATvQ6x5AytykPRMvYQ5HSNVU9OHzkxS/cAu5OVVV88MH7bG1tIiFndejYnicHRgCUqJFbN67RDm+icwNKfVIoU2J65+1ON/5wzOD5I8e/SB8eA6jrmvPnz7O8vESscmaX0hzlIcY2qFK3s7PXonNTEMVJbmWG6WBgbuOJQe5koRnBocMvMZiYJqVHZ9jPAyDGyPLyMhcvXqSuasy74Vhu2dwVRHOfgRCCsHd+gM5NCoM6kUzGzXeu13VsEbOAoYwa2L3/ILv27KVtvlg/EBFSatnYuIOEWCwvmChuOblmWygpCdMTkX1zk2ivDsxPO23K980ZNx3m3Wu+RqPE9PQECwuHaVNLCBFVRTWU1+79w67H3ctX0AoRKbmmULpM+1xk3AWPWmf/MxP064oIysF54fyNhHnMICxHo9z2SZ4uCNA6GuDo8RP88F/+kaBKm9qHcOLe0NxxV+7/0n0WsLZhamYXE4OdhaI5qLiAuWZfLPnq6IFpoEwl9s8pO/rOZuvUmj3fU0Zt3YStFQjK7VXjO7/5e6yt3eLSx+foDwaIWy5PpMwIJAdC9P5ZvyOexzVexujjOYwLqW154fhJpmd2szUcZjksYGOqCk0rzO2MHNqfAYiZu4jxzqUR75yPTPTCePIQg5RZaO6HY8g1Ul0JkxNw9r2z3F5ZYtCvEXdiGVWL5vIkSC4FvJTlWXtapiABd8HI0+nMc2XUJrY2NzP/XUgIyRTzPJBZ22r5ta/Oc/LlPVjX1IPwC3sjH11NDNuIxEyhZF46sawoTTl1N41xexX2f+kQG5sb3Lx5k14vIpIQCeNiTLuSfNybdkQKuBXBUfA47s4MGecgCHiJhoIyamFuKvLV5+fyiFEKydyFfhU4dgBGbcIRWitOnPIM3xK07oxS5qO7gFccPfoVZub30LaOap88o6tAazwEXGtcevkz766ISQCpEImIKkjANRTaZkvlPULxZBg2LSePzdPvVbki7bwkl8fCC3srFmZbNkdWJgRO62VaXE5TkjuNJxpgZE5jwpeff4npmd0MR1aOkQRPAbeAWznMSJqHty6kcdYXnNzb5lkoJCu/cyHhtACi3BnC4YUBxw/P3jNa3K4dihO++rzSr0ZZ0yb5wQ6N+Xh+n5KSLI9AmuSMUA4ePsrkzByjYcrg3RkZtAgtQhIhETEPhdueI4spyQWzvB+eOxErQMWFUQsTA+EbJ/aPA0W39C75cYepQeTkEWitIZmSLNOp9Zwr3CRrqnVSyv100zqtCQcPHWVqZhfDJhVua9Z8EsykWMDzkVJSkjnJrIzStXCebc173sus5Ttf38PMZO+BA8AHDzgcRIwPrzX85Bz06x5R8qQ4jge83Uh9e8Qu5CGYiHHxk3Osr65Qx3rsbPeuXJi5eOF3IKnnciEF2nHDIgzblm9/fTfHDs0/9PTyMUdMzrlrQ97+UAmxolJB1YrwpV8ugzgVz+GSnOjUnUvnP+TO6gqhqrh7XtS5nrti2hWRJaSWQw2VHO9bazn16m6OH57H3ND76PNIANCdCzuXlkf851lnZD0GVQmCKkg5VtIOyFhILxZxFi98wvr6TapQZUsolOE6lHNjLzVXPgzMTr01hF7P+fbJPRx+dgYzQ/VB4R8LYNsSsLIx5L/PGdfXavpRS8LKZ2UKoJ5PKbmrDZV8sHdl8WM2V1cIMeTCDAXvyuROaFACjQt3Rg0H9/T51ol9zO8clIOXRxeNn3nQ3Z3QmxtnFkecWVS22kBdhTxLLRRyKROFcsjhztgSVxfPs7G+RghV6awg0yoDaltl2DRMDZQTL83wyy8+g0p4ohP7J/qvBnk+AGCsbbW8t2icX1I2m4AGpQ5Z+9knyre9/DKnSq4vXmBrYxWN2SfMlWHrtGZMTwgvHdrJiaNz7JjsZas8gfBPDGAMZPxQZ2MrcXE5cWkZlu8IbZuPt7N/bJ/Wd1HI3Llx5RJ3Vm+jqlQ9YffsgKMHpjhycJrpif59ezzZeioAsK3YDgg4tzeMG6stS2vCyqawMXLaJNsHGUBVCROVoVtL7J6r+NLuKeZ3Dhj3vncdejzN+j+ItBvcZj2/zwAAAABJRU5ErkJggg==
-'''
-
-# 折叠图标
-collapse_icon_base64 = '''
-AAABAAEAMDAAAAAAIAC4DgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADn9JREFUeJzVmXl4VPW5xz9nm5nMTCDLJJCILAFFCEnYl4BhF/QKCOoV0VK1t9VqW32qtthHvT5afZ7W61LFrS7cpxe1VtkhgEBCgBBQthAWJSZISFiSSWaSOWfObOec+8cwQFgkWKv2++/85pz3+/u97/f9vr8j6LpuWZbFvyNEUUT8dw0+AfGHDuByYZoWsZiBZVmYpoX8QwfUEcSDNREEAafTgSBImKaBKEo/XgKWBaZpAhZ2uw1FsQEWBw7UsmLFJlYVb+bWmyf9+AiYpolpWiiKjNPpAuDY8UbWr9vOokUllJdX4vMHMI0IgiD+OAhYloVhmEiSiMuVBIioqsbatVtZvLiET9dto+7ICURJxOVy4vGk0NaqMnv2VIRgMPiDyFCiCAEcDhuyrGCaBpWVh1i2rIwVKzezb18N0WgMl8tBUpIDwzAxDAPDMMnwpLBly7vf/wkkUsRmk3E6HQAcOXKMtWsrWLKklK3bqmhrVXE47LjdTgRBQBBA00I4HAopnd0cqTvOnNuvIzs78/shYJpxFZFOpQAI+P1trF27jSVLSikp+Zy6unpAITWtEx5PyimiJrIs0tqmk901lft+PpW331uHLIncfPNEgH8dgYT0gUBSkh1JkolGo2zbVsWyZRtZvbqcffsPY8Q0JNnF4EH9SU52cKj6GFowjCSJSJKIz6eSP6Anr75wL+UVX1BbW8eQoXkUFhYQiUS+ewKGEZc+m03BZnMCUP3VEVYXl7NseRmffXYANeAHJDwZ6UwoKmTI4Ks4VF3PupI9aMEQsixjmiY+v8asaaP4/W9vxu12sGRFBWAyffq1uN0uNE37bggkUkSWJdzuuPR5vT5KS8tYvLiEsk27OX7sJGCR3KkTw4blMWXSICaNy+fwkSbefGc1O/fU4LArOBw2QqEIpmny6IMzmTtnAmCxc3cN+w4eISU1nRkzxmGaxj8no+26Y5IDQZQIhUKUle1g6dKNrF1bwRdfHsEyw8g2J/369WLk8GuYODafUcP70uht5eX5y1m8vAJRFOjcKV6wgYBOeloyTz12G+PG5tPc3EZqqptN5VWobX6mTZvIgNw+6Hr8pC6LwMW64/4DtaxauZnlK8rYtetL9GAAULiiWybDh1zF+KI8BuXn0KN7BkE9woKF63l7wac0ettITXEBAgA+n0pBXk/++OSd5PTqQktLAJtNocWnsqn8IIIgMXPWeCRJOi3BHSJwoe54/Hgj69ZvZ8mSUrZsqcTb5AWgc2oqw4cMYXzRAEaN7McVXdOw2WQEQWDj5v28/vYqtn1+CJfLQWZGJ6JRA8syaW0NMuPGkcx7+GaS7DZaW4OIooDTaad82wG+qmmgZ8/uTJ0yimg0giSJ30zgYt3x07VbWbJ0I+vWb6fmq6NADLvDRX7+1Vxb2J+xY3Lpe3U3bIqMrkcQJZHjJ30sWLiBxcsqaAuEyOqaQmqKHX9rGFWNYZomD//mJu6+cxJ6KIweiquQaZpYlkVJWRWxaJApU0aQlZWJqqpIknQ+gYt1x927v2T5ik2sWrmFyr3VRMIaCHZ69sxixLC+8RQp6EVqZzfhSBRNC2Ha482qeM0O3lqwhuqaEyQlORhUcAVul0LtYT9NTSrpHjdPzZvNhHEF+P0aghAfVCzLwm5XOHK0kW2fH8JmdzFr1oR4Hp9KudMEvqk7Ll22kYqKvfh9PkAk3ZPG4DEDGF+Uz8jhfcnumoppWeh6BG9zG4oikZbq5uChel5/ezWlZVUYhsUV2akMH5KNvy1MZeUJWvwqgwt68fSTd9KnV1daWlRk+cx4YpoWDoeN8q0HOXGiieHD4tofCodPpw+AbFlWu+645lR3LC39nLojxwGDJFcyQ4b0Z9yYAVw7uj+9c7KwyTJBPUxrIIhlWQgIpKa4ULUwb7yzmoV/34i3RcXpdDAiP4sBAzLZsbOBfQcaCUeizJo2knmP3EKSI57vZwcPIIoCQT1M6eZ9YMWYPr0Il8tJIKAiy9IZAna7je3bq1i8uJTi4nL2H6jFMsOIchJ9+lxJ4YhrGD92AHm5PUl2OwmHo+jBCEErjCgKYIHDbsPhsLG5fD/z/1pM1b6vURQbPXukMXFsDnaHRPGaao42tGKzifz2V9P52dzJ6KEwQb39jiZ23+m0U1n1NXv2HiY1zcP0GUWnhhih3Vr5pz99iqXLNhIMhkhKstOrZ1f69e3G2GvzGDmsL5kZnTAMC10P4/eriKKAKAqnayUlxUV9g5e33l3DqjU7CEUM0lLdDB6YReHIK/my2suS5bX4W4N0yezEE/NuY+LYAvyt8XyXxPOnWsuyUGSJ0k170VQ/E2dMIrd/b3Q9jHjOenlP5ZdoqoonIx3Lghn/MYIH7r0Bm6LQ1OTH59OQJBFRFJAk8bQ6uVwOTMPkw4838e7f1lFf34LT6SD3Gg9FY3rQtaub9SU17Nh1nKAepiCvB888cQd9crJp8avI0oXHccsCRZHwNrexeesBBEFm1sxxiKKEaZqIotRuvXD06AnrLy9/wHsLluHzB3C5nOTn9WLu7LGMKcwF4lY2seuKIuF2OdhZWctrbxVT8dkXSKJEl8xkhg3JZnBBV9RghJXF1dQcbiEajXDj9cN57JFbcSbZ4l5Hki4QehyGadI52cnaDbt4eN67dO+exZbyd/CkpxCNxhCEMykkiiJCNBqxZFlh375qXnhhIZ8sKkENBHC63RSNzmXu7eMZVJBDNBJDscn4fCrv/d96Pl5STiAQolMnJ3m5GQwbkk2XDDfVtc18ur6WE40BZEng/v+6nnvmTiYUjhCLGeelwLkwTRO3O4nHnvwby1aW8cv75/D6a39op/3tCGiaZhlG/E+CILF16x5efHEhq4rLCek6KSkpTJ5YwNzbJ/B13UlefWMl1bUncNjt9OjemcIR3ejRPQVRhN2VJ9hUfhS/XyMjI5nHfzebyRPO6PvZu3fh9IlLecPxFu6+7xV8vgDFq15m4sQRqGrwvGIXRfHMSJnoegk3uXpNOS++sJDSjTsxYjE8GemEQmF0PUqGx83QwdnkD8jEbpeJRA3KK46yc89xNDVEQV4Pnn58Dlf1yaa19fwXXzR9DJPUFBf/+34pzz3/ASNGFFCy4Y3Tje1ciOJZbjRxtJoWBOD6qWOYNGkEiz7ZwEsvvc+Bg4eRZZmB+R5GF15JWkoSlmXRFgizbkMt1TXNRKNRpt0wlD88cgtOpwN/a/CixXohSKKIFgyzcVMVWAYzpo/F6Txf+8/GeV4oQURVNQRBYPbsqYwfP5TC0fdw7FgzQwZn40l1Eo4YeL0axetqaGrSkGX4xd038It7phAOx9D18GUFn9D+PXsPU1l1mLR0D9OnJ7T/4s+56C8J6WxrC5CZmUZubg4hPURDQwBBFPC3hli0/At8Ph2HQ+aPT9zJYw/fiqqGiESilyzWc2FZcYUr3bwXTWulqGgQ/frloOuh85pXhwgkEL8VEMnP6wMYNHmDyJJAY5NGMBjFZpOwLPhkaTkffFyGw6HQuZPr9JTWoeCJa3+Tt43N5QntH48oiqcb5sVwyXkgIRwDB/ZFEGSavCrhqEFQj2KaFpIUj6Di8xo+2/kVwwb35idzJjBmVH8EQUDTdED4xl00DZNkl5OyLfupqT1GTu/uXHfdyHa+/58gIGKaBv379yI1LRmfL0QgEEHXIxgGdO5s4vGYnDhho7VNZPvOWnbsrqVw5DXMvX08I4ZejWlZaFoIQbgwEUGIN8kNZXsxYjpTp4yiS5eMC2r/ZRMQBYFIJEr37ln06JFFZWUNzc06QT0GgCKDM8miR/cYqibg9dpQVYHyioPs2PUVY8cM4I7bihiYn0MsahDU4yYw0RMSvv9w3Uk+21GN/ZTvt87x/ReN75IrBIjFDNxuF/3752AaEY6f1NCCUURRQFFMTBNiMXC7LHJyYrhcBsnJLsLhMCuLt/LLh97k8WcWcqjmGCmdXdhtCoZhnh6gHA6FzeUHaDzZxODB/Rg1Ko9wONSh/tEhqUg0kYEDrwag4VgbgUAEWRZQlLgBS9RKw1GRQECmpcXP7NuuY/qM8bT6AyxavIl7f/M6z/zpH9Q1eElNcaMoMtap9Nq4eR9gMGPGWJKSkohGjY6E1rGhPnHcBflXYbM7OHkygGFaKIqIJMVfJEnQ0CDhbZbx+3w89NAcXnrpEaLRKIsXb+CVVz+ioqKKhR+uZ/3GSm68fii33FRI/2u6s6V8P1X7DpPuyWTatCIM49Ke6XRsHbmdTuRpfUMTo0f/jLY2DUmSkCSLvn1jKDIcrZdobpZoa23lsXl38exzvz7d1V0uJ7qu8/ePPmX+/H+wa+dBALKzM7jrjgkcrjvJhx+tZ+asyXzy8fPout4hAqIodiyFBEEgHI6SnZVB75wriEQiQDx9ZAnq6iS8XpG2tlaefvo+nn3u1wS14KkBXUBVVQDuvmsGpSVvMn/+78nN7c2xY4089z8fs65kL7LiYObMcR3S/nYkOrrQNE0URWFAXm8ikdipAceivl7G2yyiaSrP//lBHn/852iaBme5z4QUBgIqNpvCAw/cRlnZX/nTnx/kqj7d8DY1kpXlYeqUQiKRS2v/2ejwzVzCDA4a2BeIF62uiwQCFqGQxit/eZT77/9PVFVrJ5PtXibHp6pAQCU52cnvHr2Ln9x5A++9t5S8vKtJS0shFApdlg3p8Bca0zRxuZxs317F5Ot+hc2mEIvFCIXCvP7aPO655ybUgIp0Edd4LhKjqcNx5ooyGNQvOTOcjXZ2+lIQBIFIJELv3t3weDpTX9+IXZFZsOC/uX329d9oeS/2PFmWiEZjhEKRU5cFl//ZusP/EASBaDRGenoKU6eMJDUlifc/ePZbBX/uc2VZ+lbBw2Wk0NkvjEZjqKpOVlYGqqpdVtF9l2g3Ul4OBCF+xfJtfP93icuqgbMR9/qxHzT4BMTLqfoEOnLD8H3h/wEo497WvAM0gAAAAABJRU5ErkJggg==
-'''
-
-# 文件夹栏
-folder_icon_base64 = """
-AAABAAEAMDAAAAAAIABFBwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAABwxJREFUeJzdmnuIXFcdxz+/c+a1Ozs7s4/JY7dUNxrtIkYatalGiUFqCxFC7R/a4qNIEUEKCpGCICIKBUsh6B+lSKBGpH+0EAKCFUVLW2y0DSG2+EhCUmPJGvPY5zzvPefnH3dvktmZOzObzaaNX7jM7r3n3vP9nvN7nXOvaAS89wAYYxAR3o3oxFO89+q9f1cTX4lYiDEGCcNQrbXvNKfrgnMOc6uMeieIyK0vQFRV32kia0GqVwNVpV+Nxpg1E1ot/n9nQFURES5dnuefp97CCCRJVVXSmTTbt01j7c2dha4m1Azhpz/6FhPuVUwqh6pvb6SQyVjOnpvj9J7H+eKDX8G5EGt7WucNQWIvIkIjUAb0PA/tHqFJFqF9ClRhIJvmxOkmr55/G+dCnAvXTMwY21di7TpMIqCSZnbJEeIgQUAjNMxVHAPjRaxN3bDRj824G/roSbEGPNDpUaqg6igW8hw78kfq1QqqHpHV+4IIGBFstsDue/cydfumniK6OHGcqomOBAEIOOcpj+X5+kdPUKkc53pzo6pijaG66Hj6+wd4aN8v+ND0VsQIxnQud7r4ABTzKWpNodZUArSjD8QiUEehMECplL9qabEQjdvQPgorrnmFwWyKYn6G557Zz7Ynnyaa/4SuV+aB+N9G4Dn4zAHe+P3PeO9ogE9+Rjc+q+Ifa/YK6bThzEXLtnse5asPP0ImFd250pzaBHjvEWPY/5MfMl09wH2fniJoKCLJ+S4m4H1sx63uLkQm6bXz9Y4DoUI6K/z25dP8beARvv3YD9DlEvpamNabFGMMJ8/MkJ05zH2f20Kt6lD1eK9th1v+DZ1HFTKDlpRVgtC3XA+cB4FM3mKl/XqnQ9VTqzruved95P5zmJNnZjDGtJU1bQIAqpUKxUHw9e52E49sOm1pNBq88MoMZy9CbsCievV6NmNZWKzwm5fP899FQy5nrlzvBd/wDOehWq22cOwoILav8fIGFoIhjO+dkIwV5peqHPzrB/nHyD7u+s4JXjjaJJMzOA82ZTh3YYlnT93N0dQ32P7om7x+ypPOCr6PKsz4kIXGEOPj5RaOXQWUSgWaMoI2Q4xJHifnIZ2zvHaizqE/V3jg87v52Cd28cTzbyPG4r2SGrT87liFF98MePjBPdz2/u3sP3QOk031rHKNEbQZEtgRSqVCbwEAqCefFTRbploLupbIIuCbIVOTRf7ypxe5c8dnOPXWDFs2DcKy02szZHqqxPPPPcvO3Xu4OLvEls2ZyON7GJExhkotwGfL5LMCHWqxNnbeewRIDW9kvtokZRKjP0agGcDWzZaD3/0Ad05l+eTkOX78tY2E9ZB0SmjWlY9vzfLLx+5gaqzJnjtm2ffAJoJqlCSToEDKCAvVkNTQxii8dojlbYksJjtYnGR2SZnYDAQkDpYRaDQ8e3dk2LvjNvBEUUbBqcGKx4WeL+0c5Mu73gMpQ1gPccsht5sCsTC3FDI0MtnCraX/9lPRU0fGJ5ldBGzvmC0C1apHvePY6Qa/PlonU7Q8cWiRsxeV+Zryq5cqeFUqiwHO9Y5AStT3pUUojk22cLsWbTMQj8poeTOXjwvEC5kePaYsBAFM357mzAXHzw8vsW0qxWsnGyw1PJ/9SA6vkVn0UyvFfc5WDaPliQT6HQVEkzI2voF/NXKgrndv18CifOGuHIs1T2HY0qxF5pRLR+uLVRV66phr5NhS3hBx6xBQEkPM6Ng4FTcEYdjDWFf0qUQLoYxQr0ROZ4VVkxcEXMiCH2J0ZCyxXZuAK7mgmKduRvDNELPK+liWq8p4wJRVjUH0DCP4RkggI1GFS3sO6Cgg6tEzmBHIlqnUAmy3eLdOsAYqtRDJbYy4dFqPkyAgjrfZ4QnmKyHWJueC9YAC1hrmKwHpwqYWTivRUUBMNl+aYHbJIbaP+vdGQkGsLOeAiRZOK5HgxMt+UJ7k8lLU6mbPAEa5vASl8eQcAAkCYmcZLU9wuWZBfOKm1nogygHKpapldHxzC6eV6C5grMxcI5voQOsK75lvZhmLc8BqBMQYGxul5gtoEN7UtzcigoYhVV9ipEsOgIRdiZhscThPXYcQaniVvnep14rIgpS6DlEaHmzhtBKJ2yreOwbSlszEpzhy/Cnu3rkFGtLfOnAtUCBrOfLKv8lM3M9ABrxzmITXYInb6/HpuYUaTz35PTbU/0BpANStrz+INczVDBdyu/jmvscpFQai8wkz0Pf7gTf+fobFhfnlDdMbR7iVTfRTKAzz4emp/m7pJUB1eUfuOvY61wT1KNIzePQ9A0mpfL3Q7+uqW/4Vk7mV+asqqdb997WIufkl9xUB7XvEq3+QyM3/XEFVr/3Yw16zalopJEmYJPy9vmj52OPq5zbuyoK+PXQlRaCr7a7nldJq0elzm/8B731mNSJIOCEAAAAASUVORK5CYII=
-"""
-
-# 笔记栏
-note_icon_base64 = """
-AAABAAEAMDAAAAAAIACiDAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADGlJREFUeJzNmmmMVud1x3/nee5913lnhtmAYTEGimyDIbGh2Iqr1CYxJYtVO06jJEqiru6ifumXSlE/tlLVSG3Vqo1d1YrUL/mQOLR1EjsD2ImDXQKdBgdsE2CAYZ0BZn+3uz2nH+47G7NjpPZId3R173ufe87/LM//nDuiqqoKI30nqPS/iwZlQPh/KSpIronifTtYtWUPIoI45/TWyR4q/SexfgbE/F+rubioI4lCivftonPX03gjfb1U+n+Oly2iqoDeoxfdsY7cI6+KxeYKVPtPMlpqxyv3n8T62Q+vvLr0cREwBoydVlo1ve9cei58CE8rODB+lnL/KTyCSmOxu1BeNT2shUw+XSeJIagjYT09B/A8NJODTA6slxoThZAkqZEr9o6CGFxQxlu51o0FnIKfQT0fUxnH9J+F632YW9eRiTEkqKNJlP7c+pDNQakF17Eet34Tbu0mKLZCHKbGGGGlxUPQuzDAuRTFfBa5dQ373nHs+VPI2BC4ZEb4GGQS2SiE2gQyPIBc/ADba9GWDtzWh0m2/yra2Q1hkHrMrCy0pP8Hf7/82HEOcnmkMoE58Qb2vWNIrQx+NjVKZDp5501iSUFWIImQMMQViiQ7HsPt2YcWmqBeW5ERy/eAOsgXMRffw3vjFWRoEHJ5yDdN58KdSkOaF8bMSOLGdeuhBR9xDu/4YVzfaZKnPoe7/yGoV5ad5Mv7lSrkCpjeN/EO/isyPgKFEiDTlWU+EQNhHTc6DLUKYszsyuRcel4oYcaH8Q/+C6b3x5ArLLzmig1QRXIF7Nuv4R/5LuL54PlpvC/2mBgkrCGbtlP42tfRhx4jKo+ncX5n1XFJuqbn4x/5Dvad11PvLsOIRUNI1KG5InrsEP7bP0TzxSmjFlUeIeMibmZaWfcXL1Pq3k4xHqX85kHqL34diYK5pVs1NSzfhHf0h2gmh9v9JNQqi+bEgndEHeQKjL/7M/yj34d8YeE4nyFOIZ+xXLhdYeRTL1Dq3oUb78cGFVo/+Xv4e59GqxNg53n15Pr5PP5b/465cDr1xGSoLdsAVYyfof/cBfI/+U9832PhJWYrn7NwpZJweMjwweHX+OWhb2OaO5BiBy68RTJwKQ2XBYFoXBeDfeMVpDwBngcLbLRzDFBVMp7l7MAIHHudtqRMbDxkGcjnLFwLLP9xZoxHvvYCT7zw5/zXy//Ev33pM5x56zDln75KcuoYki8uiiqq4Gexwzcxxw+lZdrN/35v9nNKxhquj1W5cfoX7BvtJ7SZNJyWUD5vhWt15fWrNfJdHXzsd/6E4pptbNv3FO+/9irvv/wNCiOnyRWa0MWUn1o0QXMF7PvH0B17cR1r0w3xjgIwywPGCEEU8YuLN9h8+yyZOECX4Ckp8sLlqtJzE2oTdR75/FcortlMMnENKhM8dOCrfPYP/5hMdQy1K9j8jUHqdeT0sQaHmuuFKQNUFc9azl4fxo0OsX78BtESoZMiD1drjp7BmCgIKK1t59Ev/jbEFYyfAeuRBDcZ+c6LjdhfTjbNeIGfxfadhonhRi4sYIC1lolylUu3xlhbu02hPoEzdtG1c1a4UlN6BhLEeMSVgJ3PfZlS91ZcWGtUsmbqJw6TnHpn6difIwrWQ8ZHMNcugpeZA4CBFH1rhCuDw4RRQmd5kMXo9ZTyVeVHA0maX1FIrquN3V/6XYir6a5rDC4OqB58CTF32dAIoA65dqHBtWbfNtCI/TBiYHicrDiaKyM4MfPaMJmwV2uOQwMx6sD3PGoTdXY+90Wa1/0KLqymoZdtpna8h/jU20ihaYXoN0QVjMXcup5S7zuAMCn6huGJCuUgIusi8mE1pQJ3WDBZKi/XHD0N5K0R4jCk0NXGni//PiQN9MWgcUjt4EvTtPpuxVqkPAr1KohlJrIGQEQYGavggEwS4iXhnOozifyVKvxoIMY5xQqIsdTLdXY++wVa1m/DBQ30c83UTvQQvXv07tGHBsUwEAQQNKj2DFw9EJxTJio1RAzGxRh16IzuaDLmr9YchwYTcIIVUBFcFFLsWMXumegjaBxSOfhSo2x/SA+IpP1DFM0B1ohAnCTUgnBeV0+HTSNhHanygDGWoFxnx29+gdaND8xAv0St9wjxu0eRQmlJ5rosG6b+zBYjIsRJQhQnGAEnXiP+wTGZsErPQDxLeURIopB8eyt7vtJAX1K+r0lM9XsvYlTnf+tKpZHI821mRgScU5wqokpkfWLroc7NqvPMVJ5p9Ld/9vlp9GnEfu9hopNvQfEeoC+S1v5MDs3m0/MZmKT7QDrQweAIvQwVv0DBKJcqyusDUVptZpZgEZI4Rf+JP/ozIEadQ6GB/kuNHfweDbNcgmtqTjs152ata1TBGosxaUMeG5+guIr+ckLPYAwqzC5cpF2aGJxL6P32tyjfGsA2tSP5Tmr/8wbRz99C7gX60EjgBNexBvzMnGpmUg5k8KzFOcUzcCbTxeGbMaJmrvIzH3aOo//wDb713JP89B//ituX+6i+8s9Lste7MUK7t8yqjJPipYM1Sz7nU67V8V3MaMtq4kwBO0/Zml5TCGtVrC/Uhm5y5G//GvPqSzyQj2HFnGcRSWK0qRm3YTMyP51OeVBzsZAmeJKQKbWQ7V6Pi6N5x34ihqge8MhX/4AtT34KzeY5sG0V2wsxEXLvhvPGQBjg7nsQbemEefRpkDloa25KSxKg6shueQD15ufgCLg4Zvv+Z3j+m9/n+Wf2s8VWCWxmisSt6FhINB1fJjsfQ+abZgCeiJA4x6pSnkIuQy2MMFGE37mG7Ib7CS+ew2SyswxR5/ByWZzxGP7mn1J487uEGYFwaGUIK4gxmEKRORXLGKhVSLY/hnZvgaA677DLA3DOkc34rO5ope/KINazaOIoPvwo8cA1NIpSOtwYn2sc4be0oed6yV47S+YTz6Sz0BVMuNOd3BDVa9RO/QxxMxAWgTjGNTUTP/40JNFcA2caMOmFDavbuTIwlH4rSGJsqYXiR/dSfudNyGSZqkfGovUaV0erDO95FhdFy1Z8UgwQiqVYHaHz/RNpnzI1WxWIQ+L9vwWrOqFWXTDUpnq0JHE0F7JsWNPG+Ss3yfoeGgZk799GPDZK7VQvJldIm4sGifvx3/wlmjA9sL0TpEmHyOxrIhA5KHpwYB1IWwknkm5+xkBlgvjx/eiDe9M56SJ5MmXAJCfauq6LwaFxavUAawwahRR37UbDOvVfvofJ5acezreUlgP2LBEgUmj1hAPdllYfgihJa5cRpFomevTjJE98psH/F59+zrrrnJLxPR7esg6dEdEaxzTteYL8jkeIwyCt8SK4JFnRgUsI4oS8OPavNjQbRz1MQAwGRWsV6nv24Z76fGOEsjQgswwQEaI4oXNVMw9tXkcUJ1MUW+OY4kf30vz4x8HzcGGwos9DRiB0UPSEA2s9Wn0lcGk7m00CKk649WufQ3/9WTQKpnNhCZkzpxARwihhc3cHcRxz5tINfM+mYR4G5DY/gN+xhuqpXupXLmKSJJ1Yz4zTO/YOmVTeh9/o9mjxU6ByGuOM5VzzRmp7Psmmh3dg6rV0918mMPNOmUQgjBK2bVyD9QwfXLiOIFhr0DDAFkuUPvYUucHr1M+fIRq4iqvXU7yMnfUdYFL5kuf49GpDm4SEoUKmwKXSRvrattKyfRcPbuyCSeVXIAuOyVIjYrZ0d1HK5Tjdd5WJWkDGs+nYL4nxu9bir+4mGR8lGrxBfPMG8fgISb2GRDE4Rww0Zyz71hUxxTx92VUMlbq4Wugkbm5n+/3r2NTeRBTNT1uWEun/wd/pYrGmqvieJYhizl8d4MrgCFGU4FkzRT2wFrE2nY5HAS6oQxCiLkYVCjkfP5tlggyBeBhr2NBe4sH17RRzOYIZubYSUUAuH35ZtT42Z1xxpxHGGDxrGKtUuTwwws3hMar1ML0nIEia01P8JlXIqRI7hzqlmLF0tZbYsKadtuYiiVMS5+5CeQFNIN+MDJ07rmOnj2BzxcYIe2E6oKpYa7DGUA9ChsarDI1XKFeq1IKIOE5wjV7ASJozuYxPqZCnvaWJtpYihVwW55S48ZH7LoIm7QiDCi07PoEkLtHbJ3uo9p/E+NklNw5NLcGY1BARSJwjihPiOCFp9AHGGHxr8TyLteksJ3EO12gJ73rWpY4kCijc9xG6PvI0oo3/txk5/99ULp/CBeVlkzJtlEsRaRxMdQOKNr4Y6azffRhRQLJNNG3cyaqtuxER/hf3JFkMAATG3AAAAABJRU5ErkJggg==
-"""
-
-# 高亮模式
-highlight_icon_base64 = """
-AAABAAEAMDAAAAAAIADsDQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADbNJREFUeJy1mnmUVdWVxn/n3OlNVVCAWIAoCqgomkDEIYoRsW3AKbZpjLjUVtu0U7Q1tkk02GjURMUY4hACrd1tEls0LtRuIzagqB0FaUQQEGRBK8UgQ1FU1X3v3fHs/uPVIFBVUAp7rbveq3Vv7XO+e/b59v72eSoMQ+EgmUjFtVLqYA2BnabpQXMuYhABrfVBG+PgeQZcN0M2lzuYQ3x1AMaYLu6leJ7HGy+/wAN33ITneW3h1JGJSJf3u7KvBEApTTaX63RQEUFrzdqVy1m4YC50sQdEBMd1cVz3q0yl+wCUUoRhmXWrV2HbdpfPZrJZqnr07PS+iGDbNls3b2Tb5k1orbu9Et0CYIzB9Ty+2FjHZWePYtnihWQyGUwnRFAulWhs2NnxCoigtcIYw/WXjOOl38/E8zyM6R6pdAuA1pqgVGLosOM59axzmPqzHyGAtqzdnlNKkyQJp3xnLH979Q2YJAF2f7NpmpLJZJn19G/ZuqmOiy+/ljhOus1YqlQqdWvNjDFkMhnqPlvPBaOO4c4Hf80V19+C7/sopRBjUFqjtSabzQIQBAHGpBhjUChQCs/z2LThMy46eRg/nPwA1956J77fjGV1HZZ7WveeprIK5XKZQYOHcvPd99O4s540SRBjyFdX0xosURiwc8cO0jQhV8iTzxeg5W6pVAIRtm/ZzFnjL+T7195EEIRobXU6bmfW5QqISKdZVETIZLOkSYrjVN7DiqVLmf/6PFZ+9CE7t31OWGpEjMHx8lT1qmXQ0GGcOXYMp485k2yuQBRF2I5LFAaV1elgrH1l804BKKWwLJswDNBa7+VARDDGUCgUWLpoIY//8jE2rJnP8UPqGXkCDD0CelUrtFj4TZoNdYpla1KWfGqRZo7n8h/cwPevvookEaIoagmdvfeJ4zgorUmTZP8BKKWIo5ByqUzf2lrCKCKJorbN2roy2azHtAcf4vnp9zJxQsgV34M+A1uiMhEwVCalAWyIM8TbPOYuDHjieZ8+gycwdcZ0+hzan3KptJt/ESGfz+M3N1MuFanq0bNDit1ry5u0kkU/XrKYCSOOZtp9dxOHAflCYTcH2azLT2+6ldf+7S6enV7DbY/dR59hP8Y0aNIGg/EFUxZMCYwPqZ+QRk041Q1MGOvwyrRaBqg5TBo/ni11n+NlshhjEBFc1yOfzzPvv17m/G8N43eP/JxMJkOHdVupVJKOruamJpn1zHQZPbivnDmkVubMfkGSJJGmxkYREZk65T4592ik8X+HishaiUXEiIhZcarIQkQWO2IW6bZLPmi5FitJ3rMkeaOnyHv95P5LHTn/tFPEb9olpVJJwjCUz9etlb87/2w5oUbLPT+8TjZ+/n8SBIEUi8W95tkp6dqOw8Sr/4H/XLyaMed9l3VrVgGQyxdY+PYCXnz6IZ7+lUX18GkkMgTbBCgTQvxFhWxEUBYoB9SXqwRRWI5BVftEDSF339yHPmoRD//zvWSzWSzbZvsXW3Bdjz/OW8i9v5nBof0PI03TDjdylyyUpgmul8F1HIRKZvVch8vGnc+4Ef/NNTcPIum/HtupOJaNk1Eb70csB3RKOVTceE8VZ46KuObyMqaoaMtTWkj8DFZUYNN24bKfJUyf/RbHDD+BNE3xXBcBir7fIYm0Wpdpz7JskjjG93385mayuRzvvf0ujVveYdIlNqZ+FzpaDslOZNsz0DgPtMakgsoJf17gsmpxhk/WOns7Nwo7FxLHCYcdYXPWN5v4w8xnsC2LKAwp+j6lYhHLsroURPvM2xU6tVCqEhlzXn6NM04KyPRWSLgLvXoMLD0awnXQeyKkBm0p4qJi7lsZLjjKprpnChbsRSJK0NkICQwXj8nz0cL5NO5qwPXctmy+L9vvwsOybOI4ZM3HHzB6FEhsQFtgGkDqUdt/h9pwO6nWqHzC/EU2VU0eg3spLM9AJy9RezESGY47ysOO61izajWe27V+6BKASVPSNCFt+WzlZNu2qd9eT6lpE0cOVKgYtBLAAmVBUg9KV+Zp4KU3PC462qWYCD17GIQOVkAUyjKkImTyFodUB6xfu75yq+Xhyjzarz2B7VUL5QuF3f5OjSEol7AsC7+5CFKkulpB2uqo5VNZGCPorLBylU3Dxgynj7R4c2XCsJ6CAuwOSh2lBMGADb2qUuq3b21xK7sVhK0WRTFJErftC3t3Z4q5r87mi80bcVyPOAo5ZfQYBg0Z2rYSSoHuMByk8oY9+I/XXc4e6KJdRUMsFKqFKIEgVFTnWgCntIdVy6fWYFLT8l1TLpV47cXnKJfLaKVRWjFm/AXU9O5DkiQopXYHIMbw0rMzWPPxMnKFAo0NDWRzOYYedzxRHJHJeIi4lMtCj5571kZgebCtTrNqWYYbJtikjYLRhqdm5pn1R0UYKmr7J/zyx81knMr/KAFEgYHmsqaqZ08ALNumadtW/v3xqZRLPtqySZOYY4efyCGH1hLH8d4AlNZMe+4V0jgGpVCAZTsE5TJKa3of0hs325fN2zZSO1AjobSJLWPAygl/et5jeLXHgBrFrq3C7d/OECRZ8i6s3iA8takJUa2BJ4ix0EphAsP2RofDBx0BQBzHHNr/MGa982GLIKoIJ601YRi2MdRum1hEMGmKtm20tipVYJqAUqRJQi5foN+g4/hwBYirdtuU2oawUfHuexkmjXQgBa8a+g1UDDoKBh6uWLAp5sLzy2RrBJMolAIT21iWZuO2GD/uwzHDjiFJKsrMmLSyF2wb3SJ09qxKO6RRk6ZIi4L6UoQDMHrsOSx4X6Fi1bYX0hRUXnj9HQd7l0fPnGLtNmFHSSiHgMCnnxpWScAlY2PEV2jdwjKBg8pq3lpcovbIkfQfeBhhGLZtUhGDSVOMSRFj9tLXHQJQqiL7vpwBtbaI4phzL/hrtuw6kuVLU1S+EjpKAQn06w1JVcRP/9LElEXN3PJakaZYyGjFrGUJo8eUqT7EYGJQWpDYRicOJoLZCwwXTrwUpfbsTFTm0TqnPW2/ElmrwygM6NO3lvMmXsPUGQZsuyLqNVBWnDIi5ve/3sX0h3bxyORGMp5Q5Sq2bhSWBAGTxkdIqb0eipuz2NUWL85pJs2PZMLFFxEEQUv4dN44238AIpWCzvXwMhm0tgiDkOv+8Ua2+iN47rkYq5ciTQAFElV42ctAFClcrajx4IWPEk48LaB2oMGECqWFpJTBUR6bNwnTZqXcMeVeMtkcSRJj2za5fL49bL4KABEDSlMoVPHF5jrWr/kE27aJ44hCdQ0PPPEbHnumwOplFlZVeygZqbBiQ5Mi72jKDYo36wOuvCBEwkrmNbGN+DnEtrjt4R2cd/ltfOfccfh+M47j0diwk5VLl5DPF/Cy2U77Tp0CEBE8L4tlaZ596jHOG3ksz//LE7iui1KKYnMzJ337DK6/8wFunRxRLtlgt5cKSgs7GhWH2BZzVqYcfmLAkKEpEoBGkezK41Q7PDRzJ/Q+h5/8fAqlcgkA13VYu2oFl551Mv907SS21H1eUYOdrcSeCsf3fYnjWFavWC7jRwyVUf0LMuPRX0hjQ0PlmRZV5Pu+iIjccNkVcvtFiKx2JHlfS7JQi6xS8qdHPLnn5P7yg28eKov/4IhZriX9QEk0t0rkrb4y78EectqQw2XjZ+sljmPxfV9KpZIUi0UJgkDenfe6fPe0E+SEXq48N/NJSdNUfL9534pMUWGhJI45few4Zi9cwXW3/wSvtSZpYQKlIIoiHnz8UT5cexyvvpxi9WzfD36TxZufGqoHB5x0YoKUBQlcdOJR3yDcOyNg8sOPMeCIIwnK5bbEpJTCpClnjB3Hi+98yK333P+lnul+KjIRwfU8bMsiSVKCoFRJbHvQWJokFKqqePP1PzPl5kt45V9TeuRStCf85X2Xe6bl+dVdPt84MSYtatKd1bjVLnc8WI8MuJpHZ87A930sa+8qL01TLMtqK+ZKpVL3JGVbVt6HIkrTlEKhwI2TrqKf/SyT73GgwYAHJFRoKRGMn0ObPEs+Drn9yWpmzf8fevetJY4iVGfCRYS0peHVmbjptLWolMLaR/u88lyl5L7+Rzdz08RX+eTquL2ibKm6tQJlNI4bs/6zJr533S3UDhiI39zc9RgtarAr63ZvdE/TuqJhh31jBAOOGEq/oSM57lunUi4VAYVtWTQ1N7Fu/ToUkNbNZvRfnVspzQ/A2dnXBgDtnTrXcRh87FGMPG0UfnMTSikc22ZHfT2RMiiEtYs8LMvp8tSmO3ZAALSaiBCWA4p+kbJfRClFZNuUiyWiMEQhGCPs2QP9OnZAAUB7za5aejlf/t5CwF/5QK8jO2AhZGmN43kEpWILa7XztmltDqQJmkp370CBOCDnxCIVqhs+chTLFr2L47qIMYgxaK3Ytm0bbibL1rr11NTUMHDQUbupqq9jBwSA1po4Tph4zY1sXLeGd+e8TJ9+h5GvqmJ7/U6aimVMFLBk7itMvPZGsrlcp/3+7lq3z8g6M2NS8vkC8197hbuuv4ozxl3IkcNHsqGujvotdSx7+w0umjiJu6Y+SRgEB+z3EwcMALSDWL5kEb/9xRTWfboabWlqanrzN1f+PZdceR1hGHR5dNVdO6AAoKKnc4UCCthZv4M4iqjp0xfXsSuHexzYX6+oIAhkf+Xb/lrFn+A4HkorkjgiTc0+y4Lumtaa/wf8Z0yCMCkPIwAAAABJRU5ErkJggg==
-"""
-
-# 粗体
-bold_icon_base64 = """
-AAABAAEAMDAAAAAAIAC4CAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAACH9JREFUeJy9WU9IVN8X/9z73psZdfzOgKQyEuJEWpgMkii1iFoW2aI/ZgRibWzTwhDatCqiiGpRtqiNkZGIRWATOEULq03QJpXUMiNx+mNW6oxNM+/P+S3qvuY5f5wZ/fWBSyPdP+fcc87nnHMf6B9B13UyDIO+fPlCu3fvpvz8fLLZbKQoSlbDZrORw+GgHTt20Js3bwj/UgEion379hEAYowRgBWNTZs2ESMiwv8ZRATGGL59+4by8nL8+vULhmFgJUdzzmEYBuRshFgp8vLy4HK5sLi4CJvNBsMwMl5LRNB13fzbMAwwxpDWhXRdJ03TVuw+hmGY+1y/fn3FrhM/UrqQMHu8xrlCmJsxBsYYBgcH8eTJE6iquuxawzAgSRKGh4fh9/vNvQSSKiCEDwaDOHfuHJ4/f45oNJq1G3HOoes6Tp8+jYMHDyIWi0GSJEiSlNU+AHD//n3s3bsXsixD0zSLsAluYxgGTU9Pk9frXRUzO51OevTokcWlVFXNaEQiEVJVlbq6uggAybJs3X+pAsJX29raCADZ7XbinOc8JEkyD+7o6KCRkRGKRqMZx4+qqkREdOvWraQKpHShmpoajI6OAkjt/5xz06/TgTEGwzCg6zokSUJFRQUKCgrSzv3vv//w4MEDuFwuMMbQ3d2NlpaWBBey0KjwfSKCpmkwDAOc85TC5xLYuq5jYmJi2Xk2mw2api17ORnngXiIW/J6vfD5fMjPz09grXhomob5+XlMTU3h3bt3iEajAABFUSzcLvYmIjidzmWFz0kBcfPt7e04e/Ys8vLyMl5rGAbev38Pv9+PK1euYHJyEpIkWZQQCmRs3aUJRzBRVVUVASDOuRkw4rfX6zXnqqpKmqaRpmlJWUT8n6iFBH78+EFNTU0JZ4gaye120+zsrDk/VRAnd/AUEPFQV1cHxhg0TYMsyya3J+N3wRHxN6uqKtxuN3p6erBt2zYzWeWCrBQQcDgcSZMaYwyyLCcMSZJMf+acQ1EUaJoGzjkuX74MSZJyrrVyCmIhrIBgq9HRUfT09JgCybIMl8uFyspKbN++HXa73Qx2WZZhGAY2b96M2tpavHz5EpzzrBRhjOWuQDzEoUNDQzhz5kzSOT6fD36/H2VlZaYSQvGamhpTARHQS+lbrIm3pGEYublQKtjtdsiybP4rht1ux6tXr9DX1wfGmIV1iAgOhyNhr1gsZin2amtrQURQVRWSJMEwDLhcrtVVQAi0dMRiMQBAcXGxZa640enpactazjnC4TDevn1rBn1NTQ2uXr0Kl8sFXddRUVGB3t7e7GhUUFhLS4ulThH1U29vb9Jizm6309GjRykSiVjO0HWd5ufnac2aNRYKFee0trYSEVE0GjXXBYNBevHiBS0sLBAR0arEgPDXLVu24M6dOxZWKSwsxIYNG+D1epOuu3jxIr5+/WpJaIKhuru70dTUhJ07d5otqMfjgcfjAfCnRlsNC2SC+ESm6zqpqkqdnZ2kKApJkpTQ5DPGiDFGhYWFdO/ePdNioksUsqaMAVFpZgMRZPFjaVEo2OTnz58YGBiAqqqm7y/dizGGUCiE5uZmzMzMmDJZ8koqYcLhcNoCLRkYY1AUxTJkWTbp0WzEAbNcvnTpUspMLM632+0JRZ8Aj58M/O32z58/j4KCAsuhy0FVVYRCIYTDYYTDYYRCISwuLgIAJEkyE1V8yX7ixAl0dHSYvUIyJdJepGEYFv+ML7wGBgZIURTinBNjbFkWevjwIZWUlFBZWRmVlpZSaWkplZWVkc/no7a2NhofH0+INV3XaWFhgYqLixMevMTvgoICCgaDlrUCZhDPzs5SJBIxJ4m2r7293Qzg5RS4e/du2t64uLiYPnz4QPGXJtYeOnQoodrMRAE+MzODpqYmVFZWorq6Gjdu3ABjzEzVx44dS9p4JIMIMlmWzSTFOQfnHA6HAzMzMwgEAmYZEe8iVVVVGblpwpmtra3o6+vD9+/fMTk5iba2Njx9+hSy/DtFeL1elJeXmxkyHQRDxA+hgBC4sLAw6TpxXtYKPH782KQlm80GxhgCgQCA3wEtyzKcTmdGm8ViMWiahmg0Ck3TLCMWi6G+vh67du0CESUE7MePH3NSQBaNiRA4FSeng2CI8vJy7N+/3yy2gN9uVVRUhPr6ehw4cCChfxbM9OzZM1OGrBRYTrhMIFyroaEBfX19aefGC6+qKhRFQSAQwPDwcE4vHTk5nqZpSa1CKZpxMVe4qngjUhQFoVAI7e3tWWd9gawUEIIMDQ2ZDKOqasaHi5JCjGAwiMOHD2N0dDTnd6as+gFd18E5x8jICDo7O83+NlkfnK43npycxIULF1BXV4fBwcGchQcytIDgdFECcM5x/Phx+P1+NDQ0wOl0mtZZ6lqMMcRiMczNzeHTp08YHx/H69evEYlEAOT+wpeVAsLnlyazQCBgUm62EEyVqfCpyCYjBdxuN9xut4UehRDxjDI3N/d70z+ZONmhgqozyezAX+sripK7An6/3/pRIQmi0SjGxsZw+/ZtdHV1AfjL8akEWw6yLENVVaxbtw5FRUXJq9L44kn8PnnypOXjQrbo7+8np9O5at/B+vv7LYVfPJJaID8/32SObCCeQRobG3Hz5k0cOXIkaWbPBLIsY/369Th16hQaGxuTlh8AwGRZJuEeorHes2cPmpubzTeY5cAYg8/nQ3V1tZnMJEnC58+fc2YYSZJQUlICAJaWNJmmq2JmRVHo2rVrRPT3O9tqYLnPvExRFFr6uTPbhl5k5Ly8PExMTMDj8ZitKGXZVwOJz4jpIOu6nkB52ZpdZOhIJIKpqSl4PB4z4eVS42R1eVu3bs2oWUm7yZ9sunbtWmzcuHHF+2WFsbEx8vl85kMSsvR9xhhxzqmkpIQCgYAZA/8K/wPBLyVnG205tgAAAABJRU5ErkJggg=="""
-
-# 斜体
-italic_icon_base64 = """
-AAABAAEAMDAAAAAAIAD3AwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAA75JREFUeJztmr9KK08Uxz+zO8GYiIqNlRGtxCJKIIoKNgo2eYJ0Nj6Kb2BhJ/oAvoAggiYRIaZVgmgpVprECNmdc4sfu+iPG91Ndm9u4B44xS7z53tyvme+M7NRxWJRGGJTwFAHoG3bHjSGvmzoM2ANGkC/9i+AQZsO20EphVIKkfhKJ8zYf2URh/mBAmfAsiyMMczPz3N4eMjExASWZaGU6trHdV3a7TbJZBKtv5/KcRxEhJOTEw4ODvz5fsQVJgCAQqHA9vY2qVQKy7K6ulKKqakpNjc3mZ6eRimFbdtd2yeTSVZXV1ldXf0yXxCTIG7btgByfHwsr6+vkk6nf+yzt7cnxhhZWlr6sW0ul5NOpyO7u7sCiNY6EK5AFFJK4bouiUSCra0t7u/vabVa2Lb92zTbto3ruuzs7NBsNnl4eOha/FprHMehUCigtaZarQIEog+EXIW01ry8vHB6etoVkFIKx3HQWpPP56nVajQaja6cFhFEBMdxqNVq3N3dhV7lAqUKEKWUjI6Oim3bopT6bRvLsgSQubk5ERHZ398PRAnbtiWZTAbG4nmoDIgI7Xb72zbeqrS8vAxApVLx+35nruvium4YOEAPSvzdsvnZ1tfXERFqtRoQTJyCjv1/C52279yjVqlUknq97lMqLo90L+QV3/j4ONlslnK5jDGGOM8ckQbgic/i4iLpdJrLy0ugd2oEmjPKwTygKysrANzc3ADhNmdhLdIAPKAbGxs0Gg3u7u6A4KLU87xRuFe8Wmt5enqSi4uLL+/j8sgy4NFndnaWmZkZSqUSQKwFDBFS6LOAKaUol8tAvPyHGAJYW1vDGMPt7S0QfwAQcQ2Uy2Wp1+v+81DUgCdgk5OTZLNZKpUKIoJt28NBIU/AFhYWSKVSfgHHKWD+3FEM4gHN5/MAXF9fA/Gv/xBRAJ8F7O3tzRewP1HAEFExaa3l8fFRzs/P/yuumHehnvedAY//mUyGTCbjr/9hbhX6mr/fAQYlYJ5FFkAvJ7CorCfR8tzjuidglmX57+MWMXqpAU+0PDfG+Cewq6srjDH++z+RhdC30yJCKpUikUj4d0ArKyuMjIxQrVYZGxsjkUggIrRaLTqdThy4v2IK4h5VcrmcNJtNeX9/l/f3d2m1WuI4joiIfHx8SKvVkmazKcYYOTs786kUF50CZ8Cjw/PzM0dHR4yMjGCMQSmFMQbXddFa+89eRrx+cdHpr/w+EMZ6+kIT9JQlIj3dtoXCw5BnYOg/8g19AP/+ajBo08VicdAY+rJfnTsOSSa06bMAAAAASUVORK5CYII="""
-
-# 下划线
-underline_icon_base64 = """
-AAABAAEAMDAAAAAAIACvDQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADXZJREFUeJydmmuMXdV1x39rn3Mf43ngMRhsY7vCSpMiNSlVwHKMAoSoVUJNEkKjGjUxKYmQQqOoom2gT6qmfKhUVf2UBCI1SkTCgGnSfMijxomLg9VSUNyqKoS2icfYcY1tjD0zd+7r7L36YT/OPtcDqnqsGd9zz36stfZ//dd/7zPyyuJ/qWABRTAoCqo0LwWEta/wTAQBNPQVERqjZGOKMb7dJfPE8VLDZj8RQFC1iAimbFGK2tRJsROGKoiCSn3vh8raSDIwN0fXNC48c443D4r459kYiqLqsvn8HAbeaCINbWWNiUIf0XSvqugbjhVbuTXG0dD/zZ2S1D6281cp6ESA42pobWf6LY3OdUcBHPKGEW2a0TBJFTH4vkoKigZbJAZR/Hz+VpIZxn+TG1XfaVgmDV6nKOulhoqY8OGNV2FNByVMJArGG6C4hiOq6ptI1j7YYxJWVZKncTlFQqcUkUbw1rhM0zmZ+Jz/ZE5pHFT9GBJXWlz4iTYIqNS2CJQ1zifmjYZI9l0wMjKMrSrPPuFhajMBZY+MkCESeEF9BEUEI4YmPE24s8EEP6AqYHyfGPBSCJSWLb2oQUUD1ZFN4K10qhRFwez8esqyxLk6gZMPSnJMNSarJOdFwBiDrSzLS0s4VYxIYq96PCFgC3A1lMIYZUyOCdJGRBCVJrOI4Jxjbm6W/mDAgYOH+Ofnnufs2XOMqwpna5ZxzvkxglGqijGCiA9Yq93i6qu3sHvXTm7c/S6Mgd7yCsYYnwMKqMlYMwZZanQolP6mpsOcHXzETLBdsM4xv349//Tc8/zxQ5/j+X95AYBOtzvBYBJgGIeTiYIEzimj0RCAW2+9lYcffohr3/YWLr5+AWMCt4hPXsQlVtdIOnEVThx7KWZxZr4k/MWkcqqsX38Zzxw+wr6772W1v8o999zNbe//VTbMz0fTPGwSW2RFTm0wxgfFOcuZV1/lqW98i4WF/Wzfvp2Fx7/CW39+R1qJSUqPlOrUYYxgijZy8thLNerUV2+f6YEFQq1rd9pcvLjMr91+J+fOX+CRRx9lz/tuZjQcYK1DVSlbbZw6UMWDTwKjhaAFCFlrMQKFKWi1W3zxkb/l9z77h9x44272L3yVajyqV09cYB9Ntjm1iBjKsh2zQ4OcyWnEhcLhcT8zPcMT+7/Bf//kpzzwwIP8+h17OPPqaZZXevT7fUxh6K2uoioMRyNW+336/T6DwZBBf4BzjvHYMhiMEBF6vVUuLi1z7txr3PepT/Lxuz/Ks88e4dvffZq59Zdhna1NwQVIRjgbn0si0YEsMUKllozajDGs9vsc/P4hNm68ktv3vI+zZ09RlC1EhLm5WY4ceY533/wr/MXDf8nU1DrEFBRliSlKynab0bjink/ex/v33MnxE6eYWjeFMX7Ofn/AXXd9hLIs+cdnDiNSICYyT26fTgA9VeI6CzRB1yeih0aL5eVlFhcX2bHjGjZecRnVeExhvFpstdosPPEUx356jMe+vsDxV07S7XZR9ck6PT3NCy/8iIMHv8+//etR/u6pbzI9PYNzDlMYhsMhP7dtG1deuZFji8cZjsaIKbIcNJ4o1SGqSBB1ilLm5jfJqPbUGEO/P2AwGNLpdHzk0mPFOocYQ6fbpdVqMxwOAl2mwaispdvtYoqC0XjkjaGWF61Wi6mpKVZWegzHlqIw2LENsNYEc019NLgXSrbXO0FC4Gr2D3kxrGwoWJOKMvRwDnUO1axv9smIwTmHdQ7ngixuVHAfQOcsq/0RhSmS8fUeJfapJYtBCpL+EB95lQxZoaIKmthxQngkeROrqJloAXVlzbo1RtLYRhXnFJee1WW3IXGimKuhE5wIVbmh3UQ83mmOmbcpTBFEYkgzEYwpEp9L+E7UQzIvfA1xJ4LVppyS8I8wft7WNKIQNFFTMKpf8vClc5PeeYO63a6PinPZbqxeMxMcVFXKoqj7m3oyDc5Za0GKzIhaKcfa4G8bDuQqqV4qEUFFsE5qmAUsep3j8b158yZEhJVejxMnTjE1NUVVjamqim63y+LxV6iqClMYtmzZ6pM47KMlydSwKOp8oC5BojQC6+fONg9xqaJ6lEy/izFpjuSlemgMhwNuuundTK1bhxSGz3/hEQaDIZs3XcWWzZv52alTfOWrj1G2Ci6/YiM33fIeBv1BkMVRqIW5A9zIPtUQqWV4qlEpuRpJlVKKuLbO2gCxDF8iFEXB8vIyO3e+k9v33EZvpcfRoz9i7137eOxrC3zx0S+xd+8+FheP01vp8YlP3MsvvHUHq/3VpFQ9tmroGUPIuQkHLuUGykSuyfBs46faSCZttFO8Tvcr1e/3+dyf/wk/O/U//PDwsxw48DTf+94/AFAUJWLgY/vu5nc+8ylef+0MhSkidaWkR6AoCr/HUJdvfbNps3xIDiSDopsNoCAIRWEyrRQXOERMhPFoxOzsLI9/7ct8/fEnOXDgIGfOnMWYgu3br2bPntv40Ac/wHi0EozL6DGFzkPEBerWqC7V1RscMXVrIa/EYRhR1NXSNRrrbDz8kkBf/pmNRckI/f4qxhjuvWcf+z66l5WVHiLC7Mw0RatkeWklJb+LskAiRQbtrw5jSkCC/KnlQaMqB4fKeqdQOyFJRmiSA0HRptMxxGCMYe6y9Zl291Fz1tKdWsfM7Cyqiq0qnML8hvl6/4xQ2Yrl5RU0jBWfFeJXVYF6O5q2LeEoJjmQYlwfjSBpSRMDUeeuoogRTFHyg0OHWVpaoiw8bj1LZLUgsgwkI40YKluxbet23v72a6kahwPipcwaJ3vqgvO1hl4DQpnsiCcQEvVHiIizlrnZWb79naf5jb2/eclE/9fLFC0OHTrIL//StfR6vbBvNlhncc42MzhuffOjGqDMz4C8gWTJ6j0Zj8bMTM+xfv08Z86cZTgcIWJ4xzt+kQcf/H1Wez3K0rOKCVzunB/ThO1jZODKOorCb+yv2ryZrVu3YG3F0tIy58+fZ8eOayhbXb+Ti/AJhVVqCEAoomWKftQmOQkF7eGqiqs2beSGnTfwxMICR4/+O7fcspu5uWn+9I8+i7UVhF1S7FizRcBxdjDr1GGCMa+df51Ou83hwz/kwoUL3HD99bQ7U6hdjRlJvZ0kjRmh2TiVqCV+Tqn+v/FwwB0f/AD7n9zPX/3137Br1/V02i1Onz4NJqgSBMKRSNrcRyZTl3FlEslccfkGTp48yee/8CXm5+fZ9a7dDIdDOmVeSusA6wSKylyhikba9ElkpAjdhdVej3fu3MWH7vgw+59c4Lc/fT9/9tAfsH3b1Ygx2blYUy3mSZwHRdUxGle89OOXeeDBh3j55f/kM5++j63brmFcVXRbkhiwCYk0OCJC2Tz/98anyeN3gZuHoxG/e//9XDh/jv37n+LZI0d47623sHXb1iS3/XFhhG9dycXkOsvXgRdf/DE/OPQMy0tL3Ptb+/jYvo9jFTotQV18bxG0T6p2TXaSE4v/oY0lakQrHrQChbDad/R7A1Dlscef4O+/9U0Wjx3zNPj/uGamprjuuuv4yJ0f5ub3vJeVwYh1MzNcecUcWvUhvAhxWgdVkh4rKIoCObH4ovokiykTVKBo0wG8dj33Wp/hyNLpTjMYrHL82E84e/YMw+GI0ciGjXrhy3xRYCuLdXFVHCJF2vBv3LSJt71lOzPTM5w6fY72VIerNm1kbl2BGw1SLqpG/V9nq2AwZQs5eezFBLX6/DEsD01FKAYGY+H8+T7LK6uU7RbddkGn3WI0slxcWmV6Zh2tsmA0GDLV7aJhj9Bpd2h12qysrPqDMFMyqiym6jE91cYB03MzbLx8DnFjsG+2qkF0lgVlOmtMMKojXivykHhO6ZTKhg1dpqY7DEbKeDxkabmXxNeoqlAcg/GIwWhIu9OhLA3D0YBxNcYYoXKOgjEtHNJqY8qCDfOzzE53ER3jnL1EOTdPq+unZUyS+ALNhAZNYq3pTBW6bUOnaxhXYF0HQbGV9QLb+KW1VYVzllZZIgLWWgrj5YZ1XmWOx5bCwFS3pGUAN8apepyvGXVFk4z0pFAmr2olERQn9e5H6kwQQK0Dp7RFoPR0Jq3STyCCEYcrBbRARL1RhSDGpTHFKNotwssOi6vsRGwnjY/xrGtBXcgE4queaGq+MV/z3Vba2kXkhf6qOFMfrLiIzkCrnllCEPAnUTIB1Th/FL4++PG9QdxL+LZ+o6vxJzfQV9d46KSNTc/aV1ql6Fw0IpxWswY0kskNfo9k4iHr1W/dI+aBILESa13+k7HNqE9G6JIre42UVkaaEX1T1zVQd2gWHW/sUxDIoo/UL5+SDRrZJyx7PW9uvMJaR4y52EoDrh35Na/YHIeXTpoeKOH4MxtLNYn8kAcTb95TJEJ5y6u0XuKQNkTWhFeXWtpoEpkw28rmg4Xv6uDX/UuM8YmVnTnW2A8dJoxYG8kTCrbxOBjkXLNNEk3xNgNq1Gg5ZFIeSnKoFCnC6UhEfjFhjAasSRqirn25sZL3CEYEA00wwgjqaj0cD84i79dVp8Z4HDX9hUDMk2BTaRoHSE3p2vh7ibSZz51dI9KQopr/yY3vVqDGZc2zCMd3admqpMTPFzi7TFHwv6ZAXqRt7u4YAAAAAElFTkSuQmCC"""
-
-# 颜色设置
-color_icon_base64 = """
-AAABAAEAMDAAAAAAIADKFgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAFpFJREFUeJxtmmmcFdW57v/vqtpjd+8e6Bm6gUaaSREQZw56FNGo0TgEhzgcvXo1xnmIGUzMMcc43ajBKBo9RsVoroqiMqkYFEVFUEBBBqGhm6kHet7de6iqte6Hqr27Pb9bn/Zee1fVetd6h+d9niXGGBER886SJbdFQpHrPK0b0NrWaAEBozEiCKBEISIYo/F/M2gM+N8QpcAo/x4ADIL/GHIjxqABEQtlDIgBBI1/iRFEjP9/I+QugzEiyrUsq8nJOM+cfc6ZjxljRO699141bcaM50aUll6VSqVxXAeMCV6qghf4l0JhjAGjQVRgnw4mLogStMn93zdaDKBMbv4YYzAYRCwEgzEeiMKgfDMMGKMRkWCxgGDRDBC2wxQUxOnu7vr7+vXrr5E3Fy++pXzEiMf7e/tcg7EA8W8MVja36hh/5YO5iAhKFFp7IILCAtForUFZwZ4MXflnGg1oEAtlwAsMUOIboLUGDEopwL9HRKG1zj3RoPASRQm7s7PzVjtkqVvTqbQWsZSIEX+zDCLir6KIv7r4G2MkeIxY/qKKClYo7yU/mLzIDz8blL/BRgeuJPi35lYGBAsgMAZEDCL+7imlBFDpdFpblnWrAqnPOlnl+8uwbTb+TQQT0EZjyBml/NlK4PeAUeIbo+zhfosZ8sC8EaKUHwNi5QbzhgoKQdDD7sstqFL5KapsNquUUvW2iCiMwYjne60RRCzyy2EMoIMXGIzn4QQP9A2R4L8arQ0GsC2Fbdso5d/vaY3reuhgVv5EDBLEg0Hj5dxSKUQ0xkjgmr5RubgYvjhKlLJRVuDbBhkWtILCaN9fjSgc10UQYvEIRdEYlrIQ5Qe11ppIOEQ8FsbTmoHBDO2HeujvG8QgFBcXUFFeRkE8im1bJJODZDIOSimUgDZ+fGWzDqlUGtfVhEIWmFzw6uH+GcSfBQZsZQQtFn5C9FOXEd+F/A0QPNejprqC+vpaSkuLCdv+1rueRzgcA8J0drex5sstbNzcREdnL9p1iEYiYITBgQyRWJSK8iKmTmnguKMnU1FWCTg4TgpL/IXzPE1fMsXuPfvZv78VpSQfTcKwxJLzdgFZtnSF8YIkBgY9lJHRWqMsi6lHNFI/qgajXTzPdwVLWVihIpr27OaVNz9k34EuDmsYxfTDGzhy0hjKKipoajmAZxRjR9fQ33mIb7c2sWHT92zd0Ux1VTnzzjuVwyc1YvQAmWwG27KwLIUom/0HO9i4aRue66CUhZjcLgzFoIggS5cuC5xHAm8cKjgGwzEzp1JdVUEmk/KzkNHEYoWkMxn+8swbfLe9hXPOOJGz5hxDNFYEKJr2t/GXBx6jNKawUp20J+HG++5jQn0V4JJK9fHBR1+z6N1Pqakq566bL2FEaTGpVB+W8rNSJBKl41AXa7/8dpj7mMDDTT6gZcnSpUYFaSsIRUQgm80yadJhTGwcRyadQimF53lEYwm2bN/Fg/Nf5bTZR3HFRT/2s5TXi+MaugcMv73pNm6JL2LqAyth3zds+OgzHvtc+NNfH6EiYWMrsELFACx+930WvvYht91wMbOOn04q3UPItvFch0g0wvc797Llu+8JhWyM0X5QBykeDLbCQsRgBIz2M7LnGQoLCxkzpg7HyQ6bfAmrPlnP86++xx9/cx2WHeW/F75KUUktc085hpKCGEsWv88sWc7UmYruheegLZvpM2Zz6oaPeGvZhdx05Zn0Z5OsXLGKjr37OX7uKTx5/AxuvfNROrt6Ofesk8lm+1DKwslmGTO6lpa9BxkYGPCz2lAa8jMRIv7kg5INgut6VFaWEw2HMFrjaU00lmDN2g288OoKFvyfu3h/1Voe+t0lFEZjdG5/mjtuvpp9bUlSyT4q+/pxXQfl9RHOdOB+8U/Kk/2kB/rZe6iHm+bdTMviRVRkM7z4o3N58e9v88Jzf+D1Nz9g5aovCIcTeNrDGAiFFFWVI/BcL+8luUIpCLb/WfLpXIKcnygqAKPRxhAORWhq3sv855fwt0du4+O129i95hr++psKGFsBycls/rSJBfPv55gfXcGWg6Wc1dJKpCSKeILd7bFlXxWHHXkET/7pL9zevpypF98IjWM4T8/lP5d/wFvj6ljw+C+58oYHqKgsYXJjHZ6bxRhDUVFhUPz8OmUQUIIYUEYb/DSr85GulEKpACoo/4aHn3qTX950CcWJBCuWvs3Pz+rCDGwn+/ks0tv+wuHTvyTU/zbliRJaZ13L8x+EyW4cJLMpxSsfReiYfQ11NWXY6z5g6pGVpN54E+dX16EP7OaGyg4+en0JRUXF3PmL83hz2aeEQgVooxFkWAGTH9QEI+DXfTEoAU/7OUgbQWu/QEXDhSx8430mTWzgqMMb8UwGSacJtYCuV9hxwZNOzL5OEoMT8bwM9z1wO/c8XMeazWuxbU3BBcfz25suYFdbOxwAU6lRRYZQdATe7k2oDRp7ylTSJsUJxx1BWXk5a77cwAkzJ2CMxvW8AJIY8qArsMkWAsyTtzSoBwaUsunq7mT1um089ofrSae6CUcKGDllJh9+XsBlo5KYqE3Is2GLy+7kEVwytpJ4yOXx319BUl+BQShSoN0UY2qraK0/jOSanRRNFrTtYfVUsnHnICVXTSdsbFKZJMWFIf744CImjb+F0pIiPG3yeGkIM/mXMvhGaSP5WFDi43qRGMtXrWP6lHEURGOoUAilwtz+8/N4z76aF1+Ose9Dl++Wu9z83mSmX3AdNSUxlBVnZ0snqz/ayJqPNtK0rxtlx6mMFzHnV//BjaEI69dn2fe1Zsmmbp4/ZSq333ERSoWwlaKmehQzpjfy7orPEIniebkFVvkahdagDbbGBF1QDm2boGD5VeHrb5q4+tIzERHaWzpZ+dVKRpdV8+f7/8CCRSfx+41rUfFijrv5ZK465ygG0ykeWfA6PQfeYfr4LGDz4esWxY3ncusNF3Dx6bPwXnyABW9/jNfaRtW08dx95Zls/ORrOvuTTDtuEo1VxZz270fx9AtLufKSAAUbH/zp/wFv7ZxVksM/CNpootEI7YfaGRhIM6WxgZdffZeH1r/Njcf+mHu+X4yzOMm7d9xD5H+fg+ekGVFgkcoY7rzvSWbWv8C9d0aBBBTHIdXCa0/cy6937OH+R+/g0pOncvqxU1Ahm/a2g/z3nU8x7rjJJDodHrvnFY77z3lcef5c0pnFHOo+RDQSyvWswyG1n3DA+H6kdVAL/HoQjUbYvK2ZhoYadm3dzc8/f5nBe6qpnzeWk68/hlFXjOf8Pz1EkZMmbjlAiJdfW8nxJX/l6quTaBMiO5ghvamN9LIM8yZmOPHTp3nxn+8jyiZhOZAd4M+3LODmg2GunzqTSxvHMf/an/L5I2+zpbmZCWNr2ba9mWgkjN/eBik0V7IwKBHBWKBFBd2WYLTBUsLBtk7G1VWzePXXhE8Lkc12cebmx3jp+4/pm9LOd2MP8OXn24hGC8hmPNZuX82h8ybwYNsc1kdihCt3E/14B6H2MtyOEzk7NY29H6xhULuEowX8a/12jupIUVddRebuN8k+8RGh7zu5NFrG6lVfMXZMDQdaD2FbKnBtExig0AgYhQ2CaH/hvXy29TNuX3KQkkQ5PcksyfZ6KkNdjCmKg93Hlr4UXu9I+jMDCCEyfR18F47xf+NXUSwef/NOZtxBm9+9ZTiuZ4Cwc4DC3m6KWzN0pwaIF5SSSjkUd2fxagZQ5RGUF8ZrbiGxrw1vIEO0tpzOji6UIoARJugPVNDOgo3ONbN+kPjpyt8e7WlcbZg2voLsIo/OCTOJRPZhlE333loqW3Zy+BGjyXopwrEICSdEebgfkqMwySms3DqaWAgeKdxLmf6Qsv5mBgpKiUeieG6aKVNG8mra5ZKN/VhVYX/l9mf59EAvo45sgP60PzOj8bSHGEH5nXQeUg9FRJ67MeRMikQidHX2cuopJzAr69Lx3HfsX1HM/iVxMi98xb3nHEtt/RgyTpZQPM7s8lra1ozBzZyJnS6l8JDD+kkOK6JFrI6ey6OhGZSeOoFiFWMwk2FG/TjK75zDbw5sZ+emg+z75gAvNe9g7YUTOP2Eo2ltPUQ4EsXgc1I+dFOIgGiDGB1UYiToFVQAkQSNEIlG2bWzmZLCOA/fcwtvvfMvNu/ZSUEkwlU3/YxZ08ex/qtNjKsdgaop4eoL57L4dy/RGh9HtGEcej+0jYL0ngi7d+1g5VFdPPeza1BK4WZSbG4+wM1XzmFhwxh+99q/kLRD1YzjuOXck4gpoWl/B8cfW4v2PCToE3yGJJfyFbbJ8SVBQ+NnKyGbcagZVc1Hq79G6zRTRsdpuPECUmmP8qIYC197lz8sX09jXRVrm7q5rrGMO3/xU5695RzueupVNhY3MnhwKoQUK3vXMOLIJh5+4CLqKqp5buEiXlvbQWFBgi1N3fzqJ6OZ/+QddPYNMiJiEVMOmewAHV0D1NVVkU5nhoiuAPpIQLLZPsIzGDyfLRO/YUils9SPHknPYJZ9+9uoqCjFSw9QVVHKgr+9zg1bw5x62808VA+/2GN4+JnXKHh2ET+/9kJeuK+cD1au45uST7HFZtJPqjll1pnUl1Xx0sJXufYfiht+cx2/Plq4/E3Nr15/CTe9iGv/1/n0dPdihyM0720jlXaoqCgj09NJjvUxAR4Kmkts8iSWyg9qrXFch8riONX19az+fDOXzZvLYNajvbWVJ9fup/qau9nTqpm2S3NCQphy6TyeffopLu9upbA4xhU/+xESeKjBoT/ZT2/PAZ5+fx/x0+7inU3wxposx9dZjJhzOQtWPMTFP+3GFYtoNMqHq7+mtn4kBQVRBjpzrAlDvKvPbPo1DIPf1Ad9MCIYDcpkOP6Eo1j58UZ6+pNEwiEOdfXQ2TcCkzY4xiViK75MazZ1CZ4To39ggKJoIV1tB3lj2SoWL1tFd+sBEoXF9A30k+orIayhVzRpO8zyfcKedgtvMEp3bx+RSITOnl5Wr93KCbNmYpwsnta5XisPeRQBb5QLCB9i+NynpfxdsDE01FdQWFnDa4s+pDBaQGlZgkqVoXe94HWFkYxL2AmRXO9Q7vZRVVvL6o8/5+T732J5e4anWxxm/nox7y9fTU3NKCrC/RR+6VCcVISUSzmKgu0uNUUehYliimJx/v6PZYxqGE9DfTW28vC8YYhZBXAiAHTqB4RRbl+061MqSpGwXU6aM5uVn25h3YZvqakezUWzCkkvf5a2VQO0fxFm3/v9mGXPcNV5R3CorYMrF37FtvOu44JLzuDCn86l8fbruXjheg7uPsjll09h4Lv5JL7so3azTdFXWbxt8zl9Th1lxdV8uPoL1n3TzJzTT6LAymAre4iT+AH/6mfNoV/FR6V+NvK3Kut6VJWEae9zOfmsM3h4/uvMf7CS/7j8x7T1LGLV14/Ra2JUhlOcf/FkLvzxKfzjxTdobTye+kSEeSuThFyLI+pj9J14Gm8s+YRf3HIF2/f2sPTdh+jdqyktVvz+l//GlRedxtZtm3n6hRX85LKLScSEEQUWjtZ+P5DzlNynIHvauRKA+D1mrh4YxOf+BerKLPrT1Rw1+yRu/+2TPP7gTdx96884c0cL2cFBKirKqK0oJmRSdPRn8Zo8zIma8uIwxoWdKY1qs+krMIhOc/1lZ1FXFudPf3wSt3wym9Zv4YOSEJ+s28bcCy+ksryE+hLLj9ScrpBrZkQY3pUFZS3IQhKIIqJwPYMSheMZyopiVBd6jJ84jsOPO5Fb7n6CngMtzJ42mumTRjGuqoCYZBjIaqZNHoUc3EvXZkXmYBinI8zgdoVs3sqxR40l60LES3L+GccysrKK6MTTKUkU8l/3P0Pz7naqKhJMrI0SCyvcQAFyHA8lOcIt50++pyiCRt5XR4bY457+LJ72G/ysq2moLWJE1KVxUiPHzjmNX973PC+/spSMUfR5Nl2Dhrb2HmbMOJxrpnaSfud5Ov61nYOr99C7aCFXHtbCzKOn03GolwEdZntLBxMmNxBvXsnFd13LN5/9k38/+0Qef/RZCm3BNb6O4Doe6YwbUJ9DTpSj82Xp8veGwkKboGRbdDtRTpg5lsKYjev6KFApYVtzLweTCtfJ8v7bS1HuICefNovDp00hGo1ijMFzHD5Y8QlfbNoNojhmykjmnnES0VgEY1m0tnXx5/uf4NLLL6Dp2+94qruYZQ/N45UW+PNvX+HluSF+cslZ9Hb34KLYtPkA4WwXWnyAmaP6BeMXspyIkbNPa4+e3gHaejIUF4TIag8EPE8zsT5BvCPFrnbh/Mvm0bJrN6s+/oplyz9j4sSxNE4cSyJRyMwTj2H23NnYSnBcj0OH2mlrbeebzU1s3byTY2f9G6MOG8fUsSP47IF/MPfRBsyEmUjdNDZse48LfOqHvkGPZDJNeRT83n6IYsGY/88OCGix2NbST9WYscyZORLtuXjBbwYIWYq+gSw79vcz4FiEwmE6OzrZsfV7Og4cwM0M+n5rhfzi77m4GqLRGDV1tUyZMZWakZVURF3GVReydUcrd/3XS+wycdI9Sf526ynMnXsCqfQg677vY//23RxWa5N1tZ9YkLyA+UMDcjFg22xr7qHXi3PqrIlMrC0g63pBOvONsJXfN3T0ZtjbMUDKEexwBCMKz/V8sSKdxWiPcMgmGo0SiYSxLIhZmlFlNiMSMbKOhx2y2bo/y45tO1G28KPZU4gqh+YuhxUff0+5NchhowpIZx3fgFxmUgEW8mVTK+9KApQVx9nf1M26jXvQegwNNXHCoUA7GyY71JbHqCmLMZhx6R9wSGY8Mq6gTQQjsYBZM4QsiIWgtMAmEY+AgKsNIVshxmPMCAhPn0AkbGO0w65ul0+/3E13ezvjJ5Tjep6viA57O34M5IZyIp4BLIoLw5QlojTv2U9P3yB7xtfRMLKEskIbKy+N5fpUUGIRjdtE4766qLUJwktQluTLf1Yb2gZcJOD6JSialiWURTW9gyk+aepjy7e7GOjpZlR1GQVRwdOuD+D0sCyUK2Q5hxLjS50aTcSyqCuP42ro7OxkXUcnW4sTFBYVEItF8kKdCVQcCdR8UQLa87WzgPHOJ8C8Su/LKX4Kz4l7wuBghkOdfSR7+ojYhoryYmpGxFDK4Hn4/NUwXCEGbANaAixtcqpH4FYlhTb1JkY0rOjrT5Ee7KO9t8dXG02u+SRQFnMSrJ89REAblSe+c66q81LRsGoPKMs/oqCUUJqIUFIcp7o0RklcgXHzKdLkpV+Dxmgbz2sJRaL1juMgxigTKOrGc7BEKC+yiYYUycIwGVeTyvpqugRdnFI5FT+InuBYgMpRNIGW5SuhKjAsx3/4C+YFRogSIiFFLGxRVhQhEQ+BdvA87Yvc+a7R6HAoRCqVbrFdTz9eEos9nnUyLsaIiCUYg2c0CsFSQlFMiIVtPBSOq30lRySvLhpMcHxi6HxDDnQpycH1HPPHEDOLL2jn/6sEWxmitsK2BKNdtHaDZianYficZywas5PJ1OP2hg3rn5g58+gjS0tKrxpMpXBdL0CjyhdetYeIEBIIK0PMlgB25ybqN9k5BJtDKEOgK/gYEGaSp8aHDnLkTy+IgPEwxkV7w3hQE7xPwA5FpCAWtQ91dv19w4b1T0juuM2SJctuC4dC13naNGiMLdrkTk4wROgFz8vT8MNHh00i71JDY2b4wP8Yy/FQQ1g/tydBhOYGxbiWbTc5WeeZs8/2j9v8P1LvJ8gSlRnnAAAAAElFTkSuQmCC"""
-
-# 分隔符
-separator_icon_base64 = """
-AAABAAEAMDAAAAAAIAATCwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAACtpJREFUeJytWjuPXVcV/tba59yZ2CjgSWxMiihKihT8AEKBKHm0dCgFBaRBSBD+wCgNAilBSUcaksIFTXryJ0gRUhjZE9nIMQk4NvLE8b33rEWxnmeMIoFyR54795yz916Pb33rcU2qSkSkJyfXXj44OHxpWZZnAUwAiJhAYBDBXkQgAKrqHwnqt6D22dYARIAq5U1boyBie44Ionad/TNibyLYLoCIxNFKRPtpmq4/fLh98/Lly6+pKvHx8TFdu/a3ty5euvQqiJ4HaKaQQhG/ABCggGpsSHbNf9v56o8TFCV8vQiqJqSq+roQ3P6tX5rK+gkzMT9/6dLFV2/evPnW8fEx0dWrV3/51FPf+P2dO5/uVXXwYNPfz1c1CU1chkJBVAoQqQsWXgmPERQKJi7Lmk19XayvexomcU/bzbIfFBBVZcJydPTEdOvWrV/R9evXTh47d+7p3XYHIuLUmtcHh62Jya1HzTrmGQUlHEKJtGUqoNCAmxtCFdDwXhiLOP+2e7UXoLLZbHB6enpjIqKnd9stp4i2K6CCfo1WfzeroOIhn6M8tmCYkAzBzcLave1+y4fVPsX1doe32y14jKeZh5s68cZtw7JawmaFVcojUwSiFKKpkR5baa8AVPNpat4rUNXzRiCUhhhj4ikWxoKAR+KxWch3aBsaq1hQhutrpaIFKrmQaGhw6JACSuTv7k0/hqg/TLCHcjGmbktVXQUViMEcwpjwBPi1wj/aYdotryjlw9JEYFcisK0IuWJ1rLOdwvIhQ7qRAA42iM0R1iI2jPYF2oPRDlTHd1kK6ZHmfYD4jCeRocFxoeRCeZ5WRMI8isJVz3qgxZpb0P5ewMzunTCCAmL6MhFAHBo61RojBb41hQkURvAjrZxedUVEK6jzejeMEjgypK3vjMIrC2pk0xZoYaHIruEVCqHbew9+UoDBRsnNLSbkSkLbLT0TXBQBB0xhFfIgi2ALRWp9QCv/zGBUlbKMulndXclkqWynaoAaRLVc7l71aMoUsSYYhWJqCjadz1IeyjP5XHId1OnDEqDFT8BH6+mVR02fHpipfYNN3GqVTYsLIqoYiIvsBVl6KhZAHPtcEKHAKAeHutE0D2N/IuJrpTSCuXwfKwQQdF5YcJuvnQmAAkKPFmhni5Cog6AC0KhniJKfu2LtFN83cbByReaJiJVIBgjG04xHq16lEzWmZNoMymIJY+wWRM2dIIAiCNz6sQFHKo3raYYmf0tW8TLHF22G27op0WwBKKbi2LICo9FiD2rmxmKhdMvUzhIEL/oy6BwOUXFpf9aVSZs6rFS9oDSvV4pjN659mqzkbRUkEZg51Q1mCppbx7W2bGzK1l6UwicpNN0feVEZsaX2OMXFbmo77KfgHSZLHCriFEnIvmDVJQWHuhVUyiuq1pGpON7q+TMlnx3WQLWCb2ZUamsUvecI0pmy+lNgDMbXLlwoFmpWS2XS3fbLmreyGjUFe6nsQWNe0RKmt5TVrVmKz1js3hPB3Xv3DOpErgAYPBjTNOGln/4M109OMG82UHjEU8GHiEE8LFDddFHwcYNb0K02KwPWoeV1tXdbP5INU2U/Y5oGxhi4f/oAL3znu/j1L36OB5/fNxaKbohh1vzXnTv45JNPsNkcAlgSAoMYNDxBuaWyf+BWqKW8tBKEWwrPJv6MN8cYxjoiXkyax5jNwLvdgmU7ME8bPGQGFgHduHFDY5owbzZ48smL1rUqQFQtDT8SvgmM/xqT/bkvuv+/rlMF7v77Hvb7HQiEicdAJItpmvDhhye4e/cexJ/u/e1ZlgjorHIFzliWsOb7IAVUstJM0yh4uRbRmwMEWfa4cOECHv/q4x4DwGQlD4MnxjQGfvC97+Pq1av/h82+6OVCZK9BDo2SOowTNZhK0LL1JfNmxoPPH+KHP3oRf/rjHyDyKVSBSUWtO1oEu/0ev/nt73D79m0cHsxQVYhoglRRrDHGyITDg8FeakijXGZARKtaZQITQ7zzqyKpcke8NAZazGBmzPMMVcEzz3wTy36XdEs3/35TyRuSMRiXL339S7b+l//6+M4/vUjIatRwfnh4iONXXsFf338f8zzbdY7mZk2IUc/zYMzTnFhmJnc/Ze8c48HBwxzBVgftdcmklAWH75t7xcCABx5st/jWC9/GT178MT5/cB9QxSSLgFjBNLDb7fDun9/Fe+/9BZvNJl1PgzF4AFmbBFNSJhSbTggi8RABsohly2kDHhNEFheM3QYGRWbOpmWwDRIIhP2yWMs6BqZ5g+12h/OPX8KYNjWePDk5SRqd5hljzDj97NQ3QdbrHJOyVpObYj7BA0FUnLmMt0UEKgL2xLfoYl6LRoYsMXLwTtRaCggUsiyIOVUofbg5j+3uIba7hwDIWCiy4n63w7JfcDDPKWWfQFO1SJmVo7wCGUTiHmCJicbkY0dgognwQGfEPMpnpUBOs9Xv85jzsy7Wnt4/vZdnEryYM94KhCtEJKkuIcOtndToYbTqLVEoaXpKVQFRSFBkFoWVK2yzZqDEppeYXo9Fe2FTEC+n/WAWn3NESZFdv0uqoiWgVBGWFW+Voq3eDPeFttKakBBes8I0ygyajtVVnubgpEEs5JxyRpP4rjFjWYIgQAZXPB+turbhvqrkeFBDLA2nq8FkVSM4+/ivXoFq5GUtecyWmglvig0slEwA9vYhZjaqBg8RK6yy1VZBdEii5nJpRZ1G+Wy86GV7sVivp2qkYnCO2bjmaKY8Ur2DT+aS5xX5hUS6z0XI/qS9m0WXwjjK3TGdA1UhqLKGWTaKDRqxhw3+7IciRrO/rticqvkJd2krld0g/rAqABYwjYJMBkPZMvCaCgVHaHw7E2JEbdRtFpFoliBd3bS3dtZUUGiFFYXbAwDu9ljYJm6BcxYbp9Q02y1J9mVePkwKwnD9xMmD8kw509SkbWLX5BgP4sKfCayk1ljEc24rpQKuQDLlA1FVeEirQ8IdUV3WeiRo7zFCkbyfhs7+F+mioG/rx23PKQQsqylUyhtQ9mo4vssSF5TLNBoeA4TV5p3p5mbJDD5DdtCyUsRhyxlu7QxiN0hEqHqgTDFxZndhfNEAkHE/FsR3xeRcKwIwVb+ccFJP//AymM5KnkDImCiOt7IhYrG/tAVSUbezUBhLXFOLeLQMVd9KKmmDhgeZ47lAEcsVfRwVZySVtuAPmQXuvSSI7sUyUtPM80DijR5xe/hOrMm0uX4hHoZf//LDa6X+1ZMSAJH0qvrBRlT1nbJZxiEF+PRCU9k+40u1iDCJijANDoKnYKHEnqaAlpENOhXD8R1Wz9weyyDE4MuQGu5DqtP3CDt3byW1NzUCkiKL8H6/vzHPLCIqoa3okoFT3O75oXs1ISbVnAOQpEcXs1ewtQqiVjiKCKIm87Rp4kbtVf2n/YjIPM+yLMsN3u+W18+d+woDEBFR8aJNZFk7zFxQ4RVJTpE8nyzWaDCUK5uHGGXdhJtqjtChZsiumE31oESQ8+fP8bJfXud33nnnjdv/+PjtoyeOpoODA4pEZv9jwg8m4+osqlSs21o0eT4FVakM7gKF91K48G6wrV9PRcMoLWHZw4SDgw0dHR1NH310++0rV668QfHfbT744IOXDx7bvCSLPAvoRF6gFC8jynnk3JKAQWNdBwFtwhDUrIlbc14VVYbrKjnSbFH0uUFBpEy8n6Zx/bPPHrz53HPPvaaq9B++KRhgTWOvIAAAAABJRU5ErkJggg==
-"""
-
-# 有序列表
-ordered_list_icon_base64 = """
-AAABAAEAMDAAAAAAIADjDgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADqpJREFUeJydmmuQXMV1x3/d987s7O7MrnZXWgOWA0ISMjbBFo+AHB6SA8GY4mFXgYRVSiU2mAAGASaUEUQmMaxJsIljnNgOIkUwCEyISQzlpLCDJUyVY4MLJEBCQspWKSJCWr32Mbs7M/f2yYd+3J6VSKVyP+zcZ/fp8/if/zm9avMbm0SMQRAUKvwqQAClFIC9FgP+PgqlFCICCpTSoBSIoFGIAmOMvwUKRMSNTDEmxeHnQsTdDx8Wc7n3jBgSnaCNMYgYO7AiTBAPbK8FIwJKo5RGlBteaycKQTSDuMmUXaqyKtFKtw+qVNv4IgYRN080oiiFEQkLMCIgVkHark77UaLBC4msZhRaJ+FxLIzXnEj7srW2VlGRoEoplIos659LpIIZ32h3bV+z1lBag4IUf9NZAKHt45lCHnntf6Xtvl2MRO7Qroz4EBG7WPdcnLZjtwFriTYXVIo0+KWOJnCuNFOjMycNz8Ma3v99REAp94ocYZXw2lHuhffsEG0uliIgStBoK1DwJikscxTBkyQhSZLCBaKQVD5yvRAFIrhFSrgpImS5IcsyEq2t1mOhI3cSIuGdw6T2mYomjj6eIXye53R1ddFd7WZqaoqxsXHyPI9ns9OIR6AC1cQJqyMX0kmCRtFdqzIwMMDY2CiN6QZJkryvG7UDjZCiigutdDGhtJtZROjv72d4eJj1659iw4aN7BsZIc+yAJP2uwJqxfm/dguwiFRYUeuE/v4++vv6OG/pUv7oD/+AOXMGOHjwUAhcP7e3hJdNRNCAemPz6+LNEpsr2EUpjDH09fex/oknufvutSRJytJly5h34jw6yh2IMha0lMIYIc9zsiwHMYDC5BkWxayLJGlCuaOE1iV+8A+PMTExwdTUNLWeKt/93vdZuvQcRvbuJUmSsID48NdaK7sAlNe4FVsAJYLSijw39PX18eijj7F27Vouu/wK7v+L+/nwokUcGWZHHt7j9fs8/9jHT6Ozs8KPn3uOVatW8fMXX+TvHl7HhRcu48DISHCn2BLxgtTmTa95yR0CuSwsghhDtVpl8xtv8pnPfJblK67msccepZSWGNk/wuHDowx+YJCs1UIpZf1b6QiNJGRzhQ9O66LGGHp6e/nc1St5+umnWL7iaiYm6vzspz+l1tPDPz7zQz409zgm65NuXO86hHyAgI5jwA5O22J0kvDtbz/EnDmD/NW3/ppSmrJjxztc8ulLWLlyFeVSmTRJ0Eqhk1jP7SgmwRYFRWk1G9xzz1dZ9snfY8OGDWx5601mz57N/pG9rHv4ETo6KiGOChrh5MMmszQgnBvZZzpjDJVKhZ07/5ONGzdyw5du5pjB2Wzf/jZnn/UJDh0+xKkfW0zTad+YHIWmp6eGbuMt2mlLwnlMPE4++cO8+O8/Y7oxzWS9zsjIAVatWsULL7zALbeuptrVSZZlAV7FmKBgJWITWSBtEcQZY+iodLB161byPOeTy5a6RXVy79B9PLl+PXv27EVrhcktJBojvPTSS0xMTKCVxogJlEMpRW6MtYURjJggVNbKOOHEeSxasJBFi07iti9/matXLOed7e+wZMnvMD423hYDwUMQUoGQxouws2iUJAnv7d0HwLHHHUOWZ/TOmsUN11/PSxs38u67e1BaIZlQq1X5xS9eZtnSZe8Trv/70V2bxVtvvk5XV4XjjjsGpRTvvbcnBHGAUW9dx4JToE1TM482k0GAyfrkFIdHx9AqRSc59clJTvnoR/nmg99i//4R965BKW0X6V0K5a4tk020ptmcZv6ChfTN6kPEYBmynSfmSPGvP0995mxnnsWhtb3O89yGoBPksssv57i5c0kSRbMpINblVq++iZDO/aId/Q0sVCzlLqoO6x7jY2NOaX6xxXxBofG1CKlloe0Zt30Rvsjwf4T6ZJ1rv/B5rv3C5zk8NoryVFhAK1AqIeagCYqYsSvls7O3CS4+VISDuBqgXbHGeYRXUFooXyGYI+iqpwbKWaJULpMkCS+9/DK1Wo3fPuUU6vUJkiSlXq+z7pG/Z2xsjFKaYqSg6eJRSKQY0/1pTDeYv/AkrrjisrZyambt0E7M7Z200LqdwFOCmRYQY7lSozHNtdd+kWd/9CygeOhv/pbrvngNKOHVV3/Dbbfeyv/n6Oiscv7SpfTWeuI8WMwf0Z34SD1jFGwta6uzmXBlzZmmJXbu2Mmzz/6Y9U8+zTPPPM3da9awYsWVdFY6OG3xYv75X55nbPQwSZqEYNRKo7UOZWGiFCrRAWEajWk+OHcuswf6MCYLcVck2UjnMxaS2jVanm7EhI+Lgsp+kCSaLM9YuGgR7/73biqVCkNDf86JC06iq6ubrNlARLj44gtJ0tRWYjMmi0EgVAQiaAVZbqjX61CpRDEpiOP91v0i/3eH9tRUhMg/LT3yfo8bIM9zent6mZqc5Kwzz2RivM4zz/wTpTSllWWUSmXKpZLNutBGiT1XsvesRbROSFxToFwuu/MYZWYWn4U7eeWkWhVo4Cdqq2vdCCY3pEnCzh3vcNFFn2L37t3cdfef8l+7dlKtVah2dTKybx/33vd1RkdHSdM0JJ0ADBGPieuH6cY0J85fyB133O7t0va+ZQsFl4rlSwONiNbaRlfdb55nJEnK29u2Mzw8TK3Wwz1fXUtHZ4033tzE7L4+du9+l3UPrwMUidahCgtiq3hEmxi0UmRZkw/OPZ6bbvoSA329KEe+41ZKnA/iQC5KSlUQ3jaNOQAvlVKyrMW55/wuv37lFUuwtKa7WuWYwTlM1CdYfNpitmx5i6mpKdI0JXd9HnDu5OSIy0WtFVmWMXtwkL7eGllWBLFHxKMV+OLcNPVdAs8tQlfCcfhiMRatkiThzDPOQLCpXmlNfaKOCDSbTX7r+A8VRYifOCTBWIAiDyilyFoZjcY0lUpHeLO9FlYhQwejIJ5OF500pZVPqm50+7IxQpqU2Deyi8WnnUGrlZEkCSd/5CM8/cMnaTam6ahU6OyskLWy8K3XFL5hoAoBCrAROqpVcpMXyvS+EFFzrVXkSdbtLYzGaEFsMt9FwJGzjK6uLq668kp27drFE088zqWXf5a0VEIhvLt7N1+58y7GxsaCv4fEGGXjWP1aKRoNm4nv/dqfUe3uCq0T5RUbV4lRWamUIjUO8LVrzooIkrsPpeAeSmtaWUZ//wBDQ/dxzjnnAvCpiy8iSTSKEiMjB/jXn/wboiBxuG3nLyzZNqYbt9lssGPnMHfdtQatk8hFCl3HlDrwIRFS7dDiiCNAl7+0/r9v3z62bN3GA9/4BkNDQ6xcfhVbt2+l2tnJ4sUfZ9v2t5mcnCRNS+Qmx7g48c0uESkWoLQtoY2hp3cWtWo3eR4FsfKN45hOFOdK+9ZiCLYZfczoPDeGUlpm29vb+P0LLuCW225neHiYwWOOpbPShTE5zWaLvlk9DAz0F/pzwV8kpdgaBa63Wi0a05N0VkrhUxETZfTIhH4Mcd2OmX2XQLEj+EoSTbPVZMmSJfzlAw/w5PrH6ego88gj66hUyrRaLTo7K3R2dVm67LOtUiRKk7riResiI/vnANXubkrlshPRymOMF76oGZxOQrpLfefASESlHWDH5tbuWaPZ5E9uv53rrruGcrmDUrnM6OFRuru72bFjJ6tX38rU9JTF/YDnThkRDyKy/HSjwfz5C3jwwW9S7a4WMSCmgHRVdOSCopUitVnPm0gVy3Mr7uzsQinF1JQVSozh4KH9VLu7QRQHDx0m1RqdJEzU62zatJnc5O5dx3ONCdYMzVvnrolOaDYbjE9M0MpaaK2ZnKyjgI5KpR37IzTyR+rdyycubwDbt2mxYMF8RIQtW7dy/nnncfDgAX707PNccMFSmq2M8ckpzjp9MRMTE5x66qls2fqm7UpoHTiMuNrY8y6JhNBaI8ZQq1Upl0sopdj29jYEWLhgIc1mC4KHECq2EFebNr8mMV7H1Nf2d+Ciiz7NCfPmsXHjBg4f2s/O4V1M1OskiWbeCcfT19truT+QpqktxGMMPErgFodCK2hmLfIso9rdzZJPnMvY6BjP/+Q5Wo1G6CvF9DzkgaP1/z3xarVaDAwMcOON17NmzRoe+s53uOXmm+jurjI93fC6pNlshuBqZNkMUFBFHogoABQsVSkol8v0zOpnaGiI37z6Ct/93vfprHQwVZ+w9QXRtyFGXElZCG4Ti/ezJEkYHR1l+Yqr+OUvf8Wtq29mfGycG278Ywb6+jn6EUPe//3Yf2CE+4bu5P6v38/nVq7k0ksv4fChg7ZDHQLeEk7j+kJaKdTmza+32fRo9XBastz+3q8N8fjjP2DwA8dy3vnnMTg4x9JmsXtc3o1w6BU244A8y0JcFAnMCrFnzx5+vmEDBw8c4JprruErd95Bs9nE5CZs1dqKLCrsvcI3bXpN/OZGbCatdNTKsNao1br5j1/9mvVPPMVrr73O2LjdobFI4dmnhBIQNQOeQ3b3aGIhun+gn7PPPpvlK5ZzxumnMz42Sm78dzNZ7Iw9Y78AAK2StnjzH3jLiEC1VqWUptTrk0zW61brCgeVRWtdJ24/OerjGOO3dCUSRuiZNYtqtUarMe2I4JFx+X5buWmxxoK7+w41MzSgFIyPj4MISZrS2d3lFq6C8KFwV0KoyH3gte0dFPZuNZuM7N3rChwd7vu/ce7wi/BekpqozrTGlSjSZ3bpxPk8mDzHmLgQ8q23YjwgdKGLNoRPSjGyGhK3tyBuW0opLyiumDFBqb4B5xoFhWkklIB+U87ej/dljWuRe3/3xXmhmWKTL8K78D3Kb9YVc7Z3xyFEilOKyXN87yqOKVvUByVKYI5KIgHiyQogb0t4/n8tCrYpof4tuHwUTxSLR6yV4lhVeBpi/wklVpID0nCetoGm41tHVmR2JjHt1Fs5WPTasMhDG9qEREYMDkXUCVH/lWIuKPCq8JJ4ia5biOsMxNoRivPAAsGxy4KLKGVZqnEyCUKiNKZN+8VOTAwKha9rlPhsHfWRAnuNEAgpxhM71v8AGl871TN2pgkAAAAASUVORK5CYII="""
-
-# 无序列表
-unordered_list_icon_base64 = """
-AAABAAEAMDAAAAAAIAArEAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAD/JJREFUeJylmX9wVFWWxz/3vtedTiBNIBARCDD+DL+CjiiCgkEdUUbEgLPCDDKl7B+7U2MJau3qDjJa61jMlA5OjW7tMoy7QBWICwprAB3LFXGipQMqshBgtAIdIMoPO+mk00l3v3v3j/vue68Tx6rZfVWpSr8f954f33PO95wrTpw4ofEvIQRaa0CjtUZKByEESimEABAAKKUAcF0XjUYrFTwDkFIC2n9P+OuZ9YUg+N/uqZRCax3cM/dBA2h8mXz5zA2EkAgBrnlNEPnWfCgE3/QMwo3swv6WgBFYa+V/J0ueGWXN0kJItLaGkmitCJczCpcsH0im7RsIBNJaTkc0lUIghfSF0ejIAtrqJrQvqPYF1b6FRT+lrfUkAhAyqhgRQ1jFiTzXvrIRzyCDtUDgDrSm1U0TwEITCC584YSvnNIaKSgR2CwVQsRA09yzj6Les/CxEAMNwn4rzU9R6hFfZdwo9sxLAUiDlw2mQ2taW1hFCJQ13znSFziiqLGmAyjfPDr4LtxfRlYPLe8FMUgolzIruKIU4BEI+BtHlLEWCINRlFhPKRPQKmJ55cPMfKuQUiB8BbWvftQLUQPZra0sJix15D64YcAJEDp4wQoatZS0G9vNfCgopXCkQ3l5OeXl5TiO9AU0azlSghAUiwX6evvI5XIo5SsjZMRIOuI5q0R/xXSJgm4oPKAF/QMn6tZSWIDnFSkvL6eyMkkul+Nk6iSHDv0Px48f49SpU2QyXaA1VUOHUltby2WXXcbESRO59JJLKIuX0dnZST6fDyEqwtiz+yulA5l0xLj2HTeESggfWwdCSEUda2Dhug7DR1xEKtXGho2b2LFjB/v/9CcKhQLfdrmuy4yZM2lc2MiCuxZw8ciRXLhwwXhESJNCSpFEEPkRNASP+xeyUOBSS1hXel6RZDJJX18fv1u/nhdf/Be++vJLAKZdO42ZM2+grq6OkSNHkqysRGtNV3c3Z86c4djRozQ3N/Pxxx8DMG7cOB5asZJl9y1Fa022J4sjZZBW+1/RTGkgLY0C/StgUBtssfAra6FQpLp6GEeOHOGnP32Q/fv3U1FRwbIf/5jFixczefJkBg0aFMQFOqwb0odiNpvl8OHDbNq0iU0bN5IvFGhomMPzv/kN3xk/jnT6a1w3FhQ5rXUQE1YvrSzMJSKVSmlr3YGw8QublBSLHtXVw9j33nssW7aMC+cvMPf223nyqSeZWj+Vvt5ecrkcnueZNaQsSYVKKRPsjqS8vIJ4PM4nn3zC6tWreeedd6gdO5bNm7cwtX4y6XQHjuMElMVYP6QrWiuElEghSiFkg0lrbSqmDyHP86iqquLDjz7knkX3kMlkeG7tWh5esYKv02m6u7oYNGgQifJEJDFGnO1XIVsPip6HV/RIJisBwdNPP81TTz3FxRePYsfOHVx+2WVkMhkcx+kHHSKuMK4Vra2tOor9UjgZolVenuDChQvMnXs7qVSKF178Vyoqymhvb2f58uXEYzFSp9r4sr3dN4LwU6gOKrdZT0YE0nhFD6UUl195Ja9uf5XH/vEfmDKlnl27dhGLuRQKeSI5NYCkgZCBthuW8IFxYAtWLB7nkUceJZVK8avnnmfChCu55eY5AFQPH8Fd8+/k2u9Oo1D89gz0bdfuN99kxcqVPL92LatXr+a3L/yWC+fPGYP0c0BYMzSu4zj9WGWYfTyvyNBhQ3l5y8vs3r2bOTd/j0cefoi33voDjuPgeR5Dhw6joqKCeXd+nxMnTpBIJMLg0xohJcrz/GC0NMVuYzwcj8dJJpOsWrWKP7z5Jhs3bmDB3QuY09BAuiONI2VgVK1DGQETxNatUcsDfiB5NDTM4cyZdv77nXe54opLUJ7iSEsL+UKBq666Cq9YJJEoo1AohDBBB3BVSg2gDFYEpTWu61IoFBg8aBBNu3ax+N57ufHGWezcuYNstjsgg1Z/mx2FEMiSzBNhgybfV/LGG2/y+eefs3jJD7nqqnq6Mhlc12XU6FGMHTvWWAdw3RiOdAwuHQdXOjjSwXUcYrEYsXicWDxGvKwMNxbDdR1c1yUWi1FWVkY8HiOdTjNv3jwaGhr44x/fo7m5mWRyiF+NCawfTRNuCbh0mDWEkBSLRbZu3YqUkiU/XEJvrodkcgifffYZ8+fPJ5/Ps2PnTq6ZNo377lvGqbYUsVjMXy/kvzqyheVXFklKKyoqBvHMml9yyfhxOFLywPLl7N27l9dee42bb7klMPAAqAurgKXFEU6fSCQ4deo07ze/T92ECdTXTyabzVI9fDitJ1rp7OwE4PCRFuqn1vPq9u2URNtfef35+HEmT6yjK5PhxhtuYMSIEbz11lucO3uWskQZxUIxoDpKK1MDgobG4kqEeT+RSNDS0kK2J8vsm26icnAlF86fp7Ojg9tvv4MHlj9AJtNNY2MjgyoqeP+D9zl9+jSxuPGAVpFgxRQf5anAu1orv0AWqBxSxbRp15DpzOB5HjUX1TB9+nSampr48+efc+20aWTynX4/EbZbaExDY11kNvLTk+ty+PBhAOrr6wNLFYuGgf5+/e8B6OzK0N3VzfTrros0Pn/99dXZr4L9Xdfl6qu/S1NTEy1HjjBzxgxCPhHFuo42NGFnZfCmaG1tBWDM6NEU/RzvxmJks1keWrGC3r5e1qz5JdXDhvH222+TSqWQA9JyaSUV/m+FRgqTYofX1DBr1iyKhYLZW2nGjqsFIJVK/YV+wKwWBHFA4kykoZQmnU4DUOmzSoChVVVs3rKZTRs3AjDj+pn8zb0/4Lbbbvu/GD64Xn7lP1mwYD7nz55DKUXl4EoAOjo7gqpOBC121BAoEHQ+PuXWWvntoMnVYLhSNpvl+unTqR1by9dfp5l69dUkKyv5+5/8hNbWVioHDzYkzDeI9L9XSgVFzfM8pHRAQCGfpzKZZPKUyfT09BiKLEzbaeWKNjElsqKNAiVV0v/tOC7Dhw8HoKc7a5oNrcnlcowePYb9Bw7Q09PD0GHD6OnJ8eyzz+I4DtKmO389m/4CJt9viGULWne2m3xvX/Asl+sFIJlMljY43wShcPQRnVAIxo8bjxCCtra2ANtCCPryefa9uw/QNDTMIRaL0dPTQzbbHRA4/DjqP5yyfbU1qAAqKipMNe7LB4Ou9jNnABgzekykW7Re0IEsgQIhlMwIo+gVmTBhAlprDh48iJQSpRXJIUP4r507WbJkCQD/vmED8+bdwc1zbqYjncaRjh+gobsDewmBkBKtFNJxAl6USJTzb+t+x9SpU8h0dOJ5XtC1TZg4kbzfpvbvWaQUUQhFRyrQ19vLxEmTGDx4MPv27aMrkyEWi+Epj2E+tAASiQoc6ZDrydHR0UEikTCxY/O/0kHA2WbH3rdTDSklfX19SCkpKyvj/PnzNDc3M6Kmhssvv4K+3lxA7aNw8qcSBG63G1kMjq0dw+zZs9mzZw8HDnzMDTfMpLOjk5kzZvDajh10ZjLMve17CAF7391LR0ca13FRWpUSOV/QQtFUU4FAKc94ASgvr6Dmoho60x1UV1ezd+9ezpw5ww/uXczIkReR/voCIWsWgIWmthAKoIWdzWgNUjo0Njaye/duXnrpJW66aTZaazzPo2FOA67rojxFrqeHiy8eSe2YMaGVgkWJdFDhVMOySXudPXsWMAqvX78egIWLFgWTa0voBkwlLJ2OxAdgUqaUEs/zuPXWW2ltPUFTUxOzZ8+iubmZpUuXIh2HzZu3MGXKJF544UVOnTqF6zgorQe4Wggz45HS1BhHStx4DOUphlVXs/RHP6J2zGh27d7DPfcs4rrrZrDnjT30ZrtRkXY0KqgQsh+ViEzdtNbk83mqq6t57LHHuP/++3n88cd5/4MPOHzkMO3t7QAcPHSI8d8Zz+onnuD/c02ZUs+oUaN4YtUqpJD87GdPEHcduj0P6ciSXlsHc6K/OBs1l+M4pNNpFi5cSFNTE9u3b+fRRx9hzZo1fPThRyAkdy9YQFVVki1bt3Ls6FHi8XiQKQycwkMN5XnBeN3GXaGQZ0TNCObf+X0efPBBWlpaWP63f8fcubfy1Zft/tlBhIprmyn9tN/W1qZNodEDcGm01cTjcbq6u5k//06OthzlF888wz89/jj5fJ6Ozg6UUiSTQ4jHYgY+9tt+VtY+9m2V9opFYvEYruOyavUT/OKfn+aaadfxetMuhC5SLBZNlhIyyFj2L5gLtbW1aTt/KRlqReiD1orBlUmOHTvGwsZG2tvbWbFyJT9/8ucIDZmurqDqYodYIsIaQ7+jMelUK01ySJJ8Ic/qJ1azbt06xo0bz87XmxhXOzoYq5ScW0Sbe9/QsnT6G9pOiHBOJKVDVybDhLo6tm3bxqWXXsrza9fSeHcjh1uOUFNTw5AhQ0xaVJGG3p/qSSkR/oTacR2qqqq4aGQNn3z6KY13N7Ju3TqurKtj6yuvMH7smEB4a9jSLBQiQ2uFOHnypO5v/VAJGWQmIQTFYpGqqira29t5+OGH2bNnD67rcv/yB1i6dCn19fVUlJfjFT2KxWIAJykl0nFwHIeeniwHDx5kw39sYMOGDWitmX/XfJ599jlGDB9OV1cXruuUCB2haaE3fC/4s1EjfHSkaOqAyeU28woBnqeoqCjHcVy2vLyFXz/3a7744gsArp8xg1mzZzNp0kRqx9QyuHIwylNks92cPn2GTz/9hH379nFg/wEALr/yClauXMniexdTLBTI5XI4ruNP8UIYW+Zpmaml0wKBSKVOhjDzC40NEr+9KR16SRGMwocOHcq5c+d4/fXX2bZtG83NzRSLRb7tKisrY9bs2SxctIh58+5g+LBq0ul0kL6D0Umk+Nn0Hg55beMFItWWMkEcYXzR81iECCbLUReCUSQWi5FMVpLPF2htbeXQoUMcP36ctlNtdHZmkFKQHFLFuLFjqaurY8LECYwfP554LE5nRwf5fB7HcYwwPosFSga7BELrIJUaY2JioJSNhqch9Ld+MB2LZijtHxdJEokEiUQCx3WCabQ5kDbWUp4il8vR29eHDmpENOlGztUsVEoqcOgdIYKOLDw0s0LaSqf9NGgFHXiiaRaxU+RcLkdPT88A2hs9LLRjce1nOGsUc5JkKWx/Gi6DyYlVxk4AfTaqABkES+iJ0KVCgArO0Gw3pYOYKSkuA4ohEfdHj68i2UWryLsENSVUJsQ9hKNGaW4GB/ZBlAdCaB3Bo456syS3hedrYcU0TFIFRrHM0n6lgl7Bnvb3ozUlv60hzTman0gNmZNSRFEWejLIDH7gBG6MvheBVoTNhqtFlbV5zVcSjfYUUjqBDCbZaKKx1r8Kh0lF4wbDKK0jwn3z1f8gWoh+96KlXop+7ieCGf/sAdB+a6m0EUxpryQm+y07QJ7gmLUkE/lahrk4PGXpP7QCQzVA+2MY3/F+9ZPBuN1YVhndfalE2PwEW0nMgTsBosxwpoQIBfD9X7p+x7o1zG5MAAAAAElFTkSuQmCC"""
-
-# 任务列表
-task_list_icon_base64 = """
-AAABAAEAMDAAAAAAIAD2DwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAD71JREFUeJydmnmUVdWVxn/73PuKmquAQhlERZRAgqiItgbFOINEDRCXBonBdmiXmtjtkMSImHZoE5kERUXb1dHVtq3p1fZyamVpDEqLYCAMxiAOAYkSlLFeFVX16t2z+48z3Fvmn179WIv3eO/ec87e+9vf/va+yLatW1QFBAUlf4m4d1VAUf8uYhBj/GdBEFTFXeNucOsIgPsdLKogYlDNEJFwAQDGJKharK26tcTdpX4tiZeK30H98kLqrrTxcPmZ3QHd2QQREElAiDej4o/tFjYCqu4ekcKG0UBbPDf+lGS26jcVjEmiw8RZ552iqFpvfO5pA5J7xBvgLrDO6851GEkQ/+4ucUZp4WAhSkXfB0eIMe5zsEDEn1nyiInzjkj0QIyyO2fYI0RJSFUtxntarTusiDrbEBcVkdwj+W4IYILR4v3R5yUgYU0fwbiEd5yqX844R1uLSjis+7eIRO8Hp6GgAqk49JNHQkGMi24xLbx3wvkDjByuNV6CCKKaG4DxP2g0GgEbIgN55EPaoQ7VEiCocW0Hpfze1BiDVRs9ocFD3nuKYoLH/MltZrE2Q4zJvai5nTEJNRwn/JYTQ3SMNzZJEjTAJobJ+DMF6In7JIqqc3gKihQ3iRgN3swPb7OMJElobW2hVCr5qPg7rMd/ZJC/fsXvFcS4ezXLyLKM9nKZ3iwjkQQ08yfyLIR6O21uoM+HVDVf2p1VCzTnwy6CzSz19XUo8Mry37B+/UZ6eioFr4K3FmdP2CyHQXwXXN4hZNUqI0eO5JKLZ1DfUKK9fT+JZ7O4do4mrNW4FgKy/dOPVP1meQLnPC2AtRlNzc188qdtXPV3N7Bhw/sMP2QYdXW1ZNUqNsswiYk0bAtMEZI/4tZ7TlGMMezZs5ddO//CmLFH8+tnn+TIkYexc+dOUiMIDt4BH67mODoNh0uj8wLO1FOZx7vajNrafuzc+SUXXjiT4YcewprVv2H0qFF0dnZQKtXQUF9PuaNMlvnQ+0RzNphCMSSunVnLwQcfzPz5S1j60KMcftihTJx4Ji+//BzHjBvD7l27SBKf7Lj8sdbmqDCCEcHETA/U4vEeSUeVhoZGfn7nL2lobOC11/6b1tZmZs6azSUzZ/POu2uZNftqPtm6jYbGOpqbGmlpbqK1pZnW1hZaWppobW1mQP/+DBjQyoDWVvr3b6F/aytGSqgq5XI7//b0rzj7rDO44IIZvP/HD2lsbEStRhhpnvUoFptlWJuRRk9psbx7alWlX79atv/5c15d/ga/vPcfSUSZNetKRo06kltvvZUrrryGE044gVFHjWLNmt/xs9vuor6hAWMkQkoE0jTB+NwSY+jtrbJg3t2cNulUbptzByNGfp0B/fuz+8u/sGjRQyx7ZAG2s9PdIwJWvYQxjqbFRTk1IlhCuQ5VMGeRmn41bN32KZWeCuPHH8Om9zYBCUOHHsL0adP5zvTpZFVlz949jBgxgmuuuZokMRhjvL5xG1lrsdYVTWMM1mYMGzaEMaPHsvmDDbzwXy9RqVR4d+161qx5l3379lFKUw8b7wVxZ7Qe7iKQBrYoMkRetp1BvZUqCPRWexl15BF0dnSSWbjx5pvZtftLXlu+gkFtB7Fp4wZ+t3YtpZoasmqVJEkwQcsUhJjxVXjNnHVkVUuappz+rVOYMW0GS5c+yKpV72CtYkqC2nBfkDYRJKCQFgg0UlXgn0BXJkkQhGq1SmNjHb+49w7um7eEtkED+WzHDp566nFqalIq1YzdX+6mpqbkq2nAcKC+vEZkWRZhtm9/Ox9u+ZhKbzfljk7SJCVJJBbCXBmHkzn9YNWSShBTFH8kCrlY7nE47ih3cuaZp9Jebuell5fz7K//lXVrf8+efXs4ZeKJTDplEv+fl9UeKj0HKKUlX65cle+rvBz9qoaaJaR54haCXBBbwRhFyaoZ/fsP4Ce3zuXNlWuYden3WLxgCS+8tJxnn3mSLVs+5N+feY76utq8N3AlMypMIyZKA6duobtSYfTor3H+1Mme4/NCVaCfqL8C7SOG1FrrQ5lXzKBF1RsTPNGvtoaPPv6YN377P0ydOoWPP97C66//ltmzZ3HE4cPZsGET69e/R21tP0C9uvCmWItViw3i069vjKHc0UWS9sOYFLCRSAgH7qNLxPcdbu0UcQpDCl5yUjWIpzxrFEiSlKxqGTpsKJs2buC666/h4Yce44rLL2X4ocO4/PJZfnPFGEedWWZBxAk2rywTj/8gU9oGDaKaVQpNlcuh4HpXhQsI8WIzNWKwxSQzucBWk1stAj3dFUaMOJxzzzmDB5Y8zLfPn8K8+Yv42U9/QtvAQbz40ovccvNtNDTUk9kMQUjTBGstWWZJksRVa6eVUbUkxtDeXmbq+VN5YPFCrD+4WoukSS4Wi0AKbKlSKGT+QvEdWNBmYnJ2StKEvXv3cNddczjxpAm8+OJLPPrIg0w85Zt89vl2Tv/WJDZvXoeNh8TVA2ujAs2srw2hKfG02tXdTXdPO4kxOWSMh4f2OX6UKwBpsactpAoGyFzE3GHUdWzNzc28uvw1Hnr4MYYMHoJVmHjqWSxeeB81I0u8ufJt0jTF2gxUfY/r1CfGw9CYPjv29lZpa2tj7NjRTsUKSDDE56D1Ik4L9gh4GiUXbwF/RSkbakKSpOxvL3Pb7Xcxecp5XDT9fC7+3veZ8d2LGH/sMaxYsYJbbrmdxianY6zNE1KtxhrgjHPbGWNo7+ji2+dPZv59d7teO0gBT+UW3FqFblDEoPg6EPU1Ersi9cIu0KGqpaamxNatn9LQ2MKgtgFMnjyVa6+/jm1bt7N7zxec+DcTeOqpxz3+/UYmSGBHnWpdRRVj0HCdMbS09qda7XZFM/TQRYqXnCltiIEqqVrPMxIKlwkkkofee6q7q4tx48aS9fayZcuHzJk7lzXvrqbrQA9Dhwzn+Ree57of3kJjU2OU0BKYzDNI4P+wQZqm7NvfzoXfuZAHFy/AZtW/6rGDAfhI5I258TmgflQkxaKTGxGsV2/QsmWLWLToQd5a8QZtg9p4/J8fodyxnwkTxrP8leei4W4zt1DspBQym/lZkJtqZNbS0FBPT0+7azVxkItg98QiAokYNwALDgjOkYK31apfqNB844ZOvdUqhx06nK9/YwybNr3HXXffycL7l3LO2acz+qgjaGlpiXdEhvPuzGuT906IigiVShW1lpDeMVlt3gdr0GsiYDNvgF/Q+LlMCEQxbCEPbGZpqG/kstlX0l7u5IfXX8dVV1/PF7v2cuXsH7By5Squ/9EtNDc3k2XWz3J8/xuEoTEUz2+MoVzuYNq0C7n3np+T2Vwd50OCHA4hl8SkgJLG6UDwjsOJ874Pu6pr7Wrr+rF58wd88qc/M23aBTz4wBL27u/kvHPPJcu6GXv0N1j26FJEswiZEFWr1reXlswncjAqyzIGDz6YarUHkyS+ABH1WCGkuUM91NMAn3z24vEn+SQhEG21WmXIwQdxoLOT+ro6hg0/lLPO+RpPPvEUf/+jq1m9ejV33j2P2tq6OFET4yjRGHFFKog6D4ckSSiXOznjjNMYf+xxrug5wBYOLQUoRxy6jizQqMTLCgHrM9ZQKpUKBx00kKuuvIxlyx7jhBMm8Kt/eYKFC+aRJgmD2tq4+LvTKJVS8qYor7xqLdXeqp9aECVBV1c3o0aNJLO9vmDl0bFhKhcdjY+sO19aADlhzK7eA27E4vMCQ6mUsm/ffq699iqOO/44Xn1lOXPmPE1dfS2f7fiMI486gnHjxn/VV/+nVzXrpLfSTWKC560nEzfVCCo5GGLd4JQUr/WlmCwCKm4+GWuCCNYqra2tPP30s9y/5CHGHX0Mb618m3t/sZD//I+nWbduA3fdM5+W5mbAMZkxDi5FPjfGxGcCRoTOzk4mnXYq115zlT9YoR/wSJCgRP0PAfapszKExuNW881iBVQlSRO++HI3981bzKzvX8rJJ53IzJk/4IZ/uJHhhwyh0tPJxG+ehDGO5azaAiDVO8HG5kjVIqp0HuiiqamxMDo3XkQWIGzEk4p7WOL6apNDqO+jCqJSBLwEVmpKJXbs2EFTcytpkjJ9+kXceNONrHjjdS656DxHmYlxDY1nLhMKoHF1RIyQmCQWOWOE3kovAwcOchHxEOqTtBompYVk9tBwSVwITSAqESdlM2ujnuno6GTC+GPoV1Ni7brfM3fu7Tz//PMcfvhIhg4dzh83f8hbb75Nv9qauLFV66bZ3hhrFZtlZFZJjCFJE9rby5x51ulMmXw21mbhyUTsy0MFF89eUZo4GtUCrwIY17KJIAYqPa6JKSUJGze+z8knTWDhgntYfP9SXn3lFSZMOJ6bb76BnTs/Z/yx43jxhWfd6D2q3PB37iRnWOaJ0l1R7ihjbTd/eH8zgwcPpqmpic5ye59aoB6G6qEpYpDt2z/SYEAR96HxsdWMtkEDueKKG3h71WpWvfM6g9r6A1CpVKip6ce+ffujyrTWgmhBnues4tY33oM2to8AbQP7s3b9Jk6dNIX58/6Jv718pp+PJjmSbOjkPKCM+Ol0oJrQaxJ0kQtfTU0N+9o7OG/KDNJ+Ncyfdw9jxoyilCYRClJgmdjyhcIYmC6Gv6CwfDf21spV3HTTrZx80sk888wTlNv39EkE1b73RSO2bduiGvwkedV0j44sAmSq1DfUs3PnLn7847m8+tobtLa0UKpJXcUNBy9AIhhf/He+cUwRRAxd3d309PRw2ayL+fkdPyVJDD09PU6fxd5G46OrIG9E8AaodfMaCQ/uCpjz+r1arVJbV0t9XT0bN/2B997bTHdXj8do/ghUMH1GlF/1nniKLBrZ1NTE+OPHceTIEZTby9hqhkqeuDYUMd+lBZEoIsi2bR+og4wpVLrwVDD3QDF09XV11NXXuR4hPFoyUkhYL37Dw8IYDa9AyR0k4pjuwIEuug50kZqEWFyN6dvN+TwKcRWB1EhCkYm0sHD0nuATzi104MABDnR15TgIZscOqk83lB+oQI3RUQXpniYJkcrVicpgfBSGqB9kuc+RRmPTocVvChuFWSlOChQbFPWFMB4+wCcs0WdAUDS6YGAYZJmIPEJbaiQ8Hw4Px/OnNn4uFJhDoqdzjVSQteo0Em6NOADog/fIZr63iDXebfhVNomPtiQItD7x83sGx+d54aJkfT9QYIviZk7aZk6bi+RcrkJ42BCP4b8KfYSzqajpyaFRMEYzW4hYYTIeTmTyNcQ7UGNGgwn/laAP22k+vg5fRifHc+dDVwmHlGIK538i3OKkguikPGdyQ4MrMX0nJGKIjVCAvHvQLfSplNGjzsbce7FY+W+8VQGB4RXkuaPJcFCPheDl4NX8NMTRuhAVcQ5TAc36GK4K/wvlA8fL6M4JGwAAAABJRU5ErkJggg=="""
-
-# 链接
-link_icon_base64 = """
-AAABAAEAMDAAAAAAIACYCQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAACV9JREFUeJydWs1PE88ffmZ22yIvLbQlQjXGb6B4MurBi948GEQ0CNGrV6PxYHiRFxHkRaCQePDgX6E2vAUvHj1w0RgOIBSMAUGhFQqU0HZ3fwcz85sddtvFSZpld2dnn+fz/pmF6LpuEEIwMTGBDx8+YHNzE/86DMNwNI8Q8k/rE0IQDAZx/fp13L59G4ZhgGiaZrx58wZTU1M4ceIEVFU99sIMuHiUQYrXxHvHJaNpGlKpFOrr6/HgwQOo09PTmJqaQmlpKXRddyxFBkqez851Xbd8hhDC5xBCoOs6KKWm67mGqqooLS3F5OQkzpw5A/Lw4UNjY2MDLpfLMXgRuCz1fGswiRuGAUqp6ZpTbRBCkM1mUVFRATUej0NV1bwvFu/bEXAiANGUdF0/ohH2y7eGoijY3NyE6vSlIkgZvDzHbjiRMNOMU23k9VgZcD4CdudsMIkTQrgJyfOZZpxoIycBK7OxAyr6gFUUEteglCKdTiOTyYBSClVV4fF4uENbzT82ASvJ291jg0WxXM6sKApSqRRCoRAqKipACMGvX7/w8+dPFBcXW/qFnUBsCeQzGyttWJEVX2oYBlwuF5LJJMLhMAYGBhAMBgEAiUQCvb29mJ+fh8/ng6Zp3Hys1hLHEd3Ymc1xHVicr+s6FEXBzs4Oqqqq8PLlSwSDQWiaBk3T4Pf70d/fj3PnzmFnZweUUktTtdKqpXFZJTQ78PIz4jxd1zn4ZDKJqqoqDA0Nwe/38+uKokDXdfh8Pk4imUxCUZScZpyTgCxBeREGlgEU74vXWLwWwQcCAWiaxqXMnFTTNJSWlpo0IQYFu2EiYGcyVlKQTcRqrqqq3GwikQg3GxZVhoaG0NfX9xeIBYn9/X0TUSsy1Aq8lTZYbSOClc/Fa5RSbG9vo7q6GpFIBH6/n4MnhGB0dBQzMzP4+PEjhoeHQQiBoiicxMDAAEKhEA4PDzkGWYhHCOQzIQAmtYoFm3iNUoqdnR1UV1djdHSUmw2LLKOjo4hGo/B6vfB6vZienkZfXx8ODw9BKeU+UVlZiUwmY6qfbAlYTbBLWlbaEe15f38f4XDYBJ5SCkopIpEI3r59i9LSUmiaxtd0uVyWJXi+oeabmC/Wy9rJZDIIBoMmm1cUBQAwPDyMaDQKv9+PbDYLVVXx588fNDY2orm5GQD4/Hg8jtXVVaiqyjUtJjV2PKIB8W8nyYstxl6STqcRCARQXl7OzUnXdYyMjCAajaKkpISDTCQSuHPnDpqbm2EYhgl8Z2cnNjY24Ha7c0YiEwGrWkaWtEyGARebEjF7GoaBFy9e4Pz583j9+jUODg6g6zoSiQQaGxvR0tJiSnZbW1vo6OhALBZDYWGhycysBE3tJJtLMzLpbDaLVCqFvb09EEKwurqKWCwGQgh6enpw6dIl1NXV4fLly3j16hV2d3fR2NiI1tZWU7KLx+Po6OjA0tIS11QuqwAEH3DisPJ9Sin29vZQXl6OsrIyGIaB9fV1rK2tob29Hf/99x+uXLmChoYGpNNpuN1ubG1tmcCzZBePx9HW1obl5WV4vV5ks1lHPQEv5py0g6LNsyQVDocxNDSEkydPAgAWFxfR1dWFhYUF3L9/H/X19Rz81NQUPn/+jI6ODt4PM/Ctra0m8LlKaBHPsbcgxPIgHA5jbGwMgUAA2WwWiqKgpqYGZ8+e5eAPDw/h8XgwPj6Oubk5dHR0AAAymQxcLhc2Nzfx9OlTxGIxE3jRD3ON/DRhLmVVVcXu7i7PsD6fD/v7+8hms9A0Db29vbh69Srq6+uRTCbh8XgwMTGB2dlZdHZ2IpPJ4ODggINvb2/H4uIiSkpKkM1mjytPZwRE8EzyIyMjCAQC3DwURcHg4CAuXryIhoYG7O7uwuv1Ynx8HN3d3fj+/Tvm5+dBKYXH48Ha2hq6urqwsrICn8/n2OblQe7evWuwUCiHRvHI6vnq6moOXizMIpEILly4gNraWm420WgUnz59wsrKChYWFhAKhRAKhUAIQSKRQDweR1FREe/C2FpOjqwsUYGjnZOc8VwuFwdvVZixDHvt2jUAgMfjwbt37/DlyxdEIhHEYjE8evQI+/v7+Pbt298XqyoKCwtNDbyIxcmRUgpqpzZ2nTmsHXgxwz558gSzs7OYnp7G169f0dvbC8MwUFVVhVAoBMMwUFRUhIKCAr6RZrfdmOucCVrX9b8+IGZdcTKlFKlUCuFwGMPDw7yTEkviaDSKsrIyUEpRUFCAx48fY25uDt3d3abQLG8f2u2P5vMDmYytE7PCrLKyEoODg0fAj42N4f379/D7/aak1tTUhLa2Nt4qUkqxtbUFtgPIyMjvcgpeJmJKZKzwYufZbBanT59GIBDgtppOpzE2NoaZmRluTqwwa2pqQmtrKy/MVFXF1tYWWlpaEI/HUVhYeKR6tZK+eMynKW5CsmpzSYM1GayL2t7eNoHXdZ2Db21txdLSEgfPnhMjiZ0T29035SWRkVxFut1urK+vY3t7m2+/u91u9PT0wOPxYHp6GgB4PS9XlW1tbVhaWjoS5+0A2YHMNci9e/e4TuV+lxDCu6v+/n74fD7TztnAwADcbjfa29tN4Flts7S0xMsDGZisDVGQVgTFDV/TfZGAVeNCKUUymURNTQ0GBgb4zhlzUjZHbEba2toQi8VM5YEsUSvJi98L7EjIax1paOSHdF2H1+vFwsICnj17hp2dHVOEkcGLhZk4J5c0ZdB216wKvCNh1Mr+NE3jJLq7u7G9vc0jlmjz7e3tWF5ePrK/Kf5E52V/W5mH3bPysMwDVosxTczPz+P58+dIJBJcupubm+jq6jKBl6OMlXnYRRo7DJZYRR9gw24Tialwb28Pp06dQkVFhakLKyoqgqZppjWsBCOem+xZIC3PsSNg2dDIkUImUVxcjN+/f2Ntbe3vIqrKq0o7sLkI5JqbL6Tm7MjEbW55p8LtdsPj8ZiilpP4nU8LdontnwiIC1p9fbHaoZDJOiEgH4+TyFTZROyGuEssLi7mCxF8Lh+wkq5TwPJ6lDXkThbIlxVlcP8ScZx8YiWEQNM0BINB0Bs3buDg4MDxt1m7+CzHd6tfvrzg9P2sT6mtrYVaV1eHHz9+YHJyEoWFhXwj1ikR4P9mlM8cnUSmfIPtAt68eRN1dXUg4r/bzMzMIB6PO/KJXI5q97w836o7yzUIIQgEAqitrcWtW7dgGAb+BxtPgyVTylm+AAAAAElFTkSuQmCC"""
-
-# 标题1
-h1_icon_base64 = """
-AAABAAEAMDAAAAAAIAA1AwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAAAvxJREFUeJztmr1O60oUhdeecZQmErHzFDRRFIoIGpBc8AC0eQxegyfAgcodT5EghZYqHUICUVEQJx5wwF63yB0Lzjmcy1VsTKR80i4sWeO1NOM9fxvGGBpjGEURSdIYwyAI6Ps+W60WlVIEUEmICFutFn3fZxAENMaQJKMootUNYwxnsxlJcjgcstfrVSb4v6LX63E4HJIkZ7PZ0oAVH4YhtdYEQKUUlVIUkcpFi0iuBwC11gzDMDeBLMs4Go0+vFC16M/CatNa8/LyklmWEXEcs9vt/njxv5rodruM45g4PT3Nh03V4r4aVmsQBMTBwUE+zqoW9n8MiAj39/cJ13UJ4Ef8sF8Nq9V1XYqIkCTWERGBYOlqbXHKbFxEPjyX0dOlGFBKAQCyLCuj+Q8UakApBRFBmqYAgEajkffCYrFAkiRFfi6nkKzwPg23222en5/z9vaWNzc3vL+/53g8ZqPRKCPjFZfe9vb2GIYh5/M5SfL19ZWLxYIk+fj4SM/zfpYBO6Fsb2/z4uIiF2uX53Eccz6fM0kS3t3dsYw5R/1hSH0ZpRRI4vDwEEdHR3h+fsbT0xNEBPV6fZmn/w37YxfNSq3aLHN1dQVjDBzHQbPZxMvLC6bTaW6wTFYyYMVNJhMkSYJarYYgCLC7u4vr62vU6/XSU+lKadQamE6nOD4+xmQywXg8BgDUarXV1X2BQuYBEcHZ2dmyQcdBlmWlDx1LIQZIQmsNkkjT9NvEAwXOxHb2/XX9Uzbl5LZvZGOgajYGqmZjoGo2BqpmY+Az0jTF29tbHnapUTSlnQttbW3BcRy4rgsA8DyvlHVSaQZOTk7Q6XTyjc7DwwOiKAJQ7AHX5mjxM7TWH4aM3SsUzdr3wPqnUc/zAHz/TmoVrNZmswnVbrfzw6d1wertdDpQ/X7/WzfhRUES/X4fa3vNurOzs7xmtRfd7y+Rqxb5N/EiQq01R6PR8qJ77UsN1r7Y40/lNoPBgL7v0/O8ysttPM+j7/scDAaM4/i3cpt/AE3Jhr3qHIToAAAAAElFTkSuQmCC"""
-
-# 标题2
-h2_icon_base64 = """
-AAABAAEAMDAAAAAAIADNBAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAABJRJREFUeJzVWr9LHF0UPfNmZpvogCKCVYgEBJuFgOlMYSmxstFii1QWFoJFFETSpgjpHQghxf4DIUXSKOI/YGGlgj/AIkRwd+fNm3Wcfecrkve+GD/zmZ2RzRy4zeybvefc9+bd++4MlFJUSrHVapEk4zhmGIacmpriwMAAHcchgJ6Y4zgcGBjg1NQUwzBkHMckyVarRcMbSilGUUSS3N7e5sTERM8I/59NTExwe3ubJBlF0XcBhny9XqcQggDoui6FED2N/s+zIISg67oEQCEE6/W6FQGtNXd2dixhM/BvNNd1raCdnR1qrQkpJavVqh3Qa5J3EQGA1WqVUkoiDMPSkP9VRBiGxOTkpJ2WXhO7q5nlPjk5SQRBQAB/xQN7VzNcgyCg8+NiaSF6TSAvvPv4U8dxIMS/sSFprXBfKGgJOY4D13XR6XRuJeq6LkhCa12Ey+9+UYAAQ9xgZGQEDx8+xODgILTWOD8/x8HBAZrNJgBACFGoiEJ2hiAIuLi4yK2tLX779o2dTocGV1dXPD095bt37zg2NnZtLy/A8u3HnudxdnaW+/v7lnC73WYURWw2m2y1WozjmGmakiQbjQafP39u7++ZALMXDw0N2Wq20Wiw0WgwSRJqrUmSl5eXjKKIcRyz2WwyTVMqpfjkyZOiZqL7m43zer3ONE2ZJIkVsre3x93dXX79+tWeM5RSbDabJMkvX74UVQHkF/Ds2TOS5NnZGV++fMnR0VF6nkfXdTkyMsI3b96w0+lQSkmlFOM45uXlJcfHx4tYSrnXIIUQXF1d5aNHj24ds7m5Sa01oyiyp79arUYA9Dyve98oAFprvH79GkdHR/A8D0IIOI4DAKhUKhBC4PPnz3Ac51qOGB4ezu27sEzseR601siy7Np1rfWtia3VauX3m/sffuBX4gamhHj69CmA7xnbzMTh4aEdkwe5n4HbzDycjx8/ZhRFTJKEUkqmacqTkxP29fURyFfK31s1+nNB9/btW/T19SHLMnQ6Hfi+jw8fPkBKaeujPLiX6Pu+TwBcWVmxHQQT/ePjY9tzKuAgdX/k5+fnqbWmlJJxHFNKSZKcnp4mUFg9dD/kp6enmWWZTVxm719bWyuSfLECDPmZmRnGccx2u00ppS0fNjY2CORLXPcmwJCam5tjlmWWvIn8+/fvbeOs4AZCceRfvHjBLMuYJIntXZJkGIZ0XZe+79sayVjPBZhoLi0tkSSVUvahVUpxdXW1yGjf9G9UdANT86yvr+PVq1eQUtprQghEUYRPnz7hwYMHNiM7jgOtNSqVCs7OzrC8vIwsy27USX+CXMtmYWHB9uxN1I21223+DhcXF+zv7782k3/MoyvJP2F4eBhpmuLq6uo/f0+S5GbESPi+j/Pz89xZOLcA3/dRqVQwODj4x/cODQ3ldd+9ANMW+fjxI3zfR5qm15pZv4OZgePjYyil7LVuUPreaO4lJIS4c+R/BclrDbFuUPoZKH13WgRBAAD2EF4GGK5BEEBUq1V7Ti0LDN9qtQpRq9Vsii8LTNlRq9VQ/tespX/RXfpPDUr/sUfZP7f5B8yBF4pGig6sAAAAAElFTkSuQmCC"""
-
-# 标题3
-h3_icon_base64 = """
-AAABAAEAMDAAAAAAIADvBQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAABbZJREFUeJzVWT1oFF0Xfu69M6MsBnfd1U0KY5FK0aAJJGIKzWoRApZCsDCFYC8o2IuFvSCoCYgk4E+njSAkcQ0KihY2qbTIKoiLaGZ2dnZ27jxfEee+rnl/vteZlzUHTjHM3/Pce+49zz0H/G5RFJEkfd/njRs3WKlUWCqVaFkWAXTFhRDcuXMnjx8/zpmZGbZaLZJks9k0jh/BLy8vc2RkpOMjUsquEfjZR0dH+ezZM5Kk67rrBBLw8/PzZrSVUr8VcCmlwWPbNufm5kiSnuetz8Dz58/pOA6llF0NmX9yy7IohKDjOKxWq4zjmPA8j4cOHTIj322Q/+QJxqGhITYaDeLWrVtmmroN7t+SmJ2dJcbHxymE2FQEpJQUQrBSqRDFYpFCiK6D+jee4C0UChRKKcZxDJLYbCalhMA6q01r1n/xUSklhBDmmqTxrC2zGZBSQkqJKIr+8hmlFEgijuMsfgkgIwKWZRngQgjs3r0b/f39yOfzIIlPnz7h3bt3+PLly4bns7BMdoQDBw7w6tWrfPnyJdfW1vijhWHI1dVV3r592yTNDLftX385SSjnz59nEAQdoKMoYhiGbLVa9H2f7XbbqN0zZ850vJ/GZZqpSxZquVzGli1bUK/X4fs+gPV4t20bjuMgjmOEYQjXdSGlxOzsLMbGxqC1hlIqDQQAadh/D4PBwUFqrc3or66ucnl5mdVqlR8/fiRJtlothmFI3/dJko8ePcoqlNLHoW3bfPPmDR8/fsyJiQlu377d3CuVSrx+/TpJMo5jaq0ZRRFrtRoLhULHOuoaASkly+VyBxAhhInxfD7Pz58/kyTb7TajKGK9XmdfX19qApkksmSrlFKamCcJIQTiOEa73Ua73e54x3VdeJ6X+t+ZEUjAtlqtDfcvXryI3t5eQySXy2FpaQmu60IpBa31L/87Uy3kOA4mJyexbds2aK3R39+PkydPYmxsDEEQII5j5HI5fP36FUeOHMHKyoohnsZSr4EkhsvlMhuNBn82z/Po+z6DIODbt2957NgxAtnkgczF3Ldv34zmEUJACGHEXRzHuHbtGhYXFwEgM02U2Qz09fUxDMMNM+D7vqnjkOT9+/fZ09NDpVTqw1SmayCXy+HcuXPI5/OIogi9vb04fPgwhoeHAayPuNYatm3j7t27mJqagpSy+2vg71wpxbNnzxo9pLWm53kkycnJySzWQvaALcuiZVlUStFxHALg5cuXTSLzPI9xHPPOnTupCaQSc4lJKY0o01ojiiJEUQStNbTWsCwLS0tL5vlkcQ8MDKTeRlPvQj8DsG17w3UQBCgUCgCAMAzhOA4AZKJEU81AAuDo0aM4deoUbNtGu902I6+1RhAEKJVKuHDhgsm4yfl4ZWUFJFMRST0DJHHp0iVMTEzg9evXWFhYwKtXr/Dhwwf09PRg//79mJ6exr59+9BsNjtyxL1798w3UmH4Ff8x+9ZqNQZBwDiON+QAktRas9Fo0Pd9c9x8+PBhR9U5hf/6bgOAU1NT5tzbbDbpeR7X1tboeR5d16XrugyCwDQnSLJarXLXrl2mRNgVAkk9dWBggA8ePDBZ9u+sXq/zypUr3Lp1a8d5IY1nlon37t2L8fFxDA0NYc+ePcjlcgCAVquF9+/fo1qt4smTJ6jVagCQSQYGMpDTQggopf7vOo9SClnWYjOvzPFPKm9Sru/W/0URedMXdzOREt00WSgUOirJm8ESvDt27IA8ePAggD/idDNYcsIbHByEnJ6e3nTdGSEESOL06dOA7/scHh4mgN+6R5z4j21W0+h+8eKFaXT/zr3iBJtSik+fPl1vdCdl8bm5uY4HMtIp6aXCd8lh27bBNj8/b4oFaDabdF2XJLm4uMjR0dGug/4rHxkZ4cLCgjmaxnG8TiBRkSQZBAFnZmZ44sQJFovFrjbAhRAsFousVCq8efOmKc37vm+k+/8AW1j5Ep7rXU8AAAAASUVORK5CYII="""
-
-# 找素材模式
-find_material_icon_base64 = """
-AAABAAEAMDAAAAAAIAClDAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAADGxJREFUeJy9mnlwlHWaxz/v1em3j5wkQSHk4NIECAmCW7XWjBaKB5eCgOM1kOCwuri7M+rsOIW4ozVyjFO14jFyhUtAcJxlSqUYcBf+mJpi5EwGCBKCAwgkIVffb3e/x/7R6SaBNEkHnafq/aer6/093+d+vr9XCAaDFimIZVmYpondnoYsK5imQWPjeY4fq6O29iSNZ7+hqbkFr9dHOBwBwGZTSE93k5+fx/DhRZSXj2F8xRhGjChGkmR0XUfTNARBRBSFVNRBSAWAYRjY7XZkWeby5Svs3XuAfXv3c/LkaTo6PJimiSRJXY+IIAg9QOu6gWEYiKJIZmYGd945igceuJcpD95HQcEQdENHC2mIooTQTxz9AmCaJqIooqoqFy58y8YN29i1azeXLzehKAqqGgMVF8uysKyerxUEIQEIQNd1QiGNaFRn8OA8ps94kKoFT1JcUkQoFEqcecsADMPA4XAQjUapWb+VNas30dTcgsvlxGazJZS9XuE+DxZAEEQEUSAaieLz+cnNzaG6+hl+suhZ7HY7gUAASZIGDsAwDFwuF6dPN/DLV9/kL3/5Cne6mzSbgmGYKSudHIyAJIlEIlE8Xh+TJlbw1rLXGDu2FL/ff1MQSQHEld+9ex8/f+W/8Hi8ZGSkYxjGd6Z470AkvF4fTqeDZcte49HHpuL3B5Ck3sOp11/jym/ZvIN/WfQS4XCY9HQ3uq5/b8pDLHd0XcftdmEYBosX/ydr127G5XJiGGb/AMSV37z5Y37xizdwOBwoioJhGN+b4r3pIMsybreLpa8tZ82aTV0gbtShRwh1D5tFi36G0+FEEOjT6qLYs2ReqzYWppl6gieU63qP1+vj3feWM2vW9BtyIgEg1pzsnDnTyOOz5xOJRFAUBdPs3XUAkiRhGAbBYIhoNIooioiiiGmamKaJLEk4nA5kWR6wB0VRQNdNBAF2flLD2LGlhEKhRInt4QFBEHhi3kKOHqnDne5Kemi8pns8XpxOBxUVY6msLGdY4VCcTgdhLcKlS5eprT3JoUPHaG/vID3dnQCXqkiShN8foLR0NJ/8fgOyLGGaJoIgIMO10Hn/vXUcPHiYQYNy0HU9iUVEotEo4XCE2bOnM3/Bjxg3rqxHI+suZ86c5ePt/8NHH+0kEo6gOtSUvWEYBm63i2PH6vjwdzW8/MqLiVAS/P6AZbMpXL50hRnTnyKkaUiS1GvciqJIOBxBVe28tWwJM2Y8DEA0GqW+/gwNDefwerw4HCrFJYWUld2B0+kE4K9/PcLLLy3lwoVvkybkzUQQhMSosuuPWygpKSIcDiObpomiKNTUbKXlais5OVnoei/ZLghEozqqaqdmwyomTZqAaZrs27ufdes/oq72JIFAMOFaVbUzcmQJTz89l8fnzODuuyewdftqnn36Bc6fv4iq2lMKJ8uykGWZjvZO1q7dwm9+86vYABiNRq2mpmamTf0RwWDoptb3+wN88Lu3mTZtCpqmsXLFu6xevRFJknA41B7VwTRNNE0jGNSYOfMhVqx4nazsLE6cqGfunCoM3UCUxJQqlCCAacaAfPb5NgoLhyLKssyePf9HU1MLiqL0+kJJkvB4vMyaNZVp06ZgmgYrV77LqlVryMzMwO2OhYlhGInHsixUVSUvL4ddu3bz058tIRgMMmbMnbzwQhVen69fw1pPL4Asy7S1tbP7i31IkowYjUbZt3c/NlvvyscVczodLKh6CoC9ew+w+sON5OfnYppm0i5pmibRqE5+fh67v9jHxo3bAZj3xGMUFxcSDod7TKj9A2GRlpbGl18eQNPCiOcav6G+/gx2e+8xKYoiwWCQCRPKKSu7g3A4wrp1WxLh0p8Q0HWd9PR0tmzaQXNzC7m5g7jvvnsIBkMpeyG+TJ05c46vv25APHKkFo/Hm7QMxpO3srIcWZY5fbqBv9WdwpFCOYxZzcbFby9z8OBhAO6aOD5l5eMS6wt+Dn11FLG29iSm2feoMKxwCAANDY39mtN7E8MwqK9vAGDo0Nu7vD7QGUugtu4kYmPjN8iyBPQOwrIsRFHE6Yglqs/r6xNw0iMFAa/HC5BYTQcyJsVKqsS5xvOITc1XkaTkL4o1EAstHAbA4VBTTrzuBzscKgCRcATD6L3b9w+ATEvLVUSf14fURz02TYNLl64AUFxSmDTh+xJRFBg5sgSAK00tsSoywDyI9yUxEon2YVELSZKoPX4C0zIpK72DUaNK0DSt34fHC0Fu7iDu/qe7ADh+rA5d1wfsTegK777+ZJoWDoeDQ4eOca7x7zhdTp55dh7BoJZ0zbteZFnG4/Ewa9Z0ioqG4fF62b//z6iqHctK3ZPdRYwzC8nEsiwUJdb9tm/7FIDZs6fz6GOP0Nx8FUVRklpREAQURaGtrZ2KinH86+KFAHzx+T7q6xtQVXXABSH+fjG2f5o3daVhGKSnu9m8eQeHDh0lLS2N5cuXMm3agzQ3txCNRrsRWtcewzBoab7KuPIyPvzwbXJysjh79hwrV6zC5XIOKI/iYpomLpcTMT8/F8PQ+2TCRFHEMAx++h9LOH/hIllZmbz3wUreePNV8vJy8Xq9tLd30NHRSXt7B52dHpxOB4tfXMjWraspKi5E16OkpaVRUHA7wWBwQL0EYpbXdZ28vFyEV15eam3f/gfcblefFolvRoVFBbzzzjIqKsYC0NJyla++Osrp0w1d+4CDESOKmTipksLCAiC22KiqnYKCobS2tVG94N84fPg4WVmZSZenmxnT7w8wc+ZDCFu27LR++eqb/XapJEkEgyHs9jQWLfox8554jNtuG5z0/x0dnXz+2Z/47dvvc9vt+Wzc9D75+XlcbW1jYdXAQIiiiM/nZ+nSlxFOnTptzZ1TTTgc6TczHA8nn9fHsGFD+eG9/8yEu8ZTUDAEVbUTDoe5crmZ2tqTHDjwZ77++ixut4tgIMTY8lJqNrzL4Pw8WlvbqB4ACMuKlfZt29YgRCIR66knf8LBg0dSSixBELpWzDDBYAhBELoodxnD0NG0CIZhoKpqYvuSJInOTg/jykup2fDeNRDV/87hQ8f6BUIURQKBIOPHj2HHzvWIiqLwwAP3EolEUmoqlmVhGAaKopCVlUlmZgY2m62rdNrIyHCTnZ1FWpotseDouk5mZgZ1taeomr+YpuZmBg3KYf36d7hrYgUdHZ1Jp+LuhguHw0ye/APsdjuirus89PD95OfnEY321ZWTA+nOmcZ+M3vlURMg6k5RNf9FmpqugZjYDxC6rpOdncXUaVNidw2aplFQMITpMx7E5/P3u7veinQHsWDBNRDrukC0trb3qockSfh8fh555H6GDy+OEVyCIKLrOtXVTzNoUA6RyK3NJ6mC+Nt1INbXrGLy5B/cuK0JoBs6GRnpPPfcsxiGEc9DAU3TKC4uZOFzz+DxegfcYG4FxPz5i2lubiEnJ5v8wbkY11E7siTj6fTy4/lPMPqOkQl6UQgGg1ackLUsmDevmtrjJxIU9z9CYkxDB/fcM4khQ2/n4+1/IDs7K1ERJUnCHwgwevQIPv10Y4KzFQShJ7mrqnbq68/w+OwFCYr7VuaVVESSRIJBLXE/ED83zsiZlsmOHeupqBhHIBBM5EgiyGLsQ4iysjtZsfJ1QqHQdVT59yuGETPg9coLgoDP7+fXv15CZWV51z5+LTd6pHp8258x42F+9careLr214FuTalKnJbvrnx7RwdLlrzE3LmP9npfdkPBjYOo6iKxXl+6HLvdjs32j7ulkSQJXdfx+wO8vvTnPP9CVVImpFfTdgfx/gcrUZRY/ZVl+XsNKUEQkGUZvz+AhcV/v/NWQvlkUZA0NrqH0ye/38j48WNobW3rSm7pOwUSUzx2adHa2kZp6Wh27qxhzpyZ+P3+m4Zwvy66nU4nmhZm7ZpNrFu3hatX23C7XSg2Bcu0BlypYldSApFIFJ8vQHZ2JguqnuT55xfgdDrw+QJdnNVNwKf6qcE3585TU7OVzz7bQ1NTCzabkiCpYmJhWTdyprGkBIh5zjAMQiGNSCRCXt4gpk6dQlX1U4wcORxN0xLfVPQl/f7Yw7Ji/JBdtSNLMhcvXmLPnv/ly30HqK9voLPTk2DM4jtx95vL2HCno+uxESAjw83o0SO5//4f8tDDkykqGtYFKtTj1vM7AxCX2LWpmbC6ruucbTjHkaN11NWeoLHx7zQ3t+D1+olErn1u43a7yM/PpaSkiHHlZVRWjmPUqBFdd9CxDz/iO0Yq8v/MGJjzZ45dYAAAAABJRU5ErkJggg==
-"""
-
-# 删除线
-strikethrough_icon_base64 = """
-AAABAAEAMDAAAAAAIAAdBgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAABeRJREFUeJztmktsVNcZx3/nnHvvPO7YmgmuccYYTJCaQB9R5MCCkHZTumq7aGIjBRMIVkK9w6V0gRBSI7nGLNJV65bag2njEGDViEXTbNtKqBZJbMmoLTKJHGFMDfIMM565z9OFmSEoUqr6Dhkj8Zfu7j6+3z3fd76HjgjDUAshODt+lncmJrhx4wZhGLIWJaUkm83ySu9e9u/fj9YaEQSBPnHiBGdGc9gpG9M0G23nl8rzPIqlEn19B/nFm29ivPP2BLnRMVpaWgjDEK11o238UlmWRUs8ztjoGF9/+mnE97+3W1+/fh3Lsta88VUJIXBdl87NnYhvbvuGXqs+/78kpUQ+qsYDhGGIbLQRUfUYoNF6DNBoGQ/rxUIIhBAgAM1DK0/qDiDlyqI6joPnumjAMAzi8ThSSoIgqOv36gqglKJYLKK1ZlNnJ+3t7SilWLi1wPXZWZyKQ3Nzc11Xo24AUkry+Tzbt2/nJ/397HpxF/F4HACtNVeuXOHMWI5Lly6RSqXqVrbUBUApxVI+T3dPNydPnsQ0TVzXZWpqCs/32fLUU3R1ddHV1cW3nv02Q0NDNNmpuqyE2PbM1ki/QkrJcqnEs889x4WLFzAMg3PnzvHbkRHm5+cJtSadTtPT3cPhgcNYlsWxY8f449k/kMlkIsdE5G1UCIEfBBw6dAjDMDh//jw/HRhg/sY8lmkRt2KU7hY5NTzM4OAgWmv6+/vJZDL4vr+yUzUKoFrWtra28vzzXfi+T24sh520SSQSaK3RWmMYBm1tbVy8cJHP5j5jw4YNbN22lXKl3FgAWNnfk8kkTc3NVCoV8ktLmKb5gGuEYVhztU8+/WQlR0iJBgQNBjAMg0K+wOJ/FrFtm46ODpZLy5imWUtmQgi01sRiMU6dHGbg8ADTH0+RStoEYYNjQCnF/M153n//zwgh+NnRo9hNNouLi7iui+d5eJ6H47oIIZienub8u+/ieR5BEER2oVXvQkIIPM8jFouRSCRoXd/KWC5Ha2sr09PTjPz6N8zMzOB53gNGSiFACMIwpLxc5u7du1ix1bezqwIQQuD7Pk1NTbw9McGmzk04jkMikcCyrNp9nufhuS6+H6C1RiqJQKAMhdaa8vIyr7/+Bh9/9BHJZHJVeSFSIhNC1Gofy7LwfR/XdWuGKKUwDIOkbT/wXL6QJ2bF4F6xFyURRXYhy7JIp9O1YA3DsFaBVu/r2LSRAwcOsHv3blzX5ciRI/z9r39DKkV+aSnSRCRSJq4aHAQBpVIJIQS2bROG4QN+79wL5uFTw/T29jI5OUn3Sy8Tj8dRSkWqi+pSSriuy86dOwmCgMuXL3/hjyqlcCoOdsrmLx98wLqWdfzoBz9kZmaGRCIRqSaKHAOe55FOpzk9+nvK5TLfffE7OI6DlLIG4fs+Vswin89z7do1nlj3BC2tX8Ob8kiKZBQT6tNSaq0pFArYts369etxXRel1P2PSEkYhsQsi2z2SYQQFAoFpIzmPhARQGuNaZosLCww+Y9JlFK81neQ4nKJcrmMFBIpJL7vc/PmTX7c/TIdGzcyNzfHv//5LxLxeGMBqlJKcfr07wiCgD179vCrt96i7ck2HNehXClj2zZHf36U48ePAzAyMsKdO3cwDCMyQOQgrgIsFfL07Olh6JdDmKaJ4zhcvXoV3/fZsmULmUwGgNHRUQYHB7ETybp0ZXUBAJBKks8X2LFjB/39/byw64VaSwnw4ZUPOZPL8af33iOVsqNlr8+pbgDwuaYeTefmzbRn25FKcuvWLWZnZ3HKlbo39XUFgPtjlUqlgud5wErJHYvHUFKt7bEK3B9gxWIx4vE4AoFG1zJ2vfXQJnPVdvJh65GfjT4GaLQeAzRasrpvP4qSUiKz2ewXJgdrXfJeH5LNZpG9r+6jWCoipXwkIKpTvWKpyL5X9yF7e3s52NfH4u3btZVYzfVVyXVdFm8v0tfXxyu9exHV4zbj4+OcPTPO3Nzc/1VsVZuar+KUS+24zd697D+wctzmv5h1omryEN2cAAAAAElFTkSuQmCC
-"""
-
-# 插入图片
-insert_image_icon_base64 = """
-AAABAAEAMDAAAAAAIAAjCwAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAACupJREFUeJzVmmtMXNXax3/7AsyFXRAYyzQVbMJACTFlWoVq6i2S2FbrpTWRVEGrIdaYmNgQbY1+8oO2XmhaiybWlFoaTQylTVPBBKj4QVDD1NK00XKxYIIw5WIYmGGGfXk/9Ox9GGag08o55/WfTIbs2Wut5/+s57aehbBq1SqDfzDE/7UAfxf/eALyUk4miiKCICAIAoZhYBjXrHP+M13Xl2zNv03AFFpVVaamppiZmUHXdSRJQpIkADRNQ9d1BEHAZrNht9uRZXlJyNw0AVPwqakpgsEgmZmZlJaW4vV6KSgowOVyYbfbAQiFQvj9fnp6ejh37hzd3d34/X4cDgepqal/i4hwM1FIlmVL26WlpTz77LPcfffdGIbBH3/8QV9fH0NDQwQCAQAURcHtdpOXl0dOTg4AHR0d1NfX8+OPP2Kz2UhNTUVV1f8sAVEUMQyDsbEx1q1bx+7duykqKqK9vZ2TJ0/S1dXF+Pg4qqoiiiKieC1G6LqOruvIskxmZiZer5etW7dy7733cvHiRfbu3YvP5yMjIwNBEG5oNxImIEkS4XCYSCTC7t27qaio4Ouvv+aTTz7hypUr2Gw2HA4HsixbDhu10L+eqapKMBhkZmaG22+/nZdffpmnnnqK+vp63n33XVJSUkhJSUHTtKUjIEkSwWAQRVE4duwYdrudV155hXPnznHLLbeQkpJiaTkRmLsTDoeZmJiguLiY2tpaQqEQFRUVTE5O4nQ6EyJx3TxgCp+VlUVLSwuDg4OUlZVx+fJl3G43siyjquoNbbuu66iqiizLZGdn09PTw0MPPcTg4CAtLS24XC6mp6etKHbTBEwtKYpCU1MTzc3N7Nixw4oes7OzMaZyIzBNKjU1FafTyY4dO2hubqapqQlFUQiHw5YfLYRFTcgMk99++y2///47lZWVZGdno+v63xJ8obVEUWR4eJgvvviC3NxcNm3aZIXZhbAgPVmWGRsb46233sJut7Nz505cLldCwguCYCUySZIsx14MZi5wuVy89NJLOJ1O3n77bcbGxpDlhdNV3B0QRZFgMEhhYSGnTp1i8+bN9Pb2xjiWqTUTmqZFZeW5wimKYmXfxSBJElNTU+Tn53PmzBkee+wxfv31VxwOR1w/i0tAkiRGR0dpbGykt7eX1157jRUrVjA7O2sJLkkSkUjESlaSJJGens7s7CzLly/nxRdfjMoDn3/+OSMjIyQlJcUNsZqmWc+TkpIYGhriww8/JD8/n61bt5KZmRk3KsXsjSiKTE1NsX79eoqKinj11VfJyMiwsqSp4dHRUVauXMkTTzxhEW5ubmZ8fJwNGzZQVVUVNW97eztdXV1kZGSgaZolsJkfFEWxwrGqqmRkZPDxxx/T2tpKSUkJ58+fx+l0xuxCzA7IsszIyAiffvopoihSVVVFdnY2qqoiCALhcJicnByefvpp7rvvPrxerzX25MmTTE5OkpeXx5133mlpTJIkfv75Z/r7+y0hFUUhOTkZgImJCfbv38/g4CA2m83K2sPDwxw+fBhN09i5cyfLly+PKTdiCJhaaWtr4/XXX6e9vR1FUSzmhmHQ2NhIcXGxNWZ+6ZAIWltb6e/vJykpiZSUFNxuN1VVVZaiRFEkEAjwwAMPsG/fPh588EFLtrmIWtF03jVr1gDg8/ks5xEEgUgkQnZ2NsXFxbS1tVFQUMDp06eRZRld14lEIsA1m29ra+PAgQMcOHCAs2fPWgqYmZlB0zSam5s5cuQIx48f5+jRo6xatYqVK1cSDoetesjhcNDV1YVhGKxZs4ZQKBSjpCgfME3E6/UyMDDA+Ph4jPOY4S4cDjM6Osr09LQldHJyMj6fj+rqaiRJoqioCIDTp0/zzjvv8MEHH7B27Vo0TeP999+PEsSss+YKaIbygYEBvF4vZ8+eRVGUhQmYAno8Hnp7e62wOBdm9Nm0aRP9/f2kpaWhaRrJycn88ssvbN++nTfffJPKysqocceOHeOZZ57hyy+/pLi42DI7wzCs7/kwo1Nvby8ejyfuOzFGK4oiLpeLoaGhuFXlXKSlpVnmpaoq1dXV7Nmzh8rKSjRNQ1VV61NRUcEbb7xBdXW1Jbwp5EJJziQ3NDREVlZWXB+LeSJJEna7ncnJyes6pRkKRVGko6MDXdd57rnnLEc0M7EoiqiqyvPPP49hGHR2di6o9XiYnJzE4XAgSVLMmCgJ5x/Cr4e5O3ThwgUKCwuj5pj7njl/YWEh3d3dUetdb43FZIkiYNpcMBhk2bJlN3Yy+heZxRYzo0siyjGh6zrLli2zoteiYdQk4Pf7cbvdCS1m/u71erl06ZL1fK525/598eJFK/klMrdhGLjdbvx+f1x5YkxIFEV6e3vJy8uLa3PzIYoiuq5TUlKCw+Hg0KFDVvVolgxwLSQeOnQIh8NBSUkJuq5f18cMw0CSJPLy8ujp6YkbVGII2Gw2fD4fubm5ZGZmJtQpME2npqaG2tpaDh48iGEYyLJsVaAHDx6ktraW/fv3Xze6mTBrotzcXHw+HzabLWZcVB7QdR273U53dzeGYbBu3Tq+++47FEVZ0CTg37tQUFBAQ0MDu3btoqGhgfz8fAB+++03nE4nDQ0NFBQUoGlajPbjzRkIBLj//vsB6O7uxm63x/hlTCJLSkpiZGSEzs5Otm3bRlNTk5WsrEGyHNVtMxGJRFi9ejXffPMNnZ2dXLhwAcMweOGFF1i/fr31jiiK1nxmu3H+oUcURUKhENu2baOjo4OxsbHEijlRFJmenqa4uJijR49SVlbGX3/9ZdXxuq7z1VdfWQItFTo7OykvL49qVaalpdHa2kpFRUXi5TT8+0Bz4sQJ+vr62LVrF263G1VViUQiuFwutm/fTkZGRtzIML+JO7fpO/89URSZmJjg+PHjXL16leTkZGRZZmhoiI8++giPx8OTTz5JVlZW3APNokfK1atXc+rUKR599FEuX76M0+m0OgmBQCBhZ1wIc3OH0+kkKSkJQRCYnp7G4/Fw5swZHn/88UWPlHFPy7quk5qais/no66ujs8++4wNGzZYwsqyTFZW1k0LPhfmnKZwZoPs8OHD1NXV4fP5uPXWWxeMhgm1VZqbm7ly5cp/ra1ing82btx4820Vc9Lk5GTKy8spKSmhpqaG4eFhK8EsFcy5RkZGqKmpobS0lPLyclJSUq6brRcloOs6NpuNQCDAI488wsMPP0xdXR3T09NMTU0l1O9ZDIIgIMuyNd+RI0fYuHEjmzdvJhAIWOfnmyYA18oBp9OJ3++nrKyMnJwcWltb8Xg8DA8PWz3OGzkPi6Jo9VSHh4fxeDy0tbWRk5NDWVkZV69eXbrm7lwSoVCILVu20NrayokTJ9i7dy/p6emMjIwQCAQs05JlOaozN/eZYRgEAgH8fj/p6ens27ePhoYGWlpa2LJlC8FgMGHh4SYvOMbHx/F6vezZs4eioiK+//57Ghsb8fl8jI2NWWWv+TGdXpKkmAuOS5cu8d5779HV1UVmZuZ/7oJjLswrpnA4zF133UVFRQX33HMPhmEwMDBAX18ff/75J5OTkwiCgKIorFixgry8PG677TYAfvjhB+rr6/npp5/+e1dMcxHvku+OO+5g7dq1eDweXC4XTqcTgGAwGHXJd/78ecbHx/93l3zziYiiyOzsLKFQiHA4bNX6ZnjUdd0yq/8316wmzMwpCAKpqakoipLQRXeiTno9LOlN/VLewCeKf/z/SvzjCfwfPdQHml0XsX0AAAAASUVORK5CYII=
-"""
-
-# 帮助
-shortcut_icon_base64 = """
-AAABAAEAMDAAAAAAIAB6CQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAACUFJREFUeJzFWltsTF8X/+1zmZlSHZpe0pZE/4zQKJFeUtGq8OBSRAQJShAJTyRuVa8VKqFUIu6m4pW+uKVpU4JEGHGpa13jbhqUOTNnOre9vgffPjqdTjud6ff/VrJfzuy9z/qty95r/c4wXdcJcUooFIKqqjCbzdA0Da2trbh69Sru3buHT58+weVyAQCsVitycnJQWFiIuXPnYubMmRg2bBh8Ph8CgQBkWY5XBbB4AYRCISQnJ8PlcqGhoQGnTp3C48eP/27MGCRJAgBwzkH09zUTJ07E+vXrsXbtWqSkpEDTNCiK8u8AICIQEYYOHYqmpiZs3boVT58+BQAoioJgMNjn+u5z8vLyUFdXh9mzZ8Pj8YAxBsbY/w5Ad+Vra2tRXV0NADCbzfD5fAAAm82G0tJS5OXlIS0tDUSEHz9+4NmzZ7h16xZevXoVsWbPnj2orq6OD4Su6xTrcLvdRERUVVVFAEhRFJJlmQDQ9OnTqbGxkTRNo2jicrmosbGRysrKCADJskyKohAA2rFjBxERaZoWsz66rlPMHhAxLywvLGixWLB3715s2rQJkiShq6sL9+/fR1tbGzo6OsAYQ3p6OvLz81FQUACLxQLOOerr61FdXQ2fz2fsVVtbi6qqKrjd7tgTOxaUwqpNTU3EGCOTyUSMMUpNTaWWlhbDcnV1dTR58mRijBGAiDFp0iQ6cOCAsV9zczOlpqaG7dnU1DQgT/QLwOPxkNfrpc7OTho7diwxxkhVVUpKSjKUdzgcVFRUZCjKGCNFUUhVVVJVlRRFCQNVVFREd+7cISKilpYWSkpKIlVViTFGNpuNOjs7yev1ksfjSRyAy+UiIqKamhoCQCaTiQBQfX29YcURI0YQAFJVlWRZJsZYr0OWZVJVlQDQ8OHDDWsfOnQobO+amhojZxIC4PF4yOfzUUdHB2VnZ4clLOecHj16RKmpqYby0RTvOQSI1NRUevjwIXHOwxI7KyuLOjo6yOfz9euFPgEI6588eTJMyWvXrlEgEDDCZiDK9wRRWFhIgUCAWltbjdADQKdOnYrJC30C0DSNOOdUUVFhxHBxcTERER0/fjxu5XuCOHbsGBERFRQUGDlUUVERUzJHBeDxeMjv99PXr18pIyPDAHD48GEiIpowYYIR1/ECEGvHjx9PRETHjh0zAGRmZtK3b9/I7/f3GUZStOOViKCqKl6+fImOjg6jrrHZbLh79y6eP38Oxhg457Gd172IWNve3o4rV66gq6sLACBJEpxOJ9rb26Gqalgd1VOiVlBic3H1iyt+6dKlsFqtYIz1ufFAhDGGRYsWIRAIhJUSr1+/RllZGTjnhgFjBiDk9+/fxksAwO12w+12D7jo6kuICIFAAJIkgYiMvV0uV7+GihpCYpO2tjbjJcAf90azRiIilAf+ev/SpUvQdb3vMOqrdBDHZyKJGu8Qx+n27dv7PI0iijkigqIo+P37N/Lz8+F0OiHLckLJGo+ICDCbzWhra0Nubi58Pl9E6EbEAuccJpMJ165dg9PphKIo/7rywB9DSpIEr9eLGzduQJZlhEKhiHkRAESsvXr1Kq4OaTBFvP/Lly9R50TNxnh71MEWIkJycnLU3yMACIvn5eWBiP4v4SNEnP8lJSVGSPWUiCeSJMHn86G8vBz//PMPQqFQQrRHvCJiftasWSguLoau67EBYIwhEAggJSUF+/fvBwAEg0EoihJxBySaI6wb9cIYMwwlSpSsrCzU19f3HQXRiiTRwNvtdrJarWGtYffGBP8tvuIZYr0488WQJIkA0OXLl/utSPts6kUj397ejtOnT+PmzZv4/v07Xr9+DQCwWCxQFAW6rgNA2G0prNvdQz1zymq1YsSIEXj79i2GDx+OhQsXorGxER6PB2PGjMGjR4/693B/LZumaRQKhYiIKBAIkNvtpnPnztGGDRvo9u3bVF9fH9EXiM4t2hCt48GDB+n79+904sQJ+vjxI9ntdsMbsbaVMdEqnHNwziHLMiRJgsViCfPSsmXL0NjYCJPJhGAwCM450tPTUVhYiOTkZKNA83q9ePDgAT5//oyKigqcP3/e8GRzczPmzZuHYDCI3NxcOBwOJCcnIxQK9e2F/jzQW6OjaRq5XC5yuVzU1dVFLpeLZsyYYVh45cqV9PPnz17Jrc7OTrLb7fTr1y/Dq4cPH6akpCQjv5qbm2OmVuImd7t7R1VV+P1+rFixAp8/f4bD4cC7d++we/dufP361Zibnp6Obdu2YfLkyXjz5g1u3bqFhoYGXL9+HcCfy/PMmTNYtWpVzORWwgCAv8n+4sUL3L9/H0uXLkVBQUEYWy0kJSUFGRkZcDqd0DTNeJ6bm4sjR45g7ty5A2LmBqVeELW8rusYOXIkOjs78eTJE5jN5rA6H/jTpIjvBgAwevRoLF++HJs3b0ZmZubAaMXBAiCOxm/fvsHhcGD69OmoqKjApUuXIubm5+ejvLwcGRkZmDJlCkpKSpCWlga/3z9g5YFBCiG/3w+r1Ypdu3bh5MmTePLkCTIzM9HQ0ACn0wlJksA5R1paGiorK2E2m8PW+nw+yLIc162eMACh/Lt37zB16lQ4nU4UFBRg//79KC8vj1Dqxo0byMrKQm5uLjRNg9lsTqwcSQQAYwwWiwUfPnzAkiVL4HA4wr7A5OTkwGQyGfM553j//j2Kiopw4cIFjBo1Cl1dXQmxG3EDEEWf3W7Hvn378OXLF6P1FInbWxEmwik7Oxs7d+7EmjVr+uV+Bh0A5xxDhgxBe3s7JkyYAODPGd6z5eut/BU3uvDSixcvYLPZ4PV642I74uJHJEmCrusYN24cFi9eHDWGRQnSfQgRJFkiyscNAIBR32zZssUIi1hFhNmWLVsSZvjiBiDLMjweD6ZNm4b58+cboRHLOs45FixYgJKSEui6nlDHlzDFRkTYunVrzNyR4J22bdtmfLZNRBICIMsydF1HaWkpZs+e3a8XRJ87Z84cTJs2LWHrA4PkAQDYvn07gOh9cvfnO3bsiPj7QbySMACRCzNmzEBlZaXx543up4okSZBlGYFAAKtXr0ZZWRm8Xu+gsB2DUgsJzsbv96OyshIXL17sdd6iRYtw9uxZmEwmcM4HhfUbFADA3+RkjOHo0aOw2+0GPWmz2bBu3Tps3LgRnHMEg8FBoyz/AxLpMJ0OBhOSAAAAAElFTkSuQmCC
-"""
@@ -0,0 +1,123 @@
+import uuid
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QBuffer, QIODevice, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QImageWriter, QColor
+
+import attachments
+
+# 插入笔记的图片最大显示宽度（像素），更大的图片会被缩小
+DISPLAY_WIDTH = 1280
+# 缩略图宽度（像素）
+THUMBNAIL_WIDTH = 256
+# 有损压缩的质量
+IMAGE_QUALITY = 85
+
+# 占位 url 为 pending:随机串。占位图片会随笔记保存，随机串保证不会与以后插入的图片混淆
+PLACEHOLDER_SCHEME = 'pending'
+
+
+def encode_image(image):
+    # 优先使用 WebP，不支持时有透明通道的用 PNG，否则用 JPEG
+    if b'webp' in QImageWriter.supportedImageFormats():
+        image_format = 'webp'
+    elif image.hasAlphaChannel():
+        image_format = 'png'
+    else:
+        image_format = 'jpeg'
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, image_format.upper(), IMAGE_QUALITY)
+    return bytes(buffer.data()), f'image/{image_format}'
+
+
+def display_size(size, max_width=DISPLAY_WIDTH):
+    if size.width() <= max_width:
+        return size
+    return QSize(max_width, max(1, round(size.height() * max_width / size.width())))
+
+
+def placeholder_image():
+    image = QImage(16, 16, QImage.Format_RGB32)
+    image.fill(QColor('#e6e6e6'))
+    return image
+
+
+class IngestSignals(QObject):
+    finished = pyqtSignal(str, object)  # (占位 url, 处理结果)
+    failed = pyqtSignal(str, str)  # (占位 url, 错误信息)
+
+
+# 在线程池中解码、缩放、重新编码图片并生成缩略图
+class ImageIngestTask(QRunnable):
+
+    def __init__(self, file_name, placeholder_url, signals):
+        super().__init__()
+        self.file_name = file_name
+        self.placeholder_url = placeholder_url
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.process()
+        except Exception as e:
+            self.signals.failed.emit(self.placeholder_url, str(e))
+            return
+        if result is None:
+            self.signals.failed.emit(self.placeholder_url, '无法读取图片')
+        else:
+            self.signals.finished.emit(self.placeholder_url, result)
+
+    def process(self):
+        reader = QImageReader(self.file_name)
+        reader.setAutoTransform(True)
+        if reader.imageCount() > 1 and reader.format() == b'gif':
+            # 动图保持原样，避免丢失动画
+            with open(self.file_name, 'rb') as image_file:
+                data = image_file.read()
+            image = QImage.fromData(data)
+            mime = 'image/gif'
+        else:
+            # 解码时直接缩放，JPEG 等格式可以少解码大量像素
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(display_size(size))
+            image = reader.read()
+            if image.isNull():
+                return None
+            if image.width() > DISPLAY_WIDTH:
+                image = image.scaledToWidth(DISPLAY_WIDTH, Qt.SmoothTransformation)
+            data, mime = encode_image(image)
+        if image.isNull():
+            return None
+        thumbnail, _ = encode_image(image.scaledToWidth(min(THUMBNAIL_WIDTH, image.width()), Qt.SmoothTransformation))
+        return {
+            'digest': attachments.content_hash(data),
+            'mime': mime,
+            'data': data,
+            'thumbnail': thumbnail,
+            'image': image,
+        }
+
+
+class ImageIngestor(QObject):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.signals = IngestSignals(self)
+        self.finished = self.signals.finished
+        self.failed = self.signals.failed
+
+    def start(self, file_name):
+        # 返回 (占位 url, 预计显示尺寸)，处理完成后通过 finished 信号通知
+        # 读不出图片尺寸时不启动任务，立即发出 failed 并返回 None
+        placeholder_url = f'{PLACEHOLDER_SCHEME}:{uuid.uuid4().hex}'
+        size = QImageReader(file_name).size()
+        if not size.isValid():
+            self.failed.emit(placeholder_url, '无法读取图片')
+            return None
+        self.pool.start(ImageIngestTask(file_name, placeholder_url, self.signals))
+        return placeholder_url, display_size(size)
+
+    def wait(self):
+        # 等待正在处理的图片全部完成，结果信号仍在事件队列中
+        self.pool.waitForDone()
@@ -0,0 +1,185 @@
+import os
+import re
+import html
+import mimetypes
+from PyQt5.QtCore import QThread, QDateTime, pyqtSignal
+from PyQt5.QtGui import QGuiApplication, QFont, QTextDocument, QImageReader
+
+import storage
+import attachments
+import codec
+import note_format
+from image_ingest import display_size
+
+# 可以导入的文件类型
+MARKDOWN_EXTENSIONS = {'.md', '.markdown'}
+HTML_EXTENSIONS = {'.html', '.htm'}
+TEXT_EXTENSIONS = {'.txt'}
+# 每个写入事务中的笔记数
+IMPORT_BATCH_SIZE = 1000
+# 每个解析进程一次领取的文件数
+PARSE_CHUNK_SIZE = 32
+# 进度信号的间隔（文件数）
+PROGRESS_INTERVAL = 50
+# 超过这个大小的本地图片不导入（字节）
+MAX_IMAGE_SIZE = 20 * 1024 * 1024
+# 文本文件依次尝试的编码
+TEXT_ENCODINGS = ('utf-8-sig', 'gb18030')
+
+IMAGE_RE = re.compile(r'<img src="([^"]*)"([^>]*)>')
+
+worker_app = None  # 解析进程中的 QGuiApplication
+
+
+def is_supported(file_name):
+    extension = os.path.splitext(file_name)[1].lower()
+    return extension in MARKDOWN_EXTENSIONS or extension in HTML_EXTENSIONS or extension in TEXT_EXTENSIONS
+
+
+def read_text(path):
+    with open(path, 'rb') as source:
+        data = source.read()
+    for encoding in TEXT_ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    return data.decode('latin-1')
+
+
+def init_worker():
+    # 解析进程中用 Qt 自己的解析器生成与编辑器完全相同的 toHtml() 输出，需要一个无界面的 QGuiApplication
+    # 默认字体与主程序一致，它会写入 toHtml() 的 body 样式
+    global worker_app
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    worker_app = QGuiApplication(['importer'])
+    QGuiApplication.setFont(QFont("微软雅黑", 10))
+
+
+def embed_images(content, base_dir):
+    # 把引用的本地图片读入，改为按哈希引用的附件；网络图片和找不到的图片保持原样
+    # 返回 (新的 HTML, [(哈希, 类型, 数据)])
+    images = {}
+
+    def replace(match):
+        source = html.unescape(match.group(1))
+        if source.startswith('file://'):
+            source = source[len('file://'):]
+        elif re.match(r'[a-zA-Z][a-zA-Z0-9+.-]+:', source):
+            return match.group(0)
+        path = os.path.join(base_dir, source)
+        mime = mimetypes.guess_type(path)[0]
+        if mime is None or not mime.startswith('image/') or not os.path.isfile(path) or os.path.getsize(path) > MAX_IMAGE_SIZE:
+            return match.group(0)
+        with open(path, 'rb') as image_file:
+            data = image_file.read()
+        digest = attachments.content_hash(data)
+        images[digest] = (digest, mime, data)
+        attributes = match.group(2)
+        if 'width=' not in attributes:
+            # 与编辑器中插入的图片一样，过宽的图片按显示宽度缩小
+            size = QImageReader(path).size()
+            if size.isValid():
+                size = display_size(size)
+                attributes = f' width="{size.width()}" height="{size.height()}"' + attributes
+        return f'<img src="{attachments.url_for(digest)}"{attributes}>'
+
+    return IMAGE_RE.sub(replace, content), list(images.values())
+
+
+def parse_file(path):
+    # 在解析进程中运行：返回 (标题, 编码后的正文, 修改时间, 纯文本, 图片)，失败时返回 None
+    try:
+        extension = os.path.splitext(path)[1].lower()
+        text = read_text(path)
+        document = QTextDocument()
+        if extension in MARKDOWN_EXTENSIONS:
+            document.setMarkdown(text)
+        elif extension in HTML_EXTENSIONS:
+            document.setHtml(text)
+        else:
+            document.setPlainText(text)
+        content, images = embed_images(document.toHtml(), os.path.dirname(path))
+        title = os.path.splitext(os.path.basename(path))[0]
+        timestamp = QDateTime.fromSecsSinceEpoch(int(os.path.getmtime(path))).toString("yyyy-MM-dd hh:mm:ss")
+        return title, codec.encode(note_format.compact(content)), timestamp, document.toPlainText(), images
+    except Exception:
+        return None
+
+
+def scan(directory):
+    # 遍历目录，返回文件夹列表 [(键, 上级的键, 名称)] 和文件列表 [(路径, 文件夹键)]
+    # 键是相对于导入目录的路径，导入目录本身成为一个同名的顶层文件夹；隐藏的目录和文件跳过
+    folders = []
+    files = []
+    for dir_path, dir_names, file_names in os.walk(directory):
+        dir_names[:] = sorted(name for name in dir_names if not name.startswith('.'))
+        key = os.path.relpath(dir_path, directory)
+        if key == '.':
+            folders.append((key, None, os.path.basename(os.path.abspath(directory))))
+        else:
+            parent_key = os.path.dirname(key) or '.'
+            folders.append((key, parent_key, os.path.basename(key)))
+        for file_name in sorted(file_names):
+            if not file_name.startswith('.') and is_supported(file_name):
+                files.append((os.path.join(dir_path, file_name), key))
+    return folders, files
+
+
+# 导入线程：遍历目录、在进程池中并行解析文件，解析结果分批交给写入线程
+# 每批在一个事务中用 executemany 写入；界面在导入结束后只刷新一次笔记树
+class Importer(QThread):
+    progress = pyqtSignal(int, int)  # (已解析的文件数, 文件总数)
+    imported = pyqtSignal(int, list, str)  # (导入的笔记数, 解析失败的文件, 出错时为错误信息)
+
+    def __init__(self, directory, parent_folder_id, storage_worker, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.parent_folder_id = parent_folder_id
+        self.storage = storage_worker
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        # 无论成功与否都发出 imported，界面据此关闭进度对话框；出错前已提交的笔记保留
+        self.count = 0
+        self.failed = []
+        error = ''
+        try:
+            self.import_files()
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self.storage.flush()
+        self.imported.emit(self.count, self.failed, error)
+
+    def import_files(self):
+        # 进程池相关的模块加载较慢，只在真正导入时加载，不拖慢程序启动
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        folders, files = scan(self.directory)
+        folder_ids = {}
+        self.storage.submit(storage.import_folders, self.parent_folder_id, folders, folder_ids)
+        self.progress.emit(0, len(files))
+        batch = []
+        # 主进程中已经有 QApplication，不能 fork，解析进程用 spawn 方式启动
+        with ProcessPoolExecutor(initializer=init_worker, mp_context=multiprocessing.get_context('spawn')) as pool:
+            results = pool.map(parse_file, [path for path, _ in files], chunksize=PARSE_CHUNK_SIZE)
+            for done, ((path, key), result) in enumerate(zip(files, results), 1):
+                if self.cancelled:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
+                if result is None:
+                    self.failed.append(path)
+                else:
+                    batch.append((key,) + result)
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    self.storage.submit(storage.import_notes, batch, folder_ids)
+                    self.count += len(batch)
+                    batch = []
+                if done % PROGRESS_INTERVAL == 0:
+                    self.progress.emit(done, len(files))
+        if batch:
+            self.storage.submit(storage.import_notes, batch, folder_ids)
+            self.count += len(batch)
@@ -1,100 +1,221 @@
 import sys
-import os
-import sqlite3
-import base64
+import re
+from html import escape as html_escape
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLineEdit,
-    QTextEdit, QSplitter, QToolBar, QAction, QTreeWidget, QTreeWidgetItem,
+    QTextEdit, QSplitter, QToolBar, QAction, QTreeView,
     QMenu, QMessageBox, QFileDialog, QInputDialog, QHBoxLayout, QStyle, QLabel, QColorDialog, QFrame, QDesktopWidget,
-    QTextBrowser, QSizePolicy, QDialog, QPushButton, QScrollArea, QGridLayout
+    QTextBrowser, QSizePolicy, QDialog, QPushButton, QScrollArea, QListWidget, QListWidgetItem,
+    QTableWidget, QTableWidgetItem, QHeaderView, QProgressDialog
 )
 from PyQt5.QtCore import Qt, QTimer, QDateTime, QSize, QEvent, QUrl, QBuffer, QIODevice
 from PyQt5.QtGui import QFont, QIcon, QTextCursor, QTextCharFormat, QFontDatabase, QPixmap, QTextBlockFormat, \
-    QTextListFormat, QColor, QDesktopServices, QCursor
+    QTextListFormat, QColor, QDesktopServices, QCursor, QTextDocument
+
+from icons import get_icon
+from note_tree_model import NoteTreeModel
+from save_scheduler import SaveScheduler
+from note_loader import NoteLoader
+from document_cache import DocumentCache
+from importer import Importer
+from backup import BackupTask
+from change_feed import ChangeFeed
+import backup
+import storage
+import migrations
+import revisions
+import attachments
+import search
+import trash
+import codec
+import profiler
+from word_count import WordCounter
+from image_ingest import ImageIngestor, placeholder_image
+
+# 找素材模式中最多同时高亮的匹配数
+MAX_FIND_MATERIAL_MATCHES = 5000
+
+
+class RevisionDialog(QDialog):
+    def __init__(self, cursor, note_id, title, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"历史版本 - {title}")
+        self.resize(900, 700)
+        self.cursor = cursor
+        self.selected_content = None
 
-# 导入应用程序相关图标的 Base64 编码
-from image_base64 import (
-    app_icon_base64, new_note_icon_base64, new_folder_icon_base64,
-    collapse_icon_base64, folder_icon_base64, note_icon_base64,
-    highlight_icon_base64
-)
+        layout = QHBoxLayout()
 
-# 导入文本编辑器相关图标的 Base64 编码
-from image_base64 import (
-    bold_icon_base64, italic_icon_base64, underline_icon_base64, color_icon_base64,
-    separator_icon_base64, ordered_list_icon_base64, unordered_list_icon_base64,
-    task_list_icon_base64, link_icon_base64, h1_icon_base64, h2_icon_base64, h3_icon_base64,
-    find_material_icon_base64, strikethrough_icon_base64, insert_image_icon_base64,
-    shortcut_icon_base64
-)
+        # 左侧版本列表，右侧预览
+        self.revision_list = QListWidget()
+        self.revision_list.setMaximumWidth(220)
+        for revision_id, created, size in revisions.list_revisions(cursor, note_id):
+            label = QDateTime.fromSecsSinceEpoch(created).toString("yyyy-MM-dd hh:mm")
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, revision_id)
+            self.revision_list.addItem(item)
+        self.revision_list.currentItemChanged.connect(self.show_revision)
 
+        self.preview = QTextBrowser()
 
-def get_icon_from_base64(base64_str):
-    pixmap = QPixmap()
-    pixmap.loadFromData(base64.b64decode(base64_str))
-    return QIcon(pixmap)
+        right_layout = QVBoxLayout()
+        right_layout.addWidget(self.preview)
+        restore_button = QPushButton("恢复此版本")
+        restore_button.clicked.connect(self.accept)
+        right_layout.addWidget(restore_button, alignment=Qt.AlignRight)
 
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
+        layout.addWidget(self.revision_list)
+        layout.addLayout(right_layout)
+        self.setLayout(layout)
+
+        if self.revision_list.count():
+            self.revision_list.setCurrentRow(0)
+
+    def show_revision(self, item, previous):
+        if item is None:
+            return
+        self.selected_content = revisions.load_revision(self.cursor, item.data(Qt.UserRole))
+        self.preview.setHtml(self.selected_content or '')
+
+class TrashDialog(QDialog):
+    def __init__(self, cursor, storage_worker, parent=None):
         super().__init__(parent)
-        self.setWindowTitle("快捷键提示")
-        self.setModal(True)
-        self.resize(400, 300)
+        self.setWindowTitle("回收站")
+        self.resize(500, 400)
+        self.cursor = cursor
+        self.storage = storage_worker
+        self.restored = False
 
         layout = QVBoxLayout()
 
-        # 使用 QScrollArea 以支持内容溢出时滚动
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_layout = QGridLayout(scroll_content)
+        self.batch_list = QListWidget()
+        self.batch_list.setSelectionMode(QListWidget.ExtendedSelection)
+        layout.addWidget(self.batch_list)
+
+        button_layout = QHBoxLayout()
+        restore_button = QPushButton("恢复")
+        restore_button.clicked.connect(self.restore_selected)
+        purge_button = QPushButton("彻底删除")
+        purge_button.clicked.connect(self.purge_selected)
+        empty_button = QPushButton("清空回收站")
+        empty_button.clicked.connect(self.purge_all)
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(restore_button)
+        button_layout.addWidget(purge_button)
+        button_layout.addWidget(empty_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
 
-        shortcuts = [
-            ("加粗", "Ctrl+B"),
-            ("斜体", "Ctrl+I"),
-            ("下划线", "Ctrl+U"),
-            ("撤销", "Ctrl+Z"),
-            ("恢复", "Ctrl+Y"),
-            ("插入图片", "Ctrl+Shift+I"),
-            ("插入超链接", "Ctrl+K"),
-            ("插入有序列表", "Ctrl+Shift+O"),
-            ("插入无序列表", "Ctrl+Shift+U"),
-            ("插入任务列表", "Ctrl+Shift+T"),
-            ("插入分割线", "Ctrl+Shift+S"),
-            ("插入一级标题", "Ctrl+Alt+1"),
-            ("插入二级标题", "Ctrl+Alt+2"),
-            ("插入三级标题", "Ctrl+Alt+3"),
-            ("高亮模式", "Ctrl+H"),
-            ("找素材模式", "Ctrl+F"),
-            ("删除线", "Ctrl+Shift+D"),
-            # 添加更多快捷键说明
-        ]
+        self.load_batches()
 
-        for i, (action, shortcut) in enumerate(shortcuts):
-            label_action = QLabel(action)
-            label_shortcut = QLabel(shortcut)
-            label_action.setStyleSheet("font-size: 14px;")
-            label_shortcut.setStyleSheet("font-size: 14px;")
-            scroll_layout.addWidget(label_action, i, 0, alignment=Qt.AlignLeft)
-            scroll_layout.addWidget(label_shortcut, i, 1, alignment=Qt.AlignLeft)
+    def load_batches(self):
+        self.batch_list.clear()
+        for batch_id, deleted_at, kind, name, note_count in trash.list_batches(self.cursor):
+            deleted = QDateTime.fromSecsSinceEpoch(deleted_at).toString("yyyy-MM-dd hh:mm")
+            if kind == 'folder':
+                label = f"{deleted}  文件夹「{name}」（{note_count} 篇笔记）"
+            else:
+                label = f"{deleted}  笔记「{name}」"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, batch_id)
+            self.batch_list.addItem(item)
+
+    def selected_batches(self):
+        return [item.data(Qt.UserRole) for item in self.batch_list.selectedItems()]
+
+    def restore_selected(self):
+        batch_ids = self.selected_batches()
+        for batch_id in batch_ids:
+            self.storage.submit(storage.restore_trash, batch_id)
+        if batch_ids:
+            self.storage.flush()
+            self.restored = True
+            self.load_batches()
+
+    def purge_selected(self):
+        self.purge(self.selected_batches())
+
+    def purge_all(self):
+        self.purge([self.batch_list.item(row).data(Qt.UserRole) for row in range(self.batch_list.count())])
+
+    def purge(self, batch_ids):
+        if not batch_ids:
+            return
+        reply = QMessageBox.question(self, '彻底删除', '彻底删除后无法恢复，确定要删除吗？', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.storage.submit(storage.purge_trash, batch_ids)
+            self.storage.flush()
+            self.load_batches()
 
-        scroll_content.setLayout(scroll_layout)
-        scroll.setWidget(scroll_content)
+class PerformanceDialog(QDialog):
+    COLUMNS = ["类别", "操作", "次数", "p50 (ms)", "p99 (ms)", "最大 (ms)", "合计 (ms)"]
 
-        layout.addWidget(scroll)
+    def __init__(self, document_cache, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("性能统计")
+        self.resize(900, 600)
+        self.document_cache = document_cache
 
-        # 添加关闭按钮
-        close_button = QPushButton("关闭")
-        close_button.clicked.connect(self.close)
-        layout.addWidget(close_button, alignment=Qt.AlignRight)
+        layout = QVBoxLayout()
 
+        # SQL 语句、写入任务和界面处理函数的耗时，按列排序
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.cache_label = QLabel()
+        layout.addWidget(self.cache_label)
+
+        button_layout = QHBoxLayout()
+        refresh_button = QPushButton("刷新")
+        refresh_button.clicked.connect(self.load_stats)
+        reset_button = QPushButton("清零")
+        reset_button.clicked.connect(self.reset_stats)
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(reset_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
         self.setLayout(layout)
 
+        self.load_stats()
+
+    def load_stats(self):
+        self.table.setSortingEnabled(False)
+        rows = profiler.stats()
+        self.table.setRowCount(len(rows))
+        for row, (category, name, count, p50, p99, maximum, total) in enumerate(rows):
+            values = [category, name, count] + [round(seconds * 1000, 3) for seconds in (p50, p99, maximum, total)]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)  # 数字按数值排序
+                if column == 1:
+                    item.setToolTip(name)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+        stats = self.document_cache.stats()
+        self.cache_label.setText(
+            f"文档缓存：命中 {stats['hits']} 次，未命中 {stats['misses']} 次，淘汰 {stats['evictions']} 次，"
+            f"缓存 {stats['documents']} 篇，约 {stats['bytes'] / 1024 / 1024:.1f} MB"
+        )
+
+    def reset_stats(self):
+        profiler.reset()
+        self.load_stats()
+
 class ElegantNoteApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle('非丨优雅笔记')
-        self.setWindowIcon(get_icon_from_base64(app_icon_base64))
+        self.setWindowIcon(get_icon('app'))
         self.resize(1100, 1500)  # 调整窗口尺寸，增加宽度以显示更多图标
 
         # 窗口居中
@@ -105,10 +226,9 @@ class ElegantNoteApp(QMainWindow):
 
         self.current_note_id = None
         self.highlight_mode = False  # 高亮模式标志
-
-        self.auto_save_timer = QTimer()
-        self.auto_save_timer.timeout.connect(self.auto_save)
-        self.auto_save_timer.start(5000)  # 每5秒自动保存一次
+        # 找素材模式的高亮（编辑器的 ExtraSelections）：当前行和所有匹配的文字
+        self.find_material_line = []
+        self.find_material_matches = []
 
         # 设置全局字体为微软雅黑
         font = QFont("微软雅黑", 10)
@@ -117,32 +237,51 @@ class ElegantNoteApp(QMainWindow):
         self.init_db()
         self.init_ui()
 
+        # 图片在线程池中缩放、压缩，完成前编辑器中显示占位图
+        self.pending_images = {}  # 占位 url -> 笔记 id
+        self.image_ingestor = ImageIngestor(self)
+        self.image_ingestor.finished.connect(self.on_image_ready)
+        self.image_ingestor.failed.connect(self.on_image_failed)
+
     def init_db(self):
-        self.conn = sqlite3.connect('notes.db')
+        # 界面线程的连接只用于读取，所有写入交给后台写入线程
+        self.conn = storage.connect()
         self.cursor = self.conn.cursor()
-        # 确保数据完整性，即使在突然断电的情况下
-        self.cursor.execute('PRAGMA synchronous = FULL')
-        # 创建文件夹表
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS folders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                parent_id INTEGER,
-                FOREIGN KEY(parent_id) REFERENCES folders(id)
-            )
-        ''')
-        # 创建笔记表
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS notes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                folder_id INTEGER,
-                title TEXT NOT NULL,
-                content TEXT,
-                timestamp TEXT,
-                FOREIGN KEY(folder_id) REFERENCES folders(id)
-            )
-        ''')
-        self.conn.commit()
+        # 创建或升级数据库结构，见 migrations
+        try:
+            migrations.upgrade(self.cursor)
+        except RuntimeError as e:
+            QMessageBox.critical(self, '错误', str(e))
+            sys.exit(1)
+
+        # 其他窗口或进程对同一个数据库的修改
+        self.change_feed = ChangeFeed(self.cursor, parent=self)
+        self.change_feed.changed.connect(self.on_external_changes)
+        self.change_feed.reload_needed.connect(self.on_external_reload)
+        self.storage = storage.StorageWorker(change_source=self.change_feed.source, parent=self)
+        self.storage.job_failed.connect(self.on_storage_error)
+        self.storage.start()
+        # 启动时在后台回收早已不被引用的图片
+        self.storage.submit(storage.collect_garbage)
+        # 为还没有全文索引的笔记（升级前的旧笔记）分批补建索引
+        self.index_missing_notes()
+        # 把升级前的笔记正文分批转换为压缩的精简格式，上次没有转换完时从中断处继续
+        self.convert_notes(storage.conversion_progress(self.cursor))
+        self.change_feed.start()
+        self.search_worker = search.SearchWorker(storage.DB_PATH, self)
+        self.search_worker.results.connect(self.show_search_results)
+        self.search_worker.start()
+
+    def convert_notes(self, after_id):
+        if after_id is not None:
+            self.storage.submit(storage.convert_notes, after_id, callback=self.convert_notes)
+
+    def index_missing_notes(self, more=True):
+        if more:
+            self.storage.submit(storage.index_missing_notes, callback=self.index_missing_notes)
+
+    def on_storage_error(self, message):
+        QMessageBox.warning(self, '错误', f'写入数据库失败：{message}')
 
     def init_ui(self):
         # 主窗口的中心部件
@@ -159,7 +298,7 @@ class ElegantNoteApp(QMainWindow):
         left_toolbar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)  # 设置工具栏的大小策略，使其宽度与笔记树一致
 
         # 折叠全部按钮
-        collapse_icon = get_icon_from_base64(collapse_icon_base64)
+        collapse_icon = get_icon('collapse')
         collapse_action = QAction(collapse_icon, "折叠全部 (Ctrl+Shift+C)", self)
         collapse_action.triggered.connect(self.collapse_all)
         collapse_action.setShortcut("Ctrl+Shift+C")
@@ -167,7 +306,7 @@ class ElegantNoteApp(QMainWindow):
         left_toolbar.addAction(collapse_action)
 
         # 新建文件夹按钮
-        new_folder_icon = get_icon_from_base64(new_folder_icon_base64)
+        new_folder_icon = get_icon('new_folder')
         new_folder_action = QAction(new_folder_icon, "新建文件夹 (Ctrl+Shift+F)", self)
         new_folder_action.triggered.connect(self.new_folder)
         new_folder_action.setShortcut("Ctrl+Shift+F")
@@ -175,7 +314,7 @@ class ElegantNoteApp(QMainWindow):
         left_toolbar.addAction(new_folder_action)
 
         # 新建笔记按钮
-        new_note_icon = get_icon_from_base64(new_note_icon_base64)
+        new_note_icon = get_icon('new_note')
         new_note_action = QAction(new_note_icon, "新建笔记 (Ctrl+Shift+N)", self)
         new_note_action.triggered.connect(self.new_note)
         new_note_action.setShortcut("Ctrl+Shift+N")
@@ -183,7 +322,7 @@ class ElegantNoteApp(QMainWindow):
         left_toolbar.addAction(new_note_action)
 
         # 快捷键提示按钮
-        shortcut_icon = get_icon_from_base64(shortcut_icon_base64)  # 假设您已将快捷键提示按钮的 Base64 编码添加到 image_base64.py
+        shortcut_icon = get_icon('shortcut')
         shortcut_action = QAction(shortcut_icon, "快捷键提示 (Ctrl+Shift+H)", self)
         shortcut_action.triggered.connect(self.show_shortcut_dialog)
         shortcut_action.setShortcut("Ctrl+Shift+H")
@@ -207,10 +346,42 @@ class ElegantNoteApp(QMainWindow):
 
         left_layout.addWidget(left_toolbar)
 
+        # 搜索框：输入停顿后在全文索引中搜索，有内容时用搜索结果替换笔记树
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("搜索笔记 (Ctrl+Shift+K)")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(lambda: self.search_timer.start())
+        self.search_box.installEventFilter(self)
+        left_layout.addWidget(self.search_box)
+
+        search_action = QAction(self)
+        search_action.setShortcut("Ctrl+Shift+K")
+        search_action.triggered.connect(self.focus_search)
+        self.addAction(search_action)
+
+        performance_action = QAction(self)
+        performance_action.setShortcut("Ctrl+Shift+P")
+        performance_action.triggered.connect(self.show_performance_dialog)
+        self.addAction(performance_action)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.search_results = QListWidget()
+        self.search_results.itemClicked.connect(self.open_search_result)
+        self.search_results.hide()
+        left_layout.addWidget(self.search_results)
+
         # 笔记树（左侧）
-        self.notes_tree = QTreeWidget()
+        # 使用按需加载的数据模型，展开文件夹时才读取其子节点
+        self.tree_model = NoteTreeModel(self.cursor, self)
+        self.notes_tree = QTreeView()
         self.notes_tree.setHeaderHidden(True)
-        self.notes_tree.itemClicked.connect(self.load_note)
+        self.notes_tree.setUniformRowHeights(True)  # 行高一致，滚动时无需逐行计算尺寸
+        self.notes_tree.setModel(self.tree_model)
+        self.notes_tree.clicked.connect(self.load_note)
         self.notes_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.notes_tree.customContextMenuRequested.connect(self.show_context_menu)
         left_layout.addWidget(self.notes_tree)
@@ -228,7 +399,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)  # 确保工具栏宽度与笔记编辑器一致
 
         # 插入图片按钮
-        insert_image_icon = get_icon_from_base64(insert_image_icon_base64)
+        insert_image_icon = get_icon('insert_image')
         insert_image_action = QAction(insert_image_icon, "插入图片 (Ctrl+Shift+I)", self)
         insert_image_action.setShortcut("Ctrl+Shift+I")
         insert_image_action.triggered.connect(self.insert_image)
@@ -236,7 +407,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(insert_image_action)
 
         # 加粗
-        bold_icon = get_icon_from_base64(bold_icon_base64)
+        bold_icon = get_icon('bold')
         bold_action = QAction(bold_icon, "加粗 (Ctrl+B)", self)
         bold_action.setShortcut("Ctrl+B")
         bold_action.triggered.connect(self.set_bold)
@@ -244,7 +415,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(bold_action)
 
         # 斜体
-        italic_icon = get_icon_from_base64(italic_icon_base64)
+        italic_icon = get_icon('italic')
         italic_action = QAction(italic_icon, "斜体 (Ctrl+I)", self)
         italic_action.setShortcut("Ctrl+I")
         italic_action.triggered.connect(self.set_italic)
@@ -252,7 +423,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(italic_action)
 
         # 下划线
-        underline_icon = get_icon_from_base64(underline_icon_base64)
+        underline_icon = get_icon('underline')
         underline_action = QAction(underline_icon, "下划线 (Ctrl+U)", self)
         underline_action.setShortcut("Ctrl+U")
         underline_action.triggered.connect(self.set_underline)
@@ -260,42 +431,42 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(underline_action)
 
         # 更改文字颜色
-        color_icon = get_icon_from_base64(color_icon_base64)
+        color_icon = get_icon('color')
         color_action = QAction(color_icon, "更改文字颜色", self)
         color_action.triggered.connect(self.change_text_color)
         color_action.setToolTip("更改文字颜色")
         editor_toolbar.addAction(color_action)
 
         # 分割线
-        separator_icon = get_icon_from_base64(separator_icon_base64)
+        separator_icon = get_icon('separator')
         separator_action = QAction(separator_icon, "插入分割线", self)
         separator_action.triggered.connect(self.insert_separator)
         separator_action.setToolTip("插入分割线")
         editor_toolbar.addAction(separator_action)
 
         # 有序列表
-        ordered_list_icon = get_icon_from_base64(ordered_list_icon_base64)
+        ordered_list_icon = get_icon('ordered_list')
         ordered_list_action = QAction(ordered_list_icon, "插入有序列表", self)
         ordered_list_action.triggered.connect(self.insert_ordered_list)
         ordered_list_action.setToolTip("插入有序列表")
         editor_toolbar.addAction(ordered_list_action)
 
         # 无序列表
-        unordered_list_icon = get_icon_from_base64(unordered_list_icon_base64)
+        unordered_list_icon = get_icon('unordered_list')
         unordered_list_action = QAction(unordered_list_icon, "插入无序列表", self)
         unordered_list_action.triggered.connect(self.insert_unordered_list)
         unordered_list_action.setToolTip("插入无序列表")
         editor_toolbar.addAction(unordered_list_action)
 
         # 任务列表
-        task_list_icon = get_icon_from_base64(task_list_icon_base64)
+        task_list_icon = get_icon('task_list')
         task_list_action = QAction(task_list_icon, "插入任务列表", self)
         task_list_action.triggered.connect(self.insert_task_list)
         task_list_action.setToolTip("插入任务列表")
         editor_toolbar.addAction(task_list_action)
 
         # 超链接
-        link_icon = get_icon_from_base64(link_icon_base64)
+        link_icon = get_icon('link')
         link_action = QAction(link_icon, "插入超链接 (Ctrl+K)", self)
         link_action.setShortcut("Ctrl+K")
         link_action.triggered.connect(self.insert_link)
@@ -303,28 +474,28 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(link_action)
 
         # 一级标题
-        h1_icon = get_icon_from_base64(h1_icon_base64)
+        h1_icon = get_icon('h1')
         h1_action = QAction(h1_icon, "插入一级标题", self)
         h1_action.triggered.connect(lambda: self.set_heading(1))
         h1_action.setToolTip("插入一级标题")
         editor_toolbar.addAction(h1_action)
 
         # 二级标题
-        h2_icon = get_icon_from_base64(h2_icon_base64)
+        h2_icon = get_icon('h2')
         h2_action = QAction(h2_icon, "插入二级标题", self)
         h2_action.triggered.connect(lambda: self.set_heading(2))
         h2_action.setToolTip("插入二级标题")
         editor_toolbar.addAction(h2_action)
 
         # 三级标题
-        h3_icon = get_icon_from_base64(h3_icon_base64)
+        h3_icon = get_icon('h3')
         h3_action = QAction(h3_icon, "插入三级标题", self)
         h3_action.triggered.connect(lambda: self.set_heading(3))
         h3_action.setToolTip("插入三级标题")
         editor_toolbar.addAction(h3_action)
 
         # 高亮模式
-        highlight_icon = get_icon_from_base64(highlight_icon_base64)
+        highlight_icon = get_icon('highlight')
         self.highlight_action = QAction(highlight_icon, "高亮模式", self)
         self.highlight_action.setToolTip("高亮模式")
         self.highlight_action.setCheckable(True)
@@ -332,7 +503,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(self.highlight_action)
 
         # 找素材模式
-        find_material_icon = get_icon_from_base64(find_material_icon_base64)
+        find_material_icon = get_icon('find_material')
         self.find_material_action = QAction(find_material_icon, "找素材模式", self)
         self.find_material_action.setToolTip("找素材模式")
         self.find_material_action.setCheckable(True)
@@ -340,7 +511,7 @@ class ElegantNoteApp(QMainWindow):
         editor_toolbar.addAction(self.find_material_action)
 
         # 删除线
-        strikethrough_icon = get_icon_from_base64(strikethrough_icon_base64)
+        strikethrough_icon = get_icon('strikethrough')
         strikethrough_action = QAction(strikethrough_icon, "删除线 (Ctrl+D)", self)
         strikethrough_action.setShortcut("Ctrl+D")
         strikethrough_action.triggered.connect(self.set_strikethrough)
@@ -392,9 +563,24 @@ class ElegantNoteApp(QMainWindow):
 
         # 笔记编辑器（右侧）
         self.note_editor = QTextEdit()
+        # 图片以 attachment:<哈希> 引用，由文档按需从附件表读取
+        # 没有打开笔记时编辑器显示空白文档，打开的笔记使用缓存中各自的文档
+        self.blank_document = attachments.NoteDocument(self.cursor, self.note_editor)
+        self.note_editor.setDocument(self.blank_document)
         self.note_editor.setPlaceholderText('在这里开始书写您的笔记...')
-        self.note_editor.textChanged.connect(self.update_word_count)  # 当文本改变时更新字数统计
-        self.note_editor.textChanged.connect(self.auto_save)  # 实时保存
+        # 最近打开的笔记文档，来回切换时不必重新读取和解析
+        self.document_cache = DocumentCache(self.cursor, parent=self)
+        # 字数统计：文档改动时只重新统计受影响的段落
+        self.word_counter = WordCounter(self.note_editor.document(), self)
+        self.word_counter.changed.connect(self.update_word_count)
+        # 自动保存：停止输入 1 秒后保存，连续输入时最多 10 秒保存一次，内容没变时不写入
+        self.save_scheduler = SaveScheduler(self.note_editor, self.auto_save, parent=self)
+        # 很长的笔记分段加载，先显示开头，其余部分在后续的事件循环中追加
+        self.note_loader = NoteLoader(self.note_editor, self)
+        self.note_loader.progress.connect(self.on_note_load_progress)
+        self.note_loader.finished.connect(self.on_note_loaded)
+        # 正在后台运行的备份或导出
+        self.backup_task = None
 
         # 添加以下两行代码
         self.note_editor.setAcceptDrops(True)
@@ -450,20 +636,18 @@ class ElegantNoteApp(QMainWindow):
         # 应用样式表，提升UI的优雅度
         self.apply_stylesheet()
 
-        # 加载文件夹和笔记
-        self.load_folders_and_notes()
 
     def apply_stylesheet(self):
         self.setStyleSheet("""
             QMainWindow {
                 background-color: #f5f5f5;
             }
-            QTreeWidget {
+            QTreeView {
                 background-color: #ffffff;
                 padding: 5px;
                 font-size: 14px;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 margin-left: -10px; /* 减少左边距 */
                 height: 25px;        /* 增加项的高度 */
             }
@@ -504,61 +688,105 @@ class ElegantNoteApp(QMainWindow):
             }
         """)
 
+    @profiler.timed
     def load_folders_and_notes(self):
-        self.notes_tree.clear()
-        # 加载根文件夹（parent_id为NULL）
-        self.cursor.execute('SELECT id, name FROM folders WHERE parent_id IS NULL')
-        root_folders = self.cursor.fetchall()
-        for folder_id, folder_name in root_folders:
-            folder_item = QTreeWidgetItem([folder_name])
-            folder_item.setData(0, Qt.UserRole, ('folder', folder_id))
-            folder_item.setIcon(0, get_icon_from_base64(folder_icon_base64))  # 添加文件夹图标
-            self.load_subfolders_and_notes(folder_item, folder_id)
-            self.notes_tree.addTopLevelItem(folder_item)
-
-        # 加载未分类的笔记（folder_id为NULL）
-        self.cursor.execute('SELECT id, title FROM notes WHERE folder_id IS NULL')
-        notes = self.cursor.fetchall()
-        for note_id, note_title in notes:
-            note_item = QTreeWidgetItem([note_title])
-            note_item.setData(0, Qt.UserRole, ('note', note_id))
-            note_item.setIcon(0, get_icon_from_base64(note_icon_base64))  # 添加笔记图标
-            self.notes_tree.addTopLevelItem(note_item)
-
-        # 展开所有节点
-        self.notes_tree.expandAll()
-
-    def load_subfolders_and_notes(self, parent_item, parent_folder_id):
-        # 加载子文件夹
-        self.cursor.execute('SELECT id, name FROM folders WHERE parent_id = ?', (parent_folder_id,))
-        subfolders = self.cursor.fetchall()
-        for folder_id, folder_name in subfolders:
-            folder_item = QTreeWidgetItem([folder_name])
-            folder_item.setData(0, Qt.UserRole, ('folder', folder_id))
-            folder_item.setIcon(0, get_icon_from_base64(folder_icon_base64))  # 添加文件夹图标
-            self.load_subfolders_and_notes(folder_item, folder_id)
-            parent_item.addChild(folder_item)
-
-        # 加载该文件夹下的笔记
-        self.cursor.execute('SELECT id, title FROM notes WHERE folder_id = ?', (parent_folder_id,))
-        notes = self.cursor.fetchall()
-        for note_id, note_title in notes:
-            note_item = QTreeWidgetItem([note_title])
-            note_item.setData(0, Qt.UserRole, ('note', note_id))
-            note_item.setIcon(0, get_icon_from_base64(note_icon_base64))  # 添加笔记图标
-            parent_item.addChild(note_item)
+        # 重新读取文件夹结构，笔记在展开时按需加载
+        self.tree_model.reload()
+
+    def selected_tree_index(self):
+        indexes = self.notes_tree.selectionModel().selectedIndexes()
+        return indexes[0] if indexes else None
+
+    def select_tree_index(self, index):
+        if index.isValid():
+            parent = index.parent()
+            while parent.isValid():
+                self.notes_tree.expand(parent)
+                parent = parent.parent()
+            self.notes_tree.setCurrentIndex(index)
+            self.notes_tree.scrollTo(index)
+
+    def focus_search(self):
+        self.search_box.setFocus()
+        self.search_box.selectAll()
+
+    def run_search(self):
+        # 查询在后台线程中执行，结果由 show_search_results 显示
+        query = self.search_box.text().strip()
+        if not query:
+            self.search_results.clear()
+            self.search_results.hide()
+            self.notes_tree.show()
+            return
+        self.search_worker.search(query)
+
+    @profiler.timed
+    def show_search_results(self, query, results):
+        # 结果到达前输入框已经改变时丢弃
+        if query != self.search_box.text().strip():
+            return
+        self.search_results.clear()
+        self.notes_tree.hide()
+        self.search_results.show()
+        for note_id, title, snippet in results:
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, note_id)
+            label = QLabel(f'<b>{html_escape(title)}</b><br><span style="color: #777;">{search.format_snippet(snippet)}</span>')
+            label.setTextFormat(Qt.RichText)
+            label.setWordWrap(True)
+            label.setContentsMargins(5, 4, 5, 4)
+            item.setSizeHint(label.sizeHint())
+            self.search_results.addItem(item)
+            self.search_results.setItemWidget(item, label)
+        if not self.search_results.count():
+            self.search_results.addItem('没有找到匹配的笔记')
+
+    @profiler.timed
+    def open_search_result(self, item):
+        note_id = item.data(Qt.UserRole)
+        if note_id is None:
+            return
+        self.cursor.execute('SELECT folder_id FROM notes WHERE id = ?', (note_id,))
+        row = self.cursor.fetchone()
+        if row is None:
+            return
+        # 在笔记树中定位并打开，清空搜索框即可回到笔记树
+        index = self.tree_model.index_for_note(note_id, row[0])
+        if index.isValid():
+            self.select_tree_index(index)
+            self.load_note(index)
+
+    def save_current_note_inside(self, item_type, item_id):
+        # 删除的笔记或文件夹中包含当前笔记时，先保存尚未写入的改动，回收站中的副本才与最后看到的一致
+        # 之后 remove_tree_item 会丢弃编辑器中的改动
+        node = self.tree_model.node_for('note', self.current_note_id)
+        while node is not None:
+            if node.kind == item_type and node.id == item_id:
+                self.save_scheduler.flush()
+                return
+            node = node.parent
+
+    def remove_tree_item(self, item_type, item_id):
+        removed_note_ids = self.tree_model.remove(item_type, item_id)
+        if self.current_note_id in removed_note_ids:
+            self.current_note_id = None
+            self.note_loader.cancel()
+            self.show_blank_document()
+            self.save_scheduler.mark_clean()
+        for note_id in removed_note_ids:
+            self.document_cache.discard(note_id)
 
     def new_note(self):
-        selected_items = self.notes_tree.selectedItems()
+        selected_index = self.selected_tree_index()
         folder_id = None
-        if selected_items:
-            item_type, item_id = selected_items[0].data(0, Qt.UserRole)
+        if selected_index is not None:
+            item_type, item_id = selected_index.data(Qt.UserRole)
             if item_type == 'folder':
                 folder_id = item_id
             elif item_type == 'note':
-                parent_item = selected_items[0].parent()
-                if parent_item:
-                    parent_type, parent_id = parent_item.data(0, Qt.UserRole)
+                parent_index = selected_index.parent()
+                if parent_index.isValid():
+                    parent_type, parent_id = parent_index.data(Qt.UserRole)
                     if parent_type == 'folder':
                         folder_id = parent_id
 
@@ -574,20 +802,23 @@ class ElegantNoteApp(QMainWindow):
         if dialog.exec_() == QInputDialog.Accepted:
             title = dialog.textValue()
             if title:
+                if folder_id is not None and not self.tree_item_exists('folder', folder_id):
+                    return
                 timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
-                self.cursor.execute('INSERT INTO notes (folder_id, title, content, timestamp) VALUES (?, ?, ?, ?)',
-                                    (folder_id, title, '', timestamp))
-                self.conn.commit()
-                self.load_folders_and_notes()
-                self.statusBar().showMessage('新建笔记成功', 2000)
+
+                def on_created(note_id):
+                    self.select_tree_index(self.tree_model.add_note(note_id, title, folder_id))
+                    self.statusBar().showMessage('新建笔记成功', 2000)
+
+                self.storage.submit(storage.create_note, folder_id, title, timestamp, callback=on_created)
             else:
                 QMessageBox.warning(self, '错误', '笔记标题不能为空')
 
     def new_folder(self):
-        selected_items = self.notes_tree.selectedItems()
+        selected_index = self.selected_tree_index()
         parent_folder_id = None
-        if selected_items:
-            item_type, item_id = selected_items[0].data(0, Qt.UserRole)
+        if selected_index is not None:
+            item_type, item_id = selected_index.data(Qt.UserRole)
             if item_type == 'folder':
                 parent_folder_id = item_id
 
@@ -603,110 +834,370 @@ class ElegantNoteApp(QMainWindow):
         if dialog.exec_() == QInputDialog.Accepted:
             name = dialog.textValue()
             if name:
-                self.cursor.execute('INSERT INTO folders (name, parent_id) VALUES (?, ?)', (name, parent_folder_id))
-                self.conn.commit()
-                self.load_folders_and_notes()
-                self.statusBar().showMessage('新建文件夹成功', 2000)
+                if parent_folder_id is not None and not self.tree_item_exists('folder', parent_folder_id):
+                    return
+
+                def on_created(folder_id):
+                    self.select_tree_index(self.tree_model.add_folder(folder_id, name, parent_folder_id))
+                    self.statusBar().showMessage('新建文件夹成功', 2000)
+
+                self.storage.submit(storage.create_folder, name, parent_folder_id, callback=on_created)
             else:
                 QMessageBox.warning(self, '错误', '文件夹名称不能为空')
 
-    def load_note(self, item, column):
-        item_type, item_id = item.data(0, Qt.UserRole)
+    @profiler.timed
+    def load_note(self, index):
+        # 停止加载上一篇笔记的剩余部分，只加载了一部分的文档不能留在缓存中
+        if self.note_loader.is_loading():
+            self.note_loader.cancel()
+            self.document_cache.discard(self.current_note_id)
+        # 切换前先保存当前笔记尚未写入的改动
+        self.save_scheduler.flush()
+        self.clear_find_material_highlight()
+        item_type, item_id = index.data(Qt.UserRole)
         if item_type == 'note':
             self.current_note_id = item_id
-            self.cursor.execute('SELECT content FROM notes WHERE id = ?', (self.current_note_id,))
-            result = self.cursor.fetchone()
-            content = result[0] if result else ''
-            self.note_editor.setHtml(content)
-            self.update_word_count()
+            document = self.document_cache.get(item_id)
+            if document is not None:
+                # 缓存中的文档就是上次离开时的内容，改动在离开时已经保存
+                self.show_document(document)
+            else:
+                content = self.read_note(item_id)
+                if 'data:image' in content:
+                    # 旧笔记中内联的图片在后台转存到附件表
+                    self.storage.submit(storage.migrate_inline_images, item_id, note_id=item_id)
         else:
             self.current_note_id = None
-            self.note_editor.clear()
-            self.update_word_count()
+            self.show_blank_document()
+        self.save_scheduler.mark_clean()
+
+    def read_note(self, note_id):
+        # 从数据库读取笔记放入新的文档并显示，返回正文
+        # 这篇笔记如果还有尚未写入的保存，等它提交后再读取
+        self.storage.wait_for_note(note_id)
+        self.cursor.execute('SELECT content FROM notes WHERE id = ?', (note_id,))
+        result = self.cursor.fetchone()
+        content = codec.decode(result[0]) if result else ''
+        self.show_document(self.document_cache.create(note_id))
+        self.note_loader.load(content)
+        return content
+
+    def reload_current_note(self):
+        # 当前笔记在其他窗口或进程中被修改：丢弃缓存的文档重新读取，保持滚动位置
+        scroll = self.note_editor.verticalScrollBar().value()
+        self.note_loader.cancel()
+        self.document_cache.discard(self.current_note_id)
+        self.read_note(self.current_note_id)
+        self.save_scheduler.mark_clean()
+        self.note_editor.verticalScrollBar().setValue(scroll)
+
+    @profiler.timed
+    def on_external_changes(self, changes):
+        # 其他实例修改了数据库：按受影响的行现在的状态只更新笔记树中对应的节点，
+        # 当前笔记的正文在别处被修改时重新读取
+        actions = {}
+        for kind, item_id, action in changes:
+            actions.setdefault((kind, item_id), set()).add(action)
+        reload_tree = False
+        current_changed = False
+        # 先处理文件夹，新建的笔记可能在新建的文件夹中
+        for (kind, item_id), item_actions in sorted(actions.items(), key=lambda entry: entry[0][0] != 'folder'):
+            if kind == 'folder':
+                self.cursor.execute('SELECT name, parent_id FROM folders WHERE id = ?', (item_id,))
+                row = self.cursor.fetchone()
+                if row is None:
+                    self.remove_tree_item('folder', item_id)
+                elif item_id not in self.tree_model.folder_parent:
+                    self.tree_model.add_folder(item_id, row[0], row[1])
+                elif self.tree_model.folder_parent[item_id] != row[1]:
+                    # 程序中没有移动文件夹的操作，只可能来自外部工具，重新加载最简单
+                    reload_tree = True
+                else:
+                    self.tree_model.rename('folder', item_id, row[0])
+                continue
+            self.cursor.execute('SELECT title, folder_id FROM notes WHERE id = ?', (item_id,))
+            row = self.cursor.fetchone()
+            if row is None:
+                self.remove_tree_item('note', item_id)
+                continue
+            title, folder_id = row
+            node = self.tree_model.node_for('note', item_id)
+            if node is not None and node.parent.id != folder_id:
+                self.tree_model.remove('note', item_id)
+                self.tree_model.add_note(item_id, title, folder_id)
+            elif node is not None and node.name != title:
+                self.tree_model.rename('note', item_id, title)
+            elif node is None and 'insert' in item_actions:
+                # 所在文件夹还没有展开时不必添加，展开时会读到
+                self.tree_model.add_note(item_id, title, folder_id)
+            if 'content' in item_actions:
+                if item_id == self.current_note_id:
+                    current_changed = True
+                else:
+                    self.document_cache.discard(item_id)
+        if reload_tree:
+            self.load_folders_and_notes()
+        if current_changed:
+            if self.save_scheduler.dirty:
+                # 本地尚未保存的改动优先，保存时覆盖别处的修改
+                self.statusBar().showMessage('这篇笔记已在其他窗口中修改，继续编辑将覆盖那里的修改', 5000)
+            else:
+                self.reload_current_note()
+                self.statusBar().showMessage('这篇笔记已在其他窗口中修改，已重新加载', 3000)
+
+    def on_external_reload(self):
+        # 修改太多或记录已被清除：重新加载笔记树，缓存的文档全部作废
+        self.load_folders_and_notes()
+        for note_id in list(self.document_cache.documents):
+            if note_id != self.current_note_id:
+                self.document_cache.discard(note_id)
+        if self.current_note_id is None:
+            return
+        self.cursor.execute('SELECT 1 FROM notes WHERE id = ?', (self.current_note_id,))
+        if self.cursor.fetchone() is None:
+            self.current_note_id = None
+            self.note_loader.cancel()
+            self.show_blank_document()
+            self.save_scheduler.mark_clean()
+        elif not self.save_scheduler.dirty:
+            self.reload_current_note()
+
+    def show_document(self, document):
+        # 把文档换入编辑器，字数统计随之切换
+        self.note_editor.setDocument(document)
+        self.word_counter.attach(document)
+
+    def show_blank_document(self):
+        self.blank_document.clear()
+        self.show_document(self.blank_document)
+
+    def on_note_load_progress(self, loaded, total):
+        # 追加的内容不是用户的修改，不需要保存
+        self.save_scheduler.mark_clean()
+        self.statusBar().showMessage(f'正在加载笔记…{loaded * 100 // total}%')
+
+    def on_note_loaded(self):
+        self.save_scheduler.mark_clean()
+        self.statusBar().clearMessage()
 
     def show_context_menu(self, position):
-        selected_item = self.notes_tree.itemAt(position)
-        if selected_item:
-            item_type, item_id = selected_item.data(0, Qt.UserRole)
+        selected_item = self.notes_tree.indexAt(position)
+        if not selected_item.isValid():
+            # 空白处的菜单
+            menu = QMenu()
+            trash_action = QAction("回收站", self)
+            trash_action.triggered.connect(self.show_trash)
+            menu.addAction(trash_action)
+            import_action = QAction("导入文件夹…", self)
+            import_action.triggered.connect(lambda: self.import_directory(None))
+            menu.addAction(import_action)
+            backup_action = QAction("备份数据库…", self)
+            backup_action.triggered.connect(self.backup_database)
+            menu.addAction(backup_action)
+            export_action = QAction("导出笔记…", self)
+            export_action.triggered.connect(self.export_notes)
+            menu.addAction(export_action)
+            performance_action = QAction("性能统计", self)
+            performance_action.triggered.connect(self.show_performance_dialog)
+            menu.addAction(performance_action)
+            menu.exec_(self.notes_tree.viewport().mapToGlobal(position))
+        else:
+            # 菜单和其后的对话框都有自己的事件循环，期间其他实例的修改可能移除这个节点，
+            # 所以先取出 id 和名称，不在之后使用索引
+            item_type, item_id = selected_item.data(Qt.UserRole)
+            name = selected_item.data()
             menu = QMenu()
             if item_type == 'folder':
                 rename_action = QAction("重命名文件夹", self)
-                rename_action.triggered.connect(lambda: self.rename_folder(selected_item))
+                rename_action.triggered.connect(lambda: self.rename_folder(item_id, name))
                 menu.addAction(rename_action)
 
                 delete_action = QAction("删除文件夹", self)
-                delete_action.triggered.connect(lambda: self.delete_folder(selected_item))
+                delete_action.triggered.connect(lambda: self.delete_folder(item_id))
                 menu.addAction(delete_action)
+
+                import_action = QAction("导入到此文件夹…", self)
+                import_action.triggered.connect(lambda: self.import_directory(item_id))
+                menu.addAction(import_action)
             elif item_type == 'note':
                 rename_action = QAction("重命名笔记", self)
-                rename_action.triggered.connect(lambda: self.rename_note(selected_item))
+                rename_action.triggered.connect(lambda: self.rename_note(item_id, name))
                 menu.addAction(rename_action)
 
+                history_action = QAction("历史版本", self)
+                history_action.triggered.connect(lambda: self.show_revisions(item_id, name))
+                menu.addAction(history_action)
+
                 delete_action = QAction("删除笔记", self)
-                delete_action.triggered.connect(lambda: self.delete_note(selected_item))
+                delete_action.triggered.connect(lambda: self.delete_note(item_id))
                 menu.addAction(delete_action)
             menu.exec_(self.notes_tree.viewport().mapToGlobal(position))
 
-    def rename_folder(self, item):
-        name, ok = QInputDialog.getText(self, '重命名文件夹', '请输入新的文件夹名称：', text=item.text(0))
+    def tree_item_exists(self, item_type, item_id):
+        # 模态对话框打开期间，其他实例可能已经删除了这一项
+        if self.tree_model.node_for(item_type, item_id) is not None:
+            return True
+        self.statusBar().showMessage('该项已在其他窗口中删除', 3000)
+        return False
+
+    def rename_folder(self, folder_id, old_name):
+        name, ok = QInputDialog.getText(self, '重命名文件夹', '请输入新的文件夹名称：', text=old_name)
         if ok and name:
-            item_type, folder_id = item.data(0, Qt.UserRole)
-            self.cursor.execute('UPDATE folders SET name = ? WHERE id = ?', (name, folder_id))
-            self.conn.commit()
-            self.load_folders_and_notes()
+            if not self.tree_item_exists('folder', folder_id):
+                return
+            self.storage.submit(storage.rename_folder, folder_id, name)
+            self.tree_model.rename('folder', folder_id, name)
             self.statusBar().showMessage('文件夹已重命名', 2000)
         else:
             QMessageBox.warning(self, '错误', '文件夹名称不能为空')
 
-    def delete_folder(self, item):
-        reply = QMessageBox.question(self, '删除文件夹', '删除文件夹将同时删除其包含的所有笔记，确定要删除吗？', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+    def delete_folder(self, folder_id):
+        reply = QMessageBox.question(self, '删除文件夹', '删除文件夹将同时删除其包含的所有笔记（可在回收站中恢复），确定要删除吗？', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            item_type, folder_id = item.data(0, Qt.UserRole)
-            self.delete_folder_recursive(folder_id)
-            self.conn.commit()
-            self.load_folders_and_notes()
-            self.statusBar().showMessage('文件夹已删除', 2000)
-
-    def delete_folder_recursive(self, folder_id):
-        # 删除子文件夹
-        self.cursor.execute('SELECT id FROM folders WHERE parent_id = ?', (folder_id,))
-        subfolders = self.cursor.fetchall()
-        for subfolder_id, in subfolders:
-            self.delete_folder_recursive(subfolder_id)
-        # 删除文件夹下的笔记
-        self.cursor.execute('DELETE FROM notes WHERE folder_id = ?', (folder_id,))
-        # 删除文件夹
-        self.cursor.execute('DELETE FROM folders WHERE id = ?', (folder_id,))
-
-    def rename_note(self, item):
-        title, ok = QInputDialog.getText(self, '重命名笔记', '请输入新的笔记标题：', text=item.text(0))
+            if not self.tree_item_exists('folder', folder_id):
+                return
+            self.save_current_note_inside('folder', folder_id)
+            self.storage.submit(storage.delete_folder, folder_id)
+            self.remove_tree_item('folder', folder_id)
+            self.statusBar().showMessage('文件夹已移入回收站', 2000)
+
+    def rename_note(self, note_id, old_title):
+        title, ok = QInputDialog.getText(self, '重命名笔记', '请输入新的笔记标题：', text=old_title)
         if ok and title:
-            item_type, note_id = item.data(0, Qt.UserRole)
-            self.cursor.execute('UPDATE notes SET title = ? WHERE id = ?', (title, note_id))
-            self.conn.commit()
-            self.load_folders_and_notes()
+            if not self.tree_item_exists('note', note_id):
+                return
+            self.storage.submit(storage.rename_note, note_id, title)
+            self.tree_model.rename('note', note_id, title)
             self.statusBar().showMessage('笔记已重命名', 2000)
         else:
             QMessageBox.warning(self, '错误', '笔记标题不能为空')
 
-    def delete_note(self, item):
-        reply = QMessageBox.question(self, '删除笔记', '确定要删除该笔记吗？', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            item_type, note_id = item.data(0, Qt.UserRole)
-            self.cursor.execute('DELETE FROM notes WHERE id = ?', (note_id,))
-            self.conn.commit()
+    def show_revisions(self, note_id, title):
+        # 先写入尚未保存的改动，历史版本才是最新的
+        if note_id == self.current_note_id:
+            self.save_scheduler.flush()
+        self.storage.wait_for_note(note_id)
+        dialog = RevisionDialog(self.cursor, note_id, title, self)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_content is not None:
+            if not self.tree_item_exists('note', note_id):
+                return
+            if note_id != self.current_note_id:
+                self.load_note(self.tree_model.index_of_node(self.tree_model.node_for('note', note_id)))
+            self.note_loader.cancel()
+            # 恢复的内容作为一次新的修改保存，原有的历史版本不受影响
+            self.note_editor.setHtml(dialog.selected_content)
+            self.save_scheduler.flush()
+            self.statusBar().showMessage('已恢复历史版本', 2000)
+
+    def show_trash(self):
+        # 等删除操作写入后再读取回收站
+        self.storage.flush()
+        dialog = TrashDialog(self.cursor, self.storage, self)
+        dialog.exec_()
+        if dialog.restored:
             self.load_folders_and_notes()
-            self.note_editor.clear()
-            self.update_word_count()
-            self.statusBar().showMessage('笔记已删除', 2000)
+            # 恢复的笔记重新加入全文索引
+            self.index_missing_notes()
+
+    def import_directory(self, parent_folder_id):
+        # 把一个目录（含子目录）中的 Markdown、HTML 和文本文件导入为笔记，目录结构对应为文件夹
+        directory = QFileDialog.getExistingDirectory(self, "选择要导入的文件夹")
+        if not directory:
+            return
+        self.import_progress = QProgressDialog("正在导入笔记…", "取消", 0, 0, self)
+        self.import_progress.setWindowTitle("导入")
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(0)
+        self.importer = Importer(directory, parent_folder_id, self.storage, self)
+        self.importer.progress.connect(self.on_import_progress)
+        self.importer.imported.connect(self.on_import_finished)
+        self.import_progress.canceled.connect(self.importer.cancel)
+        self.importer.start()
+
+    def on_import_progress(self, done, total):
+        self.import_progress.setMaximum(total)
+        self.import_progress.setValue(done)
+        self.import_progress.setLabelText(f"正在导入笔记…（{done}/{total}）")
+
+    def on_import_finished(self, imported, failed, error):
+        self.import_progress.close()
+        self.importer.wait()
+        # 导入过程中不逐篇更新笔记树，结束后重新加载一次
+        self.load_folders_and_notes()
+        self.statusBar().showMessage(f'已导入 {imported} 篇笔记', 3000)
+        if error:
+            QMessageBox.warning(self, '导入', f'导入失败：{error}\n已导入 {imported} 篇笔记')
+        elif failed:
+            names = '\n'.join(failed[:20]) + ('\n…' if len(failed) > 20 else '')
+            QMessageBox.warning(self, '导入', f'{len(failed)} 个文件无法读取：\n{names}')
+
+    def backup_database(self):
+        default_name = f"notes-{QDateTime.currentDateTime().toString('yyyyMMdd-hhmmss')}.db"
+        file_name, _ = QFileDialog.getSaveFileName(self, "备份数据库", default_name, "数据库文件 (*.db)")
+        if file_name:
+            self.start_backup_task(backup.backup, file_name, "正在备份数据库…")
 
-    def auto_save(self):
+    def export_notes(self):
+        file_name, selected_filter = QFileDialog.getSaveFileName(
+            self, "导出笔记", "notes.zip", "HTML 压缩包 (*.zip);;Markdown 压缩包 (*.zip)")
+        if file_name:
+            self.start_backup_task(backup.export_notes, file_name, "正在导出笔记…",
+                                   markdown=selected_filter.startswith('Markdown'))
+
+    def start_backup_task(self, func, target_path, label, **options):
+        # 备份和导出在后台线程中用独立的连接读取，编辑器在此期间照常使用
+        if self.backup_task is not None:
+            QMessageBox.information(self, '备份', '上一次备份或导出尚未完成')
+            return
+        # 先把尚未保存的改动写入数据库，备份中包含截至此刻的全部内容
+        self.save_scheduler.flush()
+        self.storage.flush()
+        self.backup_progress = QProgressDialog(label, "取消", 0, 0, self)
+        self.backup_progress.setWindowTitle("备份")
+        self.backup_progress.setMinimumDuration(500)
+        self.backup_task = BackupTask(func, storage.DB_PATH, target_path, self, **options)
+        self.backup_task.progress.connect(self.on_backup_progress)
+        self.backup_task.completed.connect(self.on_backup_completed)
+        self.backup_progress.canceled.connect(self.backup_task.cancel)
+        self.backup_task.start()
+
+    def on_backup_progress(self, done, total):
+        self.backup_progress.setMaximum(total)
+        self.backup_progress.setValue(done)
+
+    def on_backup_completed(self, error):
+        cancelled = self.backup_task.cancelled
+        self.backup_task.wait()
+        self.backup_task = None
+        self.backup_progress.close()
+        if error:
+            QMessageBox.warning(self, '备份', f'备份失败：{error}')
+        elif not cancelled:
+            self.statusBar().showMessage('备份完成', 3000)
+
+    def show_performance_dialog(self):
+        PerformanceDialog(self.document_cache, self).exec_()
+
+    def delete_note(self, note_id):
+        reply = QMessageBox.question(self, '删除笔记', '确定要删除该笔记吗？', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            if not self.tree_item_exists('note', note_id):
+                return
+            self.save_current_note_inside('note', note_id)
+            self.storage.submit(storage.delete_note, note_id)
+            self.remove_tree_item('note', note_id)
+            self.statusBar().showMessage('笔记已移入回收站', 2000)
+
+    @profiler.timed
+    def auto_save(self, content):
+        # 由 save_scheduler 在内容有改动时调用
         if self.current_note_id is not None:
-            content = self.note_editor.toHtml()
             timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
-            self.cursor.execute('UPDATE notes SET content = ?, timestamp = ? WHERE id = ?', (content, timestamp, self.current_note_id))
-            self.conn.commit()
-            self.statusBar().showMessage('笔记已自动保存', 1000)
+            # 纯文本直接取自编辑器，写入线程用它更新全文索引
+            self.storage.submit(storage.save_note, self.current_note_id, content, timestamp,
+                                self.note_editor.toPlainText(),
+                                callback=lambda result: self.statusBar().showMessage('笔记已自动保存', 1000),
+                                note_id=self.current_note_id)
 
     # 折叠全部节点
     def collapse_all(self):
@@ -827,10 +1318,10 @@ class ElegantNoteApp(QMainWindow):
         char_fmt.setFont(font)
         cursor.mergeCharFormat(char_fmt)
 
+    @profiler.timed
     def update_word_count(self):
-        text = self.note_editor.toPlainText()
-        word_count = len(text)
-        self.word_count_label.setText(f"字数：{word_count}")
+        self.word_count_label.setText(f"字数：{self.word_counter.words}")
+        self.word_count_label.setToolTip(f"字符数（不含空白）：{self.word_counter.chars}")
         self.update_word_count_position()
 
     def update_word_count_position(self):
@@ -847,18 +1338,49 @@ class ElegantNoteApp(QMainWindow):
             self.note_editor.viewport().setCursor(Qt.IBeamCursor)
 
     def clear_find_material_highlight(self):
-        # 清除所有高亮
-        cursor = self.note_editor.textCursor()
-        cursor.movePosition(QTextCursor.Start)
-        fmt = QTextCharFormat()
-        fmt.setBackground(Qt.transparent)
-        while not cursor.atEnd():
-            cursor.select(QTextCursor.LineUnderCursor)
-            cursor.mergeCharFormat(fmt)
-            cursor.movePosition(QTextCursor.Down)
+        # 高亮只是叠加在编辑器上的显示效果，不修改文档，清除时直接丢弃
+        self.find_material_line = []
+        self.find_material_matches = []
+        self.note_editor.setExtraSelections([])
+
+    def update_find_material_highlight(self):
+        self.note_editor.setExtraSelections(self.find_material_matches + self.find_material_line)
+
+    def make_extra_selection(self, cursor, color):
+        selection = QTextEdit.ExtraSelection()
+        selection.cursor = cursor
+        selection.format.setBackground(QColor(color))
+        return selection
+
+    def highlight_find_material_line(self, cursor):
+        cursor.select(QTextCursor.LineUnderCursor)
+        self.find_material_line = [self.make_extra_selection(cursor, 'yellow')]
+        self.update_find_material_highlight()
+
+    @profiler.timed
+    def highlight_find_material_matches(self, term):
+        # 在整篇笔记中高亮所有匹配（不区分大小写）。纯文本与文档中的位置一一对应，
+        # 用正则在纯文本中查找比逐个调用 QTextDocument.find 快得多
+        document = self.note_editor.document()
+        positions = [match.start() for match in re.finditer(re.escape(term), document.toPlainText(), re.IGNORECASE)]
+        matches = []
+        # 每个高亮都要一个 QTextCursor，匹配极多时只高亮前面一部分
+        for position in positions[:MAX_FIND_MATERIAL_MATCHES]:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + len(term), QTextCursor.KeepAnchor)
+            matches.append(self.make_extra_selection(cursor, '#ffcc80'))
+        self.find_material_matches = matches
+        self.update_find_material_highlight()
+        self.statusBar().showMessage(f'找到 {len(positions)} 处“{term}”', 3000)
 
     def toggle_find_material_mode(self, checked):
-        if not checked:
+        if checked:
+            # 开启模式时如果选中了文字，高亮笔记中所有相同的文字
+            term = self.note_editor.textCursor().selectedText()
+            if term and '\u2029' not in term:
+                self.highlight_find_material_matches(term)
+        else:
             # 取消模式时，清除高亮
             self.clear_find_material_highlight()
         # 更新鼠标指针样式
@@ -880,16 +1402,80 @@ class ElegantNoteApp(QMainWindow):
             options=options
         )
         if file_name:
-            with open(file_name, "rb") as image_file:
-                encoded_image = base64.b64encode(image_file.read()).decode('utf-8')
-                image_format = os.path.splitext(file_name)[1][1:].lower()  # 获取图片格式，如 'png'
-                html_img = f'<img src="data:image/{image_format};base64,{encoded_image}"><br>'
-                cursor = self.note_editor.textCursor()
-                cursor.insertHtml(html_img)
-                self.auto_save()  # 保存更改
+            # 先插入占位图，解码、缩放和压缩在后台完成
+            started = self.image_ingestor.start(file_name)
+            if started is None:
+                return
+            placeholder_url, size = started
+            self.pending_images[placeholder_url] = self.current_note_id
+            self.note_editor.document().addResource(QTextDocument.ImageResource, QUrl(placeholder_url), placeholder_image())
+            cursor = self.note_editor.textCursor()
+            cursor.insertHtml(f'<img src="{placeholder_url}" width="{size.width()}" height="{size.height()}"><br>')
+
+    @profiler.timed
+    def on_image_ready(self, placeholder_url, result):
+        note_id = self.pending_images.pop(placeholder_url, None)
+        # 图片按内容哈希存入附件表，同一张图片只存一份，笔记中只保留引用
+        self.storage.submit(storage.store_attachment, result['digest'], result['mime'], result['data'], result['thumbnail'])
+        url = attachments.url_for(result['digest'])
+        document = self.note_editor.document()
+        fragments = self.find_image_fragments(document, placeholder_url)
+        if note_id == self.current_note_id and fragments:
+            document.addResource(QTextDocument.ImageResource, QUrl(url), result['image'])
+            for fragment_cursor, image_format in fragments:
+                image_format.setName(url)
+                fragment_cursor.setCharFormat(image_format)
+            self.save_scheduler.flush()  # 保存更改
+        elif note_id is not None:
+            self.storage.submit(storage.replace_image_reference, note_id, placeholder_url, url, note_id=note_id)
+            # 缓存的文档中仍是占位图，下次打开时从数据库重新读取
+            if note_id != self.current_note_id:
+                self.document_cache.discard(note_id)
+
+    def on_image_failed(self, placeholder_url, message):
+        note_id = self.pending_images.pop(placeholder_url, None)
+        if note_id == self.current_note_id:
+            for fragment_cursor, image_format in self.find_image_fragments(self.note_editor.document(), placeholder_url):
+                fragment_cursor.removeSelectedText()
+        elif note_id is not None:
+            self.storage.submit(storage.remove_image, note_id, placeholder_url, note_id=note_id)
+            self.document_cache.discard(note_id)
+        QMessageBox.warning(self, '错误', f'插入图片失败：{message}')
+
+    def find_image_fragments(self, document, name):
+        # 返回选中了指定图片的光标及其格式
+        fragments = []
+        block = document.begin()
+        while block.isValid():
+            iterator = block.begin()
+            while not iterator.atEnd():
+                fragment = iterator.fragment()
+                char_format = fragment.charFormat()
+                if char_format.isImageFormat() and char_format.toImageFormat().name() == name:
+                    cursor = QTextCursor(document)
+                    cursor.setPosition(fragment.position())
+                    cursor.setPosition(fragment.position() + fragment.length(), QTextCursor.KeepAnchor)
+                    fragments.append((cursor, char_format.toImageFormat()))
+                iterator += 1
+            block = block.next()
+        return fragments
 
     def closeEvent(self, event):
+        # 关闭前保存改动，并等待写入线程把队列中的任务全部提交
+        self.note_loader.cancel()
+        self.change_feed.stop()
+        # 占位图片已随笔记保存，等正在处理的图片完成并换成正式的引用后再保存，否则笔记中会留下无效的图片
+        self.image_ingestor.wait()
+        QApplication.sendPostedEvents(None, QEvent.MetaCall)
+        self.save_scheduler.flush()
+        if self.backup_task is not None:
+            self.backup_task.cancel()
+            self.backup_task.wait()
+        self.search_worker.stop()
+        self.storage.stop()
         self.conn.close()
+        # 设置了 NOTE_PROFILE 时写出性能记录
+        profiler.dump()
         event.accept()
 
     # 添加快捷键提示窗口
@@ -921,6 +1507,8 @@ class ElegantNoteApp(QMainWindow):
             {"功能": "高亮模式", "快捷键": ""},
             {"功能": "找素材模式", "快捷键": ""},
             {"功能": "删除线", "快捷键": ""},
+            {"功能": "搜索笔记", "快捷键": "Ctrl+Shift+K"},
+            {"功能": "性能统计", "快捷键": "Ctrl+Shift+P"},
             {"功能": "撤销", "快捷键": "Ctrl+Z"},
             {"功能": "恢复", "快捷键": "Ctrl+Y"},
         ]
@@ -941,6 +1529,12 @@ class ElegantNoteApp(QMainWindow):
         dialog.exec_()
 
     def eventFilter(self, source, event):
+        if source == self.search_box:
+            # Esc 清空搜索，回到笔记树
+            if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape and self.search_box.text():
+                self.search_box.clear()
+                return True
+            return super().eventFilter(source, event)
         if source == self.note_editor.viewport():
             if event.type() == QEvent.Resize:
                 self.update_word_count_position()
@@ -969,7 +1563,7 @@ class ElegantNoteApp(QMainWindow):
 
                         cursor.select(QTextCursor.LineUnderCursor)
                         cursor.insertText(new_text, fmt)
-                        self.auto_save()  # 保存更改
+                        self.save_scheduler.flush()  # 保存更改
                         return True  # 事件已处理
 
                 # 处理超链接点击
@@ -987,19 +1581,17 @@ class ElegantNoteApp(QMainWindow):
                     self.note_editor.viewport().setCursor(Qt.IBeamCursor)
                     return True
                 elif self.find_material_action.isChecked():
-                    # 找素材模式逻辑
-                    # 清除之前的高亮
-                    self.clear_find_material_highlight()
-                    # 高亮当前行
-                    fmt = QTextCharFormat()
-                    fmt.setBackground(QColor('yellow'))
-                    cursor.mergeCharFormat(fmt)
+                    # 找素材模式逻辑：高亮当前行，替换之前高亮的行
+                    self.highlight_find_material_line(cursor)
                     return True
             return False
         return super(ElegantNoteApp, self).eventFilter(source, event)
 
 
 if __name__ == '__main__':
+    # 导入时解析进程用 spawn 方式启动，打包成可执行文件后需要这一步
+    import multiprocessing
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = ElegantNoteApp()
     window.show()
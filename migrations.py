@@ -0,0 +1,189 @@
+import sqlite3
+
+import profiler
+
+# 数据库结构的版本记在 PRAGMA user_version 中，MIGRATIONS 中每一项把数据库升级到对应的版本
+# 启动时按顺序执行数据库还没有执行过的迁移，每个迁移与新的版本号在同一个事务中提交；
+# 中途失败或退出时数据库停留在上一个版本，下次启动从这个迁移重新开始
+# 引入迁移之前的数据库用过版本 1（正文已压缩）和 2（正文已转换为精简格式），编号与之衔接
+# 已发布的迁移不能再修改，结构有变化时在末尾追加新的迁移
+
+
+def create_tables(cursor):
+    # 版本 1：引入迁移之前 init_db 和各模块创建的表。旧数据库中已有的表保持不变
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS folders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            parent_id INTEGER,
+            FOREIGN KEY(parent_id) REFERENCES folders(id)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            folder_id INTEGER,
+            title TEXT NOT NULL,
+            content TEXT,
+            timestamp TEXT,
+            FOREIGN KEY(folder_id) REFERENCES folders(id)
+        )
+    ''')
+    # 历史版本表：base_id 为空的是完整快照，否则是相对于 base_id 版本的差异；depth 为距离快照的差异个数
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS note_revisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            note_id INTEGER NOT NULL,
+            created INTEGER NOT NULL,
+            base_id INTEGER,
+            depth INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            size INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_note_revisions_note ON note_revisions (note_id, created)')
+    # 图片按内容哈希只存一份，orphaned_at 记录图片失去最后一个引用的时间
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS attachments (
+            hash TEXT PRIMARY KEY,
+            mime TEXT NOT NULL,
+            data BLOB NOT NULL,
+            thumbnail BLOB,
+            created INTEGER NOT NULL,
+            orphaned_at INTEGER
+        )
+    ''')
+    cursor.execute('PRAGMA table_info(attachments)')
+    if 'thumbnail' not in [column[1] for column in cursor.fetchall()]:
+        cursor.execute('ALTER TABLE attachments ADD COLUMN thumbnail BLOB')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS note_attachments (
+            note_id INTEGER NOT NULL,
+            hash TEXT NOT NULL,
+            PRIMARY KEY (note_id, hash)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_note_attachments_hash ON note_attachments (hash)')
+    # 全文索引的 rowid 就是笔记 id
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(title, body, tokenize = 'trigram')")
+    except sqlite3.OperationalError:
+        # SQLite 3.34 之前没有 trigram 分词器
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(title, body, tokenize = 'unicode61')")
+    # 回收站：每次删除操作是一个批次，恢复时保留原来的 id
+    # 删除笔记时把笔记行移入 trash_notes；删除文件夹时只移动文件夹行，
+    # 其中的笔记留在 notes 表里，因为所属文件夹不存在而不再显示，恢复文件夹即可全部恢复
+    # 笔记的历史版本和图片引用在彻底删除之前一直保留
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS trash_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            deleted_at INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            note_count INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS trash_folders (
+            batch_id INTEGER NOT NULL,
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            parent_id INTEGER
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS trash_notes (
+            batch_id INTEGER NOT NULL,
+            id INTEGER PRIMARY KEY,
+            folder_id INTEGER,
+            title TEXT NOT NULL,
+            content TEXT,
+            timestamp TEXT
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trash_folders_batch ON trash_folders (batch_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trash_notes_batch ON trash_notes (batch_id)')
+
+
+def convert_note_format(cursor):
+    # 版本 2：已有的笔记需要压缩并转换为精简格式。笔记很多时转换较慢，这里只记下转换进度，
+    # 实际的转换由写入线程在启动后分批完成（storage.convert_notes），转换完成后删除进度表
+    cursor.execute('SELECT EXISTS (SELECT 1 FROM notes)')
+    if cursor.fetchone()[0]:
+        cursor.execute('CREATE TABLE IF NOT EXISTS note_conversion (after_id INTEGER NOT NULL)')
+        cursor.execute('INSERT INTO note_conversion (after_id) VALUES (0)')
+
+
+def add_tree_indexes(cursor):
+    # 版本 3：笔记树、回收站和递归删除按上级文件夹查找
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders (parent_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_notes_folder ON notes (folder_id)')
+
+
+def add_modified_column(cursor):
+    # 版本 4：修改时间的整数形式（Unix 秒），便于按时间比较和排序；timestamp 仍保留为显示用的本地时间文本
+    for table in ('notes', 'trash_notes'):
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN modified INTEGER')
+        cursor.execute(f"UPDATE {table} SET modified = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)")
+
+
+def add_change_log(cursor):
+    # 版本 5：其他实例修改了哪些笔记和文件夹，由各实例写入连接上的临时触发器填写，见 change_feed
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            item_id INTEGER NOT NULL,
+            action TEXT NOT NULL
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_changes_created ON changes (created)')
+
+
+def add_bigram_index(cursor):
+    # 版本 6：两个字符的词（中文最常见的词长）查不了 trigram 索引，另建按相邻两个字符切分的全文索引，见 search.bigrams
+    # 已有的笔记由启动后的 index_missing_notes 分批补建
+    cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes_bigram USING fts5(title, body, tokenize = 'unicode61')")
+
+
+MIGRATIONS = (
+    (1, create_tables),
+    (2, convert_note_format),
+    (3, add_tree_indexes),
+    (4, add_modified_column),
+    (5, add_change_log),
+    (6, add_bigram_index),
+)
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def version(cursor):
+    cursor.execute('PRAGMA user_version')
+    return cursor.fetchone()[0]
+
+
+def upgrade(cursor):
+    # 执行尚未执行的迁移，返回执行的个数；有迁移执行时最后更新查询规划器的统计信息
+    # 在启动写入线程之前调用，cursor 所在的连接此时不能有未提交的事务
+    current = version(cursor)
+    if current > SCHEMA_VERSION:
+        raise RuntimeError(f'数据库版本 {current} 比程序支持的版本 {SCHEMA_VERSION} 新，请升级程序')
+    applied = 0
+    for target, migrate in MIGRATIONS:
+        if target <= current:
+            continue
+        with profiler.measure('migration', migrate.__name__):
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                migrate(cursor)
+                cursor.execute(f'PRAGMA user_version = {target}')
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+        applied += 1
+    if applied:
+        cursor.execute('ANALYZE')
+    return applied
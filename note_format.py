@@ -0,0 +1,178 @@
+import re
+import sys
+import random
+import argparse
+
+# 笔记的存储格式：toHtml() 的输出去掉 Qt 解析时本来就会补上的默认样式
+# setHtml() 读回后 toHtml() 的结果与原文完全相同，但体积约减半，解析也更快
+# 只删除标签 style 属性中与默认值完全一致的样式，其余保持原样，所以对任何 toHtml() 输出都是安全的
+# 正文中的双引号在 toHtml() 中转义为 &quot;，正文不会被 STYLE_RE 匹配到
+
+DOCTYPE = '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" "http://www.w3.org/TR/REC-html40/strict.dtd">\n'
+# 段落、列表项、标题上的缩进默认都是 0
+# 上下边距的默认值随上下文变化（列表的边距会移到首尾两项上），列表本身的样式也因此保留
+BLOCK_DEFAULTS = ' margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;'
+STYLE_RE = re.compile(r' style="([^"]*)"')
+# 链接文字的默认样式（只有一个 span 的链接）
+LINK_SPAN_RE = re.compile(r'(<a href="[^"]*">)<span style=" text-decoration: underline; color:#0000ff;">([^<]*)</span></a>')
+
+
+def compact(html):
+    if not html:
+        return html
+    if html.startswith(DOCTYPE):
+        html = html[len(DOCTYPE):]
+    html = STYLE_RE.sub(compact_style, html)
+    return LINK_SPAN_RE.sub(r'\1\2</a>', html)
+
+
+def compact_style(match):
+    style = match.group(1).replace(BLOCK_DEFAULTS, '')
+    return f' style="{style}"' if style else ''
+
+
+def verify(html, document_class):
+    # 检查压缩后的格式能否无损读回：返回 (是否一致, 原始 toHtml, 读回的 toHtml)
+    original = document_class()
+    original.setHtml(html)
+    expected = original.toHtml()
+    restored = document_class()
+    restored.setHtml(compact(expected))
+    actual = restored.toHtml()
+    return expected == actual, expected, actual
+
+
+# 自检用的随机正文：中英文、HTML 和 CSS 片段、与默认样式相同的文字
+SAMPLE_TEXTS = (
+    '普通的一段文字', 'plain text', ' 前后 空格  ', 'a < b && c > d', '"引号" \'单引号\'', '<b>不是标签</b>',
+    BLOCK_DEFAULTS, ' style=""', 'style="color:red"', '<span style=" text-decoration: underline; color:#0000ff;">',
+    DOCTYPE.strip(), '😀 表情', '\t制表符', '&nbsp;&amp;', '-qt-block-indent:0;',
+)
+TOOLBAR_COLORS = ('#000000', '#FF0000', '#008000', '#0000FF', '#FFFF00', '#800080', '#FFA500', '#808080')
+
+
+def sample_documents(count=200, seed=0):
+    # 按工具栏的操作（见 main.py）随机组合生成文档，返回 toHtml() 结果
+    from PyQt5.QtGui import QColor, QFont, QTextBlockFormat, QTextCharFormat, QTextCursor, QTextDocument, QTextListFormat
+    rng = random.Random(seed)
+
+    def char_format():
+        fmt = QTextCharFormat()
+        if rng.random() < 0.3:
+            fmt.setFontWeight(QFont.Bold)
+        if rng.random() < 0.3:
+            fmt.setFontItalic(True)
+        if rng.random() < 0.2:
+            fmt.setFontUnderline(True)
+        if rng.random() < 0.2:
+            fmt.setFontStrikeOut(True)
+        if rng.random() < 0.3:
+            fmt.setForeground(QColor(rng.choice(TOOLBAR_COLORS)))
+        return fmt
+
+    def text():
+        return ''.join(rng.choice(SAMPLE_TEXTS) for _ in range(rng.randint(1, 3)))
+
+    documents = []
+    for _ in range(count):
+        document = QTextDocument()
+        cursor = QTextCursor(document)
+        for block in range(rng.randint(1, 8)):
+            if block:
+                cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+            kind = rng.choice(('text', 'text', 'heading', 'list', 'task', 'link', 'separator', 'image'))
+            if kind == 'heading':
+                level = rng.randint(1, 3)
+                fmt = QTextBlockFormat()
+                fmt.setHeadingLevel(level)
+                cursor.mergeBlockFormat(fmt)
+                heading = QTextCharFormat()
+                heading.setFont(QFont('微软雅黑', 24 - level * 2, QFont.Bold))
+                cursor.insertText(text(), heading)
+            elif kind == 'list':
+                cursor.insertList(rng.choice((QTextListFormat.ListDecimal, QTextListFormat.ListDisc)))
+                for item in range(rng.randint(1, 3)):
+                    if item:
+                        cursor.insertBlock()
+                    cursor.insertText(text(), char_format())
+            elif kind == 'task':
+                cursor.insertHtml('<input type="checkbox" onclick="toggle_task(this)"> &nbsp;<span>未完成的任务</span><br>')
+                cursor.insertText(text(), char_format())
+            elif kind == 'link':
+                cursor.insertHtml(f'<a href="https://example.com/{rng.randint(0, 99)}?a=1&amp;b=2">链接</a>')
+                cursor.insertText(text(), QTextCharFormat())
+            elif kind == 'separator':
+                cursor.insertHtml('<hr/>')
+            elif kind == 'image':
+                digest = '%064x' % rng.getrandbits(256)
+                cursor.insertHtml(f'<img src="attachment:{digest}" width="{rng.randint(1, 800)}" height="{rng.randint(1, 600)}"><br>')
+            else:
+                for _ in range(rng.randint(1, 4)):
+                    cursor.insertText(text(), char_format())
+        documents.append(document.toHtml())
+    return documents
+
+
+def self_test():
+    # 工具栏能生成的各种格式加上任意文字，压缩后都必须无损读回；返回失败的个数
+    from PyQt5.QtGui import QTextDocument
+    failures = 0
+    for html in sample_documents():
+        ok, expected, actual = verify(html, QTextDocument)
+        if not ok:
+            failures += 1
+            print(f'不一致：\n{expected}\n{actual}')
+    return failures
+
+
+def main():
+    # 命令行工具：--verify 检查数据库中每篇笔记能否无损转换，--convert 转换全部笔记，
+    # --self-test 用随机生成的文档检查转换本身
+    parser = argparse.ArgumentParser(description='检查或转换笔记存储格式')
+    parser.add_argument('--db', default='notes.db')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--verify', action='store_true')
+    group.add_argument('--convert', action='store_true')
+    group.add_argument('--self-test', action='store_true')
+    args = parser.parse_args()
+
+    if args.self_test:
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QFont
+        app = QApplication(sys.argv[:1])
+        QApplication.setFont(QFont("微软雅黑", 10))
+        failures = self_test()
+        print(f'自检完成，{failures} 个文档无法无损转换')
+        sys.exit(1 if failures else 0)
+
+    import storage
+    import migrations
+    import codec
+    conn = storage.connect(args.db)
+    conn.isolation_level = None  # 手动控制事务
+    cursor = conn.cursor()
+    if args.verify:
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QFont, QTextDocument
+        app = QApplication(sys.argv[:1])
+        QApplication.setFont(QFont("微软雅黑", 10))  # 与主程序一致，默认字体会写入 toHtml() 的 body 样式
+        failures = 0
+        cursor.execute('SELECT id, title, content FROM notes ORDER BY id')
+        for note_id, title, content in cursor.fetchall():
+            ok, expected, actual = verify(codec.decode(content), QTextDocument)
+            if not ok:
+                failures += 1
+                print(f'不一致：{note_id} {title}')
+        print(f'检查完成，{failures} 篇笔记无法无损转换')
+        sys.exit(1 if failures else 0)
+    migrations.upgrade(cursor)
+    after_id = storage.conversion_progress(cursor)
+    while after_id is not None:
+        cursor.execute('BEGIN IMMEDIATE')
+        after_id = storage.convert_notes(cursor, after_id)
+        cursor.execute('COMMIT')
+    print('转换完成')
+
+
+if __name__ == '__main__':
+    main()
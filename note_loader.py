@@ -0,0 +1,108 @@
+import re
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QTextCursor, QTextDocumentFragment
+
+import profiler
+
+# 正文超过这个长度（字符）的笔记分段加载，先显示开头，其余部分在事件循环空闲时逐段追加
+PROGRESSIVE_THRESHOLD = 256 * 1024
+# 第一段只需填满首屏
+FIRST_CHUNK_SIZE = 16 * 1024
+# 之后每段的长度，解析一段大约几十毫秒，期间界面仍能响应点击
+CHUNK_SIZE = 128 * 1024
+
+# 跨行的顶层元素：列表和表格内部不能切开
+CONTAINER_RE = re.compile(r'<(/?)(?:ul|ol|table)\b')
+# 插入片段时第一个段落会并入光标所在的段落并丢掉自己的格式，
+# 所以每段前面加一个空段落，让它并入上一段的末尾，真正的内容保持原来的格式
+MERGE_BLOCK = '<p style="-qt-paragraph-type:empty;"><br /></p>\n'
+
+
+def split_html(html):
+    # 拆出 toHtml() 输出的 (头部, 正文, 尾部)，无法识别时返回 None
+    body_start = html.find('<body')
+    body_end = html.rfind('</body>')
+    if body_start < 0 or body_end < 0:
+        return None
+    body_start = html.find('>', body_start) + 1
+    if html.startswith('\n', body_start):
+        body_start += 1
+    return html[:body_start], html[body_start:body_end], html[body_end:]
+
+
+def chunk_end(body, start, size):
+    # 从 start 起至少 size 个字符之后的第一个顶层段落结尾
+    # toHtml() 中每个顶层段落占一行，列表、表格可能跨越多行
+    depth = 0
+    position = start
+    while position < len(body):
+        line_end = body.find('\n', position)
+        line_end = len(body) if line_end < 0 else line_end + 1
+        for match in CONTAINER_RE.finditer(body, position, line_end):
+            depth += -1 if match.group(1) else 1
+        position = line_end
+        if depth <= 0 and position - start >= size:
+            break
+    return position
+
+
+# 分段加载笔记：在编辑器中先显示第一段，剩余部分由计时器逐段追加到文档末尾
+# 加载期间编辑器只读、关闭撤销栈，切换笔记时调用 cancel() 停止加载
+class NoteLoader(QObject):
+    progress = pyqtSignal(int, int)  # (已加载的字符数, 正文总字符数)，每追加一段发出一次
+    finished = pyqtSignal()  # 分段加载全部完成；短笔记直接 setHtml()，不发出信号
+
+    def __init__(self, editor, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.head = self.body = self.tail = ''
+        self.loaded = 0  # body 中已加载到的位置
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.load_next_chunk)
+
+    def is_loading(self):
+        return self.timer.isActive()
+
+    @profiler.timed
+    def load(self, content):
+        self.cancel()
+        parts = split_html(content) if len(content) > PROGRESSIVE_THRESHOLD else None
+        if parts is None:
+            self.editor.setHtml(content)
+            return
+        self.head, self.body, self.tail = parts
+        self.loaded = chunk_end(self.body, 0, FIRST_CHUNK_SIZE)
+        self.editor.setReadOnly(True)
+        self.editor.document().setUndoRedoEnabled(False)
+        self.editor.setHtml(self.head + self.body[:self.loaded] + self.tail)
+        if self.loaded < len(self.body):
+            self.timer.start()
+        else:
+            self.stop()
+            self.finished.emit()
+
+    @profiler.timed
+    def load_next_chunk(self):
+        end = chunk_end(self.body, self.loaded, CHUNK_SIZE)
+        document = self.editor.document()
+        fragment = QTextDocumentFragment.fromHtml(self.head + MERGE_BLOCK + self.body[self.loaded:end] + self.tail, document)
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertFragment(fragment)
+        self.loaded = end
+        self.progress.emit(self.loaded, len(self.body))
+        if self.loaded == len(self.body):
+            self.stop()
+            self.finished.emit()
+
+    def cancel(self):
+        # 放弃尚未追加的部分，编辑器中只剩已加载的内容，调用方随后会替换它
+        if self.is_loading():
+            self.stop()
+
+    def stop(self):
+        self.timer.stop()
+        self.head = self.body = self.tail = ''
+        self.editor.document().setUndoRedoEnabled(True)
+        self.editor.setReadOnly(False)
@@ -0,0 +1,281 @@
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+from icons import get_icon
+import profiler
+
+# 每次展开或滚动到底部时最多加载的笔记行数
+FETCH_BATCH_SIZE = 256
+
+
+class TreeNode:
+    # 使用 __slots__ 让每个节点只占用很少的内存
+    __slots__ = ('kind', 'id', 'name', 'parent', 'row', 'children', 'pending_folders', 'last_note_id', 'notes_done')
+
+    def __init__(self, kind, node_id, name, parent):
+        self.kind = kind
+        self.id = node_id
+        self.name = name
+        self.parent = parent
+        self.row = 0
+        if kind == 'note':
+            self.children = None
+        else:
+            self.children = []
+            self.pending_folders = []  # 尚未生成节点的子文件夹 (id, name)
+            self.last_note_id = 0  # 已加载笔记的最大 id，用于按 id 分批加载
+            self.notes_done = False
+
+    def can_fetch_more(self):
+        return self.kind != 'note' and (bool(self.pending_folders) or not self.notes_done)
+
+
+# 笔记树的数据模型，只有在文件夹被展开时才加载其子节点
+class NoteTreeModel(QAbstractItemModel):
+
+    def __init__(self, cursor, parent=None):
+        super().__init__(parent)
+        self.cursor = cursor
+        self.reload()
+
+    @profiler.timed
+    def reload(self):
+        self.beginResetModel()
+        # 文件夹数量通常很少，一次扫描全部记录下父子关系；笔记在展开时按需查询
+        self.cursor.execute('SELECT id, name, parent_id FROM folders ORDER BY id')
+        self.folder_parent = {}
+        self.folder_children = {}
+        for folder_id, folder_name, parent_id in self.cursor.fetchall():
+            self.folder_parent[folder_id] = parent_id
+            self.folder_children.setdefault(parent_id, []).append((folder_id, folder_name))
+
+        self.root = TreeNode('root', None, '', None)
+        self.root.pending_folders = self.folder_children.pop(None, [])
+        # id -> 节点索引，只包含已经加载出来的节点
+        self.folder_nodes = {}
+        self.note_nodes = {}
+        self.endResetModel()
+
+    # ---- QAbstractItemModel 接口 ----
+
+    def node_from_index(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index_of_node(self, node):
+        if node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_of_node(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        if node.children is None:
+            return False
+        return bool(node.children) or node.can_fetch_more()
+
+    def canFetchMore(self, parent):
+        return self.node_from_index(parent).can_fetch_more()
+
+    @profiler.timed
+    def fetchMore(self, parent):
+        node = self.node_from_index(parent)
+        if not node.can_fetch_more():
+            return
+        new_nodes = []
+        # 子文件夹已在内存中，直接生成节点
+        for folder_id, folder_name in node.pending_folders:
+            new_nodes.append(self.make_folder_node(folder_id, folder_name, node))
+        node.pending_folders = []
+        if not node.notes_done:
+            self.cursor.execute(
+                'SELECT id, title FROM notes WHERE folder_id IS ? AND id > ? ORDER BY id LIMIT ?',
+                (node.id, node.last_note_id, FETCH_BATCH_SIZE)
+            )
+            rows = self.cursor.fetchall()
+            if len(rows) < FETCH_BATCH_SIZE:
+                node.notes_done = True
+            if rows:
+                node.last_note_id = rows[-1][0]
+            for note_id, note_title in rows:
+                # 新建笔记时可能已经提前插入过
+                if note_id not in self.note_nodes:
+                    new_nodes.append(self.make_note_node(note_id, note_title, node))
+        if new_nodes:
+            self.insert_nodes(node, len(node.children), new_nodes)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return node.name
+        if role == Qt.DecorationRole:
+            return get_icon(node.kind)
+        if role == Qt.UserRole:
+            return (node.kind, node.id)
+        return None
+
+    # ---- 节点维护 ----
+
+    def make_folder_node(self, folder_id, folder_name, parent_node):
+        node = TreeNode('folder', folder_id, folder_name, parent_node)
+        node.pending_folders = self.folder_children.pop(folder_id, [])
+        self.folder_nodes[folder_id] = node
+        return node
+
+    def make_note_node(self, note_id, note_title, parent_node):
+        node = TreeNode('note', note_id, note_title, parent_node)
+        self.note_nodes[note_id] = node
+        return node
+
+    def insert_nodes(self, parent_node, position, nodes):
+        self.beginInsertRows(self.index_of_node(parent_node), position, position + len(nodes) - 1)
+        parent_node.children[position:position] = nodes
+        self.renumber(parent_node, position)
+        self.endInsertRows()
+
+    def renumber(self, parent_node, start):
+        children = parent_node.children
+        for row in range(start, len(children)):
+            children[row].row = row
+
+    def node_for(self, kind, item_id):
+        return (self.folder_nodes if kind == 'folder' else self.note_nodes).get(item_id)
+
+    def folder_node_or_root(self, folder_id):
+        return self.root if folder_id is None else self.folder_nodes.get(folder_id)
+
+    def add_folder(self, folder_id, folder_name, parent_id):
+        # 返回新节点的索引；父文件夹尚未加载时返回无效索引
+        self.folder_parent[folder_id] = parent_id
+        parent_node = self.folder_node_or_root(parent_id)
+        if parent_node is None:
+            self.folder_children.setdefault(parent_id, []).append((folder_id, folder_name))
+            return QModelIndex()
+        if parent_node.pending_folders:
+            # 先加载父节点已有的子节点，新文件夹才能排到正确的位置
+            parent_node.pending_folders.append((folder_id, folder_name))
+            self.fetchMore(self.index_of_node(parent_node))
+            return self.index_of_node(self.folder_nodes[folder_id])
+        # 文件夹排在同级笔记之前
+        position = 0
+        while position < len(parent_node.children) and parent_node.children[position].kind == 'folder':
+            position += 1
+        node = self.make_folder_node(folder_id, folder_name, parent_node)
+        self.insert_nodes(parent_node, position, [node])
+        return self.index_of_node(node)
+
+    def add_note(self, note_id, note_title, folder_id):
+        parent_node = self.folder_node_or_root(folder_id)
+        if parent_node is None:
+            return QModelIndex()
+        if parent_node.pending_folders:
+            self.fetchMore(self.index_of_node(parent_node))
+            if note_id in self.note_nodes:
+                return self.index_of_node(self.note_nodes[note_id])
+        node = self.make_note_node(note_id, note_title, parent_node)
+        self.insert_nodes(parent_node, len(parent_node.children), [node])
+        return self.index_of_node(node)
+
+    def index_for_note(self, note_id, folder_id):
+        # 逐层加载笔记所在的文件夹，再分批加载到这篇笔记，返回其索引（用于定位搜索结果）
+        chain = []
+        while folder_id is not None:
+            if folder_id not in self.folder_parent:
+                return QModelIndex()
+            chain.append(folder_id)
+            folder_id = self.folder_parent[folder_id]
+        node = self.root
+        for ancestor_id in reversed(chain):
+            if ancestor_id not in self.folder_nodes and node.pending_folders:
+                self.fetchMore(self.index_of_node(node))
+            node = self.folder_nodes.get(ancestor_id)
+            if node is None:
+                return QModelIndex()
+        while note_id not in self.note_nodes and node.can_fetch_more():
+            self.fetchMore(self.index_of_node(node))
+        if note_id not in self.note_nodes:
+            return QModelIndex()
+        return self.index_of_node(self.note_nodes[note_id])
+
+    def rename(self, kind, item_id, name):
+        node = self.node_for(kind, item_id)
+        if node is not None:
+            node.name = name
+            index = self.index_of_node(node)
+            self.dataChanged.emit(index, index)
+        elif kind == 'folder':
+            # 未加载的文件夹只需更新待加载列表中的名称
+            for siblings in self.pending_lists(self.folder_parent.get(item_id)):
+                for i, (folder_id, _) in enumerate(siblings):
+                    if folder_id == item_id:
+                        siblings[i] = (folder_id, name)
+
+    def pending_lists(self, parent_id):
+        # 某个文件夹的子文件夹可能还在父节点的待加载列表里，或者父节点本身都还没加载
+        lists = []
+        if parent_id in self.folder_children:
+            lists.append(self.folder_children[parent_id])
+        parent_node = self.folder_node_or_root(parent_id)
+        if parent_node is not None and parent_node.pending_folders:
+            lists.append(parent_node.pending_folders)
+        return lists
+
+    def remove(self, kind, item_id):
+        # 移除节点及其子孙，返回其中已加载的笔记 id
+        removed_note_ids = []
+        if kind == 'folder':
+            for siblings in self.pending_lists(self.folder_parent.get(item_id)):
+                siblings[:] = [entry for entry in siblings if entry[0] != item_id]
+            self.drop_folder_subtree(item_id)
+        node = self.node_for(kind, item_id)
+        if node is None:
+            return removed_note_ids
+        parent_node = node.parent
+        self.beginRemoveRows(self.index_of_node(parent_node), node.row, node.row)
+        del parent_node.children[node.row]
+        self.renumber(parent_node, node.row)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.kind == 'folder':
+                self.folder_nodes.pop(current.id, None)
+                stack.extend(current.children)
+            else:
+                self.note_nodes.pop(current.id, None)
+                removed_note_ids.append(current.id)
+        self.endRemoveRows()
+        return removed_note_ids
+
+    def drop_folder_subtree(self, folder_id):
+        # 清理文件夹子树在父子关系表中的记录（包括尚未加载的部分）
+        children_of = {}
+        for child_id, parent_id in self.folder_parent.items():
+            children_of.setdefault(parent_id, []).append(child_id)
+        stack = [folder_id]
+        while stack:
+            current = stack.pop()
+            self.folder_parent.pop(current, None)
+            self.folder_children.pop(current, None)
+            stack.extend(children_of.get(current, []))
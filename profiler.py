@@ -0,0 +1,165 @@
+import os
+import json
+import math
+import time
+import inspect
+import contextlib
+import sqlite3
+import threading
+import functools
+
+# 性能统计：按名称记录每条 SQL 语句、每个写入任务和主要界面处理函数的耗时分布
+# 设置环境变量 NOTE_PROFILE=<文件名> 时还会记下每一次调用，退出时写成 Chrome trace 格式，
+# 可以在 chrome://tracing 或 ui.perfetto.dev 中打开，文件中同时附有各项的统计
+TRACE_ENV = 'NOTE_PROFILE'
+# 直方图把每个 2 倍区间分成几个桶，分位数的误差约为 19%
+BUCKETS_PER_DOUBLING = 4
+# trace 中最多保留的事件数，超出后只统计不记录
+MAX_TRACE_EVENTS = 1000000
+# SQL 语句作为统计名称时保留的长度
+SQL_NAME_LENGTH = 80
+
+lock = threading.Lock()
+histograms = {}  # (类别, 名称) -> Histogram
+trace_path = os.environ.get(TRACE_ENV)
+trace_events = []
+thread_names = {}
+sql_names = {}  # SQL 语句 -> 统计名称
+
+
+# 耗时直方图：按对数分桶计数，内存占用与调用次数无关
+class Histogram:
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}  # 桶序号 -> 次数，桶 i 的上界为 2 ** ((i + 1) / BUCKETS_PER_DOUBLING) 微秒
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        bucket = math.floor(math.log2(max(seconds * 1e6, 1)) * BUCKETS_PER_DOUBLING)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        # 返回秒数，取所在桶的上界，不超过最大值
+        target = max(1, math.ceil(self.count * fraction))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(2 ** ((bucket + 1) / BUCKETS_PER_DOUBLING) / 1e6, self.max)
+        return self.max
+
+
+def record(category, name, start, end):
+    # start、end 为 time.perf_counter() 的读数
+    with lock:
+        histogram = histograms.get((category, name))
+        if histogram is None:
+            histogram = histograms[(category, name)] = Histogram()
+        histogram.record(end - start)
+        if trace_path and len(trace_events) < MAX_TRACE_EVENTS:
+            thread_id = threading.get_ident()
+            if thread_id not in thread_names:
+                thread_names[thread_id] = threading.current_thread().name
+            trace_events.append((category, name, start, end, thread_id))
+
+
+@contextlib.contextmanager
+def measure(category, name):
+    # with profiler.measure('类别', '名称'): 记录代码块的耗时
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(category, name, start, time.perf_counter())
+
+
+def timed(func):
+    # 装饰界面处理函数，以函数的限定名统计耗时
+    # 与直接连接信号时一样，信号传来的多余参数被丢弃，被装饰的函数仍可以连接参数较多的信号
+    name = func.__qualname__
+    parameters = inspect.signature(func).parameters.values()
+    if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+        max_args = None
+    else:
+        max_args = sum(parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD) for parameter in parameters)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args[:max_args], **kwargs)
+        finally:
+            record('ui', name, start, time.perf_counter())
+    return wrapper
+
+
+def sql_name(sql):
+    name = sql_names.get(sql)
+    if name is None:
+        name = ' '.join(sql.split())[:SQL_NAME_LENGTH]
+        if len(sql_names) < 10000:  # 搜索等处动态拼接的语句不全部缓存
+            sql_names[sql] = name
+    return name
+
+
+# 记录每条语句执行耗时的游标。只计 execute() 本身，逐行读取结果的时间不计入
+class ProfiledCursor(sqlite3.Cursor):
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record('sql', sql_name(sql), start, time.perf_counter())
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record('sql', sql_name(sql), start, time.perf_counter())
+
+
+class ProfiledConnection(sqlite3.Connection):
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+
+def stats():
+    # 返回 [(类别, 名称, 次数, p50, p99, 最大, 合计)]，时间单位为秒，按合计耗时从大到小排列
+    with lock:
+        rows = [(category, name, histogram.count, histogram.percentile(0.5), histogram.percentile(0.99),
+                 histogram.max, histogram.total)
+                for (category, name), histogram in histograms.items()]
+    return sorted(rows, key=lambda row: row[6], reverse=True)
+
+
+def reset():
+    with lock:
+        histograms.clear()
+        trace_events.clear()
+
+
+def dump(path=None):
+    # 写出 Chrome trace（JSON），没有设置 NOTE_PROFILE 也没有指定文件时不做任何事
+    path = path or trace_path
+    if not path:
+        return
+    pid = os.getpid()
+    with lock:
+        events = [{'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': thread_id, 'args': {'name': name}}
+                  for thread_id, name in thread_names.items()]
+        events.extend({'ph': 'X', 'cat': category, 'name': name, 'pid': pid, 'tid': thread_id,
+                       'ts': round(start * 1e6, 1), 'dur': round((end - start) * 1e6, 1)}
+                      for category, name, start, end, thread_id in trace_events)
+    summary = [{'category': category, 'name': name, 'count': count, 'p50_ms': round(p50 * 1000, 3),
+                'p99_ms': round(p99 * 1000, 3), 'max_ms': round(maximum * 1000, 3), 'total_ms': round(total * 1000, 3)}
+               for category, name, count, p50, p99, maximum, total in stats()]
+    with open(path, 'w', encoding='utf-8') as trace_file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms', 'stats': summary}, trace_file, ensure_ascii=False)
@@ -0,0 +1,169 @@
+import json
+import time
+import zlib
+from difflib import SequenceMatcher
+
+# 历史版本保留策略：(最大时长（秒）, 保留粒度（秒）)
+# 一天内每分钟保留一个版本，一个月内每小时保留一个版本，更早的版本删除（最新版本始终保留）
+RETENTION = (
+    (24 * 3600, 60),
+    (30 * 24 * 3600, 3600),
+)
+
+# 每个版本保存为相对上一个版本的差异，每隔这么多个版本保存一次完整快照，限制还原时需要应用的差异数
+SNAPSHOT_INTERVAL = 64
+# 差异数据超过完整内容压缩后大小的这个比例时，直接保存完整快照
+SNAPSHOT_RATIO = 0.5
+
+# 写入线程中每篇笔记最新版本的 (版本 id, 内容)，避免每次保存都重新还原上一个版本
+_latest_cache = {}
+
+
+def make_delta(base, content):
+    # 按行比较，相同的行只记录在上一个版本中的行号范围
+    base_lines = base.splitlines(keepends=True)
+    content_lines = content.splitlines(keepends=True)
+    ops = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, base_lines, content_lines).get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j1 != j2:
+            ops.append(''.join(content_lines[j1:j2]))
+    return json.dumps(ops, ensure_ascii=False, separators=(',', ':'))
+
+
+def apply_delta(base, delta):
+    base_lines = base.splitlines(keepends=True)
+    parts = []
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_lines[op[0]:op[1]])
+    return ''.join(parts)
+
+
+def compress(text):
+    return zlib.compress(text.encode('utf-8'), 6)
+
+
+def decompress(data):
+    return zlib.decompress(data).decode('utf-8')
+
+
+def encode(base, base_depth, content):
+    # 返回 (base_id 是否使用, depth, data)：差异太大或差异链太长时保存完整快照
+    full = compress(content)
+    if base is None or base_depth + 1 >= SNAPSHOT_INTERVAL:
+        return False, 0, full
+    delta = compress(make_delta(base, content))
+    if len(delta) > len(full) * SNAPSHOT_RATIO:
+        return False, 0, full
+    return True, base_depth + 1, delta
+
+
+def record(cursor, note_id, content, now=None):
+    # 在保存笔记的同一个事务中调用，记录一个历史版本
+    now = int(time.time()) if now is None else now
+    cursor.execute('SELECT id, created, depth FROM note_revisions WHERE note_id = ? ORDER BY id DESC LIMIT 1', (note_id,))
+    latest = cursor.fetchone()
+    if latest is not None and latest[1] // RETENTION[0][1] == now // RETENTION[0][1]:
+        # 同一个最小粒度内只保留最后一次保存。最新的版本不会被其他版本引用，可以直接替换
+        cursor.execute('DELETE FROM note_revisions WHERE id = ?', (latest[0],))
+        _latest_cache.pop(note_id, None)
+        cursor.execute('SELECT id, created, depth FROM note_revisions WHERE note_id = ? ORDER BY id DESC LIMIT 1', (note_id,))
+        previous = cursor.fetchone()
+    else:
+        previous = latest
+
+    base_id, base_depth, base = None, 0, None
+    if previous is not None:
+        base_id, base_depth = previous[0], previous[2]
+        cached = _latest_cache.get(note_id)
+        base = cached[1] if cached and cached[0] == base_id else load_revision(cursor, base_id)
+    use_base, depth, data = encode(base, base_depth, content)
+    cursor.execute('INSERT INTO note_revisions (note_id, created, base_id, depth, data, size) VALUES (?, ?, ?, ?, ?, ?)',
+                   (note_id, now, base_id if use_base else None, depth, data, len(content)))
+    _latest_cache.clear()  # 只缓存一篇笔记，切换笔记时释放内存
+    _latest_cache[note_id] = (cursor.lastrowid, content)
+
+    # 每跨过一个保留粒度较粗的时间段整理一次旧版本
+    if latest is None or latest[1] // RETENTION[-1][1] != now // RETENTION[-1][1]:
+        prune(cursor, note_id, now)
+
+
+def prune(cursor, note_id, now=None):
+    now = int(time.time()) if now is None else now
+    cursor.execute('SELECT id, created, base_id, depth FROM note_revisions WHERE note_id = ? ORDER BY id', (note_id,))
+    rows = cursor.fetchall()
+    keep = set()
+    buckets = set()
+    for revision_id, created, base_id, depth in reversed(rows):
+        age = now - created
+        for tier, (max_age, granularity) in enumerate(RETENTION):
+            if age <= max_age:
+                bucket = (tier, created // granularity)
+                # 每个时间段保留最新的一个版本
+                if bucket not in buckets:
+                    buckets.add(bucket)
+                    keep.add(revision_id)
+                break
+    if rows:
+        keep.add(rows[-1][0])
+    if len(keep) == len(rows):
+        return
+
+    # 差异链是线性的：每个差异都基于 id 紧邻的前一个版本
+    # 从第一个被删除版本之前的快照开始顺序还原内容，把保留下来的版本重新编码为相对前一个保留版本的差异
+    start = next(i for i, row in enumerate(rows) if row[0] not in keep)
+    while rows[start][2] is not None:
+        start -= 1
+    cursor.execute('SELECT id, data FROM note_revisions WHERE note_id = ? AND id >= ? ORDER BY id', (note_id, rows[start][0]))
+    data_by_id = dict(cursor.fetchall())
+    # 前一个保留版本 (id, depth, 内容)；起点之前的版本没有还原，内容为 None，其后的差异改存为快照
+    previous_kept = (rows[start - 1][0], rows[start - 1][3], None) if start > 0 else None
+    content = None
+    doomed = []
+    updates = []
+    for revision_id, created, base_id, depth in rows[start:]:
+        data = decompress(data_by_id[revision_id])
+        content = data if base_id is None else apply_delta(content, data)
+        if revision_id not in keep:
+            doomed.append((revision_id,))
+            continue
+        if base_id is not None and (previous_kept is None or base_id != previous_kept[0] or depth != previous_kept[1] + 1):
+            if previous_kept is None:
+                use_base, depth, data = encode(None, 0, content)
+            else:
+                use_base, depth, data = encode(previous_kept[2], previous_kept[1], content)
+            base_id = previous_kept[0] if use_base else None
+            updates.append((base_id, depth, data, revision_id))
+        previous_kept = (revision_id, depth, content)
+    cursor.executemany('DELETE FROM note_revisions WHERE id = ?', doomed)
+    cursor.executemany('UPDATE note_revisions SET base_id = ?, depth = ?, data = ? WHERE id = ?', updates)
+    _latest_cache.pop(note_id, None)
+
+
+def list_revisions(cursor, note_id):
+    cursor.execute('SELECT id, created, size FROM note_revisions WHERE note_id = ? ORDER BY id DESC', (note_id,))
+    return cursor.fetchall()
+
+
+def load_revision(cursor, revision_id):
+    # 沿差异链回溯到最近的快照，再依次应用差异；差异链长度不超过 SNAPSHOT_INTERVAL
+    chain = []
+    while revision_id is not None:
+        cursor.execute('SELECT base_id, data FROM note_revisions WHERE id = ?', (revision_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        revision_id = row[0]
+        chain.append(row[1])
+    content = decompress(chain.pop())
+    while chain:
+        content = apply_delta(content, decompress(chain.pop()))
+    return content
+
+
+def delete_for_notes(cursor, note_ids):
+    cursor.executemany('DELETE FROM note_revisions WHERE note_id = ?', [(note_id,) for note_id in note_ids])
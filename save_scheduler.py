@@ -0,0 +1,74 @@
+import hashlib
+from PyQt5.QtCore import QObject, QTimer
+
+import profiler
+
+# 停止输入多久后保存（毫秒）
+IDLE_SAVE_DELAY = 1000
+# 连续输入时最长多久必须保存一次（毫秒）
+MAX_UNSAVED_INTERVAL = 10000
+
+
+# 自动保存调度器：记录编辑器内容是否有改动，把连续的输入合并成一次写入
+class SaveScheduler(QObject):
+
+    def __init__(self, editor, save, idle_delay=IDLE_SAVE_DELAY, max_interval=MAX_UNSAVED_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.save = save  # save(content)，真正写入数据库的回调
+        self.dirty = False
+        self.saved_revision = None  # 上次保存时文档的修订号
+        self.saved_digest = None  # 上次保存内容的摘要，内容未变时跳过写入
+
+        # 空闲计时器：每次输入都会重新计时
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(idle_delay)
+        self.idle_timer.timeout.connect(self.flush)
+
+        # 上限计时器：第一次出现未保存的改动时开始计时，不会被后续输入推迟
+        self.max_timer = QTimer(self)
+        self.max_timer.setSingleShot(True)
+        self.max_timer.setInterval(max_interval)
+        self.max_timer.timeout.connect(self.flush)
+
+        editor.textChanged.connect(self.mark_dirty)
+
+    def unchanged_since_save(self):
+        # 撤销栈关闭时修订号不会增长，只能依靠内容摘要判断
+        document = self.editor.document()
+        return document.isUndoRedoEnabled() and document.revision() == self.saved_revision
+
+    def mark_dirty(self):
+        if self.unchanged_since_save():
+            return
+        self.dirty = True
+        self.idle_timer.start()
+        if not self.max_timer.isActive():
+            self.max_timer.start()
+
+    def mark_clean(self):
+        # 加载笔记后调用，当前内容视为已保存
+        self.idle_timer.stop()
+        self.max_timer.stop()
+        self.dirty = False
+        self.saved_revision = self.editor.document().revision()
+        self.saved_digest = None
+
+    @profiler.timed
+    def flush(self):
+        # 立即保存尚未写入的改动，没有改动时不做任何事
+        self.idle_timer.stop()
+        self.max_timer.stop()
+        if not self.dirty:
+            return
+        self.dirty = False
+        if self.unchanged_since_save():
+            return
+        content = self.editor.toHtml()
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        self.saved_revision = self.editor.document().revision()
+        if digest == self.saved_digest:
+            return
+        self.saved_digest = digest
+        self.save(content)
@@ -0,0 +1,239 @@
+import re
+import html
+import queue
+import sqlite3
+from html.parser import HTMLParser
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import codec
+
+# 搜索结果中命中词的标记，界面中再替换为加粗
+MATCH_START = '\x01'
+MATCH_END = '\x02'
+
+# 重建索引时每个事务处理的笔记数
+INDEX_BATCH_SIZE = 500
+
+# trigram 分词器按三个字符切分，中英文混排都能做子串匹配，但查不到少于三个字符的词
+MIN_TRIGRAM_LENGTH = 3
+# 中文常见的两字词由 notes_bigram 索引：正文中连续的文字和数字切成相邻的两个字符，用 unicode61 分词器按空格切分
+# 单个字符和含标点的两字符词仍用 LIKE 扫描
+BIGRAM_LENGTH = 2
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+class TextExtractor(HTMLParser):
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self.skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('style', 'head', 'script'):
+            self.skip += 1
+        elif tag in ('p', 'br', 'li', 'h1', 'h2', 'h3', 'tr', 'hr'):
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'head', 'script'):
+            self.skip = max(0, self.skip - 1)
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    # 没有 QTextDocument 时（后台重建索引）从 HTML 中提取纯文本
+    if not html:
+        return ''
+    extractor = TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return clean_text(''.join(extractor.parts))
+
+
+def clean_text(text):
+    # 去掉图片等对象占位符
+    return text.replace('￼', '').strip()
+
+
+def bigrams(text):
+    # 每个由文字和数字组成的词切成相邻的两个字符，单个字符的词原样保留，以空格分隔
+    tokens = []
+    for word in WORD_RE.findall(text):
+        if len(word) < BIGRAM_LENGTH:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + BIGRAM_LENGTH] for i in range(len(word) - 1))
+    return ' '.join(tokens)
+
+
+def index_note(cursor, note_id, title, body):
+    index_notes(cursor, [(note_id, title, body)], replace=True)
+
+
+def index_notes(cursor, rows, replace=False):
+    # 批量导入的新笔记：rows 为 (笔记 id, 标题, 正文) 列表
+    if replace:
+        remove_notes(cursor, [row[0] for row in rows])
+    cursor.executemany('INSERT INTO notes_fts (rowid, title, body) VALUES (?, ?, ?)', rows)
+    cursor.executemany('INSERT INTO notes_bigram (rowid, title, body) VALUES (?, ?, ?)',
+                       [(note_id, bigrams(title), bigrams(body)) for note_id, title, body in rows])
+
+
+def update_body(cursor, note_id, body):
+    cursor.execute('UPDATE notes_fts SET body = ? WHERE rowid = ?', (body, note_id))
+    if cursor.rowcount == 0:
+        cursor.execute('SELECT title FROM notes WHERE id = ?', (note_id,))
+        row = cursor.fetchone()
+        if row is not None:
+            index_note(cursor, note_id, row[0], body)
+        return
+    # 升级后还没有补建两字索引的笔记由 index_missing 从 notes_fts 补建
+    cursor.execute('UPDATE notes_bigram SET body = ? WHERE rowid = ?', (bigrams(body), note_id))
+
+
+def update_title(cursor, note_id, title):
+    cursor.execute('UPDATE notes_fts SET title = ? WHERE rowid = ?', (title, note_id))
+    if cursor.rowcount == 0:
+        cursor.execute('SELECT content FROM notes WHERE id = ?', (note_id,))
+        row = cursor.fetchone()
+        if row is not None:
+            index_note(cursor, note_id, title, html_to_text(codec.decode(row[0])))
+        return
+    cursor.execute('UPDATE notes_bigram SET title = ? WHERE rowid = ?', (bigrams(title), note_id))
+
+
+def remove_notes(cursor, note_ids):
+    for table in ('notes_fts', 'notes_bigram'):
+        cursor.executemany(f'DELETE FROM {table} WHERE rowid = ?', [(note_id,) for note_id in note_ids])
+
+
+def index_missing(cursor):
+    # 为尚未建立索引的笔记补建索引，每次处理一批；返回是否还有剩余
+    cursor.execute(
+        'SELECT id, title, content FROM notes WHERE id NOT IN (SELECT rowid FROM notes_fts) ORDER BY id LIMIT ?',
+        (INDEX_BATCH_SIZE,)
+    )
+    rows = cursor.fetchall()
+    index_notes(cursor, [(note_id, title, html_to_text(codec.decode(content))) for note_id, title, content in rows],
+                replace=True)
+    if len(rows) == INDEX_BATCH_SIZE:
+        return True
+    # 两字索引比 notes_fts 晚引入，已有的笔记从 notes_fts 中的纯文本补建
+    cursor.execute(
+        'SELECT rowid, title, body FROM notes_fts WHERE rowid NOT IN (SELECT rowid FROM notes_bigram) ORDER BY rowid LIMIT ?',
+        (INDEX_BATCH_SIZE,)
+    )
+    rows = cursor.fetchall()
+    cursor.executemany('INSERT INTO notes_bigram (rowid, title, body) VALUES (?, ?, ?)',
+                       [(note_id, bigrams(title), bigrams(body)) for note_id, title, body in rows])
+    return len(rows) == INDEX_BATCH_SIZE
+
+
+def quote(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def escape_like(term):
+    return '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def search(cursor, query, limit=50):
+    # 返回 [(笔记 id, 标题, 摘要)]，按相关度排序；摘要中的命中词用 MATCH_START / MATCH_END 包围
+    # 三个字符以上的词查 notes_fts，两个字符的词查 notes_bigram，都按 bm25 排序；只剩单字时退化为 LIKE 扫描
+    terms = query.split()
+    if not terms:
+        return []
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    bigram_terms = [term for term in terms if len(term) == BIGRAM_LENGTH and WORD_RE.fullmatch(term)]
+    short_terms = [term for term in terms if term not in long_terms and term not in bigram_terms]
+    like = "(title LIKE ? ESCAPE '\\' OR body LIKE ? ESCAPE '\\')"
+    like_params = [param for term in short_terms for param in (escape_like(term), escape_like(term))]
+    # 被删除文件夹中的笔记仍在 notes 表中（见 trash.py），搜索时排除
+    not_trashed = 'rowid NOT IN (SELECT notes.id FROM notes JOIN trash_folders ON notes.folder_id = trash_folders.id)'
+    if long_terms:
+        conditions = ['notes_fts MATCH ?'] + [like] * len(short_terms) + [not_trashed]
+        params = [' AND '.join(quote(term) for term in long_terms)] + like_params
+        if bigram_terms:
+            # 加号使 notes_fts 不把它当作按 rowid 查找的条件，两字索引只查一次，得到的列表用来过滤
+            conditions.append('+rowid IN (SELECT rowid FROM notes_bigram WHERE notes_bigram MATCH ?)')
+            params.append(' AND '.join(quote(term) for term in bigram_terms))
+        # 标题命中的权重高于正文
+        cursor.execute(
+            f"SELECT rowid, title, snippet(notes_fts, 1, '{MATCH_START}', '{MATCH_END}', '…', 32) "
+            f"FROM notes_fts WHERE {' AND '.join(conditions)} ORDER BY bm25(notes_fts, 10.0, 1.0) LIMIT ?",
+            params + [limit]
+        )
+        return cursor.fetchall()
+    if bigram_terms:
+        # notes_bigram 中是切分后的文字：先在其中排序取前 limit 个，再从 notes_fts 取标题和正文做摘要，
+        # 常见词命中大多数笔记时也只读取这几篇的正文；单字的条件逐篇到 notes_fts 中检查
+        conditions = ['notes_bigram MATCH ?', not_trashed]
+        conditions += [f'EXISTS (SELECT 1 FROM notes_fts WHERE rowid = notes_bigram.rowid AND {like})'] * len(short_terms)
+        cursor.execute(
+            'SELECT notes_fts.rowid, title, body FROM ('
+            f"SELECT rowid, bm25(notes_bigram, 10.0, 1.0) AS score FROM notes_bigram WHERE {' AND '.join(conditions)} "
+            'ORDER BY score LIMIT ?) AS hits JOIN notes_fts ON notes_fts.rowid = hits.rowid ORDER BY hits.score',
+            [' AND '.join(quote(term) for term in bigram_terms)] + like_params + [limit]
+        )
+    else:
+        cursor.execute(f"SELECT rowid, title, body FROM notes_fts WHERE {' AND '.join([like] * len(short_terms) + [not_trashed])} "
+                       'ORDER BY rowid DESC LIMIT ?', like_params + [limit])
+    return [(note_id, title, make_snippet(body, bigram_terms + short_terms)) for note_id, title, body in cursor.fetchall()]
+
+
+def make_snippet(body, terms, width=40):
+    # 短词查询无法使用 snippet()，在 Python 中截取命中位置附近的文字；与索引一样不区分大小写
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(body)
+    if match is None:
+        return body[:width]
+    start = max(0, match.start() - width // 2)
+    text = body[start:start + width]
+    text = pattern.sub(lambda match: MATCH_START + match.group(0) + MATCH_END, text)
+    return ('…' if start > 0 else '') + text + ('…' if start + width < len(body) else '')
+
+
+def format_snippet(snippet):
+    # 转义摘要中的 HTML 字符，命中词加粗
+    return html.escape(snippet).replace(MATCH_START, '<b>').replace(MATCH_END, '</b>').replace('\n', ' ')
+
+
+# 在后台线程中用独立的只读连接执行搜索，界面线程输入时不被查询阻塞
+# 排队的查询只执行最新的一个；结果连同查询一起发出，界面丢弃与输入框不一致的过期结果
+class SearchWorker(QThread):
+    results = pyqtSignal(str, list)  # (查询, [(笔记 id, 标题, 摘要)])
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.queries = queue.Queue()
+
+    def search(self, query):
+        self.queries.put(query)
+
+    def stop(self):
+        self.queries.put(None)
+        self.wait()
+
+    def run(self):
+        import storage  # storage 导入了本模块，在这里导入避免循环
+        connection = storage.connect(self.path)
+        cursor = connection.cursor()
+        try:
+            while True:
+                query = self.queries.get()
+                while query is not None and not self.queries.empty():
+                    query = self.queries.get()
+                if query is None:
+                    break
+                try:
+                    rows = search(cursor, query)
+                except sqlite3.Error:
+                    rows = []
+                self.results.emit(query, rows)
+        finally:
+            connection.close()
@@ -0,0 +1,338 @@
+import re
+import time
+import queue
+import sqlite3
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import revisions
+import attachments
+import search
+import trash
+import codec
+import note_format
+import profiler
+import change_feed
+
+DB_PATH = 'notes.db'
+
+# 一个事务中最多合并的写入任务数
+MAX_BATCH_SIZE = 256
+# 组提交：写入线程取到一个任务后最多再等这么久（秒），期间到达的任务并入同一个事务，共用一次 fsync
+GROUP_COMMIT_WINDOW = 0.002
+# 写入队列空闲这么久（秒）后做一次检查点，把 WAL 中的内容写回数据库文件
+CHECKPOINT_IDLE_DELAY = 1.0
+# WAL 超过这么多页时 SQLite 在提交后立即检查点，平时由空闲时的检查点完成
+WAL_AUTOCHECKPOINT_PAGES = 10000
+# 放入队列表示有人在等待，立即提交已取到的任务，不再等满组提交的时间窗
+FLUSH = 'flush'
+
+# 转换旧笔记时每个事务处理的笔记数
+CONVERT_BATCH_SIZE = 500
+
+
+def connect(path=DB_PATH):
+    # WAL 模式下读写互不阻塞：界面线程读，写入线程写
+    # 连接创建的游标记录每条语句的耗时，见 profiler
+    conn = sqlite3.connect(path, factory=profiler.ProfiledConnection)
+    conn.execute('PRAGMA journal_mode = WAL')
+    # 确保数据完整性，即使在突然断电的情况下
+    conn.execute('PRAGMA synchronous = FULL')
+    conn.execute('PRAGMA busy_timeout = 5000')
+    return conn
+
+
+class JobError:
+    # 包装写入任务抛出的异常，与正常的返回值区分开
+    def __init__(self, error):
+        self.error = error
+
+
+# 数据库写入线程：拥有独立的连接，从队列中取出写入任务，合并到同一个事务中提交
+# 任务是形如 func(cursor, *args) 的函数，返回值通过 callback 在界面线程中传回
+class StorageWorker(QThread):
+    job_finished = pyqtSignal(object, object)  # (callback, result)
+    job_failed = pyqtSignal(str)
+
+    def __init__(self, path=DB_PATH, commit_window=GROUP_COMMIT_WINDOW, change_source=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.commit_window = commit_window
+        self.change_source = change_source  # 设置时在 changes 表中记录本实例的修改，供其他实例同步
+        self.jobs = queue.Queue()
+        # 记录尚未提交的任务数，以及每篇笔记尚未提交的保存次数
+        self.idle = threading.Condition()
+        self.pending = 0
+        self.pending_notes = {}
+        self.job_finished.connect(self.dispatch)
+
+    def submit(self, func, *args, callback=None, note_id=None):
+        with self.idle:
+            self.pending += 1
+            if note_id is not None:
+                self.pending_notes[note_id] = self.pending_notes.get(note_id, 0) + 1
+        self.jobs.put((func, args, callback, note_id))
+
+    def flush(self):
+        # 阻塞直到队列中的任务全部提交
+        with self.idle:
+            if self.pending:
+                self.jobs.put(FLUSH)
+            self.idle.wait_for(lambda: self.pending == 0)
+
+    def wait_for_note(self, note_id):
+        # 读取笔记前调用，只有这篇笔记还有未提交的保存时才需要等待
+        with self.idle:
+            if note_id in self.pending_notes:
+                self.jobs.put(FLUSH)
+            self.idle.wait_for(lambda: note_id not in self.pending_notes)
+
+    def stop(self):
+        self.jobs.put(None)
+        self.wait()
+
+    def dispatch(self, callback, result):
+        callback(result)
+
+    def rollback(self, cursor):
+        if cursor.connection.in_transaction:
+            cursor.execute('ROLLBACK')
+
+    def run(self):
+        threading.current_thread().name = 'StorageWorker'  # 性能记录中按线程名区分
+        conn = connect(self.path)
+        conn.isolation_level = None  # 手动控制事务
+        conn.execute(f'PRAGMA wal_autocheckpoint = {WAL_AUTOCHECKPOINT_PAGES}')
+        cursor = conn.cursor()
+        if self.change_source is not None:
+            change_feed.install_triggers(cursor, self.change_source)
+        checkpoint_due = False  # 上次检查点之后是否有新的提交
+        stopping = False
+        while not stopping:
+            try:
+                job = self.jobs.get(timeout=CHECKPOINT_IDLE_DELAY if checkpoint_due else None)
+            except queue.Empty:
+                self.checkpoint(cursor)
+                checkpoint_due = False
+                continue
+            if job is None:
+                break
+            if job == FLUSH:
+                continue
+            batch = [job]
+            deadline = time.perf_counter() + self.commit_window
+            while len(batch) < MAX_BATCH_SIZE:
+                try:
+                    job = self.jobs.get(timeout=max(0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                if job == FLUSH:
+                    break
+                batch.append(job)
+            self.apply_batch(cursor, batch)
+            checkpoint_due = True
+        conn.close()
+
+    def checkpoint(self, cursor):
+        # PASSIVE 检查点不等待读取中的连接，只写回它们不再需要的部分
+        with profiler.measure('storage', 'checkpoint'):
+            cursor.execute('PRAGMA wal_checkpoint(PASSIVE)')
+            cursor.fetchall()
+
+    def run_job(self, cursor, func, args):
+        with profiler.measure('storage', func.__name__):
+            return func(cursor, *args)
+
+    def apply_batch(self, cursor, batch):
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            results = [self.run_job(cursor, func, args) for func, args, _, _ in batch]
+            cursor.execute('COMMIT')
+        except Exception:
+            self.rollback(cursor)
+            # 批量提交失败时逐个重试，避免一个错误的任务连累其他任务
+            results = []
+            for func, args, _, _ in batch:
+                try:
+                    cursor.execute('BEGIN IMMEDIATE')
+                    results.append(self.run_job(cursor, func, args))
+                    cursor.execute('COMMIT')
+                except Exception as e:
+                    self.rollback(cursor)
+                    results.append(JobError(e))
+        for (func, args, callback, note_id), result in zip(batch, results):
+            if isinstance(result, JobError):
+                self.job_failed.emit(str(result.error))
+            elif callback is not None:
+                self.job_finished.emit(callback, result)
+        with self.idle:
+            self.pending -= len(batch)
+            for _, _, _, note_id in batch:
+                if note_id is not None:
+                    self.pending_notes[note_id] -= 1
+                    if not self.pending_notes[note_id]:
+                        del self.pending_notes[note_id]
+            self.idle.notify_all()
+
+
+def load_content(cursor, note_id):
+    # 读取并解码笔记正文，笔记不存在时返回 None
+    cursor.execute('SELECT content FROM notes WHERE id = ?', (note_id,))
+    row = cursor.fetchone()
+    return None if row is None else codec.decode(row[0])
+
+
+# ---- 写入任务 ----
+
+def save_note(cursor, note_id, content, timestamp, text=None):
+    # 内联的 base64 图片在这里转存到附件表，笔记中只保留引用
+    # text 是编辑器中的纯文本，用于更新全文索引；没有提供时从 HTML 中提取
+    content = note_format.compact(attachments.extract_inline_images(cursor, content))
+    cursor.execute('UPDATE notes SET content = ?, timestamp = ?, modified = ? WHERE id = ?',
+                   (codec.encode(content), timestamp, int(time.time()), note_id))
+    attachments.update_references(cursor, note_id, content)
+    revisions.record(cursor, note_id, content)
+    search.update_body(cursor, note_id, search.html_to_text(content) if text is None else search.clean_text(text))
+
+
+def migrate_inline_images(cursor, note_id):
+    # 打开旧笔记时调用，把其中内联的图片转存到附件表
+    content = load_content(cursor, note_id)
+    if not content or 'data:image' not in content:
+        return
+    content = attachments.extract_inline_images(cursor, content)
+    cursor.execute('UPDATE notes SET content = ? WHERE id = ?', (codec.encode(content), note_id))
+    attachments.update_references(cursor, note_id, content)
+
+
+def store_attachment(cursor, digest, mime, data, thumbnail=None):
+    attachments.store(cursor, digest, mime, data, thumbnail)
+
+
+def replace_image_reference(cursor, note_id, old_url, new_url):
+    # 图片处理完成时笔记已不在编辑器中，直接替换已保存内容中的占位图片
+    content = load_content(cursor, note_id)
+    if not content or old_url not in content:
+        return
+    content = content.replace(f'"{old_url}"', f'"{new_url}"')
+    cursor.execute('UPDATE notes SET content = ? WHERE id = ?', (codec.encode(content), note_id))
+    attachments.update_references(cursor, note_id, content)
+
+
+def remove_image(cursor, note_id, url):
+    # 图片处理失败时笔记已不在编辑器中，从已保存的内容中删除占位图片
+    content = load_content(cursor, note_id)
+    if not content or url not in content:
+        return
+    content = re.sub(f'<img [^>]*src="{re.escape(url)}"[^>]*>', '', content)
+    cursor.execute('UPDATE notes SET content = ? WHERE id = ?', (codec.encode(content), note_id))
+
+
+def collect_garbage(cursor):
+    # 先清除过期的回收站内容，其中笔记引用的图片随之变为孤立
+    trash.purge_expired(cursor)
+    change_feed.prune(cursor)
+    return attachments.collect_garbage(cursor)
+
+
+def conversion_progress(cursor):
+    # 升级到版本 2 时有旧笔记需要转换（见 migrations.convert_note_format）：返回已转换到的笔记 id，没有待转换的笔记时返回 None
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'note_conversion')")
+    if not cursor.fetchone()[0]:
+        return None
+    cursor.execute('SELECT after_id FROM note_conversion')
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def convert_notes(cursor, after_id=0):
+    # 把旧笔记按 id 分批转换为精简格式并压缩存储，返回本批最后的 id；全部完成后删除进度表，返回 None
+    cursor.execute('SELECT id, content FROM notes WHERE id > ? ORDER BY id LIMIT ?', (after_id, CONVERT_BATCH_SIZE))
+    rows = cursor.fetchall()
+    updates = []
+    for note_id, value in rows:
+        content = note_format.compact(codec.decode(value))
+        if not codec.is_encoded(value) or content != codec.decode(value):
+            updates.append((codec.encode(content), note_id))
+    cursor.executemany('UPDATE notes SET content = ? WHERE id = ?', updates)
+    if len(rows) == CONVERT_BATCH_SIZE:
+        cursor.execute('UPDATE note_conversion SET after_id = ?', (rows[-1][0],))
+        return rows[-1][0]
+    cursor.execute('DROP TABLE IF EXISTS note_conversion')
+    return None
+
+
+def index_missing_notes(cursor):
+    return search.index_missing(cursor)
+
+
+def create_note(cursor, folder_id, title, timestamp):
+    cursor.execute('INSERT INTO notes (folder_id, title, content, timestamp, modified) VALUES (?, ?, ?, ?, ?)',
+                   (folder_id, title, '', timestamp, int(time.time())))
+    note_id = cursor.lastrowid
+    search.index_note(cursor, note_id, title, '')
+    return note_id
+
+
+def create_folder(cursor, name, parent_id):
+    cursor.execute('INSERT INTO folders (name, parent_id) VALUES (?, ?)', (name, parent_id))
+    return cursor.lastrowid
+
+
+def import_folders(cursor, parent_id, folders, folder_ids):
+    # 导入时按目录结构创建文件夹。folders 为 (键, 上级的键, 名称) 列表，上级在前，顶层的上级键为 None
+    # 创建的文件夹 id 按键填入 folder_ids，之后的 import_notes 任务在同一个写入线程中使用
+    for key, parent_key, name in folders:
+        folder_ids[key] = create_folder(cursor, name, folder_ids[parent_key] if parent_key is not None else parent_id)
+
+
+def import_notes(cursor, notes, folder_ids):
+    # 批量导入笔记：notes 为 (文件夹键, 标题, 编码后的正文, 时间, 纯文本, 图片) 列表，图片为 (哈希, 类型, 数据) 列表
+    # 在事务中预先分配连续的 id，笔记、全文索引和图片引用都用 executemany 一次写入
+    cursor.execute("SELECT max(coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'notes'), 0), "
+                   "coalesce((SELECT max(id) FROM notes), 0))")
+    first_id = cursor.fetchone()[0] + 1
+    # 修改时间取自文件，与 timestamp 一致
+    cursor.executemany("INSERT INTO notes (id, folder_id, title, content, timestamp, modified) "
+                       "VALUES (?1, ?2, ?3, ?4, ?5, CAST(strftime('%s', ?5, 'utc') AS INTEGER))",
+                       [(first_id + i, folder_ids[key], title, content, timestamp)
+                        for i, (key, title, content, timestamp, text, images) in enumerate(notes)])
+    search.index_notes(cursor, [(first_id + i, title, search.clean_text(text))
+                                for i, (key, title, content, timestamp, text, images) in enumerate(notes)])
+    references = []
+    for i, (key, title, content, timestamp, text, images) in enumerate(notes):
+        for digest, mime, data in images:
+            attachments.store(cursor, digest, mime, data)
+            references.append((first_id + i, digest))
+    attachments.add_references(cursor, references)
+    return len(notes)
+
+
+def rename_note(cursor, note_id, title):
+    cursor.execute('UPDATE notes SET title = ? WHERE id = ?', (title, note_id))
+    search.update_title(cursor, note_id, title)
+
+
+def rename_folder(cursor, folder_id, name):
+    cursor.execute('UPDATE folders SET name = ? WHERE id = ?', (name, folder_id))
+
+
+def delete_note(cursor, note_id):
+    # 删除的笔记移入回收站
+    return trash.trash_note(cursor, note_id)
+
+
+def delete_folder(cursor, folder_id):
+    # 整个文件夹子树（包括其中的笔记）作为一个批次移入回收站
+    return trash.trash_folder(cursor, folder_id)
+
+
+def restore_trash(cursor, batch_id):
+    trash.restore(cursor, batch_id)
+
+
+def purge_trash(cursor, batch_ids):
+    trash.purge(cursor, batch_ids)
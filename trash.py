@@ -0,0 +1,110 @@
+import time
+
+import revisions
+import attachments
+import search
+
+# 回收站中的内容保留这么久（秒）后自动清除
+TRASH_RETENTION = 30 * 24 * 3600
+# 回收站的表结构和各表的含义见 migrations.create_tables
+
+
+def new_batch(cursor, kind, name, note_count):
+    cursor.execute('INSERT INTO trash_batches (deleted_at, kind, name, note_count) VALUES (?, ?, ?, ?)',
+                   (int(time.time()), kind, name, note_count))
+    return cursor.lastrowid
+
+
+def trash_note(cursor, note_id):
+    cursor.execute('SELECT title FROM notes WHERE id = ?', (note_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    batch_id = new_batch(cursor, 'note', row[0], 1)
+    cursor.execute('''
+        INSERT INTO trash_notes (batch_id, id, folder_id, title, content, timestamp, modified)
+        SELECT ?, id, folder_id, title, content, timestamp, modified FROM notes WHERE id = ?
+    ''', (batch_id, note_id))
+    cursor.execute('DELETE FROM notes WHERE id = ?', (note_id,))
+    search.remove_notes(cursor, [note_id])
+    return batch_id
+
+
+def trash_folder(cursor, folder_id):
+    # 用递归 CTE 一次找出整棵子树，按集合移动文件夹行，不再逐个文件夹查询和删除
+    cursor.execute('SELECT name FROM folders WHERE id = ?', (folder_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    cursor.execute('CREATE TEMP TABLE IF NOT EXISTS trash_subtree (id INTEGER PRIMARY KEY)')
+    cursor.execute('DELETE FROM trash_subtree')
+    cursor.execute('''
+        WITH RECURSIVE subtree(id) AS (
+            SELECT ?
+            UNION ALL
+            SELECT folders.id FROM folders JOIN subtree ON folders.parent_id = subtree.id
+        )
+        INSERT OR IGNORE INTO trash_subtree (id) SELECT id FROM subtree
+    ''', (folder_id,))
+    cursor.execute('SELECT count(*) FROM notes WHERE folder_id IN (SELECT id FROM trash_subtree)')
+    batch_id = new_batch(cursor, 'folder', row[0], cursor.fetchone()[0])
+    cursor.execute('''
+        INSERT INTO trash_folders (batch_id, id, name, parent_id)
+        SELECT ?, id, name, parent_id FROM folders WHERE id IN (SELECT id FROM trash_subtree)
+    ''', (batch_id,))
+    cursor.execute('DELETE FROM folders WHERE id IN (SELECT id FROM trash_subtree)')
+    cursor.execute('DELETE FROM trash_subtree')
+    return batch_id
+
+
+def list_batches(cursor):
+    cursor.execute('SELECT id, deleted_at, kind, name, note_count FROM trash_batches ORDER BY id DESC')
+    return cursor.fetchall()
+
+
+def restore(cursor, batch_id):
+    # 原来的上级文件夹已不存在时恢复到根目录；恢复的笔记稍后由 search.index_missing 重建索引
+    cursor.execute('''
+        INSERT INTO folders (id, name, parent_id)
+        SELECT id, name, CASE WHEN parent_id IN (SELECT id FROM folders)
+                                OR parent_id IN (SELECT id FROM trash_folders WHERE batch_id = ?)
+                              THEN parent_id END
+        FROM trash_folders WHERE batch_id = ? ORDER BY id
+    ''', (batch_id, batch_id))
+    cursor.execute('''
+        INSERT INTO notes (id, folder_id, title, content, timestamp, modified)
+        SELECT id, CASE WHEN folder_id IN (SELECT id FROM folders) THEN folder_id END, title, content, timestamp, modified
+        FROM trash_notes WHERE batch_id = ?
+    ''', (batch_id,))
+    delete_batches(cursor, [batch_id])
+
+
+def purge(cursor, batch_ids):
+    # 彻底删除：删除回收站中的笔记及其历史版本、图片引用和全文索引
+    for batch_id in batch_ids:
+        cursor.execute('''
+            SELECT id FROM trash_notes WHERE batch_id = ?
+            UNION ALL
+            SELECT notes.id FROM notes JOIN trash_folders ON notes.folder_id = trash_folders.id
+            WHERE trash_folders.batch_id = ?
+        ''', (batch_id, batch_id))
+        note_ids = [note_id for note_id, in cursor.fetchall()]
+        revisions.delete_for_notes(cursor, note_ids)
+        attachments.delete_references(cursor, note_ids)
+        search.remove_notes(cursor, note_ids)
+        cursor.execute('DELETE FROM notes WHERE folder_id IN (SELECT id FROM trash_folders WHERE batch_id = ?)', (batch_id,))
+    delete_batches(cursor, batch_ids)
+
+
+def purge_expired(cursor, retention=TRASH_RETENTION):
+    cursor.execute('SELECT id FROM trash_batches WHERE deleted_at < ?', (int(time.time()) - retention,))
+    batch_ids = [batch_id for batch_id, in cursor.fetchall()]
+    purge(cursor, batch_ids)
+    return len(batch_ids)
+
+
+def delete_batches(cursor, batch_ids):
+    params = [(batch_id,) for batch_id in batch_ids]
+    cursor.executemany('DELETE FROM trash_notes WHERE batch_id = ?', params)
+    cursor.executemany('DELETE FROM trash_folders WHERE batch_id = ?', params)
+    cursor.executemany('DELETE FROM trash_batches WHERE id = ?', params)
@@ -0,0 +1,92 @@
+import re
+import weakref
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import profiler
+
+# 中日韩文字每个字算一个字，连续的拉丁字母、数字（可含撇号、连字符）算一个词
+WORD_RE = re.compile(
+    '[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\u3040-\u30ff\uac00-\ud7af]'
+    "|[0-9A-Za-z\u00c0-\u024f]+(?:['\u2019-][0-9A-Za-z\u00c0-\u024f]+)*"
+)
+SPACE_RE = re.compile(r'\s')
+
+
+def count_text(text):
+    # 返回 (字数, 不含空白的字符数)
+    return len(WORD_RE.findall(text)), len(text) - len(SPACE_RE.findall(text))
+
+
+# 增量字数统计：按段落缓存统计结果，文档改动时只重新统计受影响的段落
+class WordCounter(QObject):
+    changed = pyqtSignal(int, int)  # (字数, 字符数)
+
+    def __init__(self, document=None, parent=None):
+        super().__init__(parent)
+        self.document = None
+        self.block_counts = []  # 按段落序号排列的 (段落文本的哈希, 字数, 字符数)
+        self.words = 0
+        self.chars = 0
+        self.detached = weakref.WeakKeyDictionary()  # 换下的文档 -> (修订号, block_counts, 字数, 字符数)
+        if document is not None:
+            self.attach(document)
+
+    def attach(self, document):
+        # 编辑器更换文档时重新绑定；换回之前统计过、之后没有改动的文档时沿用原来的结果
+        if self.document is not None:
+            self.document.contentsChange.disconnect(self.on_contents_change)
+            self.detached[self.document] = (self.document.revision(), self.block_counts, self.words, self.chars)
+        self.document = document
+        document.contentsChange.connect(self.on_contents_change)
+        saved = self.detached.pop(document, None)
+        if saved is not None and saved[0] == document.revision() and len(saved[1]) == document.blockCount():
+            _, self.block_counts, self.words, self.chars = saved
+            self.changed.emit(self.words, self.chars)
+        else:
+            self.recount_all()
+
+    def recount_all(self):
+        self.block_counts = []
+        self.words = self.chars = 0
+        self.update_blocks(0, 0, self.document.blockCount() - 1)
+
+    @profiler.timed
+    def on_contents_change(self, position, removed, added):
+        document = self.document
+        # 改动前后段落数之差就是改动范围内增减的段落数
+        delta = document.blockCount() - len(self.block_counts)
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(min(position + added, document.characterCount() - 1)).blockNumber()
+        first = max(first, 0)
+        last = max(last, first)
+        old_end = last - delta + 1
+        if old_end < first or old_end > len(self.block_counts):
+            self.recount_all()
+            return
+        # 撤销、重做时 Qt 报告的是合并后的净变化，实际改动可能超出报告的范围
+        # 向前后扩展，直到段落文本与缓存一致
+        while first > 0 and hash(document.findBlockByNumber(first - 1).text()) != self.block_counts[first - 1][0]:
+            first -= 1
+        block = document.findBlockByNumber(last + 1)
+        while block.isValid() and old_end < len(self.block_counts) and hash(block.text()) != self.block_counts[old_end][0]:
+            last += 1
+            old_end += 1
+            block = block.next()
+        self.update_blocks(first, old_end, last)
+
+    def update_blocks(self, first, old_end, last):
+        # 用新的 first..last 段落的统计结果替换 block_counts[first:old_end]
+        for _, words, chars in self.block_counts[first:old_end]:
+            self.words -= words
+            self.chars -= chars
+        counts = []
+        block = self.document.findBlockByNumber(first)
+        for _ in range(first, last + 1):
+            text = block.text()
+            words, chars = count_text(text)
+            counts.append((hash(text), words, chars))
+            self.words += words
+            self.chars += chars
+            block = block.next()
+        self.block_counts[first:old_end] = counts
+        self.changed.emit(self.words, self.chars)